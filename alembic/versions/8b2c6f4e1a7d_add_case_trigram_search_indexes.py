@@ -0,0 +1,42 @@
+"""Add case trigram search indexes
+
+Revision ID: 8b2c6f4e1a7d
+Revises: 419454d1c5c5
+Create Date: 2026-10-17 10:12:44.918203
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8b2c6f4e1a7d"
+down_revision: str | None = "419454d1c5c5"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "idx_case_summary_trgm",
+        "cases",
+        ["summary"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"summary": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "idx_case_description_trgm",
+        "cases",
+        ["description"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"description": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_case_description_trgm", table_name="cases")
+    op.drop_index("idx_case_summary_trgm", table_name="cases")
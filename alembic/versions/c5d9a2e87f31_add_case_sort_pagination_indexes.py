@@ -0,0 +1,34 @@
+"""Add case sort pagination indexes
+
+Revision ID: c5d9a2e87f31
+Revises: 8b2c6f4e1a7d
+Create Date: 2026-10-17 11:03:27.164530
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c5d9a2e87f31"
+down_revision: str | None = "8b2c6f4e1a7d"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+SORT_COLUMNS = ("updated_at", "priority", "severity", "status")
+
+
+def upgrade() -> None:
+    for column in SORT_COLUMNS:
+        op.create_index(
+            f"idx_case_{column}_pagination",
+            "cases",
+            ["owner_id", column, "created_at", "id"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    for column in reversed(SORT_COLUMNS):
+        op.drop_index(f"idx_case_{column}_pagination", table_name="cases")
@@ -2,11 +2,16 @@
 # WARNING: Do not import __future__ annotations from typing
 # Causes class types to resolve as strings, breaking TypedDict runtime behavior
 
-from collections.abc import Callable
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 import base64
 import binascii
+import hashlib
 from pathlib import Path
 import tempfile
+import time
 from json import JSONDecodeError
 from typing import Annotated, Any, Literal, NotRequired, Required, TypedDict
 
@@ -26,6 +31,8 @@ from tracecat.logger import logger
 from typing_extensions import Doc
 
 from tracecat.config import (
+    TRACECAT__HTTP_CLIENT_IDLE_TIMEOUT,
+    TRACECAT__HTTP_CLIENT_POOL_SIZE,
     TRACECAT__MAX_FILE_SIZE_BYTES,
     TRACECAT__MAX_AGGREGATE_UPLOAD_SIZE_BYTES,
     TRACECAT__MAX_UPLOAD_FILES_COUNT,
@@ -213,6 +220,145 @@ class TemporaryClientCertificate:
                 )
 
 
+@dataclass
+class _PooledClient:
+    key: tuple[Any, ...]
+    client: httpx.AsyncClient
+    last_used: float
+
+
+class HTTPClientPool:
+    """Reusable `httpx.AsyncClient`s for the HTTP actions in a worker.
+
+    Clients are keyed by the settings that are fixed when a client is built: SSL
+    verification, the client certificate and the redirect limit. Auth, timeouts
+    and redirect following are passed per request, so they don't fragment the
+    pool. Reusing clients keeps connections alive across actions instead of
+    paying for a TCP and TLS handshake on every request.
+
+    A borrowed client is used by one caller at a time, so cookies set during a
+    request (e.g. across redirects) work as usual. They're cleared when the
+    client is returned, so cookies never leak between requests.
+
+    Connections belong to the event loop that opened them, so each loop has its
+    own clients. They're held by an async generator that closes them when the
+    loop shuts down (`shutdown_asyncgens`). In the executor's `task` mode every
+    action runs on a new event loop, so clients are only reused within an action.
+    """
+
+    def __init__(
+        self,
+        *,
+        maxsize: int = TRACECAT__HTTP_CLIENT_POOL_SIZE,
+        idle_timeout: float = TRACECAT__HTTP_CLIENT_IDLE_TIMEOUT,
+    ):
+        self.maxsize = maxsize
+        self.idle_timeout = idle_timeout
+        self._loops: dict[
+            asyncio.AbstractEventLoop,
+            tuple[list[_PooledClient], AsyncGenerator[list[_PooledClient]]],
+        ] = {}
+
+    def __len__(self) -> int:
+        """Number of idle clients for the running event loop."""
+        entry = self._loops.get(asyncio.get_running_loop())
+        return len(entry[0]) if entry else 0
+
+    async def _hold(
+        self, loop: asyncio.AbstractEventLoop
+    ) -> AsyncGenerator[list[_PooledClient]]:
+        """Hold a loop's idle clients, closing them when the generator is closed."""
+        idle: list[_PooledClient] = []
+        try:
+            yield idle
+        finally:
+            self._loops.pop(loop, None)
+            for entry in idle:
+                await entry.client.aclose()
+
+    async def _idle_clients(self) -> list[_PooledClient]:
+        loop = asyncio.get_running_loop()
+        if (entry := self._loops.get(loop)) is None:
+            holder = self._hold(loop)
+            entry = self._loops[loop] = (await anext(holder), holder)
+        return entry[0]
+
+    @asynccontextmanager
+    async def client(
+        self,
+        *,
+        verify: bool = True,
+        max_redirects: int = 20,
+        client_cert_str: str | None = None,
+        client_key_str: str | None = None,
+        client_key_password: str | None = None,
+    ) -> AsyncIterator[httpx.AsyncClient]:
+        """Borrow a client for the given connection settings."""
+        idle = await self._idle_clients()
+        cert_fingerprint = (
+            hashlib.sha256(
+                "\0".join(
+                    (
+                        client_cert_str or "",
+                        client_key_str or "",
+                        client_key_password or "",
+                    )
+                ).encode()
+            ).hexdigest()
+            if client_cert_str or client_key_str
+            else None
+        )
+        key = (verify, max_redirects, cert_fingerprint)
+        # Take the most recently used idle client with matching settings
+        for i in range(len(idle) - 1, -1, -1):
+            if idle[i].key == key:
+                entry = idle.pop(i)
+                break
+        else:
+            # The certificate is loaded into the SSL context when the client is
+            # built, so the temporary files are only needed until then
+            with TemporaryClientCertificate(
+                client_cert_str=client_cert_str,
+                client_key_str=client_key_str,
+                client_key_password=client_key_password,
+            ) as cert_for_httpx:
+                client = httpx.AsyncClient(
+                    cert=cert_for_httpx,
+                    verify=verify,
+                    max_redirects=max_redirects,
+                )
+            entry = _PooledClient(key=key, client=client, last_used=time.monotonic())
+        try:
+            yield entry.client
+        finally:
+            entry.client.cookies.clear()
+            entry.last_used = time.monotonic()
+            idle.append(entry)
+            await self._evict_idle(idle)
+
+    async def _evict_idle(self, idle: list[_PooledClient]) -> None:
+        now = time.monotonic()
+        # Idle clients are ordered from least to most recently used
+        n_over = len(idle) - self.maxsize
+        evicted = [
+            entry
+            for i, entry in enumerate(idle)
+            if i < n_over or now - entry.last_used > self.idle_timeout
+        ]
+        for entry in evicted:
+            idle.remove(entry)
+            await entry.client.aclose()
+
+    async def aclose(self) -> None:
+        """Close the pooled clients of the running event loop."""
+        entry = self._loops.get(asyncio.get_running_loop())
+        if entry is not None:
+            await entry[1].aclose()
+
+
+http_client_pool = HTTPClientPool()
+
+
 def httpx_to_response(response: httpx.Response) -> HTTPResponse:
     # Handle 204 No Content responses
     if response.status_code == 204:
@@ -561,47 +707,39 @@ async def http_request(
         logger.error(f"File processing error in http_request: {str(e)}")
         raise TracecatException(str(e)) from e
 
-    client_cert_str = secrets.get_or_default("SSL_CLIENT_CERT")
-    client_key_str = secrets.get_or_default("SSL_CLIENT_KEY")
-    client_key_password = secrets.get_or_default("SSL_CLIENT_PASSWORD")
-
-    # Manage SSL certificates with proper cleanup
-    with TemporaryClientCertificate(
-        client_cert_str=client_cert_str,
-        client_key_str=client_key_str,
-        client_key_password=client_key_password,
-    ) as cert_for_httpx:
-        try:
-            async with httpx.AsyncClient(
-                cert=cert_for_httpx,  # SSL cert configuration from context manager
+    try:
+        async with http_client_pool.client(
+            verify=verify_ssl,
+            max_redirects=max_redirects,
+            client_cert_str=secrets.get_or_default("SSL_CLIENT_CERT"),
+            client_key_str=secrets.get_or_default("SSL_CLIENT_KEY"),
+            client_key_password=secrets.get_or_default("SSL_CLIENT_PASSWORD"),
+        ) as client:
+            response = await client.request(
+                method=method,
+                url=url,
+                headers=headers,
+                params=params,
+                json=payload,
+                data=form_data,
+                files=httpx_files_param,
                 auth=basic_auth,
                 timeout=httpx.Timeout(timeout),
                 follow_redirects=follow_redirects,
-                max_redirects=max_redirects,
-                verify=verify_ssl,
-            ) as client:
-                response = await client.request(
-                    method=method,
-                    url=url,
-                    headers=headers,
-                    params=params,
-                    json=payload,
-                    data=form_data,
-                    files=httpx_files_param,
-                )
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            error_message = _http_status_error_to_message(e)
-            logger.error(
-                "HTTP request failed",
-                status_code=e.response.status_code,
-                error_message=error_message,
             )
-            raise TracecatException(error_message) from e
-        except httpx.ReadTimeout as e:
-            logger.error(f"HTTP request timed out after {timeout} seconds.")
-            raise e
-        return httpx_to_response(response)
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        error_message = _http_status_error_to_message(e)
+        logger.error(
+            "HTTP request failed",
+            status_code=e.response.status_code,
+            error_message=error_message,
+        )
+        raise TracecatException(error_message) from e
+    except httpx.ReadTimeout as e:
+        logger.error(f"HTTP request timed out after {timeout} seconds.")
+        raise e
+    return httpx_to_response(response)
 
 
 class PredicateArgs(TypedDict):
@@ -687,49 +825,43 @@ async def http_poll(
         )
         return predicate(args)
 
-    @retry(
-        stop=stop_after_attempt(poll_max_attempts)
-        if poll_max_attempts > 0
-        else stop_never,
-        wait=wait_fixed(poll_interval) if poll_interval else wait_exponential(),
-        retry=(
-            retry_if_result(retry_status_code) | retry_if_result(user_defined_predicate)
-        ),
-        # Stop retrying immediately on critical errors (e.g., timeouts)
-        reraise=True,
-    )
-    async def call() -> httpx.Response:
-        client_cert_str = secrets.get_or_default("SSL_CLIENT_CERT")
-        client_key_str = secrets.get_or_default("SSL_CLIENT_KEY")
-        client_key_password = secrets.get_or_default("SSL_CLIENT_PASSWORD")
-
-        # SSL certificate management for each polling attempt
-        with TemporaryClientCertificate(
-            client_cert_str=client_cert_str,
-            client_key_str=client_key_str,
-            client_key_password=client_key_password,
-        ) as cert_for_httpx:
+    # All polling attempts share one pooled client (and its connections)
+    async with http_client_pool.client(
+        verify=verify_ssl,
+        max_redirects=max_redirects,
+        client_cert_str=secrets.get_or_default("SSL_CLIENT_CERT"),
+        client_key_str=secrets.get_or_default("SSL_CLIENT_KEY"),
+        client_key_password=secrets.get_or_default("SSL_CLIENT_PASSWORD"),
+    ) as client:
+
+        @retry(
+            stop=stop_after_attempt(poll_max_attempts)
+            if poll_max_attempts > 0
+            else stop_never,
+            wait=wait_fixed(poll_interval) if poll_interval else wait_exponential(),
+            retry=(
+                retry_if_result(retry_status_code)
+                | retry_if_result(user_defined_predicate)
+            ),
+            # Stop retrying immediately on critical errors (e.g., timeouts)
+            reraise=True,
+        )
+        async def call() -> httpx.Response:
             try:
-                async with httpx.AsyncClient(
-                    cert=cert_for_httpx,  # SSL cert configuration from context manager
+                return await client.request(
+                    method=method,
+                    url=url,
+                    headers=headers,
+                    params=params,
+                    json=payload,
+                    data=form_data,
                     auth=basic_auth,
                     timeout=httpx.Timeout(timeout),
                     follow_redirects=follow_redirects,
-                    max_redirects=max_redirects,
-                    verify=verify_ssl,
-                ) as client:
-                    response = await client.request(
-                        method=method,
-                        url=url,
-                        headers=headers,
-                        params=params,
-                        json=payload,
-                        data=form_data,
-                    )
-                return response
+                )
             except httpx.ReadTimeout as e:
                 logger.error(f"HTTP request timed out after {timeout} seconds.")
                 raise e
 
-    result = await call()
+        result = await call()
     return httpx_to_response(result)
@@ -1,14 +1,25 @@
 import asyncio
+import atexit
+from collections import deque
 import json
 import re
 import shutil
+import subprocess
 import sys
+import threading
 from pathlib import Path
 import tempfile
 from io import StringIO
 from typing import Annotated, Any, TypedDict
 
-from tracecat.config import TRACECAT__PYODIDE_VERSION, TRACECAT__NODE_MODULES_DIR
+from tracecat.config import (
+    TRACECAT__NODE_MODULES_DIR,
+    TRACECAT__PYODIDE_VERSION,
+    TRACECAT__PYTHON_SCRIPT_POOL_SIZE,
+    TRACECAT__PYTHON_SCRIPT_WORKER_MAX_RUNS,
+    TRACECAT__PYTHON_SCRIPT_WORKER_STARTUP_TIMEOUT,
+)
+from tracecat.contexts import ctx_role
 from tracecat.logger import logger
 from tracecat.registry.fields import Code
 from tracecat_registry import registry
@@ -45,6 +56,113 @@ class PythonScriptOutputError(PythonScriptError):
     """Exception raised when a Python script output cannot be processed."""
 
 
+_WORKER_MESSAGE_PREFIX = "__tracecat_worker__:"
+"""Marks the lines a persistent Deno worker writes for the pool to read."""
+
+_WORKER_RESET_CODE = r'''
+import builtins
+import importlib
+import os
+import sys
+
+_MISSING = object()
+_SKIP_DIRS = {"/dev", "/proc", "/sys"}
+
+
+def _is_package_module(module):
+    # Extension modules can't be imported twice in one process, so modules of the
+    # worker's packages stay loaded. Workers are never shared across workspaces.
+    origin = getattr(getattr(module, "__spec__", None), "origin", None) or ""
+    return "/site-packages/" in origin
+
+
+def _walk(roots):
+    files, dirs = {}, set()
+    for top in roots:
+        for root, subdirs, names in os.walk(top):
+            subdirs[:] = [
+                d for d in subdirs if os.path.join(root, d) not in _SKIP_DIRS
+            ]
+            dirs.update(os.path.join(root, d) for d in subdirs)
+            for name in names:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                files[path] = (stat.st_mtime_ns, stat.st_size)
+    return files, dirs
+
+
+def _restore_vars(namespace, saved):
+    for key in namespace.keys() - saved.keys():
+        del namespace[key]
+    for key, value in saved.items():
+        if namespace.get(key, _MISSING) is not value:
+            namespace[key] = value
+
+
+def _make_reset(roots):
+    """Snapshot the interpreter and filesystem, and return a function restoring them.
+
+    The returned function returns False if a script changed something it can't
+    undo, in which case the worker must not be reused.
+    """
+    modules = dict(sys.modules)
+    module_vars = {
+        name: dict(vars(module))
+        for name, module in modules.items()
+        if isinstance(getattr(module, "__dict__", None), dict)
+        and not _is_package_module(module)
+    }
+    path = list(sys.path)
+    meta_path = list(sys.meta_path)
+    path_hooks = list(sys.path_hooks)
+    environ = dict(os.environ)
+    cwd = os.getcwd()
+    files, dirs = _walk(roots)
+
+    def reset():
+        for name, module in list(sys.modules.items()):
+            if name not in modules and not _is_package_module(module):
+                del sys.modules[name]
+        for name, module in modules.items():
+            sys.modules[name] = module
+        for name, saved in module_vars.items():
+            _restore_vars(vars(modules[name]), saved)
+        sys.path[:] = path
+        sys.meta_path[:] = meta_path
+        sys.path_hooks[:] = path_hooks
+        sys.path_importer_cache.clear()
+        os.environ.clear()
+        os.environ.update(environ)
+        importlib.invalidate_caches()
+        os.chdir(cwd)
+
+        reusable = True
+        current_files, current_dirs = _walk(roots)
+        for file_path, stat in current_files.items():
+            if file_path not in files:
+                os.remove(file_path)
+                # Packages installed at runtime can't be unloaded
+                reusable = reusable and "/site-packages/" not in file_path
+            elif stat != files[file_path]:
+                reusable = False
+        for dir_path in sorted(current_dirs - dirs, reverse=True):
+            os.rmdir(dir_path)
+        return reusable and files.keys() <= current_files.keys()
+
+    return reset
+'''
+"""Python run in each worker to undo a script's changes before the next one.
+
+Restores `sys.modules`, module globals (including builtins), import state,
+environment variables and the working directory, and deletes files the script
+created. Mutations of objects inside modules, such as patched class attributes,
+are not undone, which is why workers are also keyed by workspace.
+"""
+
+
 def _extract_user_friendly_error(error_msg: str) -> str:
     """
     Extract a clean, user-friendly error message from Python tracebacks.
@@ -327,6 +445,15 @@ __result  # Return the result
         finally:
             sys.stdout = old_stdout
             sys.stderr = old_stderr
+    elif pyodide_worker_pool.maxsize > 0:
+        role = ctx_role.get()
+        internal_output = await pyodide_worker_pool.run(
+            execution_code,
+            dependencies=dependencies,
+            timeout_seconds=timeout_seconds,
+            allow_network=allow_network,
+            workspace_id=str(role.workspace_id) if role and role.workspace_id else None,
+        )
     else:
         internal_output = await _run_python_script_subprocess(
             execution_code, inputs, dependencies, timeout_seconds, allow_network
@@ -425,6 +552,128 @@ main().catch(err => {{
 """
 
 
+def _create_deno_worker_script(dependencies: list[str]) -> str:
+    """
+    Create the Deno TypeScript script for a persistent Pyodide worker.
+
+    The worker loads Pyodide and its packages once, then reads scripts as
+    newline-delimited JSON requests on stdin and writes one result per script
+    to stdout. Each result is prefixed with a marker so that it can't be
+    confused with messages printed by Pyodide itself.
+
+    Args:
+        dependencies: List of Python packages to load into the worker.
+
+    Returns:
+        The complete Deno TypeScript script as a string.
+    """
+    dependencies_json = json.dumps(dependencies)
+    prefix_json = json.dumps(_WORKER_MESSAGE_PREFIX)
+    reset_code_json = json.dumps(_WORKER_RESET_CODE)
+
+    return f"""
+import {{ loadPyodide }} from "npm:pyodide@{TRACECAT__PYODIDE_VERSION}";
+
+const PREFIX = {prefix_json};
+
+function send(message) {{
+    console.log(PREFIX + JSON.stringify(message));
+}}
+
+const pyodide = await loadPyodide();
+
+const dependencies = {dependencies_json};
+if (dependencies.length > 0) {{
+    try {{
+        await pyodide.loadPackage(dependencies);
+    }} catch (pkgError) {{
+        console.error(`Error loading dependencies: ${{pkgError.toString()}}`);
+    }}
+}}
+
+let stdout_acc = "";
+let stderr_acc = "";
+pyodide.setStdout({{
+    batched: (msg) => {{ stdout_acc += msg + "\\n"; }}
+}});
+pyodide.setStderr({{
+    batched: (msg) => {{ stderr_acc += msg + "\\n"; }}
+}});
+
+// Snapshot the interpreter and filesystem once everything is loaded
+const resetNamespace = pyodide.globals.get("dict")();
+pyodide.runPython({reset_code_json}, {{ globals: resetNamespace }});
+const resetWorker = pyodide.runPython('_make_reset(["/"])', {{ globals: resetNamespace }});
+
+async function runScript(scriptCode) {{
+    stdout_acc = "";
+    stderr_acc = "";
+    // Every script gets a fresh global namespace so nothing leaks between runs
+    const namespace = pyodide.globals.get("dict")();
+    namespace.set("__name__", "__main__");
+    let result;
+    try {{
+        let scriptResult = await pyodide.runPythonAsync(scriptCode, {{ globals: namespace }});
+        if (typeof scriptResult?.toJs === 'function') {{
+            scriptResult = scriptResult.toJs({{ dict_converter: Object.fromEntries }});
+        }}
+        result = {{
+            success: true,
+            output: scriptResult,
+            stdout: stdout_acc,
+            stderr: stderr_acc,
+            error: null
+        }};
+    }} catch (error) {{
+        result = {{
+            success: false,
+            output: null,
+            stdout: stdout_acc,
+            stderr: stderr_acc,
+            error: error.toString()
+        }};
+    }} finally {{
+        namespace.destroy();
+    }}
+    // Undo the script's changes, or have the pool discard this worker
+    try {{
+        result.reusable = resetWorker() === true;
+    }} catch (err) {{
+        result.reusable = false;
+    }}
+    return result;
+}}
+
+send({{ ready: true }});
+
+const decoder = new TextDecoder();
+let buffer = "";
+for await (const chunk of Deno.stdin.readable) {{
+    buffer += decoder.decode(chunk, {{ stream: true }});
+    let newline;
+    while ((newline = buffer.indexOf("\\n")) !== -1) {{
+        const line = buffer.slice(0, newline);
+        buffer = buffer.slice(newline + 1);
+        if (line.trim()) {{
+            try {{
+                const request = JSON.parse(line);
+                send(await runScript(request.script));
+            }} catch (err) {{
+                send({{
+                    success: false,
+                    output: null,
+                    stdout: "",
+                    stderr: `Deno wrapper error: ${{err.toString()}}`,
+                    error: `Deno wrapper error: ${{err.toString()}}`,
+                    reusable: false
+                }});
+            }}
+        }}
+    }}
+}}
+"""
+
+
 def _parse_subprocess_output(stdout: str) -> PythonScriptOutput:
     """
     Parse the stdout from Deno subprocess to extract the JSON result.
@@ -470,23 +719,6 @@ def _parse_subprocess_output(stdout: str) -> PythonScriptOutput:
 
         output_data = json.loads(json_line)
 
-        # Check if execution was successful
-        if not output_data.get("success", False):
-            # Extract clean error message for users
-            raw_error = output_data.get("error", "Unknown error occurred")
-            clean_error = _extract_user_friendly_error(raw_error)
-
-            logger.error(f"Script execution failed: {clean_error}")
-            raise PythonScriptExecutionError(f"Script execution failed: {clean_error}")
-
-        return PythonScriptOutput(
-            output=output_data.get("output"),
-            stdout=output_data.get("stdout", ""),
-            stderr=output_data.get("stderr", ""),
-            success=output_data.get("success", False),
-            error=output_data.get("error"),
-        )
-
     except json.JSONDecodeError as jde:
         # Log full error for debugging but don't expose stdout to users
         logger.error(f"Failed to decode JSON output from Deno: {jde}. stdout: {stdout}")
@@ -495,6 +727,39 @@ def _parse_subprocess_output(stdout: str) -> PythonScriptOutput:
             "Script execution failed: Unable to process script output."
         ) from jde
 
+    return _parse_script_result(output_data)
+
+
+def _parse_script_result(output_data: dict[str, Any]) -> PythonScriptOutput:
+    """
+    Convert a decoded script result from the Deno wrapper into PythonScriptOutput.
+
+    Args:
+        output_data: The JSON object reported by the Deno wrapper.
+
+    Returns:
+        Parsed PythonScriptOutput.
+
+    Raises:
+        PythonScriptExecutionError: If execution failed with a clean error message.
+    """
+    # Check if execution was successful
+    if not output_data.get("success", False):
+        # Extract clean error message for users
+        raw_error = output_data.get("error", "Unknown error occurred")
+        clean_error = _extract_user_friendly_error(raw_error)
+
+        logger.error(f"Script execution failed: {clean_error}")
+        raise PythonScriptExecutionError(f"Script execution failed: {clean_error}")
+
+    return PythonScriptOutput(
+        output=output_data.get("output"),
+        stdout=output_data.get("stdout", ""),
+        stderr=output_data.get("stderr", ""),
+        success=output_data.get("success", False),
+        error=output_data.get("error"),
+    )
+
 
 async def _run_python_script_subprocess(
     script: str,
@@ -536,29 +801,14 @@ async def _run_python_script_subprocess(
 
     deno_script = _create_deno_script(script, inputs, dependencies)
 
-    scripts_dir = Path("/app/.scripts")
-    temp_base_dir = scripts_dir if scripts_dir.exists() else None
-
-    with tempfile.TemporaryDirectory(dir=temp_base_dir) as temp_dir:
+    with tempfile.TemporaryDirectory(dir=_get_scripts_base_dir()) as temp_dir:
         temp_path = Path(temp_dir)
         script_file = temp_path / "script.ts"
         script_file.write_text(deno_script, encoding="utf-8")
 
-        # Build Deno arguments with proper permissions including temp directory
-        deno_args = [
-            deno_path,
-            "run",
-            "--no-prompt",
-            f"--allow-read={temp_dir},{TRACECAT__NODE_MODULES_DIR}",
-            f"--allow-write={temp_dir},{TRACECAT__NODE_MODULES_DIR}",
-            "--node-modules-dir=auto",
-        ]
-
-        if allow_network:
-            deno_args.append("--allow-net")
-
-        deno_args.append(str(script_file))
+        deno_args = _build_deno_args(deno_path, temp_path, script_file, allow_network)
 
+        process = None
         try:
             process = await asyncio.create_subprocess_exec(
                 *deno_args,
@@ -574,6 +824,9 @@ async def _run_python_script_subprocess(
             )
 
         except asyncio.TimeoutError as timeout_error:
+            if process is not None and process.returncode is None:
+                process.kill()
+                await process.wait()
             error_msg = f"Script execution (subprocess) timed out after {timeout_seconds} seconds"
             logger.error(error_msg)
             raise PythonScriptTimeoutError(error_msg) from timeout_error
@@ -589,3 +842,244 @@ async def _run_python_script_subprocess(
             raise PythonScriptExecutionError(clean_error)
 
         return _parse_subprocess_output(stdout)
+
+
+def _get_scripts_base_dir() -> Path | None:
+    scripts_dir = Path("/app/.scripts")
+    return scripts_dir if scripts_dir.exists() else None
+
+
+def _build_deno_args(
+    deno_path: str, temp_path: Path, script_file: Path, allow_network: bool
+) -> list[str]:
+    """Build the Deno command with permissions limited to the temp directory."""
+    deno_args = [
+        deno_path,
+        "run",
+        "--no-prompt",
+        f"--allow-read={temp_path},{TRACECAT__NODE_MODULES_DIR}",
+        f"--allow-write={temp_path},{TRACECAT__NODE_MODULES_DIR}",
+        "--node-modules-dir=auto",
+    ]
+
+    if allow_network:
+        deno_args.append("--allow-net")
+
+    deno_args.append(str(script_file))
+    return deno_args
+
+
+class _PyodideWorker:
+    """A Deno process with Pyodide loaded that runs scripts sent over stdin.
+
+    The process is driven with blocking pipe I/O in worker threads rather than
+    asyncio subprocess transports, so a worker isn't tied to the event loop that
+    started it and can be reused by later actions running on other loops.
+    """
+
+    def __init__(
+        self,
+        deno_path: str,
+        *,
+        workspace_id: str | None,
+        dependencies: tuple[str, ...],
+        allow_network: bool,
+    ):
+        self.key = (workspace_id, allow_network, dependencies)
+        self.runs = 0
+        self.reusable = True
+        self._temp_dir = tempfile.TemporaryDirectory(dir=_get_scripts_base_dir())
+        temp_path = Path(self._temp_dir.name)
+        script_file = temp_path / "worker.ts"
+        script_file.write_text(
+            _create_deno_worker_script(list(dependencies)), encoding="utf-8"
+        )
+        self._process = subprocess.Popen(
+            _build_deno_args(deno_path, temp_path, script_file, allow_network),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=str(temp_path),  # Run from temp directory to avoid permission issues
+        )
+        # Keep draining stderr so a chatty worker can't block on a full pipe
+        self._stderr: deque[str] = deque(maxlen=100)
+        self._stderr_thread = threading.Thread(target=self._drain_stderr, daemon=True)
+        self._stderr_thread.start()
+
+    @property
+    def alive(self) -> bool:
+        return self._process.poll() is None
+
+    def _drain_stderr(self) -> None:
+        assert self._process.stderr is not None
+        for line in self._process.stderr:
+            self._stderr.append(line.decode(errors="replace"))
+
+    def _read_message(self) -> dict[str, Any]:
+        assert self._process.stdout is not None
+        for line in self._process.stdout:
+            text = line.decode(errors="replace").strip()
+            if text.startswith(_WORKER_MESSAGE_PREFIX):
+                return json.loads(text.removeprefix(_WORKER_MESSAGE_PREFIX))
+
+        # The worker exited before replying
+        self._process.wait()
+        self._stderr_thread.join(timeout=1)
+        stderr = "".join(self._stderr).strip()
+        logger.error(f"Deno process error. Stderr: {stderr}")
+        raise PythonScriptExecutionError(_extract_deno_error(stderr))
+
+    def _send_script(self, script: str) -> dict[str, Any]:
+        assert self._process.stdin is not None
+        try:
+            self._process.stdin.write(json.dumps({"script": script}).encode() + b"\n")
+            self._process.stdin.flush()
+        except BrokenPipeError:
+            pass  # Reading the reply surfaces the worker's error
+        return self._read_message()
+
+    async def start(self, timeout: float) -> None:
+        """Wait until Pyodide and the worker's packages are loaded."""
+        try:
+            await asyncio.wait_for(asyncio.to_thread(self._read_message), timeout)
+        except asyncio.TimeoutError as timeout_error:
+            self.kill()
+            error_msg = f"Python runtime failed to start within {timeout} seconds"
+            logger.error(error_msg)
+            raise PythonScriptTimeoutError(error_msg) from timeout_error
+        except Exception:
+            self.kill()
+            raise
+
+    async def run(self, script: str, timeout_seconds: int) -> PythonScriptOutput:
+        self.runs += 1
+        try:
+            output_data = await asyncio.wait_for(
+                asyncio.to_thread(self._send_script, script), timeout_seconds
+            )
+        except asyncio.TimeoutError as timeout_error:
+            # Pyodide can't be interrupted, so the worker is discarded
+            self.kill()
+            error_msg = f"Script execution (subprocess) timed out after {timeout_seconds} seconds"
+            logger.error(error_msg)
+            raise PythonScriptTimeoutError(error_msg) from timeout_error
+        except json.JSONDecodeError as jde:
+            self.kill()
+            logger.error(f"Failed to decode JSON output from Deno worker: {jde}")
+            raise PythonScriptOutputError(
+                "Script execution failed: Unable to process script output."
+            ) from jde
+        # The worker reports whether it could undo the script's changes
+        self.reusable = output_data.get("reusable") is True
+        return _parse_script_result(output_data)
+
+    def kill(self) -> None:
+        if self.alive:
+            self._process.kill()
+        self._process.wait()
+        for pipe in (self._process.stdin, self._process.stdout):
+            if pipe is not None:
+                pipe.close()
+        self._temp_dir.cleanup()
+
+
+class PyodideWorkerPool:
+    """Warm Deno/Pyodide workers for `core.script.run_python`.
+
+    Starting Deno and loading Pyodide takes seconds, so idle workers are kept
+    and reused instead of spawning a fresh process for every script. Workers are
+    keyed by workspace, network access and dependency set: workers are never
+    shared across workspaces, the Deno permissions are fixed when the process
+    starts, and a worker only loads its packages once.
+
+    Each script runs in a fresh global namespace, and the worker undoes the
+    script's changes to loaded modules, builtins, import state and the
+    filesystem afterwards (see `_WORKER_RESET_CODE`). Workers are replaced after
+    `max_runs` scripts and discarded whenever a script times out, leaves
+    changes that can't be undone, or the worker crashes.
+    """
+
+    def __init__(
+        self,
+        *,
+        maxsize: int = TRACECAT__PYTHON_SCRIPT_POOL_SIZE,
+        max_runs: int = TRACECAT__PYTHON_SCRIPT_WORKER_MAX_RUNS,
+        startup_timeout: float = TRACECAT__PYTHON_SCRIPT_WORKER_STARTUP_TIMEOUT,
+    ):
+        self.maxsize = maxsize
+        self.max_runs = max_runs
+        self.startup_timeout = startup_timeout
+        self._idle: deque[_PyodideWorker] = deque()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._idle)
+
+    async def run(
+        self,
+        script: str,
+        *,
+        dependencies: list[str] | None,
+        timeout_seconds: int,
+        allow_network: bool,
+        workspace_id: str | None = None,
+    ) -> PythonScriptOutput:
+        """Run a script on an idle worker, starting a new one if none match."""
+        deno_path = shutil.which("deno")
+        if not deno_path:
+            logger.error(
+                "Deno executable not found in PATH. Install Deno to run Python scripts."
+            )
+            raise PythonScriptExecutionError(
+                "Script execution failed: Python runtime not available."
+            )
+
+        key = (workspace_id, allow_network, tuple(sorted(set(dependencies or ()))))
+        if (worker := self._checkout(key)) is None:
+            worker = _PyodideWorker(
+                deno_path,
+                workspace_id=workspace_id,
+                dependencies=key[2],
+                allow_network=allow_network,
+            )
+            await worker.start(self.startup_timeout)
+        try:
+            return await worker.run(script, timeout_seconds)
+        finally:
+            self._checkin(worker)
+
+    def _checkout(
+        self, key: tuple[str | None, bool, tuple[str, ...]]
+    ) -> _PyodideWorker | None:
+        with self._lock:
+            # Prefer the most recently used worker
+            for worker in reversed(self._idle):
+                if worker.key == key:
+                    self._idle.remove(worker)
+                    return worker
+        return None
+
+    def _checkin(self, worker: _PyodideWorker) -> None:
+        if not worker.alive or not worker.reusable or worker.runs >= self.max_runs:
+            worker.kill()
+            return
+        evicted: list[_PyodideWorker] = []
+        with self._lock:
+            self._idle.append(worker)
+            # Evict least recently used workers if the pool is over capacity
+            while len(self._idle) > self.maxsize:
+                evicted.append(self._idle.popleft())
+        for idle_worker in evicted:
+            idle_worker.kill()
+
+    def close(self) -> None:
+        """Stop all idle workers."""
+        with self._lock:
+            workers = list(self._idle)
+            self._idle.clear()
+        for worker in workers:
+            worker.kill()
+
+
+pyodide_worker_pool = PyodideWorkerPool()
+atexit.register(pyodide_worker_pool.close)
@@ -4,7 +4,10 @@ from uuid import UUID
 
 from typing_extensions import Doc
 
-from tracecat.config import TRACECAT__MAX_ROWS_CLIENT_POSTGRES
+from tracecat.config import (
+    TRACECAT__MAX_LOOKUP_KEYS_CLIENT_POSTGRES,
+    TRACECAT__MAX_ROWS_CLIENT_POSTGRES,
+)
 from tracecat.tables.enums import SqlType
 from tracecat.tables.models import TableColumnCreate, TableCreate, TableRowInsert
 from tracecat.tables.service import TablesService
@@ -81,6 +84,56 @@ async def lookup_many(
     return rows
 
 
+@registry.register(
+    default_title="Batch lookup records",
+    description=(
+        "Get the records matching each of many values with a single query."
+        " Results are aligned with the values, with null for values without a match."
+    ),
+    display_group="Tables",
+    namespace="core.table",
+)
+async def batch_lookup(
+    table: Annotated[
+        str,
+        Doc("The table to lookup the values in."),
+    ],
+    column: Annotated[
+        str | list[str],
+        Doc(
+            "The column to lookup the values in."
+            " Pass a list of columns to match composite keys."
+        ),
+    ],
+    values: Annotated[
+        list[Any],
+        Doc(
+            "The values to lookup. For composite keys, each value is a list"
+            " with one item per column."
+        ),
+    ],
+) -> list[dict[str, Any] | None]:
+    if len(values) > TRACECAT__MAX_LOOKUP_KEYS_CLIENT_POSTGRES:
+        raise ValueError(
+            f"Cannot lookup more than {TRACECAT__MAX_LOOKUP_KEYS_CLIENT_POSTGRES} values"
+        )
+    if isinstance(column, str):
+        columns = [column]
+        keys = [[value] for value in values]
+    else:
+        columns = column
+        keys = values
+
+    async with TablesService.with_session() as service:
+        results = await service.batch_lookup_rows(
+            table_name=table,
+            columns=columns,
+            keys=keys,
+            limit=1,
+        )
+    return [rows[0] if rows else None for rows in results]
+
+
 @registry.register(
     default_title="Search records",
     description="Search for records in a table with optional filtering.",
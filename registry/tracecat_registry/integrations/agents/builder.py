@@ -5,7 +5,7 @@ import textwrap
 import tempfile
 from pathlib import Path
 import base64
-from typing import Any, Union, Annotated, Self
+from typing import Any, NamedTuple, Union, Annotated, Self
 from pydantic import BaseModel
 from pydantic_core import to_jsonable_python
 from tracecat_registry import RegistrySecretType
@@ -20,15 +20,21 @@ from pydantic_ai.usage import Usage
 from pydantic_ai.tools import Tool
 from pydantic_core import PydanticUndefined
 
+from tracecat import config
+from tracecat.cache import TTLCache
+from tracecat.contexts import ctx_registry_version
 from tracecat.dsl.common import create_default_execution_context
 from tracecat.executor.service import (
     _run_action_direct,
     get_action_secrets,
+    get_bound_action,
+    get_bound_actions,
     run_template_action,
     flatten_secrets,
 )
 from tracecat.expressions.expectations import create_expectation_model
 from tracecat.logger import logger
+from tracecat.registry.actions.models import BoundRegistryAction
 from tracecat.registry.actions.service import RegistryActionsService
 from tracecat.registry.fields import ActionType, TextArea
 from tracecat.secrets.secrets_manager import env_sandbox
@@ -38,7 +44,6 @@ from tracecat_registry.integrations.pydantic_ai import (
 )
 
 from tracecat_registry import registry
-from tracecat.types.exceptions import RegistryError
 from tracecat_registry.integrations.agents.exceptions import AgentRunError
 from tracecat_registry.integrations.agents.tools import (
     create_secure_file_tools,
@@ -136,12 +141,11 @@ def generate_google_style_docstring(
 
 
 async def call_tracecat_action(action_name: str, args: dict[str, Any]) -> Any:
-    async with RegistryActionsService.with_session() as service:
-        reg_action = await service.get_action(action_name)
-        action_secrets = await service.fetch_all_action_secrets(reg_action)
-        bound_action = service.get_bound(reg_action, mode="execution")
+    bound_action, action_secrets = await get_bound_action(
+        action_name, registry_version=ctx_registry_version.get()
+    )
 
-    secrets = await get_action_secrets(args=args, action_secrets=action_secrets)
+    secrets = await get_action_secrets(args=args, action_secrets=set(action_secrets))
 
     # Call action with secrets in environment
     context = create_default_execution_context()
@@ -278,13 +282,68 @@ def _generate_tool_function_name(namespace: str, name: str, *, sep: str = "__")
     return f"{namespace}{sep}{name}".replace(".", sep)
 
 
-async def create_tool_from_registry(
-    action_name: str, fixed_args: dict[str, Any] | None = None
+class _ToolSignature(NamedTuple):
+    """Generated tool metadata for a bound action."""
+
+    action: BoundRegistryAction
+    name: str
+    signature: inspect.Signature
+    annotations: dict[str, Any]
+    docstring: str
+
+
+tool_signature_cache: TTLCache[tuple[str, frozenset[str]], _ToolSignature] = TTLCache(
+    maxsize=config.TRACECAT__REGISTRY_ACTION_CACHE_SIZE,
+    ttl=config.TRACECAT__REGISTRY_ACTION_CACHE_TTL,
+)
+"""Generated tool signatures, keyed by (action name, fixed argument names).
+
+Entries are only reused for the same bound action object, so they follow the
+bound action cache, which is keyed by registry version.
+"""
+
+
+def _get_tool_signature(
+    action_name: str, bound_action: BoundRegistryAction, fixed_arg_names: set[str]
+) -> _ToolSignature:
+    key = (action_name, frozenset(fixed_arg_names))
+    cached = tool_signature_cache.get(key)
+    if cached is not None and cached.action is bound_action:
+        return cached
+
+    # Extract metadata from the bound action
+    description, model_cls = _extract_action_metadata(bound_action)
+
+    # Validate description
+    if not description:
+        raise ValueError(f"Action '{action_name}' has no description")
+
+    # Create function signature and annotations, excluding fixed args
+    signature, annotations = _create_function_signature(model_cls, fixed_arg_names)
+    tool_signature = _ToolSignature(
+        action=bound_action,
+        name=_generate_tool_function_name(bound_action.namespace, bound_action.name),
+        signature=signature,
+        annotations=annotations,
+        # Generate Google-style docstring, excluding fixed args
+        docstring=generate_google_style_docstring(
+            description, model_cls, fixed_arg_names
+        ),
+    )
+    tool_signature_cache.set(key, tool_signature)
+    return tool_signature
+
+
+def create_tool_from_bound_action(
+    action_name: str,
+    bound_action: BoundRegistryAction,
+    fixed_args: dict[str, Any] | None = None,
 ) -> Tool:
-    """Create a Pydantic AI Tool directly from the registry.
+    """Create a Pydantic AI Tool from a bound registry action.
 
     Args:
         action_name: Full action name (e.g., "core.http_request")
+        bound_action: The execution-mode bound action
         fixed_args: Fixed arguments to curry into the tool function
 
     Returns:
@@ -293,13 +352,10 @@ async def create_tool_from_registry(
     Raises:
         ValueError: If action has no description or template action is invalid
     """
-    # Load action from registry
-    async with RegistryActionsService.with_session() as service:
-        reg_action = await service.get_action(action_name)
-        bound_action = service.get_bound(reg_action, mode="execution")
-
     fixed_args = fixed_args or {}
-    fixed_arg_names = set(fixed_args.keys())
+    tool_signature = _get_tool_signature(
+        action_name, bound_action, set(fixed_args.keys())
+    )
 
     # Create wrapper function that calls the action with fixed args merged
     async def tool_func(**kwargs) -> Any:
@@ -307,32 +363,36 @@ async def create_tool_from_registry(
         merged_args = {**fixed_args, **kwargs}
         return await call_tracecat_action(action_name, merged_args)
 
-    # Set function name
-    tool_func.__name__ = _generate_tool_function_name(
-        bound_action.namespace, bound_action.name
+    tool_func.__name__ = tool_signature.name
+    tool_func.__signature__ = tool_signature.signature
+    tool_func.__annotations__ = dict(tool_signature.annotations)
+    tool_func.__doc__ = tool_signature.docstring
+
+    # Create tool with enforced documentation standards
+    return Tool(
+        tool_func, docstring_format="google", require_parameter_descriptions=True
     )
 
-    # Extract metadata from the bound action
-    description, model_cls = _extract_action_metadata(bound_action)
 
-    # Validate description
-    if not description:
-        raise ValueError(f"Action '{action_name}' has no description")
+async def create_tool_from_registry(
+    action_name: str, fixed_args: dict[str, Any] | None = None
+) -> Tool:
+    """Create a Pydantic AI Tool directly from the registry.
 
-    # Create function signature and annotations, excluding fixed args
-    signature, annotations = _create_function_signature(model_cls, fixed_arg_names)
-    tool_func.__signature__ = signature
-    tool_func.__annotations__ = annotations
+    Args:
+        action_name: Full action name (e.g., "core.http_request")
+        fixed_args: Fixed arguments to curry into the tool function
 
-    # Generate Google-style docstring, excluding fixed args
-    tool_func.__doc__ = generate_google_style_docstring(
-        description, model_cls, fixed_arg_names
-    )
+    Returns:
+        A configured Pydantic AI Tool
 
-    # Create tool with enforced documentation standards
-    return Tool(
-        tool_func, docstring_format="google", require_parameter_descriptions=True
+    Raises:
+        ValueError: If action has no description or template action is invalid
+    """
+    bound_action, _ = await get_bound_action(
+        action_name, registry_version=ctx_registry_version.get()
     )
+    return create_tool_from_bound_action(action_name, bound_action, fixed_args)
 
 
 class TracecatAgentBuilder:
@@ -390,52 +450,42 @@ class TracecatAgentBuilder:
     async def build(self) -> Agent:
         """Build the Pydantic AI agent with tools from the registry."""
 
-        # Get actions from registry
-        async with RegistryActionsService.with_session() as service:
-            if self.action_filters:
-                actions = await service.get_actions(self.action_filters)
-            else:
+        # Resolve action names from the registry
+        if self.action_filters:
+            action_names = list(dict.fromkeys(self.action_filters))
+        else:
+            async with RegistryActionsService.with_session() as service:
                 actions = await service.list_actions(include_marked=True)
+            action_names = [
+                f"{reg_action.namespace}.{reg_action.name}" for reg_action in actions
+            ]
+
+        # Apply namespace filtering if specified
+        if self.namespace_filters:
+            action_names = [
+                action_name
+                for action_name in action_names
+                if any(action_name.startswith(ns) for ns in self.namespace_filters)
+            ]
+
+        # Bind all actions and resolve their secrets in one pass
+        bound_actions = await get_bound_actions(
+            action_names, registry_version=ctx_registry_version.get()
+        )
 
         # Collect failed action names
         failed_actions: list[str] = []
 
         # Create tools from registry actions
-        for reg_action in actions:
-            action_name = f"{reg_action.namespace}.{reg_action.name}"
-
-            # Apply namespace filtering if specified
-            if self.namespace_filters:
-                if not any(action_name.startswith(ns) for ns in self.namespace_filters):
-                    continue
-
-            try:
-                # Fetch all secrets for this action
-                async with RegistryActionsService.with_session() as service:
-                    action_secrets = await service.fetch_all_action_secrets(reg_action)
-                    self.collected_secrets.update(action_secrets)
-
-                # Determine if we should pass fixed arguments to the helper
-                has_any_fixed_args = bool(self.fixed_arguments)
-                action_fixed_args = self.fixed_arguments.get(action_name)
-
-                if has_any_fixed_args:
-                    # If some fixed arguments were supplied when constructing the builder,
-                    # we always include the second parameter – pass an empty dict when the
-                    # current action does not have any overrides so that callers may rely on
-                    # the two-argument form when the feature is in use.
-                    action_fixed_args = action_fixed_args or {}
-                    tool = await create_tool_from_registry(
-                        action_name, action_fixed_args
-                    )
-                else:
-                    # No fixed arguments functionality requested – keep the original
-                    # single-parameter call signature expected by existing tests.
-                    tool = await create_tool_from_registry(action_name)
-
-                self.tools.append(tool)
-            except RegistryError:
+        for action_name in action_names:
+            if (bound := bound_actions.get(action_name)) is None:
                 failed_actions.append(action_name)
+                continue
+            self.collected_secrets.update(bound.secrets)
+            tool = create_tool_from_bound_action(
+                action_name, bound.action, self.fixed_arguments.get(action_name, {})
+            )
+            self.tools.append(tool)
 
         # If there were failures, raise simple error
         if failed_actions:
@@ -490,18 +540,19 @@ async def collect_secrets_for_filters(
         else:
             actions = await service.list_actions(include_marked=True)
 
-    for reg_action in actions:
-        action_name = f"{reg_action.namespace}.{reg_action.name}"
-
         # Apply namespace filtering if specified
         if namespace_filters:
-            if not any(action_name.startswith(ns) for ns in namespace_filters):
-                continue
+            actions = [
+                reg_action
+                for reg_action in actions
+                if any(reg_action.action.startswith(ns) for ns in namespace_filters)
+            ]
+
+        # Fetch all secrets for these actions
+        all_secrets = await service.fetch_all_actions_secrets(actions)
 
-        # Fetch all secrets for this action
-        async with RegistryActionsService.with_session() as service:
-            action_secrets = await service.fetch_all_action_secrets(reg_action)
-            collected_secrets.update(action_secrets)
+    for action_secrets in all_secrets.values():
+        collected_secrets.update(action_secrets)
 
     return collected_secrets
 
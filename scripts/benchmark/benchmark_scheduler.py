@@ -0,0 +1,515 @@
+#!/usr/bin/env python3
+"""Benchmark DSLScheduler on synthetic workflows with a fake executor.
+
+Drives the scheduler directly, without Temporal or an executor, so results
+only reflect scheduling and control flow overhead.
+
+Usage:
+    python scripts/benchmark/benchmark_scheduler.py
+    python scripts/benchmark/benchmark_scheduler.py --output results.json
+    python scripts/benchmark/benchmark_scheduler.py --compare results.json
+    python scripts/benchmark/benchmark_scheduler.py --scenario scatter_gather --size 10000
+
+Each scenario is run `--repeat` times to measure throughput, once with the
+scheduler phases instrumented, and once under tracemalloc for peak memory.
+Phase timings only count the time a call spends running, not the time it
+spends suspended while other tasks run.
+Results are written as JSON tagged with the git commit, so runs on different
+commits can be compared with `--compare`.
+"""
+
+import argparse
+import asyncio
+import functools
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from collections.abc import Callable, Coroutine
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from temporalio.exceptions import ApplicationError
+
+from tracecat.contexts import ctx_stream_id
+from tracecat.dsl.common import DSLInput
+from tracecat.dsl.enums import JoinStrategy
+from tracecat.dsl.models import (
+    ROOT_STREAM,
+    ActionStatement,
+    ExecutionContext,
+    TaskResult,
+)
+from tracecat.dsl.scheduler import DSLScheduler
+from tracecat.expressions.common import ExprContext
+from tracecat.expressions.eval import eval_templated_object
+from tracecat.logger import logger
+
+PHASES = ("_queue_tasks", "_is_reachable", "_handle_scatter")
+"""Scheduler methods that are timed in the instrumented run."""
+
+
+# Synthetic workflows
+# -------------------
+
+
+@dataclass
+class Scenario:
+    name: str
+    dsl: DSLInput
+    trigger: dict[str, Any] = field(default_factory=dict)
+    failing: Callable[[str, Any], bool] = lambda ref, item: False
+    """Whether the fake executor fails a task, given its ref and scatter item."""
+
+
+def action(ref: str, depends_on: list[str] | None = None, **kwargs: Any) -> dict:
+    return {
+        "ref": ref,
+        "action": "core.transform.reshape",
+        "args": {"value": ref},
+        "depends_on": depends_on or [],
+        **kwargs,
+    }
+
+
+def build(name: str, actions: list[dict], **kwargs: Any) -> Scenario:
+    dsl = DSLInput(
+        title=name,
+        description=f"Synthetic {name} workflow",
+        entrypoint={"ref": actions[0]["ref"]},
+        actions=actions,
+    )
+    return Scenario(name=name, dsl=dsl, **kwargs)
+
+
+def fan_out(size: int) -> Scenario:
+    """One root with `size` children, joined by a single task."""
+    children = [action(f"child_{i}", ["root"]) for i in range(size)]
+    join = action("join", [c["ref"] for c in children], join_strategy="all")
+    return build("fan_out", [action("root"), *children, join])
+
+
+def chain(size: int) -> Scenario:
+    """A single chain of `size` tasks."""
+    actions = [action("step_0")]
+    actions += [action(f"step_{i}", [f"step_{i - 1}"]) for i in range(1, size)]
+    return build("chain", actions)
+
+
+def diamonds(size: int, join_strategy: JoinStrategy) -> Scenario:
+    """A chain of `size` diamonds.
+
+    With `JoinStrategy.ANY` the left branch of every diamond is skipped, so
+    skips have to be resolved at each join.
+    """
+    run_if = "${{ False }}" if join_strategy == JoinStrategy.ANY else None
+    actions = [action("top_0")]
+    for i in range(size):
+        top = f"top_{i}"
+        actions += [
+            action(f"left_{i}", [top], run_if=run_if),
+            action(f"right_{i}", [top]),
+            action(
+                f"top_{i + 1}",
+                [f"left_{i}", f"right_{i}"],
+                join_strategy=join_strategy.value,
+            ),
+        ]
+    return build(f"diamonds_{join_strategy.value}", actions)
+
+
+def scatter_gather(size: int) -> Scenario:
+    """Scatter `size` items, run two tasks per item and gather the results."""
+    actions = [
+        action("start"),
+        {
+            "ref": "scatter",
+            "action": "core.transform.scatter",
+            "args": {"collection": "${{ TRIGGER.items }}"},
+            "depends_on": ["start"],
+        },
+        action("process", ["scatter"]),
+        action("enrich", ["process"]),
+        {
+            "ref": "gather",
+            "action": "core.transform.gather",
+            "args": {"items": "${{ ACTIONS.enrich.result }}"},
+            "depends_on": ["enrich"],
+        },
+        action("report", ["gather"]),
+    ]
+    return build("scatter_gather", actions, trigger={"items": list(range(size))})
+
+
+def nested_scatter_gather(size: int) -> Scenario:
+    """Scatter batches of items, then scatter the items of each batch."""
+    n_outer = max(int(size**0.5), 1)
+    batches = [list(range(i, size, n_outer)) for i in range(n_outer)]
+    actions = [
+        action("start"),
+        {
+            "ref": "scatter_batches",
+            "action": "core.transform.scatter",
+            "args": {"collection": "${{ TRIGGER.batches }}"},
+            "depends_on": ["start"],
+        },
+        {
+            "ref": "scatter_items",
+            "action": "core.transform.scatter",
+            "args": {"collection": "${{ ACTIONS.scatter_batches.result }}"},
+            "depends_on": ["scatter_batches"],
+        },
+        action("process", ["scatter_items"]),
+        {
+            "ref": "gather_items",
+            "action": "core.transform.gather",
+            "args": {"items": "${{ ACTIONS.process.result }}"},
+            "depends_on": ["process"],
+        },
+        {
+            "ref": "gather_batches",
+            "action": "core.transform.gather",
+            "args": {"items": "${{ ACTIONS.gather_items.result }}"},
+            "depends_on": ["gather_items"],
+        },
+        action("report", ["gather_batches"]),
+    ]
+    return build("nested_scatter_gather", actions, trigger={"batches": batches})
+
+
+def error_paths(size: int) -> Scenario:
+    """Failing tasks with error handlers, and a scatter where every 10th item fails."""
+    actions = [action("start")]
+    prev = "start"
+    for i in range(size // 10):
+        actions += [
+            action(f"flaky_{i}", [prev]),
+            action(f"on_success_{i}", [f"flaky_{i}"]),
+            action(f"on_error_{i}", [f"flaky_{i}.error"]),
+        ]
+        prev = f"on_error_{i}"
+    actions += [
+        {
+            "ref": "scatter",
+            "action": "core.transform.scatter",
+            "args": {"collection": "${{ TRIGGER.items }}"},
+            "depends_on": [prev],
+        },
+        action("process", ["scatter"]),
+        {
+            "ref": "gather",
+            "action": "core.transform.gather",
+            "args": {"items": "${{ ACTIONS.process.result }}"},
+            "depends_on": ["process"],
+        },
+    ]
+
+    def failing(ref: str, item: Any) -> bool:
+        return ref.startswith("flaky_") or (ref == "process" and item % 10 == 0)
+
+    return build(
+        "error_paths", actions, trigger={"items": list(range(size))}, failing=failing
+    )
+
+
+SCENARIOS: dict[str, Callable[[int], Scenario]] = {
+    "fan_out": fan_out,
+    "chain": chain,
+    "diamonds_any": functools.partial(diamonds, join_strategy=JoinStrategy.ANY),
+    "diamonds_all": functools.partial(diamonds, join_strategy=JoinStrategy.ALL),
+    "scatter_gather": scatter_gather,
+    "nested_scatter_gather": nested_scatter_gather,
+    "error_paths": error_paths,
+}
+
+DEFAULT_SIZES = {
+    "fan_out": 2000,
+    "chain": 2000,
+    "diamonds_any": 500,
+    "diamonds_all": 500,
+    "scatter_gather": 10000,
+    "nested_scatter_gather": 10000,
+    "error_paths": 2000,
+}
+
+
+# Scheduler harness
+# -----------------
+
+
+class BenchmarkScheduler(DSLScheduler):
+    """DSLScheduler that evaluates expressions in-process instead of in an activity."""
+
+    async def resolve_expression(
+        self, expression: str, context: ExecutionContext
+    ) -> Any:
+        return eval_templated_object(expression, operand=context)
+
+
+def make_executor(scenario: Scenario, get_scheduler: Callable[[], DSLScheduler]):
+    async def executor(stmt: ActionStatement) -> None:
+        scheduler = get_scheduler()
+        stream_id = ctx_stream_id.get()
+        context = scheduler.get_context(stream_id)
+        # Tasks in an execution stream see the scatter item as the scatter result
+        item = None
+        if stream_id != ROOT_STREAM:
+            scatter_ref, _ = stream_id.leaf
+            item = scheduler.get_stream_aware_action_result(scatter_ref, stream_id)[
+                "result"
+            ]
+        if scenario.failing(stmt.ref, item):
+            raise ApplicationError(
+                f"Synthetic failure in {stmt.ref}",
+                {"ref": stmt.ref, "message": "Synthetic failure", "type": "Error"},
+                non_retryable=True,
+            )
+        context[ExprContext.ACTIONS][stmt.ref] = TaskResult(
+            result=item, result_typename=type(item).__name__
+        )
+
+    return executor
+
+
+class _TimedCoroutine:
+    """Await a coroutine, recording only the time it spends running.
+
+    Time spent suspended (e.g. while other tasks run) is excluded, so nested
+    and concurrent calls don't inflate each other's timings.
+    """
+
+    def __init__(self, coro: Coroutine[Any, Any, Any], record: Callable[[float], None]):
+        self.coro = coro
+        self.record = record
+
+    def __await__(self):
+        elapsed = 0.0
+        value: Any = None
+        exc: BaseException | None = None
+        try:
+            while True:
+                start = time.perf_counter()
+                try:
+                    if exc is None:
+                        signal = self.coro.send(value)
+                    else:
+                        signal = self.coro.throw(exc)
+                except StopIteration as e:
+                    return e.value
+                finally:
+                    elapsed += time.perf_counter() - start
+                try:
+                    value, exc = (yield signal), None
+                except BaseException as e:
+                    value, exc = None, e
+        finally:
+            self.record(elapsed)
+
+
+def instrument(scheduler: DSLScheduler, timings: dict[str, list[float]]) -> None:
+    """Wrap the scheduler phases to record the time spent in every call."""
+    for name in PHASES:
+        method = getattr(scheduler, name)
+        record = timings[name].append
+        if asyncio.iscoroutinefunction(method):
+
+            async def timed_async(*args, __method=method, __record=record, **kwargs):
+                return await _TimedCoroutine(__method(*args, **kwargs), __record)
+
+            setattr(scheduler, name, timed_async)
+        else:
+
+            def timed(*args, __method=method, __record=record, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return __method(*args, **kwargs)
+                finally:
+                    __record(time.perf_counter() - start)
+
+            setattr(scheduler, name, timed)
+
+
+async def run_once(
+    scenario: Scenario, timings: dict[str, list[float]] | None = None
+) -> tuple[float, int]:
+    """Run the scenario to completion. Returns the elapsed time and tasks run."""
+    context: ExecutionContext = {
+        ExprContext.ACTIONS: {},
+        ExprContext.TRIGGER: scenario.trigger,
+    }
+    scheduler: DSLScheduler | None = None
+    scheduler = BenchmarkScheduler(
+        executor=make_executor(scenario, lambda: scheduler),  # type: ignore[arg-type]
+        dsl=scenario.dsl,
+        context=context,
+    )
+    if timings is not None:
+        instrument(scheduler, timings)
+    start = time.perf_counter()
+    exceptions = await scheduler.start()
+    elapsed = time.perf_counter() - start
+    if exceptions:
+        raise RuntimeError(f"Scenario {scenario.name} failed: {list(exceptions)}")
+    # Older schedulers kept a set of completed tasks instead of a count
+    n_completed = getattr(scheduler, "n_completed_tasks", None)
+    if n_completed is None:
+        n_completed = len(scheduler.completed_tasks)  # type: ignore[attr-defined]
+    return elapsed, n_completed
+
+
+@dataclass
+class PhaseResult:
+    calls: int
+    total_ms: float
+    mean_us: float
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    size: int
+    n_actions: int
+    n_tasks: int
+    tasks_per_sec: float
+    median_ms: float
+    min_ms: float
+    peak_memory_mb: float
+    phases: dict[str, PhaseResult]
+
+
+def benchmark(scenario: Scenario, size: int, repeat: int) -> ScenarioResult:
+    durations = []
+    n_tasks = 0
+    for _ in range(repeat):
+        gc.collect()
+        elapsed, n_tasks = asyncio.run(run_once(scenario))
+        durations.append(elapsed)
+
+    timings: dict[str, list[float]] = defaultdict(list)
+    asyncio.run(run_once(scenario, timings))
+
+    gc.collect()
+    tracemalloc.start()
+    asyncio.run(run_once(scenario))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    median = statistics.median(durations)
+    return ScenarioResult(
+        name=scenario.name,
+        size=size,
+        n_actions=len(scenario.dsl.actions),
+        n_tasks=n_tasks,
+        tasks_per_sec=n_tasks / median,
+        median_ms=median * 1000,
+        min_ms=min(durations) * 1000,
+        peak_memory_mb=peak / 1024 / 1024,
+        phases={
+            name: PhaseResult(
+                calls=len(timings[name]),
+                total_ms=sum(timings[name]) * 1000,
+                mean_us=statistics.mean(timings[name]) * 1e6 if timings[name] else 0,
+            )
+            for name in PHASES
+        },
+    )
+
+
+# Reporting
+# ---------
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            text=True,
+            stderr=subprocess.DEVNULL,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_results(
+    results: list[ScenarioResult], baseline: dict[str, dict[str, Any]] | None
+) -> None:
+    def fmt(value: float, spec: str, before: float | None) -> str:
+        text = format(value, spec)
+        if before:
+            text += f" ({(value - before) / before:+.1%})"
+        return text
+
+    def get_baseline(name: str, *keys: str) -> float | None:
+        value: Any = (baseline or {}).get(name)
+        for key in keys:
+            value = value.get(key) if isinstance(value, dict) else None
+        return value
+
+    print(
+        f"{'Scenario':<24}{'Size':>8}{'Tasks':>9}"
+        f"{'Tasks/s':>22}{'Median ms':>24}{'Peak MB':>20}"
+    )
+    print("-" * 107)
+    for r in results:
+        tps = fmt(r.tasks_per_sec, ",.0f", get_baseline(r.name, "tasks_per_sec"))
+        median = fmt(r.median_ms, ",.1f", get_baseline(r.name, "median_ms"))
+        peak = fmt(r.peak_memory_mb, ",.1f", get_baseline(r.name, "peak_memory_mb"))
+        print(f"{r.name:<24}{r.size:>8}{r.n_tasks:>9}{tps:>22}{median:>24}{peak:>20}")
+    print()
+    print(f"{'Scenario':<24}{'Phase':<18}{'Calls':>9}{'Total ms':>24}{'Mean us':>12}")
+    print("-" * 87)
+    for r in results:
+        for phase, p in r.phases.items():
+            total = fmt(
+                p.total_ms, ",.1f", get_baseline(r.name, "phases", phase, "total_ms")
+            )
+            print(f"{r.name:<24}{phase:<18}{p.calls:>9}{total:>24}{p.mean_us:>12,.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--scenario", choices=list(SCENARIOS), action="append", dest="scenarios"
+    )
+    parser.add_argument("--size", type=int, help="Override the size of each scenario")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    parser.add_argument("--compare", type=Path, help="JSON results to compare with")
+    args = parser.parse_args()
+
+    # Logging would dominate the measurements
+    logger.remove()
+
+    results = []
+    for name in args.scenarios or list(SCENARIOS):
+        size = args.size or DEFAULT_SIZES[name]
+        print(f"Running {name} (size={size})...", file=sys.stderr)
+        results.append(benchmark(SCENARIOS[name](size), size, args.repeat))
+
+    baseline = None
+    if args.compare:
+        report = json.loads(args.compare.read_text())
+        print(f"Comparing with {report['revision']} ({args.compare})\n")
+        baseline = {r["name"]: r for r in report["results"]}
+    print_results(results, baseline)
+
+    if args.output:
+        report = {
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "repeat": args.repeat,
+            "results": [asdict(r) for r in results],
+        }
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"\nWrote results to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.12"
+# dependencies = [
+#     "tracecat",
+# ]
+# [tool.uv.sources]
+# tracecat = { path = "../" }
+# ///
+"""
+Train a zstd dictionary for workflow payload compression
+
+This script samples payloads from recent Temporal workflow histories and trains a
+zstd dictionary on them. Each dictionary is written as `<version>.zdict`, using
+the next version after the highest one already in the output directory.
+
+Point `TRACECAT__CONTEXT_COMPRESSION_DICT_DIR` at the output directory to compress
+new payloads with the latest version. Keep older versions in the directory, so
+payloads that were compressed with them can still be decompressed.
+
+Usage:
+    uv run train_zstd_dictionary.py --output-dir dictionaries/ --workflows 500
+"""
+
+import argparse
+import asyncio
+import random
+from pathlib import Path
+
+import zstandard
+from temporalio.api.common.v1 import Payload
+from temporalio.client import Client
+
+from tracecat.dsl.compression import (
+    ZSTD_DICT_SUFFIX,
+    ZSTD_LEVEL,
+    CompressionPayloadCodec,
+    load_zstd_dictionaries,
+)
+
+
+def iter_event_payloads(event) -> list[Payload]:
+    """Get the inputs and results recorded in a history event."""
+    for field in (
+        "workflow_execution_started_event_attributes",
+        "activity_task_scheduled_event_attributes",
+        "activity_task_completed_event_attributes",
+        "workflow_execution_completed_event_attributes",
+    ):
+        if event.HasField(field):
+            attrs = getattr(event, field)
+            container = attrs.result if hasattr(attrs, "result") else attrs.input
+            return list(container.payloads)
+    return []
+
+
+async def sample_payloads(
+    client: Client,
+    *,
+    query: str | None,
+    n_workflows: int,
+    min_size: int,
+    max_samples: int,
+) -> list[bytes]:
+    """Collect uncompressed payload data from recent workflow histories."""
+    # Existing histories may already be compressed, with or without a dictionary
+    codec = CompressionPayloadCodec(enabled=True)
+    samples: list[bytes] = []
+    n_seen = 0
+    async for execution in client.list_workflows(query=query, limit=n_workflows):
+        handle = client.get_workflow_handle(execution.id, run_id=execution.run_id)
+        history = await handle.fetch_history()
+        for event in history.events:
+            for payload in await codec.decode(iter_event_payloads(event)):
+                if len(payload.data) >= min_size:
+                    samples.append(payload.data)
+        n_seen += 1
+    print(f"Sampled {len(samples)} payloads from {n_seen} workflows")
+    random.shuffle(samples)
+    return samples[:max_samples]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--output-dir", type=Path, required=True)
+    parser.add_argument("--address", default="localhost:7233")
+    parser.add_argument("--namespace", default="default")
+    parser.add_argument("--query", help="Temporal visibility query")
+    parser.add_argument("--workflows", type=int, default=200)
+    parser.add_argument("--dict-size", type=int, default=112640)
+    parser.add_argument("--min-size", type=int, default=256)
+    parser.add_argument("--max-samples", type=int, default=10000)
+    args = parser.parse_args()
+
+    client = await Client.connect(args.address, namespace=args.namespace)
+    samples = await sample_payloads(
+        client,
+        query=args.query,
+        n_workflows=args.workflows,
+        min_size=args.min_size,
+        max_samples=args.max_samples,
+    )
+    if not samples:
+        raise SystemExit("No payloads found to train on")
+
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    version = max(load_zstd_dictionaries(args.output_dir), default=0) + 1
+    dictionary = zstandard.train_dictionary(
+        args.dict_size, samples, dict_id=version, level=ZSTD_LEVEL
+    )
+
+    # Report the gain over plain zstd on the training samples
+    plain = zstandard.ZstdCompressor(level=ZSTD_LEVEL)
+    trained = zstandard.ZstdCompressor(level=ZSTD_LEVEL, dict_data=dictionary)
+    original_size = sum(map(len, samples))
+    plain_size = sum(len(plain.compress(s)) for s in samples)
+    trained_size = sum(len(trained.compress(s)) for s in samples)
+    print(f"Plain zstd ratio: {original_size / plain_size:.2f}x")
+    print(f"Dictionary ratio: {original_size / trained_size:.2f}x")
+
+    path = args.output_dir / f"{version}{ZSTD_DICT_SUFFIX}"
+    path.write_bytes(dictionary.as_bytes())
+    print(f"Wrote dictionary version {version} to {path}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
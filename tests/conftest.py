@@ -69,6 +69,29 @@ def monkeysession(request: pytest.FixtureRequest):
     mpatch.undo()
 
 
+@pytest.fixture(autouse=True, scope="function")
+def clear_registry_action_cache():
+    """Prevent bound actions cached by one test from leaking into the next."""
+    from tracecat.registry.actions.service import bound_action_cache
+
+    bound_action_cache.clear()
+    yield
+    bound_action_cache.clear()
+
+
+@pytest.fixture(autouse=True, scope="function")
+def clear_secrets_cache():
+    """Prevent secrets and OAuth tokens cached by one test from leaking into the next."""
+    from tracecat.integrations.service import access_token_cache
+    from tracecat.secrets.service import secrets_cache
+
+    secrets_cache.clear()
+    access_token_cache.clear()
+    yield
+    secrets_cache.clear()
+    access_token_cache.clear()
+
+
 @pytest.fixture(autouse=True, scope="function")
 async def test_db_engine():
     """Create a new engine for each integration test."""
@@ -112,6 +135,8 @@ def db() -> Iterator[None]:
         test_engine = create_engine(TEST_DB_CONFIG.test_url_sync)
         with test_engine.begin() as conn:
             logger.info("Creating all tables")
+            # Required by the trigram search indexes
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
             SQLModel.metadata.create_all(conn)
         yield
     finally:
@@ -1,5 +1,6 @@
 """Tests for HTTP actions."""
 
+import asyncio
 import base64
 
 import httpx
@@ -8,6 +9,8 @@ import respx
 from tenacity import RetryError
 from tracecat_registry.core.http import (
     FileUploadData,
+    HTTPClientPool,
+    http_client_pool,
     http_poll,
     http_request,
     httpx_to_response,
@@ -860,3 +863,100 @@ async def test_http_request_file_upload_aggregate_size_exceeded() -> None:
     pytest.skip(
         "Cannot test aggregate size limit with current config: individual limit (20MB) * max files (5) = 100MB which equals aggregate limit (100MB). Need individual limit > 20MB or aggregate limit < 100MB to test this scenario."
     )
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_http_request_reuses_pooled_client() -> None:
+    """Test that requests with the same connection settings share a client."""
+    respx.get("https://api.example.com").mock(
+        return_value=httpx.Response(
+            status_code=200,
+            json={"message": "success"},
+            headers={"Set-Cookie": "session=abc"},
+        )
+    )
+    await http_client_pool.aclose()
+
+    for _ in range(3):
+        await http_request(url="https://api.example.com", method="GET")
+    assert len(http_client_pool) == 1
+
+    # Per-request options don't need a new client
+    await http_request(
+        url="https://api.example.com",
+        method="GET",
+        auth={"username": "user", "password": "pass"},
+        timeout=5.0,
+        follow_redirects=True,
+    )
+    assert len(http_client_pool) == 1
+
+    # Connection settings do
+    await http_request(url="https://api.example.com", method="GET", verify_ssl=False)
+    assert len(http_client_pool) == 2
+
+    # Cookies don't outlive the request that received them
+    async with http_client_pool.client() as client:
+        assert not client.cookies
+    await http_client_pool.aclose()
+    assert len(http_client_pool) == 0
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_http_request_keeps_cookies_across_redirects() -> None:
+    """Test that cookies set during a redirect chain are sent on the next hop."""
+    respx.get("https://api.example.com/login").mock(
+        return_value=httpx.Response(
+            status_code=302,
+            headers={
+                "Location": "https://api.example.com/home",
+                "Set-Cookie": "session=abc; Path=/",
+            },
+        )
+    )
+    home = respx.get("https://api.example.com/home").mock(
+        return_value=httpx.Response(status_code=200, json={"message": "success"})
+    )
+
+    await http_request(
+        url="https://api.example.com/login", method="GET", follow_redirects=True
+    )
+    assert home.calls.last.request.headers["Cookie"] == "session=abc"
+    await http_client_pool.aclose()
+
+
+@pytest.mark.anyio
+async def test_http_client_pool_evicts_idle_clients() -> None:
+    pool = HTTPClientPool(maxsize=1, idle_timeout=60)
+
+    async with pool.client(verify=True) as client:
+        # Clients in use are never shared or evicted
+        async with pool.client(verify=True) as other:
+            assert other is not client
+        assert len(pool) == 1
+    # Over capacity, the least recently used idle client is closed
+    assert len(pool) == 1
+    assert other.is_closed
+    async with pool.client(verify=True) as reused:
+        assert reused is client
+
+    pool.idle_timeout = 0
+    async with pool.client(verify=False):
+        pass
+    assert client.is_closed
+    await pool.aclose()
+
+
+def test_http_client_pool_is_closed_with_its_event_loop() -> None:
+    pool = HTTPClientPool()
+
+    async def borrow() -> httpx.AsyncClient:
+        async with pool.client() as client:
+            return client
+
+    first = asyncio.run(borrow())
+    assert first.is_closed
+    assert pool._loops == {}
+    assert asyncio.run(borrow()) is not first
@@ -1,10 +1,15 @@
 import os
 import shutil
+import subprocess
+import sys
+import textwrap
 from unittest.mock import patch
 
 import pytest
 
 from registry.tracecat_registry.core.python import (
+    _WORKER_RESET_CODE,
+    PyodideWorkerPool,
     PythonScriptExecutionError,
     PythonScriptTimeoutError,
     PythonScriptValidationError,
@@ -891,3 +896,143 @@ Note: Some tests require network access for downloading Pyodide.
 # Print installation instructions if Deno is not available
 if not DENO_AVAILABLE and __name__ == "__main__":
     print_deno_installation_instructions()
+
+
+class TestPyodideWorkerPool:
+    """Test suite for the persistent Deno/Pyodide worker pool."""
+
+    @pytest.mark.anyio
+    async def test_workers_are_reused_with_fresh_globals(self):
+        """Test that a warm worker is reused and globals don't leak between runs."""
+        pool = PyodideWorkerPool(maxsize=2, max_runs=10)
+        try:
+            first = await pool.run(
+                "leaked = 'secret'\nleaked",
+                dependencies=None,
+                timeout_seconds=30,
+                allow_network=False,
+            )
+            assert first["output"] == "secret"
+            assert len(pool) == 1
+
+            second = await pool.run(
+                "'leaked' in globals()",
+                dependencies=None,
+                timeout_seconds=30,
+                allow_network=False,
+            )
+            assert second["output"] is False
+            assert len(pool) == 1
+        finally:
+            pool.close()
+
+    @pytest.mark.anyio
+    async def test_workers_are_recycled_after_max_runs(self):
+        """Test that a worker is discarded once it has run max_runs scripts."""
+        pool = PyodideWorkerPool(maxsize=2, max_runs=1)
+        try:
+            result = await pool.run(
+                "1 + 1", dependencies=None, timeout_seconds=30, allow_network=False
+            )
+            assert result["output"] == 2
+            assert len(pool) == 0
+        finally:
+            pool.close()
+
+    @pytest.mark.anyio
+    async def test_timed_out_worker_is_discarded(self):
+        """Test that a worker running past its timeout is killed, not reused."""
+        pool = PyodideWorkerPool(maxsize=2, max_runs=10)
+        try:
+            with pytest.raises(PythonScriptTimeoutError):
+                await pool.run(
+                    "while True:\n    pass",
+                    dependencies=None,
+                    timeout_seconds=2,
+                    allow_network=False,
+                )
+            assert len(pool) == 0
+
+            result = await pool.run(
+                "'ok'", dependencies=None, timeout_seconds=30, allow_network=False
+            )
+            assert result["output"] == "ok"
+        finally:
+            pool.close()
+
+    @pytest.mark.anyio
+    async def test_module_changes_are_undone_between_runs(self):
+        """Test that changes to loaded modules don't leak into the next script."""
+        pool = PyodideWorkerPool(maxsize=2, max_runs=10)
+        try:
+            await pool.run(
+                "import json\njson.dumps = lambda *a, **k: 'patched'",
+                dependencies=None,
+                timeout_seconds=30,
+                allow_network=False,
+            )
+            result = await pool.run(
+                "import json\njson.dumps([1])",
+                dependencies=None,
+                timeout_seconds=30,
+                allow_network=False,
+            )
+            assert result["output"] == "[1]"
+            assert len(pool) == 1
+        finally:
+            pool.close()
+
+    @pytest.mark.anyio
+    async def test_workers_are_not_shared_across_workspaces(self):
+        """Test that each workspace gets its own worker."""
+        pool = PyodideWorkerPool(maxsize=2, max_runs=10)
+        try:
+            for workspace_id in ("ws-1", "ws-2"):
+                await pool.run(
+                    "1",
+                    dependencies=None,
+                    timeout_seconds=30,
+                    allow_network=False,
+                    workspace_id=workspace_id,
+                )
+            assert len(pool) == 2
+        finally:
+            pool.close()
+
+
+def test_worker_reset_code(tmp_path):
+    """Test the worker reset code under CPython, in a separate interpreter."""
+    (tmp_path / "kept.txt").write_text("original")
+    # Run in a function: the reset restores the globals of __main__
+    check = textwrap.dedent(
+        f"""
+        def check():
+            import json, os, sys
+            reset = _make_reset([{str(tmp_path)!r}])
+
+            json.dumps = None
+            os.environ["TRACECAT_TEST_LEAK"] = "1"
+            sys.modules["leaked_module"] = type(sys)("leaked_module")
+            os.makedirs(os.path.join({str(tmp_path)!r}, "new", "nested"))
+            open(os.path.join({str(tmp_path)!r}, "new", "nested", "f.txt"), "w").close()
+            assert reset() is True
+
+            assert json.dumps([1]) == "[1]"
+            assert "TRACECAT_TEST_LEAK" not in os.environ
+            assert "leaked_module" not in sys.modules
+            assert os.listdir({str(tmp_path)!r}) == ["kept.txt"]
+
+            with open(os.path.join({str(tmp_path)!r}, "kept.txt"), "a") as f:
+                f.write("changed")
+            assert reset() is False
+
+        check()
+        """
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", _WORKER_RESET_CODE + check],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert proc.returncode == 0, proc.stderr
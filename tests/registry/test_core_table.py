@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from tracecat_registry.core.table import (
+    batch_lookup,
     create_table,
     delete_row,
     insert_row,
@@ -102,6 +103,69 @@ class TestCoreLookup:
         assert result is None
 
 
+@pytest.mark.anyio
+class TestCoreBatchLookup:
+    """Test cases for the batch_lookup UDF."""
+
+    @patch("tracecat_registry.core.table.TablesService.with_session")
+    async def test_batch_lookup_success(self, mock_with_session, mock_row):
+        """Test that results are aligned with the values, with None for misses."""
+        mock_service = AsyncMock()
+        mock_service.batch_lookup_rows.return_value = [[mock_row], [], [mock_row]]
+
+        mock_ctx = AsyncMock()
+        mock_ctx.__aenter__.return_value = mock_service
+        mock_with_session.return_value = mock_ctx
+
+        result = await batch_lookup(
+            table="test_table",
+            column="name",
+            values=["John Doe", "Nobody", "John Doe"],
+        )
+
+        mock_service.batch_lookup_rows.assert_called_once_with(
+            table_name="test_table",
+            columns=["name"],
+            keys=[["John Doe"], ["Nobody"], ["John Doe"]],
+            limit=1,
+        )
+        assert result == [mock_row, None, mock_row]
+
+    @patch("tracecat_registry.core.table.TablesService.with_session")
+    async def test_batch_lookup_composite_key(self, mock_with_session, mock_row):
+        """Test batch lookup with a composite key."""
+        mock_service = AsyncMock()
+        mock_service.batch_lookup_rows.return_value = [[], [mock_row]]
+
+        mock_ctx = AsyncMock()
+        mock_ctx.__aenter__.return_value = mock_service
+        mock_with_session.return_value = mock_ctx
+
+        result = await batch_lookup(
+            table="test_table",
+            column=["name", "age"],
+            values=[["John Doe", 31], ["John Doe", 30]],
+        )
+
+        call_kwargs = mock_service.batch_lookup_rows.call_args.kwargs
+        assert call_kwargs["columns"] == ["name", "age"]
+        assert call_kwargs["keys"] == [["John Doe", 31], ["John Doe", 30]]
+        assert result == [None, mock_row]
+
+    @patch("tracecat_registry.core.table.TablesService.with_session")
+    async def test_batch_lookup_too_many_values(self, mock_with_session):
+        """Test that batch_lookup rejects more values than the configured maximum."""
+        from tracecat.config import TRACECAT__MAX_LOOKUP_KEYS_CLIENT_POSTGRES
+
+        with pytest.raises(ValueError, match="Cannot lookup more than"):
+            await batch_lookup(
+                table="test_table",
+                column="name",
+                values=["x"] * (TRACECAT__MAX_LOOKUP_KEYS_CLIENT_POSTGRES + 1),
+            )
+        mock_with_session.assert_not_called()
+
+
 @pytest.mark.anyio
 class TestCoreLookupMany:
     """Test cases for the lookup_many UDF."""
@@ -16,6 +16,7 @@ from tracecat_registry.integrations.agents.builder import (
     _generate_tool_function_name,
     agent,
     call_tracecat_action,
+    create_tool_from_bound_action,
     create_tool_from_registry,
     generate_google_style_docstring,
 )
@@ -25,6 +26,7 @@ from tests.conftest import (
     skip_if_no_slack_token,
 )
 from tracecat.registry.actions.models import BoundRegistryAction
+from tracecat.registry.actions.service import CachedBoundAction
 from tracecat.types.exceptions import RegistryError
 
 # Load environment variables from .env file
@@ -213,20 +215,14 @@ class TestCreateToolFromRegistry:
         mock_bound_action.args_cls = Mock()
         mock_bound_action.args_cls.model_fields = {}
 
-        # Mock the registry action (different from bound action)
-        mock_reg_action = Mock()
-
         with patch(
-            "tracecat_registry.integrations.agents.builder.RegistryActionsService"
-        ) as mock_service_cls:
-            mock_service = Mock()  # Use regular Mock, not AsyncMock for the service
-            mock_service.get_action = AsyncMock(return_value=mock_reg_action)
-            mock_service.get_bound = Mock(return_value=mock_bound_action)
-
-            mock_context = AsyncMock()
-            mock_context.__aenter__.return_value = mock_service
-            mock_service_cls.with_session.return_value = mock_context
-
+            "tracecat_registry.integrations.agents.builder.get_bound_action",
+            AsyncMock(
+                return_value=CachedBoundAction(
+                    action=mock_bound_action, secrets=frozenset()
+                )
+            ),
+        ):
             with pytest.raises(
                 ValueError, match="Action 'test.action' has no description"
             ):
@@ -369,7 +365,9 @@ class TestTracecatAgentBuilder:
         mock_context_manager.__aexit__.return_value = None
         mock_registry_service.with_session.return_value = mock_context_manager
 
-        mock_create_tool = AsyncMock()
+        mock_get_bound_actions = AsyncMock()
+
+        mock_create_tool = Mock()
         mock_create_tool.return_value = Tool(lambda: None)
 
         mock_build_agent = Mock()
@@ -380,20 +378,27 @@ class TestTracecatAgentBuilder:
             "tracecat_registry.integrations.agents.builder.RegistryActionsService",
             mock_registry_service,
         ):
-            with patch(
-                "tracecat_registry.integrations.agents.builder.create_tool_from_registry",
-                mock_create_tool,
-            ):
-                with patch(
+            with (
+                patch(
+                    "tracecat_registry.integrations.agents.builder.get_bound_actions",
+                    mock_get_bound_actions,
+                ),
+                patch(
+                    "tracecat_registry.integrations.agents.builder.create_tool_from_bound_action",
+                    mock_create_tool,
+                ),
+                patch(
                     "tracecat_registry.integrations.agents.builder.build_agent",
                     mock_build_agent,
-                ):
-                    yield {
-                        "RegistryActionsService": mock_registry_service,
-                        "create_tool_from_registry": mock_create_tool,
-                        "build_agent": mock_build_agent,
-                        "service": mock_service,
-                    }
+                ),
+            ):
+                yield {
+                    "RegistryActionsService": mock_registry_service,
+                    "get_bound_actions": mock_get_bound_actions,
+                    "create_tool_from_bound_action": mock_create_tool,
+                    "build_agent": mock_build_agent,
+                    "service": mock_service,
+                }
 
     async def test_builder_initialization(self):
         """Test that TracecatAgentBuilder initializes correctly."""
@@ -461,17 +466,20 @@ class TestTracecatAgentBuilder:
 
         mock_registry_deps["service"].list_actions.return_value = [mock_reg_action]
 
-        # Mock create_tool_from_registry to return a simple tool instead of calling the real function
-        from pydantic import BaseModel, Field
-
-        class MockArgs(BaseModel):
-            test_param: str = Field(description="Test parameter")
+        mock_bound_action = Mock(spec=BoundRegistryAction)
+        slack_secret = RegistrySecret(name="slack", keys=["SLACK_BOT_TOKEN"])
+        mock_registry_deps["get_bound_actions"].return_value = {
+            "tools.slack.post_message": CachedBoundAction(
+                action=mock_bound_action, secrets=frozenset([slack_secret])
+            )
+        }
 
+        # Mock create_tool_from_bound_action to return a simple tool instead of calling the real function
         async def mock_tool_func(test_param: str) -> str:
             return f"Mock result: {test_param}"
 
         mock_tool = Tool(mock_tool_func)
-        mock_registry_deps["create_tool_from_registry"].return_value = mock_tool
+        mock_registry_deps["create_tool_from_bound_action"].return_value = mock_tool
 
         # Build the agent
         agent = await builder.build()
@@ -480,9 +488,13 @@ class TestTracecatAgentBuilder:
         mock_registry_deps["service"].list_actions.assert_called_once_with(
             include_marked=True
         )
-        mock_registry_deps["create_tool_from_registry"].assert_called_once_with(
-            "tools.slack.post_message"
+        mock_registry_deps["get_bound_actions"].assert_called_once_with(
+            ["tools.slack.post_message"], registry_version=None
+        )
+        mock_registry_deps["create_tool_from_bound_action"].assert_called_once_with(
+            "tools.slack.post_message", mock_bound_action, {}
         )
+        assert builder.collected_secrets == {slack_secret}
         mock_registry_deps["build_agent"].assert_called_once()
 
         # Verify the agent is returned
@@ -515,29 +527,59 @@ class TestTracecatAgentBuilder:
 
         mock_registry_deps["service"].list_actions.return_value = mock_actions
 
-        # Mock create_tool_from_registry to return a simple tool
-        from pydantic import BaseModel, Field
-
-        class MockArgs(BaseModel):
-            test_param: str = Field(description="Test parameter")
+        mock_bound_action = Mock(spec=BoundRegistryAction)
+        mock_registry_deps["get_bound_actions"].return_value = {
+            "tools.slack.post_message": CachedBoundAction(
+                action=mock_bound_action, secrets=frozenset()
+            ),
+            "tools.slack.lookup_user": CachedBoundAction(
+                action=mock_bound_action, secrets=frozenset()
+            ),
+        }
 
+        # Mock create_tool_from_bound_action to return a simple tool
         async def mock_tool_func(test_param: str) -> str:
             return f"Mock result: {test_param}"
 
         mock_tool = Tool(mock_tool_func)
-        mock_registry_deps["create_tool_from_registry"].return_value = mock_tool
+        mock_registry_deps["create_tool_from_bound_action"].return_value = mock_tool
 
         await builder.build()
 
-        # Should only call create_tool_from_registry for tools.slack actions
+        # Should only bind and create tools for tools.slack actions
+        mock_registry_deps["get_bound_actions"].assert_called_once_with(
+            ["tools.slack.post_message", "tools.slack.lookup_user"],
+            registry_version=None,
+        )
         expected_calls = [
-            call("tools.slack.post_message"),
-            call("tools.slack.lookup_user"),
+            call("tools.slack.post_message", mock_bound_action, {}),
+            call("tools.slack.lookup_user", mock_bound_action, {}),
         ]
-        mock_registry_deps["create_tool_from_registry"].assert_has_calls(
+        mock_registry_deps["create_tool_from_bound_action"].assert_has_calls(
             expected_calls, any_order=True
         )
-        assert mock_registry_deps["create_tool_from_registry"].call_count == 2
+        assert mock_registry_deps["create_tool_from_bound_action"].call_count == 2
+
+    async def test_builder_build_with_unknown_actions(
+        self, test_role, mock_registry_deps
+    ):
+        """Test that actions missing from the registry are reported together."""
+        builder = TracecatAgentBuilder(
+            model_name="gpt-4",
+            model_provider="openai",
+        ).with_action_filters("tools.slack.post_message", "tools.unknown.action")
+
+        mock_registry_deps["get_bound_actions"].return_value = {
+            "tools.slack.post_message": CachedBoundAction(
+                action=Mock(spec=BoundRegistryAction), secrets=frozenset()
+            )
+        }
+
+        with pytest.raises(ValueError, match="- tools.unknown.action"):
+            await builder.build()
+
+        mock_registry_deps["service"].list_actions.assert_not_called()
+        mock_registry_deps["build_agent"].assert_not_called()
 
 
 @pytest.mark.anyio
@@ -691,6 +733,47 @@ class TestAgentBuilderHelpers:
         with pytest.raises(ValueError, match="Template action is not set"):
             _extract_action_metadata(mock_action)
 
+    def test_create_tool_from_bound_action_caches_signature(self):
+        """Test that tool signatures are reused for the same bound action."""
+        from pydantic import BaseModel, Field
+
+        class MockArgs(BaseModel):
+            text: str = Field(description="Message text")
+            channel: str = Field(description="Channel ID")
+
+        def make_bound_action() -> Mock:
+            bound_action = Mock()
+            bound_action.is_template = False
+            bound_action.namespace = "tools.cache_test"
+            bound_action.name = "post_message"
+            bound_action.description = "Post a message"
+            bound_action.args_cls = MockArgs
+            return bound_action
+
+        bound_action = make_bound_action()
+        with patch(
+            "tracecat_registry.integrations.agents.builder._extract_action_metadata",
+            wraps=_extract_action_metadata,
+        ) as mock_extract:
+            tool1 = create_tool_from_bound_action(
+                "tools.cache_test.post_message", bound_action, {"channel": "C1"}
+            )
+            tool2 = create_tool_from_bound_action(
+                "tools.cache_test.post_message", bound_action, {"channel": "C2"}
+            )
+            assert mock_extract.call_count == 1
+
+            # A new binding (e.g. after a registry sync) regenerates the signature
+            create_tool_from_bound_action(
+                "tools.cache_test.post_message", make_bound_action(), {"channel": "C1"}
+            )
+            assert mock_extract.call_count == 2
+
+        for tool in (tool1, tool2):
+            params = inspect.signature(tool.function).parameters
+            assert list(params) == ["text"]
+            assert tool.function.__name__ == "tools__cache_test__post_message"
+
 
 @pytest.mark.anyio
 class TestCallTracecatAction:
@@ -700,11 +783,6 @@ class TestCallTracecatAction:
         """Test that call_tracecat_action properly fetches and sets up secrets."""
         from unittest.mock import AsyncMock, Mock
 
-        # Mock the registry action
-        mock_reg_action = Mock()
-        mock_reg_action.namespace = "tools.test"
-        mock_reg_action.name = "test_action"
-
         # Mock the bound action
         mock_bound_action = Mock(spec=BoundRegistryAction)
         mock_bound_action.is_template = False
@@ -714,19 +792,14 @@ class TestCallTracecatAction:
         # Mock action secrets
         test_secret = RegistrySecret(name="test_secret", keys=["TEST_KEY"])
 
-        # Mock the registry service - mix of async and sync methods
-        mock_service = Mock()
-        mock_service.get_action = AsyncMock(return_value=mock_reg_action)
-        mock_service.fetch_all_action_secrets = AsyncMock(return_value=[test_secret])
-        mock_service.get_bound = Mock(return_value=mock_bound_action)  # This is sync
-
-        # Mock the service context manager
-        mock_context = AsyncMock()
-        mock_context.__aenter__.return_value = mock_service
-
+        # Mock the cached bound action lookup
         mocker.patch(
-            "tracecat_registry.integrations.agents.builder.RegistryActionsService.with_session",
-            return_value=mock_context,
+            "tracecat_registry.integrations.agents.builder.get_bound_action",
+            AsyncMock(
+                return_value=CachedBoundAction(
+                    action=mock_bound_action, secrets=frozenset([test_secret])
+                )
+            ),
         )
 
         # Mock get_action_secrets to return the expected secrets
@@ -776,11 +849,6 @@ class TestCallTracecatAction:
 
         from tracecat.registry.actions.models import TemplateAction
 
-        # Mock the registry action
-        mock_reg_action = Mock()
-        mock_reg_action.namespace = "tools.test"
-        mock_reg_action.name = "test_template"
-
         # Mock template action
         mock_template_action = Mock(spec=TemplateAction)
 
@@ -794,21 +862,14 @@ class TestCallTracecatAction:
         # Mock action secrets
         template_secret = RegistrySecret(name="template_secret", keys=["TEMPLATE_KEY"])
 
-        # Mock the registry service - mix of async and sync methods
-        mock_service = Mock()
-        mock_service.get_action = AsyncMock(return_value=mock_reg_action)
-        mock_service.fetch_all_action_secrets = AsyncMock(
-            return_value=[template_secret]
-        )
-        mock_service.get_bound = Mock(return_value=mock_bound_action)  # This is sync
-
-        # Mock the service context manager
-        mock_context = AsyncMock()
-        mock_context.__aenter__.return_value = mock_service
-
+        # Mock the cached bound action lookup
         mocker.patch(
-            "tracecat_registry.integrations.agents.builder.RegistryActionsService.with_session",
-            return_value=mock_context,
+            "tracecat_registry.integrations.agents.builder.get_bound_action",
+            AsyncMock(
+                return_value=CachedBoundAction(
+                    action=mock_bound_action, secrets=frozenset([template_secret])
+                )
+            ),
         )
 
         # Mock get_action_secrets
@@ -974,31 +1035,26 @@ class TestFixedArguments:
         assert builder.fixed_arguments == fixed_arguments
 
         # Mock dependencies for build()
-        mock_reg_action1 = Mock()
-        mock_reg_action1.namespace = "core.cases"
-        mock_reg_action1.name = "create_case"
-
-        mock_reg_action2 = Mock()
-        mock_reg_action2.namespace = "tools.slack"
-        mock_reg_action2.name = "post_message"
-
-        mock_service = Mock()
-        mock_service.get_actions = AsyncMock(
-            return_value=[mock_reg_action1, mock_reg_action2]
-        )
-        mock_service.fetch_all_action_secrets = AsyncMock(return_value=[])
-
-        mock_context = AsyncMock()
-        mock_context.__aenter__.return_value = mock_service
+        mock_bound_action1 = Mock(spec=BoundRegistryAction)
+        mock_bound_action2 = Mock(spec=BoundRegistryAction)
 
         mocker.patch(
-            "tracecat_registry.integrations.agents.builder.RegistryActionsService.with_session",
-            return_value=mock_context,
+            "tracecat_registry.integrations.agents.builder.get_bound_actions",
+            AsyncMock(
+                return_value={
+                    "core.cases.create_case": CachedBoundAction(
+                        action=mock_bound_action1, secrets=frozenset()
+                    ),
+                    "tools.slack.post_message": CachedBoundAction(
+                        action=mock_bound_action2, secrets=frozenset()
+                    ),
+                }
+            ),
         )
 
-        # Mock create_tool_from_registry to verify it's called with fixed args
+        # Mock create_tool_from_bound_action to verify it's called with fixed args
         mock_create_tool = mocker.patch(
-            "tracecat_registry.integrations.agents.builder.create_tool_from_registry",
+            "tracecat_registry.integrations.agents.builder.create_tool_from_bound_action",
             return_value=Mock(),  # Just return a simple mock instead of trying to create a Tool
         )
 
@@ -1012,14 +1068,16 @@ class TestFixedArguments:
             "core.cases.create_case", "tools.slack.post_message"
         ).build()
 
-        # Verify create_tool_from_registry was called with correct fixed args
+        # Verify create_tool_from_bound_action was called with correct fixed args
         expected_calls = [
             call(
                 "core.cases.create_case",
+                mock_bound_action1,
                 {"priority": "high", "severity": "critical"},
             ),
             call(
                 "tools.slack.post_message",
+                mock_bound_action2,
                 {"channel": "C123456789", "username": "TestBot"},
             ),
         ]
@@ -1039,30 +1097,25 @@ class TestFixedArguments:
         )
 
         # Mock dependencies
-        mock_reg_action1 = Mock()
-        mock_reg_action1.namespace = "core.cases"
-        mock_reg_action1.name = "create_case"
-
-        mock_reg_action2 = Mock()
-        mock_reg_action2.namespace = "tools.slack"
-        mock_reg_action2.name = "post_message"
-
-        mock_service = Mock()
-        mock_service.get_actions = AsyncMock(
-            return_value=[mock_reg_action1, mock_reg_action2]
-        )
-        mock_service.fetch_all_action_secrets = AsyncMock(return_value=[])
-
-        mock_context = AsyncMock()
-        mock_context.__aenter__.return_value = mock_service
+        mock_bound_action1 = Mock(spec=BoundRegistryAction)
+        mock_bound_action2 = Mock(spec=BoundRegistryAction)
 
         mocker.patch(
-            "tracecat_registry.integrations.agents.builder.RegistryActionsService.with_session",
-            return_value=mock_context,
+            "tracecat_registry.integrations.agents.builder.get_bound_actions",
+            AsyncMock(
+                return_value={
+                    "core.cases.create_case": CachedBoundAction(
+                        action=mock_bound_action1, secrets=frozenset()
+                    ),
+                    "tools.slack.post_message": CachedBoundAction(
+                        action=mock_bound_action2, secrets=frozenset()
+                    ),
+                }
+            ),
         )
 
         mock_create_tool = mocker.patch(
-            "tracecat_registry.integrations.agents.builder.create_tool_from_registry",
+            "tracecat_registry.integrations.agents.builder.create_tool_from_bound_action",
             return_value=Mock(),  # Just return a simple mock instead of trying to create a Tool
         )
 
@@ -1075,10 +1128,12 @@ class TestFixedArguments:
             "core.cases.create_case", "tools.slack.post_message"
         ).build()
 
-        # Verify create_tool_from_registry was called correctly
+        # Verify create_tool_from_bound_action was called correctly
         expected_calls = [
-            call("core.cases.create_case", {"priority": "high"}),  # Has fixed args
-            call("tools.slack.post_message", {}),  # No fixed args, empty dict
+            # Has fixed args
+            call("core.cases.create_case", mock_bound_action1, {"priority": "high"}),
+            # No fixed args, empty dict
+            call("tools.slack.post_message", mock_bound_action2, {}),
         ]
         mock_create_tool.assert_has_calls(expected_calls, any_order=True)
 
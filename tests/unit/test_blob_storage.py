@@ -1,5 +1,6 @@
 """Tests for the storage module."""
 
+import asyncio
 import hashlib
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -18,11 +19,13 @@ from tracecat.storage import (
     compute_sha256,
     delete_file,
     download_file,
+    download_file_stream,
     ensure_bucket_exists,
     file_exists,
     generate_presigned_download_url,
     generate_presigned_upload_url,
     upload_file,
+    upload_file_stream,
     validate_content_type,
     validate_file_size,
 )
@@ -447,6 +450,178 @@ class TestS3Operations:
             Bucket="test-bucket", Key=key, Body=content, ContentType=content_type
         )
 
+    @pytest.mark.anyio
+    @patch("tracecat.storage.get_storage_client")
+    async def test_upload_file_stream_single_part(self, mock_get_client):
+        """Test that streams smaller than a part are uploaded in one request."""
+        mock_client = AsyncMock()
+        mock_get_client.return_value.__aenter__.return_value = mock_client
+
+        async def chunks():
+            yield b"test "
+            yield b"content"
+
+        size = await upload_file_stream(chunks(), "test/file.txt", "test-bucket")
+
+        assert size == len(b"test content")
+        mock_client.put_object.assert_called_once_with(
+            Bucket="test-bucket", Key="test/file.txt", Body=b"test content"
+        )
+        mock_client.create_multipart_upload.assert_not_called()
+
+    @pytest.mark.anyio
+    @patch("tracecat.storage.get_storage_client")
+    async def test_upload_file_stream_multipart(self, mock_get_client):
+        """Test that large streams are uploaded in parts of bounded size."""
+        mock_client = AsyncMock()
+        mock_get_client.return_value.__aenter__.return_value = mock_client
+        mock_client.create_multipart_upload.return_value = {"UploadId": "upload-1"}
+        mock_client.upload_part.side_effect = [
+            {"ETag": f"etag-{i}"} for i in range(1, 4)
+        ]
+
+        async def chunks():
+            for _ in range(5):
+                yield b"x" * 4
+
+        with patch.object(storage.config, "TRACECAT__BLOB_STORAGE_PART_SIZE", 8):
+            size = await upload_file_stream(
+                chunks(), "test/file.bin", "test-bucket", "application/octet-stream"
+            )
+
+        assert size == 20
+        mock_client.create_multipart_upload.assert_called_once_with(
+            Bucket="test-bucket",
+            Key="test/file.bin",
+            ContentType="application/octet-stream",
+        )
+        part_sizes = [
+            len(call.kwargs["Body"]) for call in mock_client.upload_part.call_args_list
+        ]
+        assert part_sizes == [8, 8, 4]
+        mock_client.complete_multipart_upload.assert_called_once_with(
+            Bucket="test-bucket",
+            Key="test/file.bin",
+            UploadId="upload-1",
+            MultipartUpload={
+                "Parts": [
+                    {"ETag": "etag-1", "PartNumber": 1},
+                    {"ETag": "etag-2", "PartNumber": 2},
+                    {"ETag": "etag-3", "PartNumber": 3},
+                ]
+            },
+        )
+        mock_client.abort_multipart_upload.assert_not_called()
+
+    @pytest.mark.anyio
+    @patch("tracecat.storage.get_storage_client")
+    async def test_upload_file_stream_aborts_on_error(self, mock_get_client):
+        """Test that a failed multipart upload is aborted."""
+        mock_client = AsyncMock()
+        mock_get_client.return_value.__aenter__.return_value = mock_client
+        mock_client.create_multipart_upload.return_value = {"UploadId": "upload-1"}
+        mock_client.upload_part.side_effect = ClientError(
+            error_response={"Error": {"Code": "InternalError"}},
+            operation_name="upload_part",
+        )
+
+        async def chunks():
+            yield b"x" * 16
+
+        with (
+            patch.object(storage.config, "TRACECAT__BLOB_STORAGE_PART_SIZE", 8),
+            pytest.raises(ClientError),
+        ):
+            await upload_file_stream(chunks(), "test/file.bin", "test-bucket")
+
+        mock_client.abort_multipart_upload.assert_called_once_with(
+            Bucket="test-bucket", Key="test/file.bin", UploadId="upload-1"
+        )
+        mock_client.complete_multipart_upload.assert_not_called()
+
+    @pytest.mark.anyio
+    @patch("tracecat.storage.get_storage_client")
+    async def test_download_file_stream(self, mock_get_client):
+        """Test streaming a file download in chunks."""
+        mock_client = AsyncMock()
+        mock_get_client.return_value.__aenter__.return_value = mock_client
+
+        async def iter_chunks(chunk_size):
+            yield b"test "
+            yield b"content"
+
+        body = MagicMock()
+        body.__aenter__.return_value = body
+        body.iter_chunks = iter_chunks
+        mock_client.get_object.return_value = {"Body": body}
+
+        chunks = await download_file_stream("test/file.txt", "test-bucket")
+
+        assert [chunk async for chunk in chunks] == [b"test ", b"content"]
+        body.__aexit__.assert_called_once()
+
+    @pytest.mark.anyio
+    @patch("tracecat.storage.get_storage_client")
+    async def test_download_file_stream_not_found(self, mock_get_client):
+        """Test that a missing file raises before streaming starts."""
+        mock_client = AsyncMock()
+        mock_get_client.return_value.__aenter__.return_value = mock_client
+        mock_client.get_object.side_effect = ClientError(
+            error_response={"Error": {"Code": "NoSuchKey"}}, operation_name="get_object"
+        )
+
+        with pytest.raises(FileNotFoundError, match="File nonexistent.txt not found"):
+            await download_file_stream("nonexistent.txt", "test-bucket")
+
+    @pytest.mark.anyio
+    async def test_storage_client_is_shared(self):
+        """Test that the S3 client is created once and reused across calls."""
+        mock_client = AsyncMock()
+        client_cm = MagicMock()
+        client_cm.__aenter__ = AsyncMock(return_value=mock_client)
+        client_cm.__aexit__ = AsyncMock(return_value=None)
+
+        with patch(
+            "tracecat.storage._create_storage_client", return_value=client_cm
+        ) as mock_create:
+            async with storage.get_storage_client() as first:
+                pass
+            async with storage.get_storage_client() as second:
+                pass
+            await storage.close_storage_client()
+
+        assert first is second is mock_client
+        mock_create.assert_called_once()
+        client_cm.__aexit__.assert_called_once()
+
+    def test_storage_client_is_closed_with_its_event_loop(self):
+        """Test that each event loop gets its own client, closed when the loop ends."""
+        client_cms = []
+
+        def create_client():
+            client_cm = MagicMock()
+            client_cm.__aenter__ = AsyncMock(return_value=AsyncMock())
+            client_cm.__aexit__ = AsyncMock(return_value=None)
+            client_cms.append(client_cm)
+            return client_cm
+
+        async def use_client():
+            async with storage.get_storage_client() as client:
+                return client
+
+        with patch(
+            "tracecat.storage._create_storage_client", side_effect=create_client
+        ):
+            first = asyncio.run(use_client())
+            client_cms[0].__aexit__.assert_called_once()
+            second = asyncio.run(use_client())
+
+        assert first is not second
+        assert len(client_cms) == 2
+        client_cms[1].__aexit__.assert_called_once()
+        # Closed loops don't leave their clients behind
+        assert storage._client_pool._clients == {}
+
     @patch("tracecat.storage.get_storage_client")
     async def test_download_file(self, mock_get_client):
         """Test file download."""
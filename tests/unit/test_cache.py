@@ -0,0 +1,44 @@
+import pytest
+
+from tracecat.cache import TTLCache
+
+
+def test_ttl_cache_lru_eviction():
+    cache: TTLCache[str, int] = TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    # Touch "a" so that "b" becomes the least recently used entry
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.cache_info() == (3, 1, 2, 2)
+
+
+def test_ttl_cache_expiry(monkeypatch: pytest.MonkeyPatch):
+    now = 1000.0
+    monkeypatch.setattr("tracecat.cache.time.monotonic", lambda: now)
+    cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=5)
+    cache.set("default", 1)
+    cache.set("override", 2, ttl=60)
+
+    now += 10
+    assert cache.get("default") is None
+    assert cache.get("override") == 2
+    assert len(cache) == 1
+
+
+def test_ttl_cache_invalidation():
+    cache: TTLCache[str, int] = TTLCache(maxsize=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.pop("a") == 1
+    assert "a" not in cache
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_ttl_cache_rejects_invalid_maxsize():
+    with pytest.raises(ValueError):
+        TTLCache(maxsize=0)
@@ -0,0 +1,127 @@
+import uuid
+
+import pytest
+
+from tracecat import config
+from tracecat.dsl.common import DSLRunArgs
+from tracecat.dsl.inline import can_run_inline, get_inline_action, run_inline_action
+from tracecat.dsl.models import ActionStatement, RunActionInput, RunContext
+from tracecat.expressions.common import ExprContext
+from tracecat.expressions.core import extract_expressions
+from tracecat.identifiers.workflow import WorkflowUUID
+from tracecat.types.auth import Role
+from tracecat.types.exceptions import RegistryValidationError
+
+
+def make_input(task: ActionStatement) -> RunActionInput:
+    wf_id = WorkflowUUID.new_uuid4()
+    return RunActionInput(
+        task=task,
+        exec_context={
+            ExprContext.ACTIONS: {
+                "alert": {"result": {"id": 1, "tags": ["a", None, "b", ""]}}
+            },
+            ExprContext.TRIGGER: {"severity": "high"},
+        },
+        run_context=RunContext(
+            wf_id=wf_id,
+            wf_exec_id=wf_id.short() + "/exec_test",
+            wf_run_id=uuid.uuid4(),
+            environment="default",
+        ),
+    )
+
+
+@pytest.mark.parametrize(
+    "task,expected",
+    [
+        (
+            ActionStatement(
+                ref="reshape",
+                action="core.transform.reshape",
+                args={"value": "${{ ACTIONS.alert.result.id }}"},
+            ),
+            True,
+        ),
+        (
+            ActionStatement(
+                ref="reshape",
+                action="core.transform.reshape",
+                args={"value": "${{ SECRETS.api.KEY }}"},
+            ),
+            False,
+        ),
+        (
+            ActionStatement(
+                ref="http",
+                action="core.http_request",
+                args={"url": "https://example.com", "method": "GET"},
+            ),
+            False,
+        ),
+    ],
+    ids=["pure_transform", "references_secrets", "not_allowlisted"],
+)
+def test_can_run_inline(task: ActionStatement, expected: bool) -> None:
+    expr_ctxs = extract_expressions(task.model_dump())
+    assert can_run_inline(task, expr_ctxs) is expected
+
+
+def test_run_args_record_inline_setting_at_start(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(config, "TRACECAT__INLINE_ACTIONS_ENABLED", False)
+    args = DSLRunArgs(
+        role=Role(type="service", service_id="tracecat-runner"),
+        wf_id=WorkflowUUID.new_uuid4(),
+    )
+    assert args.inline_actions is False
+
+    # Replays read the setting from the recorded input, not the worker's config
+    monkeypatch.setattr(config, "TRACECAT__INLINE_ACTIONS_ENABLED", True)
+    replayed = DSLRunArgs.model_validate(args.model_dump(mode="json"))
+    assert replayed.inline_actions is False
+
+
+def test_get_inline_action_rejects_other_actions() -> None:
+    with pytest.raises(ValueError, match="can't run inline"):
+        get_inline_action("core.http_request")
+
+
+@pytest.mark.anyio
+async def test_run_inline_action() -> None:
+    task = ActionStatement(
+        ref="normalize",
+        action="core.transform.reshape",
+        args={
+            "value": {
+                "id": "${{ ACTIONS.alert.result.id }}",
+                "severity": "${{ TRIGGER.severity }}",
+            }
+        },
+    )
+    result = await run_inline_action(make_input(task))
+    assert result == {"id": 1, "severity": "high"}
+
+
+@pytest.mark.anyio
+async def test_run_inline_action_validates_args() -> None:
+    task = ActionStatement(
+        ref="compact",
+        action="core.transform.compact",
+        args={"items": "${{ ACTIONS.alert.result.id }}"},
+    )
+    with pytest.raises(RegistryValidationError):
+        await run_inline_action(make_input(task))
+
+
+@pytest.mark.anyio
+async def test_run_inline_action_with_for_each() -> None:
+    task = ActionStatement(
+        ref="upper",
+        action="core.transform.apply",
+        for_each="${{ for var.tag in ACTIONS.alert.result.tags }}",
+        args={"value": "${{ var.tag }}", "python_lambda": "lambda x: x or 'none'"},
+    )
+    result = await run_inline_action(make_input(task))
+    assert result == ["a", "none", "b", "none"]
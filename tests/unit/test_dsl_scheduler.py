@@ -0,0 +1,120 @@
+"""Tests for DSLScheduler control flow, run outside of a Temporal workflow."""
+
+from typing import Any
+
+import pytest
+from temporalio.exceptions import ApplicationError
+
+from tracecat.contexts import ctx_stream_id
+from tracecat.dsl.common import DSLInput
+from tracecat.dsl.enums import PlatformAction
+from tracecat.dsl.models import (
+    ROOT_STREAM,
+    ActionStatement,
+    ExecutionContext,
+    TaskResult,
+)
+from tracecat.dsl.scheduler import DSLScheduler
+from tracecat.expressions.common import ExprContext
+from tracecat.expressions.eval import eval_templated_object
+
+
+class InProcessScheduler(DSLScheduler):
+    """DSLScheduler that evaluates expressions without an activity."""
+
+    async def resolve_expression(
+        self, expression: str, context: ExecutionContext
+    ) -> Any:
+        return eval_templated_object(expression, operand=context)
+
+
+def make_scheduler(
+    actions: list[dict[str, Any]], trigger: dict[str, Any], **kwargs: Any
+) -> DSLScheduler:
+    scheduler: DSLScheduler
+
+    async def executor(stmt: ActionStatement) -> None:
+        if stmt.action == PlatformAction.TRANSFORM_GATHER:
+            return
+        stream_id = ctx_stream_id.get()
+        scatter_ref, _ = stream_id.leaf
+        item = scheduler.get_stream_aware_action_result(scatter_ref, stream_id)
+        value = item["result"] if item else None
+        if value == 4:
+            raise ApplicationError(
+                "Item 4 failed",
+                {"ref": stmt.ref, "message": "Item 4 failed", "type": "ValueError"},
+                non_retryable=True,
+            )
+        context = scheduler.get_context(stream_id)
+        context[ExprContext.ACTIONS][stmt.ref] = TaskResult(
+            result=value * 10 if isinstance(value, int) else value,
+            result_typename=type(value).__name__,
+        )
+
+    dsl = DSLInput(
+        title="Scheduler test",
+        description="Scheduler test",
+        entrypoint={"ref": actions[0]["ref"]},
+        actions=actions,
+    )
+    context: ExecutionContext = {ExprContext.ACTIONS: {}, ExprContext.TRIGGER: trigger}
+    scheduler = InProcessScheduler(
+        executor=executor, dsl=dsl, context=context, **kwargs
+    )
+    return scheduler
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("compact_scatter", [True, False])
+async def test_nested_scatter_gather_releases_streams(compact_scatter: bool):
+    actions = [
+        {"ref": "start", "action": "core.transform.reshape", "args": {"value": 1}},
+        {
+            "ref": "scatter_batches",
+            "action": "core.transform.scatter",
+            "args": {"collection": "${{ TRIGGER.batches }}"},
+            "depends_on": ["start"],
+        },
+        {
+            "ref": "scatter_items",
+            "action": "core.transform.scatter",
+            "args": {"collection": "${{ ACTIONS.scatter_batches.result }}"},
+            "depends_on": ["scatter_batches"],
+        },
+        {
+            "ref": "process",
+            "action": "core.transform.reshape",
+            "args": {"value": 1},
+            "depends_on": ["scatter_items"],
+        },
+        {
+            "ref": "gather_items",
+            "action": "core.transform.gather",
+            "args": {"items": "${{ ACTIONS.process.result }}"},
+            "depends_on": ["process"],
+        },
+        {
+            "ref": "gather_batches",
+            "action": "core.transform.gather",
+            "args": {"items": "${{ ACTIONS.gather_items.result }}"},
+            "depends_on": ["gather_items"],
+        },
+    ]
+    scheduler = make_scheduler(
+        actions,
+        {"batches": [[1, 2], [], [3, 4, 5]]},
+        compact_scatter=compact_scatter,
+    )
+
+    assert await scheduler.start() is None
+
+    root_actions = scheduler.get_context(ROOT_STREAM)[ExprContext.ACTIONS]
+    assert root_actions["gather_batches"]["result"] == [[10, 20], [], [30, 50]]
+    # Nothing is left behind for the execution streams once they're gathered
+    assert scheduler.scatters == {}
+    assert scheduler.open_streams == {}
+    assert list(scheduler.streams) == [ROOT_STREAM]
+    assert scheduler.stream_hierarchy == {ROOT_STREAM: None}
+    assert scheduler.stream_exceptions == {}
+    assert all(task.stream_id == ROOT_STREAM for task in scheduler.indegrees)
@@ -0,0 +1,74 @@
+import uuid
+
+import httpx
+import orjson
+import pytest
+import respx
+
+from tracecat import config
+from tracecat.dsl.models import ActionStatement, RunActionInput, RunContext
+from tracecat.executor.client import (
+    ExecutorClient,
+    close_executor_http_client,
+    get_executor_http_client,
+)
+from tracecat.identifiers.workflow import WorkflowUUID
+from tracecat.types.auth import Role
+
+
+@pytest.fixture
+def run_action_input() -> RunActionInput:
+    wf_id = WorkflowUUID.new_uuid4()
+    return RunActionInput(
+        task=ActionStatement(action="core.transform.reshape", args={}, ref="a"),
+        exec_context={},
+        run_context=RunContext(
+            wf_id=wf_id,
+            wf_exec_id=wf_id.short() + "/exec_test",
+            wf_run_id=uuid.uuid4(),
+            environment="default",
+        ),
+    )
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_executor_clients_share_pooled_transport(run_action_input):
+    """Test that executor clients reuse one HTTP client and send their own role."""
+    route = respx.post(
+        f"{config.TRACECAT__EXECUTOR_URL}/run/core.transform.reshape"
+    ).mock(return_value=httpx.Response(200, json={"ok": True}))
+    await close_executor_http_client()
+
+    roles = [
+        Role(
+            type="service",
+            service_id="tracecat-runner",
+            workspace_id=uuid.uuid4(),
+        )
+        for _ in range(2)
+    ]
+    http_client = get_executor_http_client()
+    for role in roles:
+        result = await ExecutorClient(role=role).run_action_memory_backend(
+            run_action_input
+        )
+        assert result == {"ok": True}
+        assert get_executor_http_client() is http_client
+
+    for call, role in zip(route.calls, roles, strict=True):
+        request = call.request
+        assert request.headers["x-tracecat-role-workspace-id"] == str(role.workspace_id)
+        assert request.url.params["workspace_id"] == str(role.workspace_id)
+        assert orjson.loads(request.content) == orjson.loads(
+            run_action_input.model_dump_json()
+        )
+    await close_executor_http_client()
+
+
+def test_executor_client_defaults_to_service_role():
+    """Test that a client without a role falls back to the default service role."""
+    client = ExecutorClient()
+
+    assert client.role == Role(type="service", service_id="tracecat-service")
+    assert client._params == {}
@@ -0,0 +1,108 @@
+from concurrent.futures import Future
+
+import pytest
+from ray.runtime_env import RuntimeEnv
+
+from tracecat import config
+from tracecat.executor import pool as pool_module
+from tracecat.executor.pool import (
+    LocalProcessPool,
+    get_worker_pool,
+    shutdown_worker_pools,
+)
+
+
+class FakePool:
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.closed = False
+
+    async def run(self, input, role, registry_version, **kwargs):
+        return None
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def fake_pools(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(pool_module, "RayActorPool", FakePool)
+    monkeypatch.setattr(pool_module, "LocalProcessPool", FakePool)
+    yield
+    shutdown_worker_pools()
+
+
+def test_task_mode_has_no_pool(monkeypatch: pytest.MonkeyPatch, fake_pools):
+    monkeypatch.setattr(config, "TRACECAT__EXECUTOR_WORKER_MODE", "task")
+    assert get_worker_pool(RuntimeEnv(env_vars={})) is None
+
+
+def test_process_mode_falls_back_for_runtime_deps(
+    monkeypatch: pytest.MonkeyPatch, fake_pools
+):
+    monkeypatch.setattr(config, "TRACECAT__EXECUTOR_WORKER_MODE", "process")
+    assert get_worker_pool(RuntimeEnv(uv=["some-package"])) is None
+    assert isinstance(get_worker_pool(RuntimeEnv(env_vars={})), FakePool)
+
+
+def test_actor_pool_is_reused_per_runtime_env(
+    monkeypatch: pytest.MonkeyPatch, fake_pools
+):
+    monkeypatch.setattr(config, "TRACECAT__EXECUTOR_WORKER_MODE", "actor")
+    monkeypatch.setattr(config, "TRACECAT__EXECUTOR_WORKER_POOL_SIZE", 2)
+    monkeypatch.setattr(config, "TRACECAT__EXECUTOR_WORKER_MAX_TASKS", 10)
+
+    env_a = RuntimeEnv(uv=["git+ssh://git@github.com/org/repo.git@sha1"])
+    pool_a = get_worker_pool(env_a)
+    assert isinstance(pool_a, FakePool)
+    assert pool_a.kwargs["size"] == 2
+    assert pool_a.kwargs["max_tasks_per_worker"] == 10
+    assert get_worker_pool(env_a) is pool_a
+
+    # A new registry commit replaces the pool
+    env_b = RuntimeEnv(uv=["git+ssh://git@github.com/org/repo.git@sha2"])
+    pool_b = get_worker_pool(env_b)
+    assert pool_b is not pool_a
+    assert pool_a.closed
+
+
+class FakeProcess:
+    def __init__(self) -> None:
+        self.terminated = False
+
+    def terminate(self) -> None:
+        self.terminated = True
+
+
+class HangingProcessExecutor:
+    """Stands in for a ProcessPoolExecutor whose calls never finish."""
+
+    def __init__(self, **kwargs):
+        self._processes = {1: FakeProcess()}
+        self.shut_down = False
+
+    def submit(self, fn, *args):
+        return Future()
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        self.shut_down = True
+
+
+@pytest.mark.anyio
+async def test_process_pool_terminates_timed_out_worker(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(pool_module, "ProcessPoolExecutor", HangingProcessExecutor)
+    monkeypatch.setattr(pool_module, "EXECUTION_TIMEOUT", 0.01)
+    pool = LocalProcessPool(size=1, max_tasks_per_worker=10)
+    worker = pool._idle.get_nowait()
+    pool._idle.put_nowait(worker)
+
+    with pytest.raises(TimeoutError):
+        await pool.run(None, None, None)  # type: ignore[arg-type]
+
+    # The stuck process is killed and a fresh worker takes its slot
+    assert worker._processes[1].terminated
+    assert worker.shut_down
+    assert pool._idle.qsize() == 1
+    assert pool._idle.get_nowait() is not worker
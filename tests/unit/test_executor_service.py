@@ -1,3 +1,5 @@
+import asyncio
+import os
 import uuid
 from unittest.mock import AsyncMock, patch
 
@@ -9,7 +11,10 @@ from tracecat.executor.models import DispatchActionContext
 from tracecat.executor.service import (
     _dispatch_action,
     dispatch_action_on_cluster,
+    get_bound_action,
+    get_ray_runtime_env,
     run_action_from_input,
+    with_loop_vars,
 )
 from tracecat.expressions.common import ExprContext
 from tracecat.git import GitUrl
@@ -105,8 +110,12 @@ async def test_dispatch_action_basic(mock_session, basic_task_input, dispatch_co
 async def test_dispatch_action_with_foreach(
     mock_session, basic_looped_task_input, dispatch_context
 ):
-    with patch("tracecat.executor.service.run_action_on_ray_cluster") as mock_ray:
+    with (
+        patch("tracecat.executor.service.run_action_on_ray_cluster") as mock_ray,
+        patch("tracecat.executor.service.ray.put") as mock_put,
+    ):
         mock_ray.return_value = {"result": "success"}
+        mock_put.return_value = "input_ref"
 
         result = await _dispatch_action(
             input=basic_looped_task_input, ctx=dispatch_context
@@ -114,20 +123,63 @@ async def test_dispatch_action_with_foreach(
 
         assert result == [{"result": "success"}] * 3
 
+        # The shared input is put in the object store once
+        mock_put.assert_called_once_with(basic_looped_task_input)
         # Assert the number of calls
         assert mock_ray.call_count == 3
 
         # Get all calls and their arguments
-        calls = mock_ray.call_args_list
+        calls = sorted(mock_ray.call_args_list, key=lambda c: c.kwargs["iteration"])
 
         # Verify each call's arguments
         for i, call in enumerate(calls, 1):
             args, kwargs = call
-            input_arg = args[0]
-            # Verify the loop variable 'x' was set to different values (1, 2, 3)
-            assert input_arg.task.args["key"] == "value"
-            assert input_arg.exec_context[ExprContext.LOCAL_VARS] == {"x": i}
+            # The shared input is passed through unpatched
+            assert args[0] is basic_looped_task_input
             assert args[1] == dispatch_context
+            assert kwargs["input_ref"] == "input_ref"
+            # Verify the loop variable 'x' was set to different values (1, 2, 3)
+            assert kwargs["loop_vars"] == {"x": i}
+
+
+@pytest.mark.anyio
+async def test_dispatch_action_with_foreach_bounded_window(
+    monkeypatch, basic_looped_task_input, dispatch_context
+):
+    """Test that loop iterations are capped by the window and returned in order."""
+    monkeypatch.setattr("tracecat.config.TRACECAT__LOOP_MAX_BATCH_SIZE", 2)
+    basic_looped_task_input.task.for_each = "${{ for var.x in FN.range(0, 10) }}"
+    in_flight = 0
+    max_in_flight = 0
+
+    async def run_iteration(input, ctx, iteration, *, loop_vars, input_ref):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        # Finish later iterations first
+        await asyncio.sleep(0.001 * (10 - loop_vars["x"]))
+        in_flight -= 1
+        return loop_vars["x"] * 2
+
+    with (
+        patch("tracecat.executor.service.run_action_on_ray_cluster", run_iteration),
+        patch("tracecat.executor.service.ray.put"),
+    ):
+        result = await _dispatch_action(
+            input=basic_looped_task_input, ctx=dispatch_context
+        )
+
+    assert result == [x * 2 for x in range(10)]
+    assert max_in_flight == 2
+
+
+def test_with_loop_vars_does_not_mutate_shared_input(basic_looped_task_input):
+    basic_looped_task_input.exec_context[ExprContext.LOCAL_VARS] = {"y": 0}
+
+    patched = with_loop_vars(basic_looped_task_input, {"x": 1})
+
+    assert patched.exec_context[ExprContext.LOCAL_VARS] == {"y": 0, "x": 1}
+    assert basic_looped_task_input.exec_context[ExprContext.LOCAL_VARS] == {"y": 0}
 
 
 @pytest.mark.anyio
@@ -256,3 +308,71 @@ async def test_run_action_from_input_secrets_handling(mocker, test_role):
 
     # Verify environment parameter
     assert call_kwargs["environment"] == "test_env"
+
+
+@pytest.mark.anyio
+async def test_get_bound_action_caches_per_registry_version(mocker):
+    """Test that bound actions are loaded once per (action, registry version)."""
+    mock_reg_service = mocker.AsyncMock(spec=RegistryActionsService)
+    mock_reg_service.get_action.return_value = mocker.MagicMock()
+    mock_reg_service.get_bound.return_value = mocker.MagicMock()
+    secret = RegistrySecret(name="my_secret", keys=["KEY"])
+    mock_reg_service.fetch_all_action_secrets.return_value = {secret}
+    mocker.patch(
+        "tracecat.registry.actions.service.RegistryActionsService.with_session",
+        return_value=mocker.AsyncMock(
+            __aenter__=mocker.AsyncMock(return_value=mock_reg_service)
+        ),
+    )
+
+    first = await get_bound_action("test_action", registry_version="sha1")
+    second = await get_bound_action("test_action", registry_version="sha1")
+    assert second is first
+    assert first.secrets == frozenset({secret})
+    assert mock_reg_service.get_action.await_count == 1
+
+    # A new registry commit is a cache miss
+    await get_bound_action("test_action", registry_version="sha2")
+    assert mock_reg_service.get_action.await_count == 2
+
+    # Syncing or editing actions invalidates every binding
+    from tracecat.registry.actions.service import bound_action_cache
+
+    bound_action_cache.clear()
+    await get_bound_action("test_action", registry_version="sha1")
+    assert mock_reg_service.get_action.await_count == 3
+
+
+def test_get_ray_runtime_env_memoized_per_commit_and_pyproject(
+    monkeypatch, tmp_path, test_role
+):
+    """Test that runtime envs are rebuilt only for a new commit or pyproject.toml."""
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text('[project]\nname = "custom"\ndependencies = ["httpx"]\n')
+    monkeypatch.setattr("tracecat.config.TRACECAT__LOCAL_REPOSITORY_ENABLED", True)
+    monkeypatch.setattr(
+        "tracecat.config.TRACECAT__LOCAL_REPOSITORY_CONTAINER_PATH", str(tmp_path)
+    )
+    git_url = GitUrl(host="github.com", org="org", repo="repo", ref="sha1")
+    ctx = DispatchActionContext(role=test_role, git_url=git_url)
+
+    env = get_ray_runtime_env(ctx)
+    assert env["uv"]["packages"] == [git_url.to_url(), str(tmp_path), "httpx"]
+    assert get_ray_runtime_env(ctx) is env
+
+    # A new commit SHA is a new environment
+    new_ctx = DispatchActionContext(
+        role=test_role,
+        git_url=GitUrl(host="github.com", org="org", repo="repo", ref="sha2"),
+    )
+    assert get_ray_runtime_env(new_ctx) is not env
+
+    # Editing the local repository's pyproject.toml is picked up
+    pyproject.write_text('[project]\nname = "custom"\ndependencies = ["orjson"]\n')
+    stat = pyproject.stat()
+    os.utime(pyproject, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert get_ray_runtime_env(ctx)["uv"]["packages"] == [
+        git_url.to_url(),
+        str(tmp_path),
+        "orjson",
+    ]
@@ -161,6 +161,49 @@ def test_eval_jsonpath():
     )
 
 
+@pytest.mark.parametrize(
+    "expr",
+    [
+        "ACTIONS.a.result",
+        "ACTIONS.a.result.items[0].id",
+        "ACTIONS.a.result.items[5]",
+        "ACTIONS.a.result.missing.deep",
+        "ACTIONS.a.result.null_value",
+        "ACTIONS.a.result.null_value.field",
+        "ACTIONS.a.result.text.field",
+        "ACTIONS.a.result.items.field",
+        "ACTIONS.a.result.empty[0]",
+        "ACTIONS.a.result.truthy",
+        "$.ACTIONS.a.result.items[1]",
+        "TRIGGER",
+    ],
+)
+def test_eval_jsonpath_fast_path_matches_jsonpath_ng(expr: str) -> None:
+    """Test that simple paths resolved by direct indexing match jsonpath_ng."""
+    import jsonpath_ng.ext
+
+    operand = {
+        "ACTIONS": {
+            "a": {
+                "result": {
+                    "items": [{"id": 1}, {"id": 2}],
+                    "empty": [],
+                    "null_value": None,
+                    "text": "hello",
+                    "truthy": True,
+                }
+            }
+        },
+        "TRIGGER": {"x": 1},
+    }
+    expected = [found.value for found in jsonpath_ng.ext.parse(expr).find(operand)]
+    actual = eval_jsonpath(expr, operand)
+    if expected:
+        assert actual == expected[0]
+    else:
+        assert actual is None
+
+
 @pytest.mark.parametrize(
     "expression,expected_result",
     [
@@ -1764,3 +1807,33 @@ def test_build_lambda_input_sanitization() -> None:
     # Test with string input (should not be wrapped)
     str_lambda = build_safe_lambda("lambda x: x.upper()")
     assert str_lambda("hello") == "HELLO"
+
+
+def test_expr_parser_cache_reuses_parse_trees() -> None:
+    """Test that repeated expressions are served from the parse tree cache."""
+    parser = ExprParser(cache_size=2)
+    tree = parser.parse("ACTIONS.a.result")
+    assert parser.parse("ACTIONS.a.result") is tree
+    info = parser.cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+    assert info.currsize == 1
+
+    # Cached trees can be evaluated repeatedly with different operands
+    assert tree is not None
+    assert ExprEvaluator(operand={"ACTIONS": {"a": {"result": 1}}}).evaluate(tree) == 1
+    assert ExprEvaluator(operand={"ACTIONS": {"a": {"result": 2}}}).evaluate(tree) == 2
+
+    # Eviction is bounded by the cache size
+    parser.parse("ACTIONS.b.result")
+    parser.parse("ACTIONS.c.result")
+    assert parser.cache_info().currsize == 2
+
+    # Parse errors are raised every time and never cached
+    for _ in range(2):
+        with pytest.raises(TracecatExpressionError):
+            parser.parse("ACTIONS.")
+    assert parser.cache_info().currsize == 2
+
+    parser.cache_clear()
+    assert parser.cache_info() == (0, 0, 2, 0)
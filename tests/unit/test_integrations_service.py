@@ -1,3 +1,4 @@
+import asyncio
 import os
 import uuid
 from datetime import UTC, datetime, timedelta
@@ -22,7 +23,11 @@ from tracecat.integrations.models import (
     ProviderScopes,
     TokenResponse,
 )
-from tracecat.integrations.service import IntegrationService
+from tracecat.integrations.service import (
+    IntegrationService,
+    access_token_cache,
+    cache_access_token,
+)
 from tracecat.types.auth import Role
 from tracecat.types.exceptions import TracecatAuthorizationError
 
@@ -459,6 +464,39 @@ class TestIntegrationService:
         assert retrieved.grant_type == provider_key.grant_type
         assert retrieved.encrypted_access_token == b""
 
+    async def test_access_token_cache(
+        self,
+        integration_service: IntegrationService,
+        mock_token_response: TokenResponse,
+    ) -> None:
+        """Test that access tokens are cached until refresh and invalidated on writes."""
+        provider_key = ProviderKey(
+            id="test_provider",
+            grant_type=OAuthGrantType.AUTHORIZATION_CODE,
+        )
+        integration = await integration_service.store_integration(
+            provider_key=provider_key,
+            access_token=mock_token_response.access_token,
+            expires_in=3600,
+        )
+        cache_key = (integration_service.workspace_id, provider_key)
+        access_token = await integration_service.get_access_token(integration)
+
+        cache_access_token(integration, access_token)
+        assert access_token_cache.get(cache_key) == access_token
+
+        # Tokens due for refresh are not cached
+        access_token_cache.clear()
+        integration.expires_at = datetime.now(UTC) + timedelta(minutes=1)
+        cache_access_token(integration, access_token)
+        assert access_token_cache.get(cache_key) is None
+
+        # Disconnecting invalidates the cached token
+        integration.expires_at = datetime.now(UTC) + timedelta(hours=1)
+        cache_access_token(integration, access_token)
+        await integration_service.disconnect_integration(integration=integration)
+        assert access_token_cache.get(cache_key) is None
+
     async def test_disconnect_integration_with_provider_config(
         self,
         integration_service: IntegrationService,
@@ -812,6 +850,60 @@ class TestIntegrationService:
                     "New expiry should be greater than or equal to old expiry"
                 )
 
+    async def test_refresh_token_if_needed_single_flight(
+        self,
+        integration_service: IntegrationService,
+        mock_provider: MockOAuthProvider,
+        mock_token_response: TokenResponse,
+    ) -> None:
+        """Test that concurrent refreshes of one integration call the provider once."""
+        provider_key = ProviderKey(
+            id=mock_provider.id,
+            grant_type=mock_provider.grant_type,
+        )
+
+        with patch("tracecat.integrations.service.ProviderRegistry") as mock_registry:
+            mock_registry.get.return_value.get_class.return_value = MockOAuthProvider
+
+            with patch.object(
+                MockOAuthProvider, "refresh_access_token", new_callable=AsyncMock
+            ) as mock_refresh:
+                mock_refresh.return_value = TokenResponse(
+                    access_token=SecretStr("refreshed_token"),
+                    refresh_token=SecretStr("new_refresh_token"),
+                    expires_in=7200,
+                    scope="read write",
+                    token_type="Bearer",
+                )
+
+                await integration_service.store_provider_config(
+                    provider_key=provider_key,
+                    client_id="mock_client_id",
+                    client_secret=SecretStr("mock_client_secret"),
+                    provider_config={},
+                )
+                integration = await integration_service.store_integration(
+                    provider_key=provider_key,
+                    access_token=mock_token_response.access_token,
+                    refresh_token=mock_token_response.refresh_token,
+                    expires_in=60,  # Expires in 1 minute
+                )
+
+                results = await asyncio.gather(
+                    *(
+                        integration_service.refresh_token_if_needed(integration)
+                        for _ in range(5)
+                    )
+                )
+
+                # Callers that waited reuse the refreshed token
+                mock_refresh.assert_called_once()
+                for refreshed in results:
+                    access_token, _ = integration_service.get_decrypted_tokens(
+                        refreshed
+                    )
+                    assert access_token == "refreshed_token"
+
     async def test_refresh_token_if_needed_no_refresh_token(
         self,
         integration_service: IntegrationService,
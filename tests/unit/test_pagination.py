@@ -68,6 +68,23 @@ class TestCursorPaginator:
         assert decoded.created_at.microsecond == 123456
         assert decoded.id == entity_id
 
+    def test_cursor_roundtrip_with_sort_column(self, session: AsyncSession):
+        """Test that the sort column and value are encoded in the cursor."""
+        paginator = BaseCursorPaginator(session)
+        timestamp = datetime.now(UTC)
+        cursor = paginator.encode_cursor(
+            timestamp, "test-id", sort_column="priority", sort_value="high"
+        )
+        decoded = paginator.decode_cursor(cursor)
+
+        assert decoded.sort_column == "priority"
+        assert decoded.sort_value == "high"
+
+        # Cursors without a sort column decode with empty sort fields
+        decoded = paginator.decode_cursor(paginator.encode_cursor(timestamp, "id"))
+        assert decoded.sort_column is None
+        assert decoded.sort_value is None
+
     def test_cursor_pagination_params(self):
         """Test cursor pagination parameters."""
         # Test default values
@@ -0,0 +1,125 @@
+"""Tests for compressing large Temporal payloads."""
+
+import threading
+
+import orjson
+import pytest
+import zstandard
+from temporalio.api.common.v1 import Payload
+
+from tracecat.dsl.compression import (
+    ZSTD_DICT_SUFFIX,
+    CompressionPayloadCodec,
+    load_zstd_dictionaries,
+)
+
+
+def make_alert(i: int) -> bytes:
+    return orjson.dumps(
+        {
+            "alert_id": f"alert-{i}",
+            "severity": ["low", "medium", "high"][i % 3],
+            "source": "crowdstrike",
+            "host": {"hostname": f"host-{i % 17}", "os": "windows"},
+            "tags": ["edr", "malware", f"tenant-{i % 5}"],
+        }
+    )
+
+
+def make_payload(data: bytes) -> Payload:
+    return Payload(metadata={"encoding": b"json/plain"}, data=data)
+
+
+@pytest.fixture(scope="module")
+def dictionaries() -> dict[int, zstandard.ZstdCompressionDict]:
+    samples = [make_alert(i) for i in range(2000)]
+    return {
+        version: zstandard.train_dictionary(1024, samples, dict_id=version)
+        for version in (1, 2)
+    }
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("algorithm", ["zstd", "gzip", "brotli"])
+async def test_compression_roundtrip(algorithm: str):
+    codec = CompressionPayloadCodec(
+        threshold_bytes=64, algorithm=algorithm, enabled=True
+    )
+    small, large = make_payload(b'"small"'), make_payload(make_alert(0) * 20)
+
+    encoded = await codec.encode([small, large])
+
+    assert encoded[0] == small
+    assert encoded[1].metadata["encoding"] == f"binary/{algorithm}".encode()
+    assert await codec.decode(encoded) == [small, large]
+    stats = codec.stats["compress", f"binary/{algorithm}"]
+    assert stats.payloads == 1
+    assert stats.ratio > 1
+
+
+@pytest.mark.anyio
+async def test_dictionary_compression_uses_latest_version(dictionaries):
+    codec = CompressionPayloadCodec(
+        threshold_bytes=64, algorithm="zstd", enabled=True, dictionaries=dictionaries
+    )
+    payload = make_payload(make_alert(4242))
+
+    [encoded] = await codec.encode([payload])
+
+    assert encoded.metadata["encoding"] == b"binary/zstd-dict"
+    assert encoded.metadata["dictionary_id"] == b"2"
+    plain = CompressionPayloadCodec(threshold_bytes=64, algorithm="zstd", enabled=True)
+    [plain_encoded] = await plain.encode([payload])
+    assert len(encoded.data) < len(plain_encoded.data)
+    assert await codec.decode([encoded]) == [payload]
+
+
+@pytest.mark.anyio
+async def test_dictionary_versions_remain_decodable(dictionaries):
+    old = CompressionPayloadCodec(
+        threshold_bytes=64,
+        algorithm="zstd",
+        enabled=True,
+        dictionaries={1: dictionaries[1]},
+    )
+    payload = make_payload(make_alert(7))
+    encoded = await old.encode([payload])
+
+    # A codec that encodes with version 2 still decodes version 1 payloads
+    new = CompressionPayloadCodec(
+        threshold_bytes=64, algorithm="zstd", enabled=True, dictionaries=dictionaries
+    )
+    assert await new.decode(encoded) == [payload]
+
+    # Without the dictionary the payload is passed through untouched
+    missing = CompressionPayloadCodec(
+        threshold_bytes=64, algorithm="zstd", enabled=True
+    )
+    assert await missing.decode(encoded) == encoded
+
+
+def test_load_zstd_dictionaries(tmp_path, dictionaries):
+    for version, dictionary in dictionaries.items():
+        (tmp_path / f"{version}{ZSTD_DICT_SUFFIX}").write_bytes(dictionary.as_bytes())
+    (tmp_path / "notes.txt").write_text("ignored")
+
+    loaded = load_zstd_dictionaries(tmp_path)
+
+    assert sorted(loaded) == [1, 2]
+
+
+@pytest.mark.anyio
+async def test_compression_runs_off_the_event_loop(monkeypatch):
+    codec = CompressionPayloadCodec(threshold_bytes=64, algorithm="zstd", enabled=True)
+    threads: list[str] = []
+    compress = codec._compress
+
+    def record_thread(data: bytes):
+        threads.append(threading.current_thread().name)
+        return compress(data)
+
+    monkeypatch.setattr(codec, "_compress", record_thread)
+    await codec.encode([make_payload(make_alert(i) * 10) for i in range(4)])
+
+    assert len(threads) == 4
+    assert all(name.startswith("payload-codec") for name in threads)
@@ -0,0 +1,158 @@
+"""Tests for offloading large Temporal payloads to blob storage."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from temporalio.api.common.v1 import Payload
+
+from tracecat.dsl._converter import ChainedPayloadCodec
+from tracecat.dsl.compression import CompressionPayloadCodec
+from tracecat.dsl.offload import OFFLOAD_ENCODING, OffloadPayloadCodec
+
+
+@pytest.fixture
+def blob_store():
+    """Patch the storage layer with an in-memory bucket."""
+    objects: dict[str, bytes] = {}
+    modified: dict[str, datetime] = {}
+
+    async def upload_file(content: bytes, key: str, bucket: str) -> None:
+        objects[key] = content
+        modified[key] = datetime.now(UTC)
+
+    async def download_file(key: str, bucket: str) -> bytes:
+        return objects[key]
+
+    async def get_file_last_modified(key: str, bucket: str) -> datetime | None:
+        return modified.get(key)
+
+    with (
+        patch("tracecat.storage.ensure_bucket_exists", AsyncMock()),
+        patch("tracecat.storage.set_bucket_expiration", AsyncMock()) as expiration,
+        patch("tracecat.storage.upload_file", AsyncMock(side_effect=upload_file)),
+        patch("tracecat.storage.download_file", AsyncMock(side_effect=download_file)),
+        patch(
+            "tracecat.storage.get_file_last_modified",
+            AsyncMock(side_effect=get_file_last_modified),
+        ),
+        patch("tracecat.storage.touch_file", AsyncMock()) as touch,
+    ):
+        yield objects, modified, expiration, touch
+
+
+def make_payload(data: bytes) -> Payload:
+    return Payload(metadata={"encoding": b"json/plain"}, data=data)
+
+
+@pytest.mark.anyio
+async def test_offload_roundtrip(blob_store):
+    objects, _, expiration, _ = blob_store
+    codec = OffloadPayloadCodec(threshold_bytes=16, enabled=True, retention_days=30)
+    small, large = make_payload(b'"small"'), make_payload(b'"' + b"x" * 1024 + b'"')
+
+    encoded = await codec.encode([small, large])
+
+    assert encoded[0] == small
+    assert encoded[1].metadata["encoding"] == OFFLOAD_ENCODING
+    assert len(encoded[1].data) < len(large.data)
+    assert len(objects) == 1
+    expiration.assert_awaited_once()
+    assert expiration.await_args.kwargs["days"] == 30
+
+    # A fresh codec has nothing cached and fetches from the store
+    decoded = await OffloadPayloadCodec(enabled=True).decode(encoded)
+    assert decoded == [small, large]
+
+
+@pytest.mark.anyio
+async def test_offload_deduplicates_identical_payloads(blob_store):
+    objects, modified, _, touch = blob_store
+    codec = OffloadPayloadCodec(threshold_bytes=16, enabled=True, retention_days=30)
+    payload = make_payload(b"y" * 1024)
+
+    first = await codec.encode([payload, payload])
+    assert first[0] == first[1]
+    assert len(objects) == 1
+
+    # Content stored long ago by another process is refreshed, not re-uploaded
+    [key] = objects
+    modified[key] = datetime.now(UTC) - timedelta(days=20)
+    await OffloadPayloadCodec(threshold_bytes=16, enabled=True).encode([payload])
+    touch.assert_awaited_once()
+    assert len(objects) == 1
+
+
+@pytest.mark.anyio
+async def test_offload_rejects_tampered_content(blob_store):
+    objects, *_ = blob_store
+    codec = OffloadPayloadCodec(threshold_bytes=16, enabled=True)
+    encoded = await codec.encode([make_payload(b"z" * 1024)])
+    [key] = objects
+    objects[key] = make_payload(b"tampered").SerializeToString()
+
+    with pytest.raises(ValueError, match="integrity check"):
+        await OffloadPayloadCodec(enabled=True).decode(encoded)
+
+
+@pytest.mark.anyio
+async def test_offload_falls_back_to_inline_on_storage_error(blob_store):
+    codec = OffloadPayloadCodec(threshold_bytes=16, enabled=True)
+    payload = make_payload(b"w" * 1024)
+    with patch("tracecat.storage.upload_file", AsyncMock(side_effect=OSError)):
+        assert await codec.encode([payload]) == [payload]
+
+
+@pytest.mark.anyio
+async def test_offload_after_compression(blob_store):
+    objects, *_ = blob_store
+    codec = ChainedPayloadCodec(
+        CompressionPayloadCodec(threshold_bytes=16, enabled=True),
+        OffloadPayloadCodec(threshold_bytes=64, enabled=True),
+    )
+    compressible = make_payload(b"a" * 4096)
+    incompressible = make_payload(bytes(range(256)) * 4)
+
+    encoded = await codec.encode([compressible, incompressible])
+
+    # Only the payload that is still large after compression is offloaded
+    assert encoded[0].metadata["encoding"] == b"binary/zstd"
+    assert encoded[1].metadata["encoding"] == OFFLOAD_ENCODING
+    assert len(objects) == 1
+    assert await codec.decode(encoded) == [compressible, incompressible]
+
+
+@pytest.mark.anyio
+async def test_offload_dedupe_expires_with_stored_object(blob_store):
+    objects, modified, _, touch = blob_store
+    codec = OffloadPayloadCodec(threshold_bytes=16, enabled=True, retention_days=30)
+    payload = make_payload(b"v" * 1024)
+    await codec.encode([payload])
+    [key] = objects
+
+    # An object stored 14 days ago by another process has one day until it
+    # needs a touch, so the codec only skips the check for that long
+    codec._stored.clear()
+    modified[key] = datetime.now(UTC) - timedelta(days=14)
+    with patch("tracecat.cache.time.monotonic", return_value=0.0):
+        await codec.encode([payload])
+    with patch("tracecat.cache.time.monotonic", return_value=2 * 86400.0):
+        assert codec._stored.get(key) is None
+    touch.assert_not_awaited()
+
+
+@pytest.mark.anyio
+async def test_offload_decode_cache_is_bounded_by_size(blob_store):
+    codec = OffloadPayloadCodec(threshold_bytes=16, enabled=True)
+    encoded = await codec.encode(
+        [make_payload(bytes([i]) * 1024) for i in range(4)]
+        + [make_payload(b"h" * 8192)]
+    )
+    decoder = OffloadPayloadCodec(enabled=True)
+    decoder._decoded.maxbytes = 3000
+
+    await decoder.decode(encoded)
+
+    # Only the most recent small payloads fit, the large one is never cached
+    assert len(decoder._decoded) == 2
+    assert decoder._decoded.currbytes <= 3000
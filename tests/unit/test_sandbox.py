@@ -17,7 +17,7 @@ from tracecat.secrets.models import (
     SecretKeyValue,
     SecretSearch,
 )
-from tracecat.secrets.service import SecretsService
+from tracecat.secrets.service import SecretsService, secrets_cache
 from tracecat.types.auth import Role
 from tracecat.types.exceptions import TracecatCredentialsError
 
@@ -53,6 +53,42 @@ async def test_auth_sandbox_with_secrets(mocker: pytest_mock.MockFixture, test_r
     AuthSandbox._get_secrets.assert_called_once()
 
 
+@pytest.mark.anyio
+async def test_auth_sandbox_caches_secrets(mocker: pytest_mock.MockFixture, test_role):
+    role = ctx_role.get()
+    assert role is not None
+    assert role.workspace_id is not None
+
+    mock_secret = BaseSecret(
+        name="my_secret",
+        owner_id=role.workspace_id,
+        encrypted_keys=encrypt_keyvalues(
+            [SecretKeyValue(key="SECRET_KEY", value=SecretStr("my_secret_key"))],
+            key=os.environ["TRACECAT__DB_ENCRYPTION_KEY"],
+        ),
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+        tags={},
+    )
+    mocker.patch.object(AuthSandbox, "_get_secrets", return_value=[mock_secret])
+
+    for _ in range(2):
+        async with AuthSandbox(secrets=["my_secret"]) as sandbox:
+            assert sandbox.secrets == {"my_secret": {"SECRET_KEY": "my_secret_key"}}
+    AuthSandbox._get_secrets.assert_called_once_with({"my_secret"})
+
+    # Secrets are cached per environment
+    async with AuthSandbox(secrets=["my_secret"], environment="staging"):
+        pass
+    assert AuthSandbox._get_secrets.call_count == 2
+
+    # Writes to secrets invalidate the cache
+    secrets_cache.clear()
+    async with AuthSandbox(secrets=["my_secret"]):
+        pass
+    assert AuthSandbox._get_secrets.call_count == 3
+
+
 @pytest.mark.anyio
 async def test_auth_sandbox_without_secrets(test_role, mock_user_id):
     # Auth sandbox has a different role.
@@ -259,6 +295,8 @@ async def test_auth_sandbox_optional_secrets(
 
     # Test that missing required secret still raises an error
     mock_secrets_service.search_secrets.return_value = []
+    # Deleting a secret invalidates the secrets cache
+    secrets_cache.clear()
     with pytest.raises(TracecatCredentialsError) as exc_info:
         async with AuthSandbox(
             secrets=["required_secret", "optional_secret"],
@@ -1,14 +1,19 @@
 """Unit tests for the CSVImporter class."""
 
+from datetime import UTC, datetime
+from decimal import Decimal
+from io import BytesIO
 from unittest.mock import AsyncMock, Mock
 from uuid import uuid4
 
 import pytest
 
 from tracecat.db.schemas import Table, TableColumn
+from tracecat.tables.common import to_copy_value
 from tracecat.tables.enums import SqlType
 from tracecat.tables.importer import ColumnInfo, CSVImporter
 from tracecat.tables.service import TablesService
+from tracecat.types.exceptions import TracecatImportError
 
 
 @pytest.fixture
@@ -206,3 +211,95 @@ class TestCSVImporter:
 
         mock_service.batch_insert_rows.assert_not_called()
         assert csv_importer.total_rows_inserted == 0
+
+    @pytest.mark.anyio
+    async def test_import_csv(self, csv_importer: CSVImporter) -> None:
+        """Test streaming a CSV file into the table in chunks."""
+        mock_service = AsyncMock(spec=TablesService)
+        mock_service.copy_rows = AsyncMock(
+            side_effect=lambda table, columns, records: len(records)
+        )
+        mock_table = Mock(spec=Table)
+        mock_table.name = "people"
+        csv_file = BytesIO(
+            "\ufeffcsv_name,csv_age,csv_score,extra\n"
+            "Jöhn,30,95.5,x\n"
+            '"Doe, Jane",,1.25,y\n'
+            "Bob,41,,z\n".encode()
+        )
+        column_mapping = {
+            "csv_name": "name",
+            "csv_age": "age",
+            "csv_score": "score",
+            "extra": "skip",
+        }
+
+        count = await csv_importer.import_csv(
+            csv_file, column_mapping, mock_service, mock_table, chunk_size=2
+        )
+
+        assert count == 3
+        assert csv_importer.total_rows_inserted == 3
+        assert not csv_file.closed
+        calls = mock_service.copy_rows.await_args_list
+        assert [call.args[1] for call in calls] == [["name", "age", "score"]] * 2
+        assert [list(call.args[2]) for call in calls] == [
+            [("Jöhn", 30, Decimal("95.5")), ("Doe, Jane", None, Decimal("1.25"))],
+            [("Bob", 41, None)],
+        ]
+
+    @pytest.mark.anyio
+    async def test_import_csv_reports_row_errors(
+        self, csv_importer: CSVImporter
+    ) -> None:
+        """Test that conversion errors are reported per row and stop the load."""
+        mock_service = AsyncMock(spec=TablesService)
+        mock_service.copy_rows = AsyncMock(return_value=1)
+        mock_table = Mock(spec=Table)
+        csv_file = BytesIO(b"age,active\n1,true\nabc,false\n2,maybe\n")
+
+        with pytest.raises(TracecatImportError) as exc_info:
+            await csv_importer.import_csv(
+                csv_file,
+                {"age": "age", "active": "active"},
+                mock_service,
+                mock_table,
+            )
+
+        assert [(e["line"], e["column"]) for e in exc_info.value.detail] == [
+            (3, "age"),
+            (4, "active"),
+        ]
+        mock_service.copy_rows.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "value,sql_type,expected",
+    [
+        ("", SqlType.TEXT, ""),
+        ("", SqlType.INTEGER, None),
+        ("0.1", SqlType.NUMERIC, Decimal("0.1")),
+        ('{"a": 1}', SqlType.JSONB, '{"a": 1}'),
+        (
+            "2024-01-01T12:00:00+02:00",
+            SqlType.TIMESTAMP,
+            datetime(2024, 1, 1, 10, 0),
+        ),
+        (
+            "2024-01-01T12:00:00",
+            SqlType.TIMESTAMPTZ,
+            datetime(2024, 1, 1, 12, 0, tzinfo=UTC),
+        ),
+    ],
+)
+def test_to_copy_value(value: str, sql_type: SqlType, expected: object) -> None:
+    assert to_copy_value(value, sql_type) == expected
+
+
+@pytest.mark.parametrize(
+    "value,sql_type",
+    [("abc", SqlType.NUMERIC), ("{", SqlType.JSONB), ("x", SqlType.UUID)],
+)
+def test_to_copy_value_invalid(value: str, sql_type: SqlType) -> None:
+    with pytest.raises(TypeError, match="Cannot convert value"):
+        to_copy_value(value, sql_type)
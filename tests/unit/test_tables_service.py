@@ -19,6 +19,7 @@ from tracecat.tables.models import (
 from tracecat.tables.service import TablesService
 from tracecat.types.auth import Role
 from tracecat.types.exceptions import TracecatNotFoundError
+from tracecat.types.pagination import CursorPaginationParams
 
 pytestmark = pytest.mark.usefixtures("db")
 
@@ -227,6 +228,55 @@ class TestTableColumns:
 
         assert "Table cannot have multiple unique indexes" in str(exc_info.value)
 
+    async def test_create_and_drop_search_index(
+        self, tables_service: TablesService, table: Table
+    ) -> None:
+        """Test creating and dropping a trigram search index."""
+        await tables_service.create_search_index(table, "name")
+
+        search_indexes = await tables_service.get_search_index(table)
+        assert list(search_indexes) == ["name"]
+        # Search indexes are not unique indexes
+        assert await tables_service.get_index(table) == []
+
+        await tables_service.drop_search_index(table, "name")
+        assert await tables_service.get_search_index(table) == {}
+
+    async def test_create_search_index_on_jsonb_column(
+        self, tables_service: TablesService, table: Table
+    ) -> None:
+        """Test that JSONB search indexes are reflected by column name."""
+        await tables_service.create_column(
+            table,
+            TableColumnCreate(name="data", type=SqlType.JSONB, nullable=True),
+        )
+        await tables_service.session.refresh(table)
+        await tables_service.create_search_index(table, "data")
+
+        search_indexes = await tables_service.get_search_index(table)
+        assert list(search_indexes) == ["data"]
+
+    async def test_create_and_drop_secondary_index(
+        self, tables_service: TablesService, table: Table
+    ) -> None:
+        """Test creating and dropping a secondary index."""
+        await tables_service.create_secondary_index(table, "age")
+
+        secondary_indexes = await tables_service.get_secondary_index(table)
+        assert list(secondary_indexes) == ["age"]
+        assert await tables_service.get_index(table) == []
+        assert await tables_service.get_search_index(table) == {}
+
+        await tables_service.drop_secondary_index(table, "age")
+        assert await tables_service.get_secondary_index(table) == {}
+
+    async def test_create_search_index_unsupported_type(
+        self, tables_service: TablesService, table: Table
+    ) -> None:
+        """Test that search indexes can only be created on TEXT and JSONB columns."""
+        with pytest.raises(ValueError, match="only supported on TEXT and JSONB"):
+            await tables_service.create_search_index(table, "age")
+
 
 @pytest.mark.anyio
 class TestTableRows:
@@ -381,6 +431,52 @@ class TestTableRows:
         assert result["name"] == "Bob"
         assert result["age"] == 40
 
+    async def test_batch_lookup_rows(
+        self, tables_service: TablesService, table: Table
+    ) -> None:
+        """Test that batch lookups return matches aligned with the keys."""
+        for name, age in [("Bob", 40), ("Carol", 35), ("Bob", 45)]:
+            await tables_service.insert_row(
+                table, TableRowInsert(data={"name": name, "age": age})
+            )
+
+        results = await tables_service.batch_lookup_rows(
+            table.name,
+            columns=["name"],
+            keys=[["Carol"], ["Dave"], ["Bob"], ["Carol"]],
+        )
+        assert [[row["age"] for row in rows] for rows in results] == [
+            [35],
+            [],
+            [40, 45],
+            [35],
+        ]
+
+        # Composite keys, with string values coerced to the column type
+        results = await tables_service.batch_lookup_rows(
+            table.name,
+            columns=["name", "age"],
+            keys=[["Bob", "45"], ["Bob", 35]],
+        )
+        assert [[row["age"] for row in rows] for rows in results] == [[45], []]
+
+        # Limit the number of rows per key
+        results = await tables_service.batch_lookup_rows(
+            table.name, columns=["name"], keys=[["Bob"], ["Carol"]], limit=1
+        )
+        assert [len(rows) for rows in results] == [1, 1]
+        assert "__key_index" not in results[0][0]
+        assert "__key_rank" not in results[0][0]
+
+    async def test_batch_lookup_rows_unknown_column(
+        self, tables_service: TablesService, table: Table
+    ) -> None:
+        """Test that batch lookups reject columns that don't exist."""
+        with pytest.raises(ValueError, match="does not exist"):
+            await tables_service.batch_lookup_rows(
+                table.name, columns=["missing"], keys=[["x"]]
+            )
+
     async def test_list_rows(self, tables_service: TablesService, table: Table) -> None:
         """Test listing rows with pagination using limit and offset."""
         # Insert multiple test rows
@@ -415,6 +511,53 @@ class TestTableRows:
         empty_rows = await tables_service.list_rows(table, offset=10)
         assert len(empty_rows) == 0
 
+    async def test_list_rows_paginated_by_column(
+        self, tables_service: TablesService, table: Table
+    ) -> None:
+        """Test keyset pagination ordered by a user column, with NULLs last."""
+        await tables_service.create_secondary_index(table, "age")
+        for name, age in [
+            ("Alice", 30),
+            ("Bob", None),
+            ("Carol", 25),
+            ("David", 40),
+            ("Eve", 30),
+        ]:
+            await tables_service.insert_row(
+                table, TableRowInsert(data={"name": name, "age": age})
+            )
+
+        ages: list[int | None] = []
+        cursor = None
+        while True:
+            page = await tables_service.list_rows_paginated(
+                table,
+                CursorPaginationParams(limit=2, cursor=cursor),
+                order_by="age",
+                sort="asc",
+            )
+            ages.extend(row["age"] for row in page.items)
+            if not page.has_more:
+                break
+            cursor = page.next_cursor
+        assert ages == [25, 30, 30, 40, None]
+
+        # Walk back from the last page
+        assert page.prev_cursor is not None
+        previous = await tables_service.list_rows_paginated(
+            table,
+            CursorPaginationParams(limit=2, cursor=page.prev_cursor, reverse=True),
+            order_by="age",
+            sort="asc",
+        )
+        assert [row["age"] for row in previous.items] == [30, 40]
+
+        # Cursors are bound to their sort order
+        with pytest.raises(ValueError, match="does not match"):
+            await tables_service.list_rows_paginated(
+                table, CursorPaginationParams(limit=2, cursor=page.prev_cursor)
+            )
+
     async def test_batch_insert_rows(
         self, tables_service: TablesService, table: Table
     ) -> None:
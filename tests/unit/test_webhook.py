@@ -1,11 +1,26 @@
-from unittest.mock import AsyncMock, MagicMock
+import uuid
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import orjson
 import pytest
-from fastapi import Request
+from fastapi import HTTPException, Request
 from fastapi.datastructures import FormData
 
-from tracecat.webhooks.dependencies import parse_webhook_payload
+from tracecat.contexts import ctx_role
+from tracecat.dsl.common import DSLInput
+from tracecat.identifiers.workflow import WorkflowUUID
+from tracecat.webhooks.cache import (
+    dsl_input_cache,
+    invalidate_webhook_cache,
+    latest_definition_version_cache,
+    webhook_cache,
+)
+from tracecat.webhooks.dependencies import (
+    parse_webhook_payload,
+    validate_incoming_webhook,
+    validate_workflow_definition,
+)
 
 
 class TestParseWebhookPayload:
@@ -159,3 +174,95 @@ class TestParseWebhookPayload:
 
         result = await parse_webhook_payload(request, "text/plain")
         assert result == test_data
+
+
+@pytest.fixture
+def clear_webhook_caches():
+    yield
+    webhook_cache.clear()
+    latest_definition_version_cache.clear()
+    dsl_input_cache.clear()
+
+
+def mock_session_manager(record):
+    """Patch the DB session used by the webhook dependencies to return `record`."""
+    result = MagicMock()
+    result.one.return_value = record
+    result.first.return_value = record
+    session = MagicMock()
+    session.exec = AsyncMock(return_value=result)
+
+    @asynccontextmanager
+    async def session_cm():
+        yield session
+
+    patcher = patch(
+        "tracecat.webhooks.dependencies.get_async_session_context_manager",
+        side_effect=session_cm,
+    )
+    return patcher, session
+
+
+@pytest.mark.usefixtures("clear_webhook_caches")
+class TestWebhookIngressCache:
+    """Test cases for caching on the webhook ingress path."""
+
+    @pytest.mark.anyio
+    async def test_incoming_webhook_served_from_cache(self):
+        """Test that a validated webhook is only loaded from the database once."""
+        workflow_id = WorkflowUUID.new_uuid4()
+        record = MagicMock(
+            owner_id=uuid.uuid4(),
+            secret="s3cret",
+            status="online",
+            normalized_methods=("post",),
+        )
+        request = MagicMock(spec=Request, method="POST")
+        patcher, session = mock_session_manager(record)
+        with patcher:
+            await validate_incoming_webhook(workflow_id, "s3cret", request)
+            await validate_incoming_webhook(workflow_id, "s3cret", request)
+            with pytest.raises(HTTPException) as exc_info:
+                await validate_incoming_webhook(workflow_id, "wrong", request)
+
+        assert exc_info.value.status_code == 401
+        assert session.exec.await_count == 1
+        role = ctx_role.get()
+        assert role is not None and role.workspace_id == record.owner_id
+
+    @pytest.mark.anyio
+    async def test_workflow_definition_served_from_cache(self):
+        """Test that the latest definition is validated once and reloaded after invalidation."""
+        workflow_id = WorkflowUUID.new_uuid4()
+        content = {
+            "title": "Webhook workflow",
+            "description": "Reshapes the trigger",
+            "entrypoint": {"ref": "reshape"},
+            "actions": [
+                {
+                    "ref": "reshape",
+                    "action": "core.transform.reshape",
+                    "args": {"value": "${{ TRIGGER }}"},
+                }
+            ],
+        }
+        defn = MagicMock(version=1, content=content)
+        patcher, session = mock_session_manager(defn)
+        with patcher:
+            first = await validate_workflow_definition(workflow_id)
+            second = await validate_workflow_definition(workflow_id)
+            assert isinstance(first, DSLInput)
+            assert second is first
+            assert session.exec.await_count == 1
+
+            # A commit invalidates the latest version, but the validated DSL
+            # for an unchanged version is reused
+            invalidate_webhook_cache(workflow_id)
+            assert await validate_workflow_definition(workflow_id) is first
+            assert session.exec.await_count == 2
+
+            defn.version = 2
+            invalidate_webhook_cache(workflow_id)
+            third = await validate_workflow_definition(workflow_id)
+            assert third is not first
+            assert session.exec.await_count == 3
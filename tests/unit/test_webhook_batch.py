@@ -0,0 +1,133 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from temporalio.service import RPCError, RPCStatusCode
+
+from tracecat.dsl.common import DSLInput
+from tracecat.identifiers.workflow import WorkflowUUID, generate_exec_id
+from tracecat.types.exceptions import TracecatValidationError
+from tracecat.webhooks.batch import (
+    MAX_START_ATTEMPTS,
+    AdaptiveRateLimiter,
+    WebhookBatch,
+    create_webhook_batch,
+    dispatch_webhook_batch,
+    webhook_batch_cache,
+)
+from tracecat.webhooks.models import WebhookBatchRecord
+from tracecat.workflow.executions.service import WorkflowExecutionsService
+
+
+@pytest.fixture
+def service() -> MagicMock:
+    svc = MagicMock(spec=WorkflowExecutionsService)
+    svc.start_workflow_execution = AsyncMock()
+    return svc
+
+
+@pytest.fixture
+def dsl() -> DSLInput:
+    return MagicMock(spec=DSLInput)
+
+
+def make_batch(n_records: int) -> WebhookBatch:
+    wf_id = WorkflowUUID.new_uuid4()
+    return WebhookBatch(
+        batch_id="wh-batch-test",
+        wf_id=wf_id,
+        records=[
+            WebhookBatchRecord(index=i, wf_exec_id=generate_exec_id(wf_id))
+            for i in range(n_records)
+        ],
+    )
+
+
+def test_adaptive_rate_limiter_aimd():
+    """Test that the rate grows additively and halves on backpressure."""
+    limiter = AdaptiveRateLimiter(10, min_rate=2, max_rate=12)
+    limiter.on_success()
+    assert limiter.rate == 11
+    limiter.on_success()
+    limiter.on_success()
+    assert limiter.rate == 12
+
+    limiter.on_backpressure()
+    assert limiter.rate == 6
+    assert limiter.tokens <= 0
+    for _ in range(5):
+        limiter.on_backpressure()
+    assert limiter.rate == 2
+
+
+@pytest.mark.anyio
+async def test_create_webhook_batch(service: MagicMock, dsl: DSLInput):
+    """Test that every record gets an execution ID and is started in the background."""
+    wf_id = WorkflowUUID.new_uuid4()
+    payloads = [{"i": i} for i in range(20)]
+
+    batch = create_webhook_batch(service, dsl=dsl, wf_id=wf_id, payloads=payloads)
+    assert webhook_batch_cache.get(batch.batch_id) is batch
+    assert len({r.wf_exec_id for r in batch.records}) == 20
+    assert batch.task is not None
+    await batch.task
+
+    read = batch.to_read()
+    assert (read.total, read.started, read.pending, read.failed) == (20, 20, 0, 0)
+    started = {
+        call.kwargs["wf_exec_id"]: call.kwargs["payload"]
+        for call in service.start_workflow_execution.await_args_list
+    }
+    assert started == {r.wf_exec_id: payloads[r.index] for r in batch.records}
+
+
+@pytest.mark.anyio
+async def test_dispatch_webhook_batch_retries_backpressure(
+    service: MagicMock, dsl: DSLInput
+):
+    """Test that overloaded starts are retried and other errors are recorded."""
+    payloads = [{"ok": True}, {"ok": False}, {"busy": True}]
+    busy_attempts = 0
+
+    async def start_workflow_execution(*, payload, **kwargs):
+        nonlocal busy_attempts
+        if payload.get("busy") and busy_attempts < 2:
+            busy_attempts += 1
+            raise RPCError("busy", RPCStatusCode.RESOURCE_EXHAUSTED, b"")
+        if payload.get("ok") is False:
+            raise TracecatValidationError("Invalid trigger inputs")
+
+    service.start_workflow_execution.side_effect = start_workflow_execution
+    batch = make_batch(len(payloads))
+    limiter = AdaptiveRateLimiter(1000, max_rate=1000)
+    await dispatch_webhook_batch(
+        service, batch, dsl=dsl, payloads=payloads, limiter=limiter
+    )
+
+    statuses = [(r.status, r.error) for r in batch.records]
+    assert statuses == [
+        ("started", None),
+        ("failed", "Invalid trigger inputs"),
+        ("started", None),
+    ]
+    assert busy_attempts == 2
+    assert limiter.rate < 1000
+
+
+@pytest.mark.anyio
+async def test_dispatch_webhook_batch_gives_up_after_max_attempts(
+    service: MagicMock, dsl: DSLInput
+):
+    """Test that a record fails once it exhausts its start attempts."""
+    service.start_workflow_execution.side_effect = RPCError(
+        "unavailable", RPCStatusCode.UNAVAILABLE, b""
+    )
+    batch = make_batch(1)
+    await dispatch_webhook_batch(
+        service,
+        batch,
+        dsl=dsl,
+        payloads=[{}],
+        limiter=AdaptiveRateLimiter(1000, min_rate=1000),
+    )
+    assert batch.records[0].status == "failed"
+    assert service.start_workflow_execution.await_count == MAX_START_ATTEMPTS
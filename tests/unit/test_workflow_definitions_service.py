@@ -9,7 +9,13 @@ from tracecat.db.schemas import Workflow, Workspace
 from tracecat.dsl.common import DSLInput
 from tracecat.identifiers.workflow import WorkflowUUID
 from tracecat.types.auth import Role
-from tracecat.workflow.management.definitions import WorkflowDefinitionsService
+from tracecat.workflow.management.definitions import (
+    WorkflowDefinitionsService,
+    definition_cache,
+    get_workflow_definition_activity,
+    resolve_workflow_definition_activity,
+)
+from tracecat.workflow.management.models import GetWorkflowDefinitionActivityInputs
 
 pytestmark = pytest.mark.usefixtures("db")
 
@@ -189,3 +195,47 @@ async def test_create_workflow_definition_with_various_datetime_formats(
     assert isinstance(args["date_only"], str)
     assert isinstance(args["nested_dates"]["start"], str)
     assert isinstance(args["nested_dates"]["end"], str)
+
+
+@pytest.mark.anyio
+async def test_resolve_workflow_definition_pins_version_and_caches(
+    definitions_service: WorkflowDefinitionsService,
+    workflow_id: WorkflowUUID,
+    svc_role: Role,
+):
+    """Test that resolving a definition pins the latest version and caches it."""
+    for title in ("v1", "v2"):
+        dsl = DSLInput.model_validate(
+            {
+                "title": title,
+                "description": "Test workflow",
+                "entrypoint": {"ref": "a"},
+                "actions": [{"ref": "a", "action": "core.transform.reshape"}],
+            }
+        )
+        await definitions_service.create_workflow_definition(
+            workflow_id=workflow_id, dsl=dsl, commit=True
+        )
+    definition_cache.clear()
+
+    resolved = await resolve_workflow_definition_activity(
+        GetWorkflowDefinitionActivityInputs(role=svc_role, workflow_id=workflow_id)
+    )
+    assert resolved.workflow_id == workflow_id
+    assert resolved.version == 2
+    assert resolved.dsl.title == "v2"
+
+    # Children pass (workflow ID, version) and are served from the cache
+    pinned = GetWorkflowDefinitionActivityInputs(
+        role=svc_role, workflow_id=workflow_id, version=resolved.version
+    )
+    assert await get_workflow_definition_activity(pinned) is resolved.dsl
+
+    # Older versions stay addressable
+    old = await get_workflow_definition_activity(
+        GetWorkflowDefinitionActivityInputs(
+            role=svc_role, workflow_id=workflow_id, version=1
+        )
+    )
+    assert old.title == "v1"
+    assert definition_cache.get((svc_role.workspace_id, workflow_id, 1)) is old
@@ -51,11 +51,12 @@ from tracecat.secrets.router import org_router as org_secrets_router
 from tracecat.secrets.router import router as secrets_router
 from tracecat.settings.router import router as org_settings_router
 from tracecat.settings.service import SettingsService, get_setting_override
-from tracecat.storage import ensure_bucket_exists
+from tracecat.storage import close_storage_client, ensure_bucket_exists
 from tracecat.tables.router import router as tables_router
 from tracecat.tags.router import router as tags_router
 from tracecat.types.auth import Role
 from tracecat.types.exceptions import TracecatException
+from tracecat.webhooks.router import batch_router as webhook_batch_router
 from tracecat.webhooks.router import router as webhook_router
 from tracecat.workflow.actions.router import router as workflow_actions_router
 from tracecat.workflow.executions.router import router as workflow_executions_router
@@ -85,6 +86,7 @@ async def lifespan(app: FastAPI):
         await reload_registry(session, role)
         await setup_workspace_defaults(session, role)
     yield
+    await close_storage_client()
 
 
 async def setup_org_settings(session: AsyncSession, admin_role: Role):
@@ -175,6 +177,7 @@ def create_app(**kwargs) -> FastAPI:
 
     # Routers
     app.include_router(webhook_router)
+    app.include_router(webhook_batch_router)
     app.include_router(workspaces_router)
     app.include_router(workflow_management_router)
     app.include_router(workflow_executions_router)
@@ -11,6 +11,7 @@ from tracecat.api.common import (
     tracecat_exception_handler,
 )
 from tracecat.executor.engine import setup_ray
+from tracecat.executor.pool import shutdown_worker_pools
 from tracecat.executor.router import router as executor_router
 from tracecat.logger import logger
 from tracecat.middleware import RateLimitMiddleware, RequestLoggingMiddleware
@@ -20,7 +21,10 @@ from tracecat.types.exceptions import TracecatException
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     with setup_ray():
-        yield
+        try:
+            yield
+        finally:
+            shutdown_worker_pools()
 
 
 def create_app(**kwargs) -> FastAPI:
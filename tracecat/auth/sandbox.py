@@ -10,11 +10,12 @@ from typing import Any, Self
 
 from tracecat.contexts import ctx_role
 from tracecat.db.schemas import BaseSecret
+from tracecat.identifiers import WorkspaceID
 from tracecat.logger import logger
 from tracecat.secrets.constants import DEFAULT_SECRETS_ENVIRONMENT
 from tracecat.secrets.encryption import decrypt_keyvalues
 from tracecat.secrets.models import SecretKeyValue, SecretSearch
-from tracecat.secrets.service import SecretsService
+from tracecat.secrets.service import SecretsService, secrets_cache
 from tracecat.types.auth import Role
 from tracecat.types.exceptions import TracecatCredentialsError
 
@@ -51,8 +52,7 @@ class AuthSandbox:
 
     def __enter__(self) -> Self:
         if self._secret_paths:
-            self._secret_objs = asyncio.run(self._get_secrets())
-            self._set_secrets()
+            asyncio.run(self._load_secrets())
         return self
 
     def __exit__(
@@ -70,8 +70,7 @@ class AuthSandbox:
 
     async def __aenter__(self) -> Self:
         if self._secret_paths:
-            self._secret_objs = await self._get_secrets()
-            self._set_secrets()
+            await self._load_secrets()
         return self
 
     async def __aexit__(
@@ -100,6 +99,24 @@ class AuthSandbox:
             logger.error(f"Error decrypting secrets: {e!r}")
             raise
 
+    def _cache_key(self, name: str) -> tuple[WorkspaceID | None, str, str]:
+        return (self._role.workspace_id, self._environment, name)
+
+    async def _load_secrets(self) -> None:
+        """Load secrets into the context, reading from the secrets cache first."""
+        unique_secret_names = {path.split(".")[0] for path in self._secret_paths}
+        for name in unique_secret_names:
+            if (keys := secrets_cache.get(self._cache_key(name))) is not None:
+                self._context[name] = keys.copy()
+        if uncached_names := unique_secret_names - self._context.keys():
+            self._secret_objs = await self._get_secrets(uncached_names)
+            self._set_secrets()
+        logger.debug(
+            "Loaded secrets",
+            n_cached=len(unique_secret_names) - len(uncached_names),
+            n_fetched=len(uncached_names),
+        )
+
     def _set_secrets(self) -> None:
         """Set secrets in the target."""
         logger.info(
@@ -107,32 +124,35 @@ class AuthSandbox:
             paths=self._secret_paths,
             objs=self._secret_objs,
         )
+        fetched: dict[str, dict[str, str]] = {}
         for name, kv in self._iter_secrets():
-            if name not in self._context:
-                self._context[name] = {}
-            self._context[name][kv.key] = kv.value.get_secret_value()
+            if name not in fetched:
+                fetched[name] = {}
+            fetched[name][kv.key] = kv.value.get_secret_value()
+        for name, keys in fetched.items():
+            secrets_cache.set(self._cache_key(name), keys)
+            self._context[name] = keys.copy()
 
     def _unset_secrets(self) -> None:
         logger.trace("Cleaning up secrets")
-        for secret in self._secret_objs:
-            if secret.name in self._context:
-                del self._context[secret.name]
+        self._context.clear()
 
-    async def _get_secrets(self) -> Sequence[BaseSecret]:
+    async def _get_secrets(self, secret_names: set[str]) -> Sequence[BaseSecret]:
         """Retrieve secrets from a secrets manager."""
-        return await self._get_secrets_from_service()
+        return await self._get_secrets_from_service(secret_names)
 
-    async def _get_secrets_from_service(self) -> Sequence[BaseSecret]:
+    async def _get_secrets_from_service(
+        self, unique_secret_names: set[str]
+    ) -> Sequence[BaseSecret]:
         """Retrieve secrets from the secrets service."""
         logger.debug(
             "Retrieving secrets directly from db",
-            secret_names=self._secret_paths,
+            secret_names=unique_secret_names,
             role=self._role,
             environment=self._environment,
         )
 
         # These are a combination of required and optional secrets
-        unique_secret_names = {path.split(".")[0] for path in self._secret_paths}
         async with SecretsService.with_session(role=self._role) as service:
             logger.info("Retrieving secrets", secret_names=unique_secret_names)
 
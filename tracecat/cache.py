@@ -0,0 +1,91 @@
+"""In-process caching utilities."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import NamedTuple
+
+
+class CacheInfo(NamedTuple):
+    """Hit/miss statistics for a cache."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class TTLCache[K: Hashable, V]:
+    """A bounded, thread-safe LRU cache with optional per-entry expiry.
+
+    Entries are evicted in least-recently-used order once `maxsize` is reached,
+    and lazily dropped on access after their time-to-live has elapsed.
+    A `ttl` of None means entries only leave the cache through eviction or
+    explicit invalidation. None is used to signal a miss, so it cannot be cached
+    as a value.
+    """
+
+    def __init__(self, *, maxsize: int = 1024, ttl: float | None = None) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[K, tuple[V, float | None]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: K) -> bool:
+        return self.get(key, record=False) is not None
+
+    def get(self, key: K, *, record: bool = True) -> V | None:
+        """Return the cached value for `key`, or None if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._data.move_to_end(key)
+                    if record:
+                        self._hits += 1
+                    return value
+                del self._data[key]
+            if record:
+                self._misses += 1
+            return None
+
+    def set(self, key: K, value: V, *, ttl: float | None = None) -> None:
+        """Cache `value` under `key`. `ttl` overrides the cache-wide default."""
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: K) -> V | None:
+        """Remove `key` from the cache and return its value, if any."""
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return entry[0] if entry is not None else None
+
+    def clear(self) -> None:
+        """Remove all entries from the cache. Statistics are preserved."""
+        with self._lock:
+            self._data.clear()
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                maxsize=self.maxsize,
+                currsize=len(self._data),
+            )
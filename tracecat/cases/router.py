@@ -3,8 +3,10 @@ import uuid
 from typing import Annotated, Literal
 
 from fastapi import APIRouter, HTTPException, Query, Request, UploadFile, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.exc import DBAPIError
 
+from tracecat import config
 from tracecat.auth.credentials import RoleACL
 from tracecat.auth.models import UserRead
 from tracecat.auth.users import search_users
@@ -46,6 +48,7 @@ from tracecat.storage import (
     StorageLimitExceededError,
 )
 from tracecat.types.auth import AccessLevel, Role
+from tracecat.types.exceptions import TracecatException, TracecatNotFoundError
 from tracecat.types.pagination import (
     CursorPaginatedResponse,
     CursorPaginationParams,
@@ -84,6 +87,11 @@ async def list_cases(
     limit: int = Query(20, ge=1, le=100, description="Maximum items per page"),
     cursor: str | None = Query(None, description="Cursor for pagination"),
     reverse: bool = Query(False, description="Reverse pagination direction"),
+    order_by: Literal["created_at", "updated_at", "priority", "severity", "status"]
+    | None = Query(None, description="Field to order the cases by"),
+    sort: Literal["asc", "desc"] | None = Query(
+        None, description="Direction to sort (asc or desc)"
+    ),
 ) -> CursorPaginatedResponse[CaseReadMinimal]:
     """List cases with cursor-based pagination."""
     service = CasesService(session, role)
@@ -93,7 +101,13 @@ async def list_cases(
         reverse=reverse,
     )
     try:
-        cases = await service.list_cases_paginated(pagination_params)
+        cases = await service.list_cases_paginated(
+            pagination_params, order_by=order_by, sort=sort
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
     except Exception as e:
         logger.error(f"Failed to list cases: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve cases") from e
@@ -530,6 +544,20 @@ async def create_attachment(
             detail=f"Case with ID {case_id} not found",
         )
 
+    # Reject oversized uploads before reading them into memory
+    if file.size is not None and file.size > config.TRACECAT__MAX_ATTACHMENT_SIZE_BYTES:
+        max_mb = config.TRACECAT__MAX_ATTACHMENT_SIZE_BYTES / 1024 / 1024
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail={
+                "error": "file_too_large",
+                "message": (
+                    f"File size ({file.size / 1024 / 1024:.1f}MB) exceeds maximum "
+                    f"allowed size ({max_mb}MB)"
+                ),
+            },
+        )
+
     # Read file content
     try:
         # Reset file pointer to beginning to ensure we read the full content
@@ -827,6 +855,59 @@ async def download_attachment(
         ) from e
 
 
+@cases_router.get("/{case_id}/attachments/{attachment_id}/content")
+async def download_attachment_content(
+    *,
+    role: WorkspaceUser,
+    session: AsyncDBSession,
+    case_id: uuid.UUID,
+    attachment_id: uuid.UUID,
+) -> StreamingResponse:
+    """Stream an attachment's content through the API.
+
+    For clients that can't reach blob storage through a presigned URL.
+    """
+    service = CasesService(session, role)
+    case = await service.get_case(case_id)
+    if case is None:
+        logger.warning("Case not found", case_id=case_id, attachment_id=attachment_id)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Case with ID {case_id} not found",
+        )
+
+    try:
+        chunks, filename, _ = await service.attachments.stream_attachment(
+            case, attachment_id
+        )
+    except TracecatNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        ) from e
+    except TracecatException as e:
+        logger.error(
+            "Failed to stream attachment",
+            case_id=case_id,
+            attachment_id=attachment_id,
+            error=str(e),
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e),
+        ) from e
+
+    # Always force download with a safe content type, like presigned URLs do
+    return StreamingResponse(
+        chunks,
+        media_type="application/octet-stream",
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "X-Content-Type-Options": "nosniff",
+        },
+    )
+
+
 @cases_router.delete(
     "/{case_id}/attachments/{attachment_id}", status_code=status.HTTP_204_NO_CONTENT
 )
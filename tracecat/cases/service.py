@@ -1,5 +1,6 @@
+import hashlib
 import uuid
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 from datetime import UTC, datetime
 from typing import Any, Literal
 
@@ -7,7 +8,7 @@ import sqlalchemy as sa
 from asyncpg import UndefinedColumnError
 from sqlalchemy.exc import ProgrammingError
 from sqlalchemy.orm import selectinload
-from sqlmodel import and_, cast, col, desc, func, or_, select
+from sqlmodel import cast, col, desc, func, or_, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from tracecat import config, storage
@@ -65,6 +66,14 @@ from tracecat.types.pagination import (
     CursorPaginationParams,
 )
 
+_CASE_SORT_VALUE_TYPES: dict[str, Any] = {
+    "updated_at": datetime.fromisoformat,
+    "priority": CasePriority,
+    "severity": CaseSeverity,
+    "status": CaseStatus,
+}
+"""Converters from cursor-encoded sort values back to the case column types."""
+
 
 class CasesService(BaseWorkspaceService):
     service_name = "cases"
@@ -98,47 +107,63 @@ class CasesService(BaseWorkspaceService):
         return result.all()
 
     async def list_cases_paginated(
-        self, params: CursorPaginationParams
+        self,
+        params: CursorPaginationParams,
+        order_by: Literal["created_at", "updated_at", "priority", "severity", "status"]
+        | None = None,
+        sort: Literal["asc", "desc"] | None = None,
     ) -> CursorPaginatedResponse[CaseReadMinimal]:
-        """List cases with cursor-based pagination."""
+        """List cases with cursor-based pagination.
+
+        Args:
+            params: Pagination parameters
+            order_by: Field to order the cases by. Defaults to `created_at`.
+            sort: Direction to sort (asc or desc). Defaults to desc.
+        """
         paginator = BaseCursorPaginator(self.session)
 
         # Get estimated total count from table statistics
         total_estimate = await paginator.get_table_row_estimate("cases")
 
+        # Ties on the sort column are broken by (created_at, id)
+        sort_column = None if order_by in (None, "created_at") else order_by
+        sort_attr = col(getattr(Case, sort_column)) if sort_column else None
+        descending = sort != "asc"
+
         # Base query with workspace filter
         stmt = (
             select(Case)
             .where(Case.owner_id == self.workspace_id)
-            .order_by(col(Case.created_at).desc(), col(Case.id).desc())
+            .order_by(
+                *paginator.keyset_order_by(
+                    col(Case.created_at),
+                    col(Case.id),
+                    sort_column=sort_attr,
+                    descending=descending,
+                    reverse=params.reverse,
+                )
+            )
         )
 
         # Apply cursor filtering
         if params.cursor:
             cursor_data = paginator.decode_cursor(params.cursor)
-            cursor_time = cursor_data.created_at
-            cursor_id = uuid.UUID(cursor_data.id)
-
-            if params.reverse:
-                stmt = stmt.where(
-                    or_(
-                        col(Case.created_at) > cursor_time,
-                        and_(
-                            col(Case.created_at) == cursor_time,
-                            col(Case.id) > cursor_id,
-                        ),
-                    )
-                ).order_by(col(Case.created_at).asc(), col(Case.id).asc())
-            else:
-                stmt = stmt.where(
-                    or_(
-                        col(Case.created_at) < cursor_time,
-                        and_(
-                            col(Case.created_at) == cursor_time,
-                            col(Case.id) < cursor_id,
-                        ),
-                    )
+            if cursor_data.sort_column != sort_column:
+                raise ValueError("Cursor does not match the requested sort order")
+            sort_value = cursor_data.sort_value
+            if sort_column is not None and sort_value is not None:
+                sort_value = _CASE_SORT_VALUE_TYPES[sort_column](sort_value)
+            stmt = stmt.where(
+                paginator.keyset_predicate(
+                    col(Case.created_at),
+                    col(Case.id),
+                    cursor_data,
+                    sort_column=sort_attr,
+                    sort_value=sort_value,
+                    descending=descending,
+                    reverse=params.reverse,
                 )
+            )
 
         # Fetch limit + 1 to determine if there are more items
         stmt = stmt.limit(params.limit + 1)
@@ -156,19 +181,26 @@ class CasesService(BaseWorkspaceService):
 
         if has_more and cases:
             last_case = cases[-1]
-            next_cursor = paginator.encode_cursor(last_case.created_at, last_case.id)
+            next_cursor = paginator.encode_cursor(
+                last_case.created_at,
+                last_case.id,
+                sort_column=sort_column,
+                sort_value=getattr(last_case, sort_column) if sort_column else None,
+            )
 
         if params.cursor and cases:
             first_case = cases[0]
             # For reverse pagination, swap the cursor meaning
+            first_cursor = paginator.encode_cursor(
+                first_case.created_at,
+                first_case.id,
+                sort_column=sort_column,
+                sort_value=getattr(first_case, sort_column) if sort_column else None,
+            )
             if params.reverse:
-                next_cursor = paginator.encode_cursor(
-                    first_case.created_at, first_case.id
-                )
+                next_cursor = first_cursor
             else:
-                prev_cursor = paginator.encode_cursor(
-                    first_case.created_at, first_case.id
-                )
+                prev_cursor = first_cursor
 
         # Convert to CaseReadMinimal objects
         case_items = [
@@ -284,6 +316,15 @@ class CasesService(BaseWorkspaceService):
                 statement = statement.order_by(attr.desc())
             else:
                 statement = statement.order_by(attr)
+        elif search_term:
+            # Rank the best matching cases first, newest first among equal ranks
+            rank = func.greatest(
+                func.word_similarity(search_term, Case.summary),
+                func.word_similarity(search_term, Case.description),
+            )
+            statement = statement.order_by(
+                rank.desc(), col(Case.created_at).desc(), col(Case.id).desc()
+            )
 
         result = await self.session.exec(statement)
         return result.all()
@@ -1040,6 +1081,59 @@ class CaseAttachmentService(BaseWorkspaceService):
         except Exception as e:
             raise TracecatException(f"Failed to download attachment: {str(e)}") from e
 
+    async def stream_attachment(
+        self, case: Case, attachment_id: uuid.UUID
+    ) -> tuple[AsyncIterator[bytes], str, str]:
+        """Stream an attachment's content without buffering it in memory.
+
+        The content hash is verified incrementally. A mismatch raises once the
+        stream is exhausted, which aborts the response before it completes.
+
+        Args:
+            case: The case the attachment belongs to
+            attachment_id: The attachment ID
+
+        Returns:
+            Tuple of (content stream, filename, content_type)
+
+        Raises:
+            TracecatNotFoundError: If attachment not found
+            TracecatException: If download fails
+        """
+
+        attachment = await self.get_attachment(case, attachment_id)
+        if not attachment:
+            raise TracecatNotFoundError(f"Attachment {attachment_id} not found")
+
+        # Download from blob storage
+        storage_key = attachment.storage_path
+        expected_sha256 = attachment.file.sha256
+        try:
+            chunks = await storage.download_file_stream(
+                key=storage_key,
+                bucket=config.TRACECAT__BLOB_STORAGE_BUCKET_ATTACHMENTS,
+            )
+        except FileNotFoundError as e:
+            raise TracecatNotFoundError("Attachment file not found in storage") from e
+        except Exception as e:
+            raise TracecatException(f"Failed to download attachment: {str(e)}") from e
+
+        async def verified_chunks() -> AsyncIterator[bytes]:
+            digest = hashlib.sha256()
+            async for chunk in chunks:
+                digest.update(chunk)
+                yield chunk
+            # Verify integrity
+            if digest.hexdigest() != expected_sha256:
+                logger.error(
+                    "File integrity check failed",
+                    attachment_id=attachment_id,
+                    storage_key=storage_key,
+                )
+                raise TracecatException("File integrity check failed")
+
+        return verified_chunks(), attachment.file.name, attachment.file.content_type
+
     async def get_attachment_download_url(
         self,
         case: Case,
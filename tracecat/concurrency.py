@@ -64,7 +64,7 @@ class CloudpickleProcessPoolExecutor(ProcessPoolExecutor):
 
 
 async def cooperative[T](
-    it: Iterable[T], *, delay: float = 0
+    it: Iterable[T], *, delay: float = 0, batch_size: int = 1
 ) -> AsyncGenerator[T, None]:
     """Yield items from an iterable in a cooperative manner.
 
@@ -73,7 +73,9 @@ async def cooperative[T](
     Args:
         it: The iterable to yield items from.
         duration: The duration to sleep between yielding items.
+        batch_size: The number of items to yield between each sleep.
     """
-    for item in it:
+    for i, item in enumerate(it, start=1):
         yield item
-        await asyncio.sleep(delay)
+        if i % batch_size == 0:
+            await asyncio.sleep(delay)
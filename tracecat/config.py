@@ -27,8 +27,45 @@ TRACECAT__EXECUTOR_CLIENT_TIMEOUT = float(
 
 The `httpx.Client` default is 5s, which doesn't work for long-running actions.
 """
+TRACECAT__EXECUTOR_CLIENT_MAX_CONNECTIONS = int(
+    os.environ.get(
+        "TRACECAT__EXECUTOR_CLIENT_MAX_CONNECTIONS",
+        os.environ.get("TEMPORAL__THREADPOOL_MAX_WORKERS", 100),
+    )
+)
+"""Maximum number of concurrent connections from a process to the executor.
+
+Defaults to `TEMPORAL__THREADPOOL_MAX_WORKERS` (100), one per concurrent activity.
+"""
+
+TRACECAT__EXECUTOR_CLIENT_MAX_KEEPALIVE_CONNECTIONS = int(
+    os.environ.get("TRACECAT__EXECUTOR_CLIENT_MAX_KEEPALIVE_CONNECTIONS", 20)
+)
+"""Maximum number of idle keep-alive connections to the executor. Defaults to 20."""
+
 TRACECAT__LOOP_MAX_BATCH_SIZE = int(os.environ.get("TRACECAT__LOOP_MAX_BATCH_SIZE", 64))
-"""Maximum number of parallel requests to the worker service."""
+"""Maximum number of `for_each` iterations the executor runs concurrently."""
+
+TRACECAT__EXECUTOR_WORKER_MODE: Literal["task", "actor", "process"] = os.environ.get(
+    "TRACECAT__EXECUTOR_WORKER_MODE", "task"
+).lower()  # type: ignore
+"""How the executor runs actions (default `task`).
+
+- `task`: A one-off Ray task per action, with a fresh event loop and DB engine.
+- `actor`: A pool of warm Ray actors that are reused across actions.
+- `process`: A local pool of warm worker processes. Actions that need a Ray runtime
+  environment (e.g. a remote or local custom registry) still run as Ray tasks.
+"""
+
+TRACECAT__EXECUTOR_WORKER_POOL_SIZE = int(
+    os.environ.get("TRACECAT__EXECUTOR_WORKER_POOL_SIZE", min(os.cpu_count() or 8, 8))
+)
+"""Number of warm executor workers when using a persistent worker mode."""
+
+TRACECAT__EXECUTOR_WORKER_MAX_TASKS = int(
+    os.environ.get("TRACECAT__EXECUTOR_WORKER_MAX_TASKS", 1000)
+)
+"""Number of actions a warm executor worker runs before it is recycled. Defaults to 1000."""
 
 # TODO: Set this as an environment variable
 TRACECAT__SERVICE_ROLES_WHITELIST = [
@@ -193,6 +230,16 @@ TEMPORAL__DISABLE_EAGER_ACTIVITY_EXECUTION = os.environ.get(
 ).lower() in ("true", "1")
 """Disable eager activity execution for Temporal workflows."""
 
+TRACECAT__INLINE_ACTIONS_ENABLED = os.environ.get(
+    "TRACECAT__INLINE_ACTIONS_ENABLED", "true"
+).lower() in ("true", "1")
+"""Run pure platform actions (e.g. `core.transform.reshape`) in a local activity on the workflow worker instead of the executor. Defaults to True."""
+
+TRACECAT__WORKFLOW_DEFINITION_CACHE_SIZE = int(
+    os.environ.get("TRACECAT__WORKFLOW_DEFINITION_CACHE_SIZE", 256)
+)
+"""Maximum number of workflow definition versions cached on each worker. Defaults to 256."""
+
 # Secrets manager config
 TRACECAT__UNSAFE_DISABLE_SM_MASKING = os.environ.get(
     "TRACECAT__UNSAFE_DISABLE_SM_MASKING",
@@ -225,6 +272,12 @@ TRACECAT__BLOB_STORAGE_BUCKET_ATTACHMENTS = os.environ.get(
 )
 """Bucket for case attachments."""
 
+# Bucket for offloaded workflow payloads
+TRACECAT__BLOB_STORAGE_BUCKET_PAYLOADS = os.environ.get(
+    "TRACECAT__BLOB_STORAGE_BUCKET_PAYLOADS", "tracecat-payloads"
+)
+"""Bucket for workflow payloads offloaded from Temporal history."""
+
 TRACECAT__BLOB_STORAGE_ENDPOINT = os.environ.get(
     "TRACECAT__BLOB_STORAGE_ENDPOINT", "http://minio:9000"
 )
@@ -235,6 +288,25 @@ TRACECAT__BLOB_STORAGE_PRESIGNED_URL_EXPIRY = int(
 )
 """Default expiry time for presigned URLs in seconds (default: 10 seconds for immediate use)."""
 
+TRACECAT__BLOB_STORAGE_MAX_POOL_CONNECTIONS = int(
+    os.environ.get("TRACECAT__BLOB_STORAGE_MAX_POOL_CONNECTIONS", 32)
+)
+"""Maximum number of keep-alive connections of the shared blob storage client."""
+
+TRACECAT__BLOB_STORAGE_KEEPALIVE_TIMEOUT = float(
+    os.environ.get("TRACECAT__BLOB_STORAGE_KEEPALIVE_TIMEOUT", 60)
+)
+"""Seconds an idle blob storage connection is kept open for reuse."""
+
+TRACECAT__BLOB_STORAGE_PART_SIZE = max(
+    int(os.environ.get("TRACECAT__BLOB_STORAGE_PART_SIZE", 8 * 1024 * 1024)),
+    5 * 1024 * 1024,
+)
+"""Part size in bytes for multipart uploads (minimum 5MB, default: 8MB).
+
+Bounds the memory held per in-flight streaming upload.
+"""
+
 TRACECAT__DISABLE_PRESIGNED_URL_IP_CHECKING = (
     os.environ.get("TRACECAT__DISABLE_PRESIGNED_URL_IP_CHECKING", "true").lower()
     == "true"
@@ -257,6 +329,105 @@ TRACECAT__NODE_MODULES_DIR = os.environ.get(
 )
 """Directory where Node.js modules are installed for Deno/Pyodide execution."""
 
+TRACECAT__PYTHON_SCRIPT_POOL_SIZE = int(
+    os.environ.get("TRACECAT__PYTHON_SCRIPT_POOL_SIZE", 4)
+)
+"""Maximum number of warm Deno/Pyodide workers kept per executor process for `core.script.run_python`.
+
+Set to 0 to start a fresh Deno process for every script. Defaults to 4.
+"""
+
+TRACECAT__PYTHON_SCRIPT_WORKER_MAX_RUNS = int(
+    os.environ.get("TRACECAT__PYTHON_SCRIPT_WORKER_MAX_RUNS", 100)
+)
+"""Number of scripts a Deno/Pyodide worker runs before it is replaced. Defaults to 100."""
+
+TRACECAT__PYTHON_SCRIPT_WORKER_STARTUP_TIMEOUT = float(
+    os.environ.get("TRACECAT__PYTHON_SCRIPT_WORKER_STARTUP_TIMEOUT", 60)
+)
+"""Time in seconds a Deno/Pyodide worker may take to load Pyodide and its packages. Defaults to 60 seconds."""
+
+# === Registry === #
+TRACECAT__REGISTRY_ACTION_CACHE_SIZE = int(
+    os.environ.get("TRACECAT__REGISTRY_ACTION_CACHE_SIZE", 512)
+)
+"""Maximum number of bound registry actions cached per executor process. Defaults to 512."""
+
+TRACECAT__REGISTRY_ACTION_CACHE_TTL = float(
+    os.environ.get("TRACECAT__REGISTRY_ACTION_CACHE_TTL", 60)
+)
+"""Time in seconds a cached bound registry action stays valid. Defaults to 60 seconds.
+
+Cache entries are keyed by the registry commit SHA, so repository syncs take effect
+immediately. The TTL bounds staleness for edits that don't change the SHA, e.g. custom
+template actions updated through the API.
+"""
+
+# === Secrets === #
+TRACECAT__SECRETS_CACHE_SIZE = int(os.environ.get("TRACECAT__SECRETS_CACHE_SIZE", 1024))
+"""Maximum number of decrypted secrets cached per executor process. Defaults to 1024."""
+
+TRACECAT__SECRETS_CACHE_TTL = float(os.environ.get("TRACECAT__SECRETS_CACHE_TTL", 15))
+"""Time in seconds a decrypted secret stays cached in an executor process. Defaults to 15 seconds.
+
+Secret writes clear the cache of the process that made them. The TTL bounds staleness
+in other processes. Set to 0 to disable caching.
+"""
+
+# === Webhooks === #
+TRACECAT__WEBHOOK_CACHE_SIZE = int(os.environ.get("TRACECAT__WEBHOOK_CACHE_SIZE", 1024))
+"""Maximum number of webhooks and workflow definitions cached per API process for webhook ingress. Defaults to 1024."""
+
+TRACECAT__WEBHOOK_CACHE_TTL = float(os.environ.get("TRACECAT__WEBHOOK_CACHE_TTL", 10))
+"""Time in seconds a webhook and its latest workflow definition version stay cached. Defaults to 10 seconds.
+
+Webhook updates and workflow commits clear the entry in the process that made them. The
+TTL bounds staleness in other processes. Set to 0 to disable caching.
+"""
+
+TRACECAT__WEBHOOK_BATCH_CONCURRENCY = int(
+    os.environ.get("TRACECAT__WEBHOOK_BATCH_CONCURRENCY", 32)
+)
+"""Maximum number of concurrent workflow start requests per NDJSON webhook batch. Defaults to 32."""
+
+TRACECAT__WEBHOOK_BATCH_START_RATE = float(
+    os.environ.get("TRACECAT__WEBHOOK_BATCH_START_RATE", 100)
+)
+"""Initial rate, in workflow starts per second, at which an NDJSON webhook batch is admitted. Defaults to 100.
+
+The rate grows while Temporal accepts starts and halves whenever Temporal pushes back.
+"""
+
+TRACECAT__WEBHOOK_BATCH_MAX_RATE = float(
+    os.environ.get("TRACECAT__WEBHOOK_BATCH_MAX_RATE", 1000)
+)
+"""Upper bound on the admission rate of an NDJSON webhook batch, in workflow starts per second. Defaults to 1000."""
+
+TRACECAT__WEBHOOK_BATCH_TTL = float(os.environ.get("TRACECAT__WEBHOOK_BATCH_TTL", 3600))
+"""Time in seconds the status of an NDJSON webhook batch can be polled. Defaults to 1 hour."""
+
+# === HTTP actions === #
+TRACECAT__HTTP_CLIENT_POOL_SIZE = int(
+    os.environ.get("TRACECAT__HTTP_CLIENT_POOL_SIZE", 32)
+)
+"""Maximum number of idle HTTP clients kept per executor worker for HTTP actions. Defaults to 32."""
+
+TRACECAT__HTTP_CLIENT_IDLE_TIMEOUT = float(
+    os.environ.get("TRACECAT__HTTP_CLIENT_IDLE_TIMEOUT", 60)
+)
+"""Time in seconds an unused pooled HTTP client is kept open. Defaults to 60 seconds."""
+
+# === Expressions === #
+TRACECAT__EXPR_PARSE_CACHE_SIZE = int(
+    os.environ.get("TRACECAT__EXPR_PARSE_CACHE_SIZE", 4096)
+)
+"""Maximum number of compiled expression parse trees cached per process. Defaults to 4096."""
+
+TRACECAT__JSONPATH_CACHE_SIZE = int(
+    os.environ.get("TRACECAT__JSONPATH_CACHE_SIZE", 4096)
+)
+"""Maximum number of compiled jsonpath expressions cached per process. Defaults to 4096."""
+
 # === Rate Limiting === #
 TRACECAT__RATE_LIMIT_ENABLED = (
     os.environ.get("TRACECAT__RATE_LIMIT_ENABLED", "true").lower() == "true"
@@ -323,6 +494,11 @@ TRACECAT__MAX_ROWS_CLIENT_POSTGRES = int(
 )
 """Maximum number of rows that can be returned from PostgreSQL client queries. Defaults to 1,000."""
 
+TRACECAT__MAX_LOOKUP_KEYS_CLIENT_POSTGRES = int(
+    os.environ.get("TRACECAT__MAX_LOOKUP_KEYS_CLIENT_POSTGRES", 10000)
+)
+"""Maximum number of keys in a single batch table lookup. Defaults to 10,000."""
+
 # === Context Compression === #
 TRACECAT__CONTEXT_COMPRESSION_ENABLED = os.environ.get(
     "TRACECAT__CONTEXT_COMPRESSION_ENABLED", "false"
@@ -339,6 +515,46 @@ TRACECAT__CONTEXT_COMPRESSION_ALGORITHM = os.environ.get(
 )
 """Compression algorithm to use. Supported: zstd, gzip, brotli. Defaults to zstd."""
 
+TRACECAT__CONTEXT_COMPRESSION_DICT_DIR = os.environ.get(
+    "TRACECAT__CONTEXT_COMPRESSION_DICT_DIR"
+)
+"""Directory of trained zstd dictionaries (`<version>.zdict`). Optional.
+
+When set, zstd payloads are compressed with the highest dictionary version. Keep
+older versions in the directory so existing histories can still be decompressed.
+"""
+
+TRACECAT__CONTEXT_COMPRESSION_MAX_WORKERS = int(
+    os.environ.get("TRACECAT__CONTEXT_COMPRESSION_MAX_WORKERS", 4)
+)
+"""Size of the thread pool that compresses payloads off the event loop. Defaults to 4."""
+
+# === Payload Offload === #
+TRACECAT__PAYLOAD_OFFLOAD_ENABLED = os.environ.get(
+    "TRACECAT__PAYLOAD_OFFLOAD_ENABLED", "false"
+).lower() in ("true", "1")
+"""Store large workflow payloads in blob storage and keep only a reference in Temporal history. Defaults to False."""
+
+TRACECAT__PAYLOAD_OFFLOAD_THRESHOLD_KB = int(
+    os.environ.get("TRACECAT__PAYLOAD_OFFLOAD_THRESHOLD_KB", 512)
+)
+"""Threshold in KB (after compression) above which payloads are offloaded. Defaults to 512KB."""
+
+TRACECAT__PAYLOAD_OFFLOAD_RETENTION_DAYS = int(
+    os.environ.get("TRACECAT__PAYLOAD_OFFLOAD_RETENTION_DAYS", 30)
+)
+"""Days after which an offloaded payload expires unless it is referenced again. Defaults to 30.
+
+A reference only refreshes payloads older than half the retention period, so a
+payload is guaranteed to be kept for half of it after its last reference. This
+must exceed the Temporal namespace retention plus the longest workflow run.
+"""
+
+TRACECAT__PAYLOAD_OFFLOAD_CACHE_SIZE_MB = int(
+    os.environ.get("TRACECAT__PAYLOAD_OFFLOAD_CACHE_SIZE_MB", 64)
+)
+"""Maximum total size in MB of downloaded payloads cached in each process. Defaults to 64MB."""
+
 TRACECAT__WORKFLOW_RETURN_STRATEGY = os.environ.get(
     "TRACECAT__WORKFLOW_RETURN_STRATEGY", "minimal"
 ).lower()
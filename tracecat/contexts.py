@@ -14,6 +14,7 @@ __all__ = [
     "ctx_logger",
     "ctx_interaction",
     "ctx_stream_id",
+    "ctx_registry_version",
     "get_env",
 ]
 
@@ -25,6 +26,9 @@ ctx_interaction: ContextVar[InteractionContext | None] = ContextVar(
 )
 ctx_stream_id: ContextVar[StreamID] = ContextVar("stream-id", default=ROOT_STREAM)
 ctx_env: ContextVar[dict[str, str] | None] = ContextVar("env", default=None)
+ctx_registry_version: ContextVar[str | None] = ContextVar(
+    "registry-version", default=None
+)
 
 
 def get_env() -> dict[str, str]:
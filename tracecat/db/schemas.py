@@ -797,6 +797,32 @@ class Case(Resource, table=True):
     __tablename__: str = "cases"
     __table_args__ = (
         Index("idx_case_cursor_pagination", "owner_id", "created_at", "id"),
+        Index(
+            "idx_case_updated_at_pagination",
+            "owner_id",
+            "updated_at",
+            "created_at",
+            "id",
+        ),
+        Index(
+            "idx_case_priority_pagination", "owner_id", "priority", "created_at", "id"
+        ),
+        Index(
+            "idx_case_severity_pagination", "owner_id", "severity", "created_at", "id"
+        ),
+        Index("idx_case_status_pagination", "owner_id", "status", "created_at", "id"),
+        Index(
+            "idx_case_summary_trgm",
+            "summary",
+            postgresql_using="gin",
+            postgresql_ops={"summary": "gin_trgm_ops"},
+        ),
+        Index(
+            "idx_case_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ),
     )
 
     id: uuid.UUID = Field(
@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from typing import Any
 
 import orjson
@@ -9,9 +10,11 @@ from temporalio.converter import (
     DataConverter,
     DefaultPayloadConverter,
     JSONPlainPayloadConverter,
+    PayloadCodec,
 )
 
 from tracecat.dsl.compression import get_compression_payload_codec
+from tracecat.dsl.offload import get_offload_payload_codec
 
 
 def _serializer(obj: Any) -> Any:
@@ -67,9 +70,47 @@ class PydanticPayloadConverter(CompositePayloadConverter):
         )
 
 
-def get_data_converter(*, compression_enabled: bool = False) -> DataConverter:
-    """Data converter using Pydantic JSON conversion with optional compression."""
+class ChainedPayloadCodec(PayloadCodec):
+    """Payload codec that applies codecs in order on encode and in reverse on decode."""
+
+    def __init__(self, *codecs: PayloadCodec) -> None:
+        self.codecs = codecs
+
+    async def encode(self, payloads: Iterable[Payload]) -> list[Payload]:
+        result = list(payloads)
+        for codec in self.codecs:
+            result = await codec.encode(result)
+        return result
+
+    async def decode(self, payloads: Iterable[Payload]) -> list[Payload]:
+        result = list(payloads)
+        for codec in reversed(self.codecs):
+            result = await codec.decode(result)
+        return result
+
+
+def get_data_converter(
+    *, compression_enabled: bool = False, offload_enabled: bool = False
+) -> DataConverter:
+    """Data converter using Pydantic JSON conversion with optional compression
+    and offloading of large payloads to blob storage.
+
+    Payloads are compressed before the offload threshold is checked, so only
+    payloads that are still too large after compression are offloaded.
+    """
+    codecs: list[PayloadCodec] = []
+    if compression_enabled:
+        codecs.append(get_compression_payload_codec())
+    if offload_enabled:
+        codecs.append(get_offload_payload_codec())
+    match codecs:
+        case []:
+            payload_codec = None
+        case [codec]:
+            payload_codec = codec
+        case _:
+            payload_codec = ChainedPayloadCodec(*codecs)
     return DataConverter(
         payload_converter_class=PydanticPayloadConverter,
-        payload_codec=get_compression_payload_codec() if compression_enabled else None,
+        payload_codec=payload_codec,
     )
@@ -16,6 +16,7 @@ from tenacity import (
 
 from tracecat.contexts import ctx_logger, ctx_run
 from tracecat.db.engine import get_async_session_context_manager
+from tracecat.dsl.inline import run_inline_action
 from tracecat.dsl.models import ActionErrorInfo, ActionStatement, RunActionInput
 from tracecat.executor.client import ExecutorClient
 from tracecat.expressions.common import ExprContext
@@ -177,6 +178,37 @@ class DSLActivities:
                 err_msg, err_info, type=kind, non_retryable=True
             ) from e
 
+    @staticmethod
+    @activity.defn
+    async def run_inline_action_activity(input: RunActionInput, role: Role) -> Any:
+        """Run a pure platform action on the worker, without the executor.
+
+        This runs as a local activity for actions in `INLINE_ACTIONS`. Errors are
+        reported the same way as in `run_action_activity`.
+        """
+        ctx_run.set(input.run_context)
+        task = input.task
+        act_attempt = activity.info().attempt
+        try:
+            return await run_inline_action(input)
+        except Exception as e:
+            kind = e.__class__.__name__
+            msg = str(e)
+            logger.info(
+                "Inline action error",
+                task_ref=task.ref,
+                action_name=task.action,
+                error=msg,
+            )
+            err_info = ActionErrorInfo(
+                ref=task.ref,
+                message=msg,
+                type=kind,
+                attempt=act_attempt,
+            )
+            err_msg = err_info.format("run_action")
+            raise ApplicationError(err_msg, err_info, type=kind) from e
+
     @staticmethod
     @activity.defn
     async def parse_wait_until_activity(
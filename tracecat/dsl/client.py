@@ -21,6 +21,7 @@ from tracecat.config import (
     TEMPORAL__METRICS_PORT,
 )
 from tracecat.dsl._converter import get_data_converter
+from tracecat.dsl.compression import get_compression_payload_codec
 from tracecat.logger import logger
 
 _client: Client | None = None
@@ -60,6 +61,7 @@ async def connect_to_temporal() -> Client:
         logger.info("Initializing Prometheus runtime", port=TEMPORAL__METRICS_PORT)
         try:
             runtime = init_runtime_with_prometheus(port=int(TEMPORAL__METRICS_PORT))
+            get_compression_payload_codec().bind_metric_meter(runtime.metric_meter)
         except Exception as e:
             logger.warning("Failed to initialize Prometheus runtime", error=e)
     client = await Client.connect(
@@ -69,7 +71,8 @@ async def connect_to_temporal() -> Client:
         api_key=api_key,
         tls=tls_config,
         data_converter=get_data_converter(
-            compression_enabled=config.TRACECAT__CONTEXT_COMPRESSION_ENABLED
+            compression_enabled=config.TRACECAT__CONTEXT_COMPRESSION_ENABLED,
+            offload_enabled=config.TRACECAT__PAYLOAD_OFFLOAD_ENABLED,
         ),
         runtime=runtime,
     )
@@ -24,6 +24,7 @@ from temporalio import workflow
 from temporalio.common import RetryPolicy, SearchAttributeKey, TypedSearchAttributes
 from temporalio.exceptions import ApplicationError, ChildWorkflowError, FailureError
 
+from tracecat import config
 from tracecat.db.schemas import Action
 from tracecat.dsl.enums import (
     EdgeType,
@@ -472,6 +473,22 @@ class DSLRunArgs(BaseModel):
         default=None,
         description="The schedule ID that triggered this workflow, if any.",
     )
+    definition_version: int | None = Field(
+        default=None,
+        description=(
+            "The workflow definition version to run when no DSL is provided. "
+            "Child workflows are dispatched by (wf_id, version) reference and "
+            "resolve the definition from the worker cache."
+        ),
+    )
+    inline_actions: bool = Field(
+        default_factory=lambda: config.TRACECAT__INLINE_ACTIONS_ENABLED,
+        description=(
+            "Whether pure platform actions run inline on the workflow worker. "
+            "This is decided when the run starts and recorded in its input, so "
+            "replays don't depend on the worker's configuration."
+        ),
+    )
 
     @field_validator("wf_id", mode="before")
     @classmethod
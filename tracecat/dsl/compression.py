@@ -1,19 +1,75 @@
 """Temporal PayloadCodec for compressing large workflow payloads."""
 
+import asyncio
+import time
+from collections import defaultdict
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
 
 import cramjam
+import zstandard
 from loguru import logger
 from temporalio.api.common.v1 import Payload
+from temporalio.common import MetricMeter
 from temporalio.converter import PayloadCodec
 
-from tracecat.concurrency import cooperative
 from tracecat.config import (
     TRACECAT__CONTEXT_COMPRESSION_ALGORITHM,
+    TRACECAT__CONTEXT_COMPRESSION_DICT_DIR,
     TRACECAT__CONTEXT_COMPRESSION_ENABLED,
+    TRACECAT__CONTEXT_COMPRESSION_MAX_WORKERS,
     TRACECAT__CONTEXT_COMPRESSION_THRESHOLD_KB,
 )
 
+ZSTD_LEVEL = 11
+ZSTD_DICT_SUFFIX = ".zdict"
+
+_COMPRESSION_METADATA_KEYS = (
+    "encoding",
+    "original_encoding",
+    "original_size",
+    "compressed_size",
+    "dictionary_id",
+)
+
+
+def load_zstd_dictionaries(
+    directory: str | Path,
+) -> dict[int, zstandard.ZstdCompressionDict]:
+    """Load trained zstd dictionaries from a directory, keyed by version.
+
+    The version of a dictionary is its zstd dictionary ID, which is also
+    recorded in the frame header of every payload compressed with it.
+    """
+    dictionaries: dict[int, zstandard.ZstdCompressionDict] = {}
+    for path in sorted(Path(directory).glob(f"*{ZSTD_DICT_SUFFIX}")):
+        dictionary = zstandard.ZstdCompressionDict(path.read_bytes())
+        if (dictionary_id := dictionary.dict_id()) == 0:
+            logger.warning("Skipping zstd dictionary without a version", path=path)
+            continue
+        dictionaries[dictionary_id] = dictionary
+    return dictionaries
+
+
+@dataclass
+class CompressionStats:
+    """Running totals of the work done for one encoding."""
+
+    payloads: int = 0
+    original_bytes: int = 0
+    compressed_bytes: int = 0
+    seconds: float = 0.0
+
+    @property
+    def ratio(self) -> float:
+        return (
+            self.original_bytes / self.compressed_bytes
+            if self.compressed_bytes
+            else 1.0
+        )
+
 
 class CompressionPayloadCodec(PayloadCodec):
     """Temporal PayloadCodec that compresses large payloads using zstd/gzip/brotli.
@@ -21,6 +77,11 @@ class CompressionPayloadCodec(PayloadCodec):
     This codec automatically compresses payloads that exceed a configurable size
     threshold, helping workflows handle large data without hitting Temporal's
     payload size limits.
+
+    Compression runs on a dedicated thread pool so large payloads don't stall the
+    worker event loop. With zstd, payloads can be compressed against a trained
+    dictionary, which shrinks repetitive JSON far better at small sizes. The
+    dictionary version is recorded in the payload metadata.
     """
 
     def __init__(
@@ -28,6 +89,8 @@ class CompressionPayloadCodec(PayloadCodec):
         threshold_bytes: int | None = None,
         algorithm: str | None = None,
         enabled: bool | None = None,
+        dictionaries: dict[int, zstandard.ZstdCompressionDict] | None = None,
+        max_workers: int | None = None,
     ):
         self.enabled = (
             enabled if enabled is not None else TRACECAT__CONTEXT_COMPRESSION_ENABLED
@@ -42,156 +105,248 @@ class CompressionPayloadCodec(PayloadCodec):
         if self.enabled and self.algorithm not in ("zstd", "gzip", "brotli"):
             raise ValueError(f"Unsupported compression algorithm: {self.algorithm}")
 
+        if dictionaries is None and TRACECAT__CONTEXT_COMPRESSION_DICT_DIR:
+            dictionaries = load_zstd_dictionaries(
+                TRACECAT__CONTEXT_COMPRESSION_DICT_DIR
+            )
+        # All versions are kept for decoding, new payloads use the latest one
+        self.dictionaries = dictionaries or {}
+        self.dictionary_id = (
+            max(self.dictionaries, default=None) if self.algorithm == "zstd" else None
+        )
+        if self.dictionary_id is not None:
+            self.dictionaries[self.dictionary_id].precompute_compress(level=ZSTD_LEVEL)
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or TRACECAT__CONTEXT_COMPRESSION_MAX_WORKERS,
+            thread_name_prefix="payload-codec",
+        )
+        # Running totals, keyed by (operation, encoding)
+        self.stats: defaultdict[tuple[str, str], CompressionStats] = defaultdict(
+            CompressionStats
+        )
+        self.bind_metric_meter(MetricMeter.noop)
+
         logger.info(
             "Compression codec initialized",
             enabled=self.enabled,
             threshold=self.threshold,
             algorithm=self.algorithm,
+            dictionary_id=self.dictionary_id,
+        )
+
+    def bind_metric_meter(self, meter: MetricMeter) -> None:
+        """Report compression ratio and time metrics through a Temporal metric meter."""
+        self._original_bytes = meter.create_counter(
+            "tracecat_payload_codec_original_bytes",
+            "Size of payloads before compression",
+            "By",
+        )
+        self._compressed_bytes = meter.create_counter(
+            "tracecat_payload_codec_compressed_bytes",
+            "Size of payloads after compression",
+            "By",
+        )
+        self._duration = meter.create_histogram_float(
+            "tracecat_payload_codec_duration",
+            "Time spent compressing or decompressing a payload",
+            "s",
         )
 
     async def encode(self, payloads: Iterable[Payload]) -> list[Payload]:
         """Encode payloads, compressing those that exceed the threshold."""
         if not self.enabled:
             return list(payloads)
+        return list(await asyncio.gather(*map(self._encode_payload, payloads)))
 
-        result = []
-        async for payload in cooperative(payloads):
-            # Check if payload size exceeds threshold
-            if len(payload.data) <= self.threshold:
-                result.append(payload)
-                continue
-
-            try:
-                # Compress the payload data
-                if self.algorithm == "zstd":
-                    compressed_data = bytes(cramjam.zstd.compress(payload.data, 11))  # type: ignore
-                    encoding = b"binary/zstd"
-                elif self.algorithm == "gzip":
-                    compressed_data = bytes(cramjam.gzip.compress(payload.data))  # type: ignore
-                    encoding = b"binary/gzip"
-                elif self.algorithm == "brotli":
-                    compressed_data = bytes(cramjam.brotli.compress(payload.data))  # type: ignore
-                    encoding = b"binary/brotli"
-                else:
-                    logger.warning(f"Unknown compression algorithm: {self.algorithm}")
-                    result.append(payload)
-                    continue
-
-                # Calculate compression ratio
-                original_size = len(payload.data)
-                compressed_size = len(compressed_data)
-                compression_ratio = (
-                    original_size / compressed_size if compressed_size > 0 else 1.0
-                )
+    async def decode(self, payloads: Iterable[Payload]) -> list[Payload]:
+        """Decode payloads, decompressing those that were compressed."""
+        return list(await asyncio.gather(*map(self._decode_payload, payloads)))
 
-                logger.debug(
-                    "Compressed payload",
-                    original_size=original_size,
-                    compressed_size=compressed_size,
-                    compression_ratio=f"{compression_ratio:.2f}x",
-                    algorithm=self.algorithm,
-                )
+    async def _encode_payload(self, payload: Payload) -> Payload:
+        # Check if payload size exceeds threshold
+        if len(payload.data) <= self.threshold:
+            return payload
 
-                # Create new payload with compression metadata
-                # Store the original encoding so we can restore it later
-                original_encoding = payload.metadata.get("encoding", b"")
-                new_metadata = dict(payload.metadata)
-                new_metadata.update(
-                    {
-                        "encoding": encoding,
-                        "original_encoding": original_encoding,
-                        "original_size": str(original_size).encode(),
-                        "compressed_size": str(compressed_size).encode(),
-                    }
-                )
+        original_size = len(payload.data)
+        try:
+            # Compress the payload data
+            loop = asyncio.get_running_loop()
+            (
+                compressed_data,
+                encoding,
+                extra_metadata,
+                elapsed,
+            ) = await loop.run_in_executor(self._executor, self._compress, payload.data)
+        except Exception as e:
+            logger.error(
+                "Failed to compress payload, storing uncompressed",
+                original_size=original_size,
+                algorithm=self.algorithm,
+                error=str(e),
+            )
+            return payload
 
-                result.append(
-                    Payload(
-                        metadata=new_metadata,
-                        data=compressed_data,
-                    )
-                )
+        compressed_size = len(compressed_data)
+        stats = self._record(
+            "compress", encoding, original_size, compressed_size, elapsed
+        )
+        logger.debug(
+            "Compressed payload",
+            original_size=original_size,
+            compressed_size=compressed_size,
+            compression_ratio=f"{original_size / max(compressed_size, 1):.2f}x",
+            average_ratio=f"{stats.ratio:.2f}x",
+            encoding=encoding,
+            seconds=elapsed,
+        )
 
-            except Exception as e:
-                logger.error(
-                    "Failed to compress payload, storing uncompressed",
-                    original_size=len(payload.data),
-                    algorithm=self.algorithm,
-                    error=str(e),
-                )
-                result.append(payload)
+        # Create new payload with compression metadata
+        # Store the original encoding so we can restore it later
+        original_encoding = payload.metadata.get("encoding", b"")
+        new_metadata = dict(payload.metadata)
+        new_metadata.update(
+            {
+                "encoding": encoding.encode(),
+                "original_encoding": original_encoding,
+                "original_size": str(original_size).encode(),
+                "compressed_size": str(compressed_size).encode(),
+                **extra_metadata,
+            }
+        )
+        return Payload(metadata=new_metadata, data=compressed_data)
 
-        return result
+    async def _decode_payload(self, payload: Payload) -> Payload:
+        encoding = payload.metadata.get("encoding", b"").decode()
 
-    async def decode(self, payloads: Iterable[Payload]) -> list[Payload]:
-        """Decode payloads, decompressing those that were compressed."""
-        result = []
-        async for payload in cooperative(payloads):
-            encoding = payload.metadata.get("encoding", b"").decode()
-
-            # If not compressed, return as-is
-            if not encoding.startswith("binary/"):
-                result.append(payload)
-                continue
-
-            try:
-                # Decompress based on encoding
-                if encoding == "binary/zstd":
-                    decompressed_data = bytes(cramjam.zstd.decompress(payload.data))  # type: ignore
-                elif encoding == "binary/gzip":
-                    decompressed_data = bytes(cramjam.gzip.decompress(payload.data))  # type: ignore
-                elif encoding == "binary/brotli":
-                    decompressed_data = bytes(cramjam.brotli.decompress(payload.data))  # type: ignore
-                else:
-                    logger.warning(f"Unknown compression encoding: {encoding}")
-                    result.append(payload)
-                    continue
-
-                # Create new payload with original metadata restored
-                # Restore the original encoding that was preserved during compression
-                original_encoding = payload.metadata.get("original_encoding", b"")
-                new_metadata = {
-                    k: v
-                    for k, v in payload.metadata.items()
-                    if k
-                    not in (
-                        "encoding",
-                        "original_encoding",
-                        "original_size",
-                        "compressed_size",
-                    )
-                }
-                # Restore the original encoding
-                if original_encoding:
-                    new_metadata["encoding"] = original_encoding
-
-                logger.debug(
-                    "Decompressed payload",
-                    original_size=payload.metadata.get("original_size", b"").decode(),
-                    compressed_size=payload.metadata.get(
-                        "compressed_size", b""
-                    ).decode(),
-                    encoding=encoding,
-                )
+        # If not compressed, return as-is
+        if not encoding.startswith("binary/"):
+            return payload
+        if encoding not in (
+            "binary/zstd",
+            "binary/zstd-dict",
+            "binary/gzip",
+            "binary/brotli",
+        ):
+            logger.warning(f"Unknown compression encoding: {encoding}")
+            return payload
 
-                result.append(
-                    Payload(
-                        metadata=new_metadata,
-                        data=decompressed_data,
-                    )
-                )
+        try:
+            # Decompress based on encoding
+            loop = asyncio.get_running_loop()
+            decompressed_data, elapsed = await loop.run_in_executor(
+                self._executor,
+                self._decompress,
+                encoding,
+                payload.data,
+                payload.metadata.get("dictionary_id"),
+            )
+        except Exception as e:
+            logger.error(
+                "Failed to decompress payload",
+                encoding=encoding,
+                compressed_size=len(payload.data),
+                error=str(e),
+            )
+            # Return the compressed payload as-is if decompression fails
+            return payload
+
+        self._record(
+            "decompress", encoding, len(decompressed_data), len(payload.data), elapsed
+        )
+
+        # Create new payload with original metadata restored
+        # Restore the original encoding that was preserved during compression
+        original_encoding = payload.metadata.get("original_encoding", b"")
+        new_metadata = {
+            k: v
+            for k, v in payload.metadata.items()
+            if k not in _COMPRESSION_METADATA_KEYS
+        }
+        # Restore the original encoding
+        if original_encoding:
+            new_metadata["encoding"] = original_encoding
 
-            except Exception as e:
-                logger.error(
-                    "Failed to decompress payload",
-                    encoding=encoding,
-                    compressed_size=len(payload.data),
-                    error=str(e),
+        logger.debug(
+            "Decompressed payload",
+            original_size=len(decompressed_data),
+            compressed_size=len(payload.data),
+            encoding=encoding,
+            seconds=elapsed,
+        )
+        return Payload(metadata=new_metadata, data=decompressed_data)
+
+    def _compress(self, data: bytes) -> tuple[bytes, str, dict[str, bytes], float]:
+        """Compress data on a pool thread.
+
+        Returns the compressed data, its encoding, extra metadata and the time taken.
+        """
+        start = time.perf_counter()
+        extra_metadata: dict[str, bytes] = {}
+        match self.algorithm:
+            case "zstd" if self.dictionary_id is not None:
+                # Compressors aren't thread-safe, so each call gets its own
+                compressor = zstandard.ZstdCompressor(
+                    level=ZSTD_LEVEL, dict_data=self.dictionaries[self.dictionary_id]
                 )
-                # Return the compressed payload as-is if decompression fails
-                result.append(payload)
+                compressed_data = compressor.compress(data)
+                encoding = "binary/zstd-dict"
+                extra_metadata["dictionary_id"] = str(self.dictionary_id).encode()
+            case "zstd":
+                compressed_data = bytes(cramjam.zstd.compress(data, ZSTD_LEVEL))  # type: ignore
+                encoding = "binary/zstd"
+            case "gzip":
+                compressed_data = bytes(cramjam.gzip.compress(data))  # type: ignore
+                encoding = "binary/gzip"
+            case "brotli":
+                compressed_data = bytes(cramjam.brotli.compress(data))  # type: ignore
+                encoding = "binary/brotli"
+            case _:
+                raise ValueError(f"Unknown compression algorithm: {self.algorithm}")
+        return compressed_data, encoding, extra_metadata, time.perf_counter() - start
+
+    def _decompress(
+        self, encoding: str, data: bytes, dictionary_id: bytes | None
+    ) -> tuple[bytes, float]:
+        """Decompress data on a pool thread. Returns the data and the time taken."""
+        start = time.perf_counter()
+        match encoding:
+            case "binary/zstd-dict":
+                version = int(dictionary_id or 0)
+                if (dictionary := self.dictionaries.get(version)) is None:
+                    raise KeyError(f"zstd dictionary version {version} is not loaded")
+                decompressed_data = zstandard.ZstdDecompressor(
+                    dict_data=dictionary
+                ).decompress(data)
+            case "binary/zstd":
+                decompressed_data = bytes(cramjam.zstd.decompress(data))  # type: ignore
+            case "binary/gzip":
+                decompressed_data = bytes(cramjam.gzip.decompress(data))  # type: ignore
+            case "binary/brotli":
+                decompressed_data = bytes(cramjam.brotli.decompress(data))  # type: ignore
+            case _:
+                raise ValueError(f"Unknown compression encoding: {encoding}")
+        return decompressed_data, time.perf_counter() - start
+
+    def _record(
+        self,
+        operation: str,
+        encoding: str,
+        original_size: int,
+        compressed_size: int,
+        elapsed: float,
+    ) -> CompressionStats:
+        stats = self.stats[operation, encoding]
+        stats.payloads += 1
+        stats.original_bytes += original_size
+        stats.compressed_bytes += compressed_size
+        stats.seconds += elapsed
 
-        return result
+        attributes = {"operation": operation, "encoding": encoding}
+        self._original_bytes.add(original_size, attributes)
+        self._compressed_bytes.add(compressed_size, attributes)
+        self._duration.record(elapsed, attributes)
+        return stats
 
 
 # Global codec instance
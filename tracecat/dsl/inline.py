@@ -0,0 +1,88 @@
+"""Inline execution of pure platform actions.
+
+Deterministic, side-effect-free actions like `core.transform.reshape` only
+evaluate expressions over data that's already in the workflow context. Running
+them through the executor costs an activity task, an HTTP request, a Ray task
+and a registry lookup, so the workflow worker runs them in a local activity
+instead. The actions are bound from the installed `tracecat_registry` package.
+"""
+
+from __future__ import annotations
+
+import functools
+from collections.abc import Mapping
+from typing import Any
+
+from tracecat.dsl.models import ActionStatement, RunActionInput
+from tracecat.executor.service import (
+    _run_action_direct,
+    evaluate_templated_args,
+    iter_for_each,
+)
+from tracecat.expressions.common import ExprContext
+from tracecat.registry.actions.models import BoundRegistryAction
+from tracecat.registry.repository import Repository
+
+INLINE_ACTIONS = frozenset(
+    {
+        "core.transform.apply",
+        "core.transform.compact",
+        "core.transform.deduplicate",
+        "core.transform.filter",
+        "core.transform.map",
+        "core.transform.reshape",
+    }
+)
+"""Actions that are safe to run inline: deterministic, side-effect free and secretless."""
+
+
+def can_run_inline(
+    task: ActionStatement, expr_ctxs: Mapping[ExprContext, set[str]]
+) -> bool:
+    """Whether a task can skip the executor and run inline.
+
+    Whether inlining is enabled at all is decided when the workflow run starts,
+    see `DSLRunArgs.inline_actions`.
+
+    Args:
+        task: The action statement to run.
+        expr_ctxs: The expression contexts referenced by the task.
+    """
+    return (
+        task.action in INLINE_ACTIONS
+        # Secrets are only resolved by the executor
+        and not expr_ctxs.get(ExprContext.SECRETS)
+    )
+
+
+@functools.cache
+def _get_inline_repository() -> Repository:
+    from tracecat_registry.core import transform
+
+    repo = Repository()
+    repo._register_udfs_from_module(transform)
+    return repo
+
+
+def get_inline_action(action_name: str) -> BoundRegistryAction:
+    """Get the bound implementation of an inline action."""
+    if action_name not in INLINE_ACTIONS:
+        raise ValueError(f"Action {action_name!r} can't run inline")
+    return _get_inline_repository().get(action_name)
+
+
+async def run_inline_action(input: RunActionInput) -> Any:
+    """Run an inline action over its execution context.
+
+    Loop iterations are cheap here, so they run one after another. Results are
+    returned in iteration order, as with the executor.
+    """
+    task = input.task
+    action = get_inline_action(task.action)
+    if task.for_each:
+        return [
+            await _run_action_direct(action=action, args=args)
+            for args in iter_for_each(task, input.exec_context)
+        ]
+    args = evaluate_templated_args(task, input.exec_context)
+    return await _run_action_direct(action=action, args=args)
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 from dataclasses import dataclass
-from functools import cached_property
 from typing import Any, ClassVar, Literal, NotRequired, Required, Self, TypedDict
 
 from pydantic import (
@@ -231,6 +230,9 @@ type SkipToken = Literal["skip"]
 class StreamID(str):
     """Hierarchical stream identifier: 'scatter_1:2/scatter_2:0'"""
 
+    # Massive scatters create one stream ID per item, so don't give each a __dict__
+    __slots__ = ()
+
     __stream_sep: ClassVar[str] = "/"
     __idx_sep: ClassVar[str] = ":"
 
@@ -266,7 +268,7 @@ class StreamID(str):
         """
         return cls.new(scope, "skip", base_stream_id=base_stream_id)
 
-    @cached_property
+    @property
     def streams(self) -> list[str]:
         """Get the list of streams in the stream ID.
 
@@ -275,7 +277,7 @@ class StreamID(str):
         """
         return self.split(self.__stream_sep)
 
-    @cached_property
+    @property
     def leaf(self) -> tuple[str, int | SkipToken]:
         """Get the leaf stream ID.
 
@@ -285,7 +287,9 @@ class StreamID(str):
         Raises:
             ValueError: If the stream ID is invalid.
         """
-        scope, index, *rest = self.streams[-1].split(self.__idx_sep)
+        scope, index, *rest = self.rpartition(self.__stream_sep)[2].split(
+            self.__idx_sep
+        )
         if rest:
             raise ValueError(f"Invalid stream ID: {self}")
         return scope, int(index) if index != "skip" else "skip"
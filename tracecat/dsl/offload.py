@@ -0,0 +1,208 @@
+"""Temporal PayloadCodec for offloading large workflow payloads to blob storage."""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
+
+import orjson
+from loguru import logger
+from temporalio.api.common.v1 import Payload
+from temporalio.converter import PayloadCodec
+
+from tracecat import storage
+from tracecat.cache import TTLCache
+from tracecat.concurrency import cooperative
+from tracecat.config import (
+    TRACECAT__BLOB_STORAGE_BUCKET_PAYLOADS,
+    TRACECAT__PAYLOAD_OFFLOAD_CACHE_SIZE_MB,
+    TRACECAT__PAYLOAD_OFFLOAD_ENABLED,
+    TRACECAT__PAYLOAD_OFFLOAD_RETENTION_DAYS,
+    TRACECAT__PAYLOAD_OFFLOAD_THRESHOLD_KB,
+)
+
+OFFLOAD_ENCODING = b"binary/claim-check"
+"""Encoding of payloads whose content lives in blob storage."""
+
+OFFLOAD_KEY_PREFIX = "payloads/"
+
+
+class _PayloadCache:
+    """A thread-safe LRU cache of payloads, bounded by their total size in bytes."""
+
+    def __init__(self, *, maxbytes: int) -> None:
+        self.maxbytes = maxbytes
+        self.currbytes = 0
+        self._data: OrderedDict[str, tuple[Payload, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str) -> Payload | None:
+        with self._lock:
+            if (entry := self._data.get(key)) is None:
+                return None
+            self._data.move_to_end(key)
+            return entry[0]
+
+    def set(self, key: str, payload: Payload, *, size: int) -> None:
+        """Cache `payload` under `key`. Payloads larger than the cache are skipped."""
+        if size > self.maxbytes:
+            return
+        with self._lock:
+            if (entry := self._data.pop(key, None)) is not None:
+                self.currbytes -= entry[1]
+            self._data[key] = (payload, size)
+            self.currbytes += size
+            while self.currbytes > self.maxbytes:
+                _, (_, evicted_size) = self._data.popitem(last=False)
+                self.currbytes -= evicted_size
+
+
+class OffloadPayloadCodec(PayloadCodec):
+    """Temporal PayloadCodec that moves large payloads out of workflow history.
+
+    Payloads that exceed a configurable size threshold are written to blob
+    storage and replaced with a claim check: a small payload that references the
+    stored content by its SHA-256 digest. Identical payloads are stored once.
+
+    Stored objects expire through a bucket lifecycle rule. Referencing an object
+    again after half of the retention period restarts its expiration clock, so
+    every reference is guaranteed at least half of the retention period.
+    """
+
+    def __init__(
+        self,
+        threshold_bytes: int | None = None,
+        bucket: str | None = None,
+        retention_days: int | None = None,
+        enabled: bool | None = None,
+    ):
+        self.enabled = (
+            enabled if enabled is not None else TRACECAT__PAYLOAD_OFFLOAD_ENABLED
+        )
+        self.threshold = (
+            threshold_bytes
+            if threshold_bytes is not None
+            else TRACECAT__PAYLOAD_OFFLOAD_THRESHOLD_KB * 1024
+        )
+        self.bucket = bucket or TRACECAT__BLOB_STORAGE_BUCKET_PAYLOADS
+        self.retention = timedelta(
+            days=retention_days or TRACECAT__PAYLOAD_OFFLOAD_RETENTION_DAYS
+        )
+        self._bucket_ready = False
+        # Keys known to be stored and fresh, so repeat payloads skip the HEAD request.
+        # Each entry expires when its object becomes old enough to need a touch.
+        self._stored: TTLCache[str, bool] = TTLCache(maxsize=1024)
+        # Downloaded payloads, so replays don't download the same content again
+        self._decoded = _PayloadCache(
+            maxbytes=TRACECAT__PAYLOAD_OFFLOAD_CACHE_SIZE_MB * 1024 * 1024
+        )
+
+        logger.info(
+            "Offload codec initialized",
+            enabled=self.enabled,
+            threshold=self.threshold,
+            bucket=self.bucket,
+            retention_days=self.retention.days,
+        )
+
+    async def encode(self, payloads: Iterable[Payload]) -> list[Payload]:
+        """Encode payloads, offloading those that exceed the threshold."""
+        if not self.enabled:
+            return list(payloads)
+
+        result = []
+        async for payload in cooperative(payloads):
+            if len(payload.data) <= self.threshold:
+                result.append(payload)
+                continue
+
+            # Store the whole payload so its metadata (e.g. compression) survives
+            content = payload.SerializeToString(deterministic=True)
+            digest = storage.compute_sha256(content)
+            key = f"{OFFLOAD_KEY_PREFIX}{digest}"
+            try:
+                await self._store(key, content)
+            except Exception as e:
+                logger.error(
+                    "Failed to offload payload, storing inline",
+                    size=len(content),
+                    key=key,
+                    error=str(e),
+                )
+                result.append(payload)
+                continue
+
+            logger.debug("Offloaded payload", size=len(content), key=key)
+            result.append(
+                Payload(
+                    metadata={
+                        "encoding": OFFLOAD_ENCODING,
+                        "sha256": digest.encode(),
+                        "size": str(len(content)).encode(),
+                    },
+                    data=orjson.dumps({"bucket": self.bucket, "key": key}),
+                )
+            )
+
+        return result
+
+    async def decode(self, payloads: Iterable[Payload]) -> list[Payload]:
+        """Decode payloads, fetching the content of claim checks from blob storage."""
+        result = []
+        async for payload in cooperative(payloads):
+            if payload.metadata.get("encoding") != OFFLOAD_ENCODING:
+                result.append(payload)
+                continue
+
+            ref = orjson.loads(payload.data)
+            key = ref["key"]
+            if (decoded := self._decoded.get(key)) is None:
+                # Let failures propagate, the claim check itself can't be deserialized
+                content = await storage.download_file(key, bucket=ref["bucket"])
+                digest = storage.compute_sha256(content)
+                if digest.encode() != payload.metadata.get("sha256"):
+                    raise ValueError(
+                        f"Offloaded payload {key!r} failed integrity check"
+                    )
+                decoded = Payload.FromString(content)
+                self._decoded.set(key, decoded, size=len(content))
+                logger.debug("Fetched offloaded payload", size=len(content), key=key)
+            result.append(decoded)
+
+        return result
+
+    async def _store(self, key: str, content: bytes) -> None:
+        if self._stored.get(key):
+            return
+        if not self._bucket_ready:
+            await storage.ensure_bucket_exists(self.bucket)
+            await storage.set_bucket_expiration(
+                self.bucket, days=self.retention.days, prefix=OFFLOAD_KEY_PREFIX
+            )
+            self._bucket_ready = True
+
+        last_modified = await storage.get_file_last_modified(key, bucket=self.bucket)
+        age = timedelta(0)
+        if last_modified is None:
+            await storage.upload_file(content, key=key, bucket=self.bucket)
+        elif (age := datetime.now(UTC) - last_modified) > self.retention / 2:
+            # Identical content is already stored, keep it from expiring under us
+            await storage.touch_file(key, bucket=self.bucket)
+            age = timedelta(0)
+        # References are skipped only while the object has half its retention left
+        self._stored.set(key, True, ttl=(self.retention / 2 - age).total_seconds())
+
+
+# Global codec instance
+_offload_codec_instance: OffloadPayloadCodec | None = None
+
+
+def get_offload_payload_codec() -> OffloadPayloadCodec:
+    """Get the global offload payload codec instance."""
+    global _offload_codec_instance
+    if _offload_codec_instance is None:
+        _offload_codec_instance = OffloadPayloadCodec()
+    return _offload_codec_instance
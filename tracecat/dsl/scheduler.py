@@ -2,8 +2,8 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict
-from collections.abc import Awaitable, Callable, Mapping
-from dataclasses import dataclass
+from collections.abc import Awaitable, Callable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
 from datetime import timedelta
 from typing import Any, cast
 
@@ -66,6 +66,40 @@ class DSLEdge:
         return f"{self.src}-[{self.type.value}]->{self.dst} ({self.stream_id})"
 
 
+SCATTER_QUEUE_BATCH_SIZE = 1024
+"""Number of execution streams a scatter queues before yielding to the event loop"""
+
+# Edge markers of execution streams are stored as one byte per stream
+_EDGE_MARKERS = (EdgeMarker.PENDING, EdgeMarker.VISITED, EdgeMarker.SKIPPED)
+_EDGE_MARKER_CODES = {marker: code for code, marker in enumerate(_EDGE_MARKERS)}
+
+
+@dataclass(slots=True)
+class ScatterState:
+    """Bookkeeping for the execution streams of a scatter.
+
+    Execution streams are only identified by their item index. Their edge markers
+    live in one array per edge, and their contexts are created on first use from
+    the scattered collection, so a scatter over N items doesn't hold N copies of
+    the per-stream bookkeeping. Everything is dropped once the gather completes.
+    """
+
+    collection: Sequence[Any]
+    """The scattered collection. Execution stream `i` holds `collection[i]`"""
+    edges: dict[tuple[str, str, EdgeType], bytearray] = field(default_factory=dict)
+    """Edge markers of the execution streams, indexed by item"""
+    nested_edges: dict[DSLEdge, EdgeMarker] = field(default_factory=dict)
+    """Edge markers of skip streams nested in the execution streams"""
+    nested_streams: list[StreamID] = field(default_factory=list)
+    """Skip streams nested in the execution streams"""
+    nested_scatters: list[Task] = field(default_factory=list)
+    """Empty scatters nested in the execution streams"""
+    pending: int = 0
+    """Number of queued or running tasks in the execution streams"""
+    gathered: bool = False
+    """Whether the gather has synchronized all execution streams"""
+
+
 class DSLScheduler:
     """Manage only scheduling and control flow of tasks in a topological-like order."""
 
@@ -76,11 +110,18 @@ class DSLScheduler:
         dsl: DSLInput,
         skip_strategy: SkipStrategy = SkipStrategy.PROPAGATE,
         context: ExecutionContext,
+        compact_scatter: bool = True,
     ):
         # Static
         self.dsl = dsl
         self.executor = executor
         self.skip_strategy = skip_strategy
+        self.compact_scatter = compact_scatter
+        """Queue tasks without spawning an asyncio task per queued task or stream.
+
+        This changes the order in which tasks are scheduled, so workflows that
+        started before it was introduced must replay with it disabled.
+        """
         # self.logger = ctx_logger.get(logger).bind(unit="dsl-scheduler")
         self.logger = logger
         self.tasks: dict[str, ActionStatement] = {}
@@ -92,13 +133,13 @@ class DSLScheduler:
         # Mut: Queue is used to schedule tasks
         self.queue: asyncio.Queue[Task] = asyncio.Queue()
 
-        # Mut: Use to
+        # Mut: Remaining indegrees of tasks that aren't queued yet
         self.indegrees: dict[Task, int] = {}
         # Mut
-        self.completed_tasks: set[Task] = set()
+        self.n_completed_tasks = 0
         # Mut: This tracks the state of edges between tasks
         # This is no longer correct because we now have multiple edges between tasks
-        self.edges: dict[DSLEdge, EdgeMarker] = defaultdict(lambda: EdgeMarker.PENDING)
+        self.edges: dict[DSLEdge, EdgeMarker] = {}
         # Mut
         self.task_exceptions: dict[str, TaskExceptionInfo] = {}
         self.stream_exceptions: dict[StreamID, TaskExceptionInfo] = {}
@@ -116,7 +157,8 @@ class DSLScheduler:
 
         self.stream_hierarchy: dict[StreamID, StreamID | None] = {ROOT_STREAM: None}
         """Points to the parent stream ID for each stream ID"""
-        self.task_streams: defaultdict[Task, list[StreamID]] = defaultdict(list)
+        self.scatters: dict[Task, ScatterState] = {}
+        """Bookkeeping for the execution streams of each running scatter"""
         self.open_streams: dict[Task, int] = {}
         """Used to track the number of scopes that have been closed for an scatter"""
 
@@ -342,33 +384,41 @@ class DSLScheduler:
             task=task,
             next_tasks=next_tasks,
         )
-        async with asyncio.TaskGroup() as tg:
-            for next_ref, edge_type in next_tasks:
-                self.logger.debug("Processing next task", ref=ref, next_ref=next_ref)
-                edge = DSLEdge(
-                    src=ref, dst=next_ref, type=edge_type, stream_id=stream_id
-                )
-                if unreachable and edge in unreachable:
-                    self._mark_edge(edge, EdgeMarker.SKIPPED)
-                else:
-                    self._mark_edge(edge, EdgeMarker.VISITED)
-                # Mark the edge as processed
-                # Task inherits the current stream
-                next_task = Task(ref=next_ref, stream_id=stream_id)
-                # We dynamically add the indegree of the next task to the indegrees dict
-                if next_task not in self.indegrees:
-                    self.indegrees[next_task] = len(self.tasks[next_ref].depends_on)
-                self.indegrees[next_task] -= 1
-                if self.indegrees[next_task] == 0:
-                    # Schedule the next task
-                    self.logger.debug(
-                        "Adding task to queue; mark visited", next_ref=next_ref
-                    )
+        ready_tasks: list[Task] = []
+        for next_ref, edge_type in next_tasks:
+            self.logger.debug("Processing next task", ref=ref, next_ref=next_ref)
+            edge = DSLEdge(src=ref, dst=next_ref, type=edge_type, stream_id=stream_id)
+            if unreachable and edge in unreachable:
+                self._mark_edge(edge, EdgeMarker.SKIPPED)
+            else:
+                self._mark_edge(edge, EdgeMarker.VISITED)
+            # Mark the edge as processed
+            # Task inherits the current stream
+            next_task = Task(ref=next_ref, stream_id=stream_id)
+            # We dynamically add the indegree of the next task to the indegrees dict
+            # and drop it once the task is ready, so finished streams leave nothing behind
+            indegree = self.indegrees.pop(
+                next_task, len(self.tasks[next_ref].depends_on)
+            )
+            if indegree > 1:
+                self.indegrees[next_task] = indegree - 1
+                continue
+            # Schedule the next task
+            self.logger.debug("Adding task to queue; mark visited", next_ref=next_ref)
+            self._track_pending(next_task.stream_id, 1)
+            ready_tasks.append(next_task)
+
+        if self.compact_scatter:
+            for next_task in ready_tasks:
+                self.queue.put_nowait(next_task)
+        else:
+            async with asyncio.TaskGroup() as tg:
+                for next_task in ready_tasks:
                     tg.create_task(self.queue.put(next_task))
         self.logger.trace(
             "Queued tasks",
-            visited_tasks=list(self.completed_tasks),
-            tasks=list(self.tasks.keys()),
+            n_completed_tasks=self.n_completed_tasks,
+            n_tasks=len(self.tasks),
             queue_size=self.queue.qsize(),
         )
 
@@ -429,7 +479,8 @@ class DSLScheduler:
         finally:
             # 5) Regardless of the outcome, the task is now complete
             self.logger.info("Task completed", task=task)
-            self.completed_tasks.add(task)
+            self.n_completed_tasks += 1
+            self._track_pending(task.stream_id, -1)
 
     async def start(self) -> dict[str, TaskExceptionInfo] | None:
         """Run the scheduler and return any exceptions that occurred."""
@@ -466,7 +517,7 @@ class DSLScheduler:
                 "DSLScheduler got task exceptions, stopping...",
                 n_exceptions=len(self.task_exceptions),
                 exceptions=self.task_exceptions,
-                n_visited=len(self.completed_tasks),
+                n_visited=self.n_completed_tasks,
                 n_tasks=len(self.tasks),
             )
             # Cancel all pending tasks and wait for them to complete
@@ -483,7 +534,7 @@ class DSLScheduler:
             return self.task_exceptions
         self.logger.info(
             "All tasks completed",
-            completed_tasks=list(self.completed_tasks),
+            n_completed_tasks=self.n_completed_tasks,
             n_tasks=len(self.tasks),
         )
         return None
@@ -537,7 +588,7 @@ class DSLScheduler:
         stream_id: StreamID,
     ) -> bool:
         edge = self._get_edge_by_refs(src_ref_path, dst_ref, stream_id)
-        return self.edges[edge] == marker
+        return self._get_edge_marker(edge) == marker
 
     def _get_edge_components(self, ref_path: str) -> AdjDst:
         return edge_components_from_dep(ref_path)
@@ -561,8 +612,47 @@ class DSLScheduler:
 
     def _mark_edge(self, edge: DSLEdge, marker: EdgeMarker) -> None:
         logger.debug("Marking edge", edge=edge, marker=marker)
+        for _, state, index in self._iter_scatters(edge.stream_id):
+            if index is None:
+                state.nested_edges[edge] = marker
+            else:
+                key = (edge.src, edge.dst, edge.type)
+                if (markers := state.edges.get(key)) is None:
+                    markers = state.edges[key] = bytearray(len(state.collection))
+                markers[index] = _EDGE_MARKER_CODES[marker]
+            return
         self.edges[edge] = marker
 
+    def _get_edge_marker(self, edge: DSLEdge) -> EdgeMarker:
+        for _, state, index in self._iter_scatters(edge.stream_id):
+            if index is None:
+                return state.nested_edges.get(edge, EdgeMarker.PENDING)
+            markers = state.edges.get((edge.src, edge.dst, edge.type))
+            return (
+                EdgeMarker.PENDING if markers is None else _EDGE_MARKERS[markers[index]]
+            )
+        return self.edges.get(edge, EdgeMarker.PENDING)
+
+    def _iter_scatters(
+        self, stream_id: StreamID
+    ) -> Iterator[tuple[Task, ScatterState, int | None]]:
+        """Iterate over the running scatters whose execution streams contain a stream.
+
+        Yields the scatter task, its state and the item index if the stream is
+        one of its execution streams (as opposed to nested in one), innermost first.
+        """
+        nested = False
+        while True:
+            parent, sep, leaf = stream_id.rpartition("/")
+            if not sep:
+                return
+            scatter_ref, _, stream_idx = leaf.partition(":")
+            stream_id = StreamID(parent)
+            scatter = Task(ref=scatter_ref, stream_id=stream_id)
+            if stream_idx != "skip" and (state := self.scatters.get(scatter)):
+                yield scatter, state, None if nested else int(stream_idx)
+            nested = True
+
     def _skip_should_propagate(self, task: Task, stmt: ActionStatement) -> bool:
         """
         Check if a task's skip should propagate to its dependents.
@@ -599,11 +689,20 @@ class DSLScheduler:
                 return True
         return False
 
-    async def _queue_skip_stream(self, task: Task, stream_id: StreamID) -> None:
-        """Queue a skip stream for a task."""
+    def _create_skip_stream(self, task: Task, stream_id: StreamID) -> StreamID:
+        """Create a skip stream for a task in the given stream."""
         new_stream_id = StreamID.skip(task.ref, base_stream_id=stream_id)
         self.stream_hierarchy[new_stream_id] = stream_id
         self.streams[new_stream_id] = {ExprContext.ACTIONS: {}}
+        # Drop it along with the execution stream it's nested in, if any
+        for _, state, _ in self._iter_scatters(new_stream_id):
+            state.nested_streams.append(new_stream_id)
+            break
+        return new_stream_id
+
+    async def _queue_skip_stream(self, task: Task, stream_id: StreamID) -> None:
+        """Queue a skip stream for a task."""
+        new_stream_id = self._create_skip_stream(task, stream_id)
         unreachable = {
             DSLEdge(src=task.ref, dst=dst, type=edge_type, stream_id=new_stream_id)
             for dst, edge_type in self.adj[task.ref]
@@ -616,12 +715,10 @@ class DSLScheduler:
     async def _handle_scatter_skip_stream(
         self, task: Task, stream_id: StreamID
     ) -> None:
-        new_stream_id = StreamID.skip(task.ref, base_stream_id=stream_id)
+        new_stream_id = self._create_skip_stream(task, stream_id)
         self.logger.debug(
             "Creating skip stream", task=task, new_stream_id=new_stream_id
         )
-        self.stream_hierarchy[new_stream_id] = stream_id
-        self.streams[new_stream_id] = {ExprContext.ACTIONS: {}}
         all_next = {
             DSLEdge(src=task.ref, dst=dst, type=edge_type, stream_id=new_stream_id)
             for dst, edge_type in self.adj[task.ref]
@@ -644,6 +741,8 @@ class DSLScheduler:
 
         The tasks in each stream are executed in the order of the collection.
 
+        Streams aren't materialized up front. A stream's context is created from
+        the collection when one of its tasks first reads it.
         """
         # Our current location, before creating any new streams
         curr_stream_id = task.stream_id
@@ -666,62 +765,92 @@ class DSLScheduler:
         # ALWAYS initialize tracking structures (even for empty collections)
         # This ensures that _handle_gather can find the scatter task in tracking structures
 
-        streams: list[StreamID] = []
-        self.task_streams[task] = streams
         # -- SKIP STREAM
         if not collection:
             # Mark scatter as observed
             self.open_streams[task] = 0
+            for _, state, _ in self._iter_scatters(curr_stream_id):
+                state.nested_scatters.append(task)
+                break
             self.logger.debug("Empty collection for scatter", task=task)
             return await self._handle_scatter_skip_stream(task, curr_stream_id)
 
         # -- EXECUTION STREAM
-        self.logger.debug(
-            "Exploding collection", task=task, collection_size=len(collection)
-        )
+        if not isinstance(collection, Sequence):
+            collection = list(collection)
+        size = len(collection)
+        self.logger.debug("Exploding collection", task=task, collection_size=size)
+        self.scatters[task] = ScatterState(collection=collection)
+        self.open_streams[task] = size
 
         # Create stream for each collection item
-        async for i, item in cooperative(enumerate(collection)):
+        batch_size = SCATTER_QUEUE_BATCH_SIZE if self.compact_scatter else 1
+        async for i in cooperative(range(size), batch_size=batch_size):
             new_stream_id = StreamID.new(task.ref, i, base_stream_id=curr_stream_id)
-            streams.append(new_stream_id)
-
-            # Initialize stream with single item
-            self.stream_hierarchy[new_stream_id] = curr_stream_id
-            self.streams[new_stream_id] = {
-                ExprContext.ACTIONS: {
-                    task.ref: TaskResult(
-                        result=item,
-                        result_typename=type(item).__name__,
-                    ),
-                }
-            }
-
             # Create tasks for all tasks in this stream
             new_scoped_task = Task(ref=task.ref, stream_id=new_stream_id)
             self.logger.debug(
-                "Creating stream",
-                item=item,
-                stream_id=new_stream_id,
-                task=new_scoped_task,
+                "Creating stream", stream_id=new_stream_id, task=new_scoped_task
             )
             # This will queue the task for execution stream
-            coro = self._queue_tasks(new_scoped_task)
-            _ = asyncio.create_task(coro)
+            if self.compact_scatter:
+                await self._queue_tasks(new_scoped_task)
+            else:
+                _ = asyncio.create_task(self._queue_tasks(new_scoped_task))
 
-        self.open_streams[task] = len(streams)
         # Get the next tasks to queue
         self.logger.debug(
-            "Scatter completed",
-            task=task,
-            collection_size=len(collection),
-            scopes_created=len(streams),
+            "Scatter completed", task=task, collection_size=size, scopes_created=size
         )
 
     def get_context(self, stream_id: StreamID) -> ExecutionContext:
-        context = self.streams[stream_id]
         self.logger.trace("Getting stream context", stream_id=stream_id)
+        if (context := self._find_context(stream_id)) is None:
+            raise KeyError(stream_id)
         return context
 
+    def _find_context(self, stream_id: StreamID) -> ExecutionContext | None:
+        """Get the context of a stream, creating it if it's an execution stream."""
+        if (context := self.streams.get(stream_id)) is not None:
+            return context
+        for scatter, state, index in self._iter_scatters(stream_id):
+            if index is None:
+                break
+            # Initialize stream with single item
+            item = state.collection[index]
+            context = self.streams[stream_id] = {
+                ExprContext.ACTIONS: {
+                    scatter.ref: TaskResult(
+                        result=item,
+                        result_typename=type(item).__name__,
+                    ),
+                }
+            }
+            return context
+        return None
+
+    def _track_pending(self, stream_id: StreamID, delta: int) -> None:
+        """Count a task queued in or finished from the scatters containing a stream."""
+        for scatter, state, _ in self._iter_scatters(stream_id):
+            state.pending += delta
+            if state.gathered and state.pending == 0:
+                self._release_scatter(scatter, state)
+
+    def _release_scatter(self, scatter: Task, state: ScatterState) -> None:
+        """Drop the bookkeeping of a gathered scatter once its streams are idle."""
+        self.logger.debug("Releasing scatter streams", task=scatter)
+        del self.scatters[scatter]
+        self.open_streams.pop(scatter, None)
+        for i in range(len(state.collection)):
+            stream_id = StreamID.new(scatter.ref, i, base_stream_id=scatter.stream_id)
+            self.streams.pop(stream_id, None)
+            self.stream_exceptions.pop(stream_id, None)
+        for stream_id in state.nested_streams:
+            self.streams.pop(stream_id, None)
+            self.stream_hierarchy.pop(stream_id, None)
+        for nested_scatter in state.nested_scatters:
+            self.open_streams.pop(nested_scatter, None)
+
     async def _handle_gather_skip_stream(
         self, task: Task, stmt: ActionStatement, stream_id: StreamID
     ) -> None:
@@ -740,7 +869,7 @@ class DSLScheduler:
                 # NOTE: This block is executed by the first execution stream that finishes.
                 # We need to initialize the result with the cardinality of the scatter
                 # This is the number of execution streams that will be synchronized by this gather
-                size = len(self.task_streams[parent_scatter])
+                size = len(self.scatters[parent_scatter].collection)
                 result = [Sentinel.GATHER_UNSET for _ in range(size)]
                 parent_action_context[gather_ref] = TaskResult(
                     result=result,
@@ -773,8 +902,19 @@ class DSLScheduler:
                 remaining_open_streams=self.open_streams[parent_scatter],
             )
 
+    def _get_parent_stream(self, stream_id: StreamID) -> StreamID | None:
+        """Get the parent of a stream.
+
+        Execution streams aren't recorded in the stream hierarchy, as their parent
+        is always the stream that the scatter ran in.
+        """
+        if stream_id in self.stream_hierarchy:
+            return self.stream_hierarchy[stream_id]
+        parent, sep, _ = stream_id.rpartition("/")
+        return StreamID(parent) if sep else None
+
     def _get_parent_stream_id_safe(self, task: Task, stream_id: StreamID) -> StreamID:
-        parent_stream = self.stream_hierarchy[stream_id]
+        parent_stream = self._get_parent_stream(stream_id)
         if parent_stream is None:
             # Raise a detailed error if a gather is found in a skip stream with no parent stream.
             raise RuntimeError(
@@ -938,7 +1078,7 @@ class DSLScheduler:
             # NOTE: This block is executed by the first execution stream that finishes.
             # We need to initialize the result with the cardinality of the scatter
             # This is the number of execution streams that will be synchronized by this gather
-            size = len(self.task_streams[parent_scatter])
+            size = len(self.scatters[parent_scatter].collection)
             result = [Sentinel.GATHER_UNSET for _ in range(size)]
             parent_action_context[gather_ref] = TaskResult(
                 result=result,
@@ -973,6 +1113,11 @@ class DSLScheduler:
         gather_ref: str,
     ) -> None:
         self.logger.debug("Handling gather result", task=task)
+        # The execution streams are released once their remaining tasks finish
+        scatter_ref, _ = task.stream_id.leaf
+        parent_scatter = Task(ref=scatter_ref, stream_id=parent_stream_id)
+        if state := self.scatters.get(parent_scatter):
+            state.gathered = True
         # We have closed all execution streams for this scatter. The gather is now complete.
         # Apply filtering if requested
 
@@ -1084,7 +1229,7 @@ class DSLScheduler:
 
         while curr_stream is not None:
             # Check if the action exists in the current stream
-            if stream_context := self.streams.get(curr_stream):
+            if stream_context := self._find_context(curr_stream):
                 actions_context = stream_context.get(ExprContext.ACTIONS, {})
                 if action_ref in actions_context:
                     self.logger.trace(
@@ -1095,7 +1240,7 @@ class DSLScheduler:
                     return actions_context[action_ref]
 
             # Move to parent stream
-            curr_stream = self.stream_hierarchy.get(curr_stream)
+            curr_stream = self._get_parent_stream(curr_stream)
             self.logger.trace(
                 "Moving to parent stream",
                 action_ref=action_ref,
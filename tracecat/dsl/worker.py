@@ -21,9 +21,11 @@ with workflow.unsafe.imports_passed_through():
     from tracecat.dsl.validation import validate_trigger_inputs_activity
     from tracecat.dsl.workflow import DSLWorkflow
     from tracecat.ee.interactions.service import InteractionService
+    from tracecat.executor.client import close_executor_http_client
     from tracecat.logger import logger
     from tracecat.workflow.management.definitions import (
         get_workflow_definition_activity,
+        resolve_workflow_definition_activity,
     )
     from tracecat.workflow.management.management import WorkflowsManagementService
     from tracecat.workflow.schedules.service import WorkflowSchedulesService
@@ -59,6 +61,7 @@ def get_activities() -> list[Callable]:
     return [
         *DSLActivities.load(),
         get_workflow_definition_activity,
+        resolve_workflow_definition_activity,
         *WorkflowSchedulesService.get_activities(),
         validate_trigger_inputs_activity,
         *WorkflowsManagementService.get_activities(),
@@ -106,6 +109,7 @@ async def main() -> None:
             # Wait until interrupted
             await interrupt_event.wait()
             logger.info("Shutting down")
+    await close_executor_http_client()
 
 
 if __name__ == "__main__":
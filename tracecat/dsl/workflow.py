@@ -54,6 +54,7 @@ with workflow.unsafe.imports_passed_through():
         PlatformAction,
         WaitStrategy,
     )
+    from tracecat.dsl.inline import can_run_inline
     from tracecat.dsl.models import (
         ActionErrorInfo,
         ActionErrorInfoAdapter,
@@ -93,11 +94,13 @@ with workflow.unsafe.imports_passed_through():
     from tracecat.workflow.executions.models import ErrorHandlerWorkflowInput
     from tracecat.workflow.management.definitions import (
         get_workflow_definition_activity,
+        resolve_workflow_definition_activity,
     )
     from tracecat.workflow.management.management import WorkflowsManagementService
     from tracecat.workflow.management.models import (
         GetErrorHandlerWorkflowIDActivityInputs,
         GetWorkflowDefinitionActivityInputs,
+        ResolvedWorkflowDefinition,
         ResolveWorkflowAliasActivityInputs,
     )
     from tracecat.workflow.schedules.models import GetScheduleActivityInputs
@@ -111,6 +114,7 @@ class DSLWorkflow:
     @workflow.init
     def __init__(self, args: DSLRunArgs) -> None:
         self.role = args.role
+        self.inline_actions = args.inline_actions
         self.start_to_close_timeout = args.timeout
         wf_info = workflow.info()
         # Tracecat wf exec id == Temporal wf exec id
@@ -157,7 +161,7 @@ class DSLWorkflow:
     def get_context(self, stream_id: StreamID | None = None) -> ExecutionContext:
         """Get the current execution context."""
         sid = stream_id or ctx_stream_id.get()
-        return self.scheduler.streams[sid]
+        return self.scheduler.get_context(sid)
 
     @workflow.run
     async def run(self, args: DSLRunArgs) -> Any:
@@ -168,10 +172,14 @@ class DSLWorkflow:
             self.dsl = args.dsl
             self.dispatch_type = "push"
         else:
-            # Otherwise, fetch the latest workflow definition
-            self.logger.debug("Fetching latest workflow definition")
+            # Otherwise, fetch the pinned or latest workflow definition
+            self.logger.debug(
+                "Fetching workflow definition", version=args.definition_version
+            )
             try:
-                self.dsl = await self._get_workflow_definition(args.wf_id)
+                self.dsl = await self._get_workflow_definition(
+                    args.wf_id, version=args.definition_version
+                )
             except TracecatException as e:
                 self.logger.error("Failed to fetch workflow definition")
                 raise ApplicationError(
@@ -179,7 +187,11 @@ class DSLWorkflow:
                     non_retryable=True,
                     type=e.__class__.__name__,
                 ) from e
-            self.dispatch_type = "pull"
+            # Child workflows pass their definition by (wf_id, version) reference,
+            # but are still dispatched by their parent
+            self.dispatch_type = (
+                "push" if args.definition_version is not None else "pull"
+            )
 
         # Note that we can't run the error handler above this
         # Run the workflow with error handling
@@ -357,6 +369,7 @@ class DSLWorkflow:
             executor=self.execute_task,
             dsl=self.dsl,
             context=self.context,
+            compact_scatter=workflow.patched("compact-scatter"),
         )
         try:
             task_exceptions = await self.scheduler.start()
@@ -780,6 +793,19 @@ class DSLWorkflow:
             retry_policy=RETRY_POLICIES["activity:fail_slow"],
         )
 
+    async def _resolve_workflow_definition(
+        self, workflow_id: identifiers.WorkflowID, version: int | None = None
+    ) -> ResolvedWorkflowDefinition:
+        activity_inputs = GetWorkflowDefinitionActivityInputs(
+            role=self.role, workflow_id=workflow_id, version=version
+        )
+        return await workflow.execute_activity(
+            resolve_workflow_definition_activity,
+            arg=activity_inputs,
+            start_to_close_timeout=self.start_to_close_timeout,
+            retry_policy=RETRY_POLICIES["activity:fail_slow"],
+        )
+
     async def _validate_trigger_inputs(
         self, trigger_inputs: TriggerInputs
     ) -> DSLValidationResult:
@@ -862,7 +888,18 @@ class DSLWorkflow:
         else:
             raise ValueError("Either workflow_id or workflow_alias must be provided")
 
-        dsl = await self._get_workflow_definition(child_wf_id, version=args.version)
+        # Pin the definition version once per child action, so every child run
+        # (including each iteration of a loop) gets the definition by reference.
+        # Histories recorded before pinning keep replaying the by-value lookup.
+        definition_version = None
+        if workflow.patched("child-definition-by-reference"):
+            resolved = await self._resolve_workflow_definition(
+                child_wf_id, version=args.version
+            )
+            dsl = resolved.dsl
+            definition_version = resolved.version
+        else:
+            dsl = await self._get_workflow_definition(child_wf_id, version=args.version)
 
         self.logger.debug(
             "Got workflow definition",
@@ -886,6 +923,8 @@ class DSLWorkflow:
             parent_run_context=ctx_run.get(),
             trigger_inputs=args.trigger_inputs,
             runtime_config=runtime_config,
+            definition_version=definition_version,
+            inline_actions=self.inline_actions,
         )
 
     async def _noop_gather_action(self, task: ActionStatement) -> Any:
@@ -940,6 +979,24 @@ class DSLWorkflow:
             stream_id=stream_id,
         )
 
+        # Pure platform actions run on this worker as local activities.
+        # Histories recorded before inlining keep replaying as regular activities.
+        if (
+            self.inline_actions
+            and can_run_inline(task, expr_ctxs)
+            and workflow.patched("inline-actions")
+        ):
+            return await workflow.execute_local_activity(
+                DSLActivities.run_inline_action_activity,
+                args=(arg, self.role),
+                start_to_close_timeout=timedelta(
+                    seconds=task.start_delay + task.retry_policy.timeout
+                ),
+                retry_policy=RetryPolicy(
+                    maximum_attempts=task.retry_policy.max_attempts,
+                ),
+            )
+
         return await workflow.execute_activity(
             DSLActivities.run_action_activity,
             args=(arg, self.role),
@@ -971,6 +1028,10 @@ class DSLWorkflow:
             wait_strategy=args.wait_strategy,
             memo=memo,
         )
+        if run_args.definition_version is not None:
+            # The child resolves the pinned definition itself, so keep the DSL
+            # out of the child's start event
+            run_args = run_args.model_copy(update={"dsl": None})
 
         match args.wait_strategy:
             case WaitStrategy.DETACH:
@@ -1083,6 +1144,7 @@ class DSLWorkflow:
                 trigger_type=trigger_type,
             ),
             runtime_config=runtime_config,
+            inline_actions=self.inline_actions,
         )
 
     async def _run_error_handler_workflow(
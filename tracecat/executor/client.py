@@ -1,7 +1,8 @@
 """Use this in worker to execute actions."""
 
-from collections.abc import AsyncIterator, Mapping
-from contextlib import asynccontextmanager
+import asyncio
+import os
+from collections.abc import Mapping
 from json import JSONDecodeError
 from typing import Any, NoReturn
 
@@ -10,7 +11,6 @@ import orjson
 from fastapi import status
 
 from tracecat import config
-from tracecat.clients import AuthenticatedServiceClient
 from tracecat.contexts import ctx_role
 from tracecat.dsl.models import RunActionInput
 from tracecat.executor.models import ExecutorActionErrorInfo
@@ -23,39 +23,87 @@ from tracecat.types.exceptions import (
     ExecutorClientError,
     RateLimitExceeded,
     RegistryError,
+    TracecatCredentialsError,
 )
 
 
-class ExecutorHTTPClient(AuthenticatedServiceClient):
-    """Async httpx client for the executor service."""
+class ExecutorHTTPClient(httpx.AsyncClient):
+    """Connection-pooled async httpx client for the executor service.
 
-    def __init__(self, role: Role | None = None, *args: Any, **kwargs: Any) -> None:
-        self._executor_base_url = config.TRACECAT__EXECUTOR_URL
-        super().__init__(role, *args, base_url=self._executor_base_url, **kwargs)
-        self.params = self.params.add(
-            "workspace_id", str(self.role.workspace_id) if self.role else None
+    One client is shared by every `ExecutorClient` in a process, so role headers
+    are sent with each request rather than set on the client.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        try:
+            service_key = os.environ["TRACECAT__SERVICE_KEY"]
+        except KeyError as e:
+            raise TracecatCredentialsError(
+                "TRACECAT__SERVICE_KEY environment variable not set"
+            ) from e
+        super().__init__(
+            *args,
+            base_url=config.TRACECAT__EXECUTOR_URL,
+            headers={"x-tracecat-service-key": service_key},
+            limits=httpx.Limits(
+                max_connections=config.TRACECAT__EXECUTOR_CLIENT_MAX_CONNECTIONS,
+                max_keepalive_connections=config.TRACECAT__EXECUTOR_CLIENT_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+            timeout=config.TRACECAT__EXECUTOR_CLIENT_TIMEOUT,
+            **kwargs,
         )
 
 
+_http_client: ExecutorHTTPClient | None = None
+_http_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_executor_http_client() -> ExecutorHTTPClient:
+    """Get the process-wide executor HTTP client for the running event loop."""
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    # Pooled connections belong to the loop that opened them
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client = ExecutorHTTPClient()
+        _http_client_loop = loop
+    return _http_client
+
+
+async def close_executor_http_client() -> None:
+    """Close the process-wide executor HTTP client, if any."""
+    global _http_client, _http_client_loop
+    if _http_client is not None:
+        await _http_client.aclose()
+    _http_client = None
+    _http_client_loop = None
+
+
 class ExecutorClient:
     """Use this to interact with the remote executor service."""
 
     _timeout: float = config.TRACECAT__EXECUTOR_CLIENT_TIMEOUT
 
     def __init__(self, role: Role | None = None):
-        self.role = role or ctx_role.get()
+        # Precedence: role > ctx_role > default service role
+        self.role = (
+            role
+            or ctx_role.get()
+            or Role(type="service", service_id="tracecat-service")
+        )
         self.logger = logger.bind(service="executor-client", role=self.role)
-
-    @asynccontextmanager
-    async def _client(self) -> AsyncIterator[ExecutorHTTPClient]:
-        async with ExecutorHTTPClient(self.role) as client:
-            yield client
+        self._headers = self.role.to_headers()
+        self._params = (
+            {"workspace_id": str(self.role.workspace_id)}
+            if self.role.workspace_id
+            else {}
+        )
 
     # === Execution ===
 
     async def run_action_memory_backend(self, input: RunActionInput) -> Any:
         action_type = input.task.action
-        content = input.model_dump_json()
+        # Serialize straight to bytes, skipping the str round trip
+        content = input.__pydantic_serializer__.to_json(input)
         logger.trace(
             f"Calling action {action_type!r} with content",
             content=content,
@@ -63,15 +111,13 @@ class ExecutorClient:
             timeout=self._timeout,
         )
         try:
-            async with self._client() as client:
-                # No need to include role headers here because it's already
-                # added in AuthenticatedServiceClient
-                response = await client.post(
-                    f"/run/{action_type}",
-                    headers={"Content-Type": "application/json"},
-                    content=content,
-                    timeout=self._timeout,
-                )
+            response = await get_executor_http_client().post(
+                f"/run/{action_type}",
+                headers={**self._headers, "Content-Type": "application/json"},
+                params=self._params,
+                content=content,
+                timeout=self._timeout,
+            )
             response.raise_for_status()
             return orjson.loads(response.content)
         except httpx.HTTPStatusError as e:
@@ -89,6 +135,22 @@ class ExecutorClient:
                 f"Unexpected error calling action {action_type!r} in executor: {e}"
             ) from e
 
+    async def prewarm(self) -> None:
+        """Ask the executor to install the current registry runtime environment."""
+        try:
+            response = await get_executor_http_client().post(
+                "/prewarm", headers=self._headers, params=self._params
+            )
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            raise ExecutorClientError(
+                f"Failed to prewarm executor: HTTP {e.response.status_code}"
+            ) from e
+        except httpx.RequestError as e:
+            raise ExecutorClientError(
+                f"Network error while prewarming executor: {str(e)}"
+            ) from e
+
     # === Validation ===
 
     async def validate_action(
@@ -97,10 +159,12 @@ class ExecutorClient:
         """Validate an action."""
         try:
             logger.warning("Validating action")
-            async with self._client() as client:
-                response = await client.post(
-                    f"/validate/{action_name}", json={"args": args}
-                )
+            response = await get_executor_http_client().post(
+                f"/validate/{action_name}",
+                headers=self._headers,
+                params=self._params,
+                json={"args": args},
+            )
             response.raise_for_status()
             return RegistryActionValidateResponse.model_validate_json(response.content)
         except httpx.HTTPStatusError as e:
@@ -0,0 +1,295 @@
+"""Persistent executor worker pools.
+
+By default, every action runs as a fresh Ray task that sets up and tears down its
+own event loop and DB engine. The pools here keep warm workers alive across
+actions instead:
+
+- `actor`: a pool of Ray actors, one per worker slot, created with the same
+  runtime environment as the equivalent Ray task.
+- `process`: a pool of local worker processes. This runs actions against the
+  packages installed in the executor image and does not support Ray runtime
+  environments, so actions that need one fall back to Ray tasks.
+
+Workers are recycled after `TRACECAT__EXECUTOR_WORKER_MAX_TASKS` actions.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Literal, Protocol
+
+import orjson
+import ray
+from ray import ObjectRef
+from ray.actor import ActorHandle
+from ray.runtime_env import RuntimeEnv
+
+from tracecat import config
+from tracecat.dsl.models import RunActionInput
+from tracecat.executor.engine import EXECUTION_TIMEOUT
+from tracecat.logger import logger
+from tracecat.types.auth import Role
+
+WorkerMode = Literal["task", "actor", "process"]
+
+
+class ExecutorWorkerPool(Protocol):
+    async def run(
+        self,
+        input: RunActionInput,
+        role: Role,
+        registry_version: str | None,
+        *,
+        loop_vars: dict[str, Any] | None = None,
+        input_ref: ObjectRef[RunActionInput] | None = None,
+    ) -> Any: ...
+
+    def close(self) -> None: ...
+
+
+@ray.remote
+class ExecutorActor:
+    """Ray actor that keeps an executor runtime warm across actions."""
+
+    def __init__(self) -> None:
+        # Imported here as the executor service depends on this module
+        from tracecat.executor.service import ExecutorWorkerRuntime
+
+        self._runtime = ExecutorWorkerRuntime()
+
+    def run(
+        self,
+        input: RunActionInput,
+        role: Role,
+        registry_version: str | None = None,
+        loop_vars: dict[str, Any] | None = None,
+    ) -> Any:
+        return self._runtime.run(input, role, registry_version, loop_vars)
+
+
+@dataclass
+class _PooledActor:
+    handle: ActorHandle
+    n_tasks: int = 0
+
+
+class RayActorPool:
+    """A fixed-size pool of warm Ray actors.
+
+    Each actor runs one action at a time. An actor is replaced once it has run
+    `max_tasks_per_worker` actions, or if it fails or times out.
+    """
+
+    def __init__(
+        self,
+        *,
+        size: int,
+        max_tasks_per_worker: int,
+        runtime_env: RuntimeEnv | None = None,
+    ) -> None:
+        self._runtime_env = runtime_env
+        self._max_tasks = max_tasks_per_worker
+        self._closed = False
+        self._idle: asyncio.Queue[_PooledActor] = asyncio.Queue()
+        for _ in range(size):
+            self._idle.put_nowait(self._spawn())
+
+    def _spawn(self) -> _PooledActor:
+        handle = ExecutorActor.options(runtime_env=self._runtime_env).remote()  # type: ignore[attr-defined]
+        return _PooledActor(handle=handle)
+
+    def _release(self, worker: _PooledActor, *, healthy: bool) -> None:
+        if healthy and not self._closed and worker.n_tasks < self._max_tasks:
+            self._idle.put_nowait(worker)
+            return
+        logger.debug(
+            "Recycling executor actor", n_tasks=worker.n_tasks, healthy=healthy
+        )
+        ray.kill(worker.handle)
+        if not self._closed:
+            self._idle.put_nowait(self._spawn())
+
+    async def run(
+        self,
+        input: RunActionInput,
+        role: Role,
+        registry_version: str | None,
+        *,
+        loop_vars: dict[str, Any] | None = None,
+        input_ref: ObjectRef[RunActionInput] | None = None,
+    ) -> Any:
+        worker = await self._idle.get()
+        healthy = False
+        try:
+            obj_ref = worker.handle.run.remote(
+                input_ref or input, role, registry_version, loop_vars
+            )
+            worker.n_tasks += 1
+            coro = asyncio.to_thread(ray.get, obj_ref)
+            result = await asyncio.wait_for(coro, timeout=EXECUTION_TIMEOUT)
+            healthy = True
+            return result
+        finally:
+            # Actor tasks can't be force-cancelled, so timed out or crashed
+            # actors are killed and replaced
+            self._release(worker, healthy=healthy)
+
+    def close(self) -> None:
+        self._closed = True
+        while not self._idle.empty():
+            ray.kill(self._idle.get_nowait().handle)
+
+
+_process_runtime: Any = None
+
+
+def _init_worker_process() -> None:
+    global _process_runtime
+    from tracecat.executor.service import ExecutorWorkerRuntime
+
+    _process_runtime = ExecutorWorkerRuntime()
+
+
+def _run_in_worker_process(
+    input: RunActionInput,
+    role: Role,
+    registry_version: str | None,
+    loop_vars: dict[str, Any] | None,
+) -> Any:
+    return _process_runtime.run(input, role, registry_version, loop_vars)
+
+
+def _terminate_process_executor(executor: ProcessPoolExecutor) -> None:
+    # ProcessPoolExecutor has no public API to stop a running call
+    for process in list(executor._processes.values()):
+        process.terminate()
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+class LocalProcessPool:
+    """A fixed-size pool of warm local executor processes.
+
+    Each worker is a single-process executor that runs one action at a time.
+    Worker processes are spawned rather than forked, so they don't inherit the
+    parent's Ray connection or event loop. A worker process is restarted once it
+    has run `max_tasks_per_worker` actions, and replaced if it fails or times out.
+    """
+
+    def __init__(self, *, size: int, max_tasks_per_worker: int) -> None:
+        self._max_tasks = max_tasks_per_worker
+        self._closed = False
+        self._idle: asyncio.Queue[ProcessPoolExecutor] = asyncio.Queue()
+        for _ in range(size):
+            self._idle.put_nowait(self._spawn())
+
+    def _spawn(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker_process,
+            max_tasks_per_child=self._max_tasks,
+        )
+
+    def _release(self, worker: ProcessPoolExecutor, *, healthy: bool) -> None:
+        if healthy and not self._closed:
+            self._idle.put_nowait(worker)
+            return
+        logger.debug("Replacing executor worker process", healthy=healthy)
+        _terminate_process_executor(worker)
+        if not self._closed:
+            self._idle.put_nowait(self._spawn())
+
+    async def run(
+        self,
+        input: RunActionInput,
+        role: Role,
+        registry_version: str | None,
+        *,
+        loop_vars: dict[str, Any] | None = None,
+        input_ref: ObjectRef[RunActionInput] | None = None,
+    ) -> Any:
+        worker = await self._idle.get()
+        healthy = False
+        try:
+            # Worker processes aren't Ray workers, so the input is always sent inline
+            loop = asyncio.get_running_loop()
+            fut = loop.run_in_executor(
+                worker,
+                _run_in_worker_process,
+                input,
+                role,
+                registry_version,
+                loop_vars,
+            )
+            result = await asyncio.wait_for(fut, timeout=EXECUTION_TIMEOUT)
+            healthy = True
+            return result
+        finally:
+            # Calls running in a worker process can't be cancelled, so timed out
+            # or crashed workers are terminated and replaced
+            self._release(worker, healthy=healthy)
+
+    def close(self) -> None:
+        self._closed = True
+        while not self._idle.empty():
+            self._idle.get_nowait().shutdown(wait=False, cancel_futures=True)
+
+
+_pools: dict[str, ExecutorWorkerPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_worker_pool(runtime_env: RuntimeEnv) -> ExecutorWorkerPool | None:
+    """Get the warm worker pool for a runtime environment.
+
+    Returns None if actions should run as one-off Ray tasks, either because
+    worker pools are disabled or the pool can't honour the runtime environment.
+    A new runtime environment means the registry has changed (e.g. a new commit
+    SHA), so pools for previous environments are shut down.
+    """
+    mode = config.TRACECAT__EXECUTOR_WORKER_MODE
+    if mode == "task":
+        return None
+    if mode == "process" and runtime_env.get("uv"):
+        logger.debug(
+            "Local process pool can't install runtime dependencies, using Ray task"
+        )
+        return None
+
+    key = f"{mode}:{orjson.dumps(dict(runtime_env), option=orjson.OPT_SORT_KEYS, default=str).decode()}"
+    with _pools_lock:
+        if (pool := _pools.get(key)) is not None:
+            return pool
+        _close_pools()
+        size = config.TRACECAT__EXECUTOR_WORKER_POOL_SIZE
+        max_tasks = config.TRACECAT__EXECUTOR_WORKER_MAX_TASKS
+        logger.info(
+            "Starting executor worker pool",
+            mode=mode,
+            size=size,
+            max_tasks_per_worker=max_tasks,
+        )
+        if mode == "actor":
+            pool = RayActorPool(
+                size=size, max_tasks_per_worker=max_tasks, runtime_env=runtime_env
+            )
+        else:
+            pool = LocalProcessPool(size=size, max_tasks_per_worker=max_tasks)
+        _pools[key] = pool
+        return pool
+
+
+def _close_pools() -> None:
+    for pool in _pools.values():
+        pool.close()
+    _pools.clear()
+
+
+def shutdown_worker_pools() -> None:
+    """Shut down all executor worker pools."""
+    with _pools_lock:
+        _close_pools()
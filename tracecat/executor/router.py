@@ -1,7 +1,7 @@
 from typing import Any
 
 import orjson
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, HTTPException, status
 from pydantic_core import to_jsonable_python
 
 from tracecat.auth.credentials import RoleACL
@@ -10,7 +10,12 @@ from tracecat.contexts import ctx_logger
 from tracecat.db.dependencies import AsyncDBSession
 from tracecat.dsl.models import RunActionInput
 from tracecat.executor.models import ExecutorActionErrorInfo
-from tracecat.executor.service import dispatch_action_on_cluster
+from tracecat.executor.service import (
+    dispatch_action_on_cluster,
+    get_ray_runtime_env,
+    prepare_dispatch_context,
+    prewarm_runtime_env,
+)
 from tracecat.logger import logger
 from tracecat.types.auth import Role
 from tracecat.types.exceptions import (
@@ -91,3 +96,24 @@ async def run_action(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=err_info_dict,
         ) from e
+
+
+@router.post("/prewarm", status_code=status.HTTP_202_ACCEPTED, tags=["execution"])
+async def prewarm_executor(
+    *,
+    role: Role = RoleACL(
+        allow_user=False,
+        allow_service=True,
+        require_workspace="no",
+    ),
+    session: AsyncDBSession,
+    background_tasks: BackgroundTasks,
+) -> None:
+    """Install the current registry's runtime environment on every Ray node.
+
+    Called after a registry sync so the first action on the new commit doesn't
+    wait on dependency installation. The install runs in the background.
+    """
+    ctx = await prepare_dispatch_context(session)
+    runtime_env = get_ray_runtime_env(ctx)
+    background_tasks.add_task(prewarm_runtime_env, runtime_env)
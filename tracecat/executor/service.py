@@ -1,24 +1,32 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import itertools
 import traceback
-from collections.abc import Iterator, Mapping
+from collections.abc import Iterable, Iterator, Mapping
 from pathlib import Path
 from typing import Any, cast
 
 import ray
 import uvloop
+from ray import ObjectRef
 from ray.exceptions import RayTaskError
 from ray.runtime_env import RuntimeEnv
+from ray.util.scheduling_strategies import NodeAffinitySchedulingStrategy
 from sqlmodel.ext.asyncio.session import AsyncSession
 from tracecat_registry import RegistrySecretType
 from tracecat_registry._internal.models import RegistryOAuthSecret
 
 from tracecat import config
 from tracecat.auth.sandbox import AuthSandbox
-from tracecat.concurrency import GatheringTaskGroup
-from tracecat.contexts import ctx_interaction, ctx_logger, ctx_role, ctx_run
+from tracecat.contexts import (
+    ctx_interaction,
+    ctx_logger,
+    ctx_registry_version,
+    ctx_role,
+    ctx_run,
+)
 from tracecat.db.engine import get_async_engine
 from tracecat.dsl.common import context_locator, create_default_execution_context
 from tracecat.dsl.models import (
@@ -29,6 +37,7 @@ from tracecat.dsl.models import (
 )
 from tracecat.executor.engine import EXECUTION_TIMEOUT
 from tracecat.executor.models import DispatchActionContext, ExecutorActionErrorInfo
+from tracecat.executor.pool import get_worker_pool
 from tracecat.expressions.common import ExprContext, ExprOperand
 from tracecat.expressions.eval import (
     eval_templated_object,
@@ -38,11 +47,19 @@ from tracecat.expressions.eval import (
 from tracecat.git import prepare_git_url
 from tracecat.integrations.enums import OAuthGrantType
 from tracecat.integrations.models import ProviderKey
-from tracecat.integrations.service import IntegrationService
+from tracecat.integrations.service import (
+    IntegrationService,
+    access_token_cache,
+    cache_access_token,
+)
 from tracecat.logger import logger
 from tracecat.parse import get_pyproject_toml_required_deps, traverse_leaves
 from tracecat.registry.actions.models import BoundRegistryAction
-from tracecat.registry.actions.service import RegistryActionsService
+from tracecat.registry.actions.service import (
+    CachedBoundAction,
+    RegistryActionsService,
+    bound_action_cache,
+)
 from tracecat.secrets.common import apply_masks_object
 from tracecat.secrets.constants import DEFAULT_SECRETS_ENVIRONMENT
 from tracecat.secrets.secrets_manager import env_sandbox
@@ -61,7 +78,12 @@ type ArgsT = Mapping[str, Any]
 type ExecutionResult = Any | ExecutorActionErrorInfo
 
 
-def sync_executor_entrypoint(input: RunActionInput, role: Role) -> ExecutionResult:
+def sync_executor_entrypoint(
+    input: RunActionInput,
+    role: Role,
+    registry_version: str | None = None,
+    loop_vars: dict[str, Any] | None = None,
+) -> ExecutionResult:
     """We run this on the ray cluster."""
 
     asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
@@ -72,7 +94,12 @@ def sync_executor_entrypoint(input: RunActionInput, role: Role) -> ExecutionResu
 
     async_engine = get_async_engine()
     try:
-        coro = run_action_from_input(input=input, role=role)
+        coro = run_action_from_input(
+            input=input,
+            role=role,
+            registry_version=registry_version,
+            loop_vars=loop_vars,
+        )
         return loop.run_until_complete(coro)
     except Exception as e:
         # Raise the error proxy here
@@ -85,9 +112,63 @@ def sync_executor_entrypoint(input: RunActionInput, role: Role) -> ExecutionResu
         return ExecutorActionErrorInfo.from_exc(e, input.task.action)
     finally:
         loop.run_until_complete(async_engine.dispose())
+        # Close async generators, such as the ones holding shared storage clients
+        loop.run_until_complete(loop.shutdown_asyncgens())
         loop.close()  # We always close the loop
 
 
+class ExecutorWorkerRuntime:
+    """Long-lived execution runtime for a persistent executor worker process.
+
+    Unlike `sync_executor_entrypoint`, the event loop and the process-wide DB
+    engine are kept alive across actions, so registry modules, cached bindings
+    and connection pools are reused until the worker is recycled.
+    """
+
+    def __init__(self) -> None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        self.loop = uvloop.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.n_tasks = 0
+
+    def run(
+        self,
+        input: RunActionInput,
+        role: Role,
+        registry_version: str | None = None,
+        loop_vars: dict[str, Any] | None = None,
+    ) -> ExecutionResult:
+        self.n_tasks += 1
+        logger.info(
+            "Running action in persistent worker",
+            action=input.task.action,
+            n_tasks=self.n_tasks,
+        )
+        try:
+            coro = run_action_from_input(
+                input=input,
+                role=role,
+                registry_version=registry_version,
+                loop_vars=loop_vars,
+            )
+            return self.loop.run_until_complete(coro)
+        except Exception as e:
+            logger.info(
+                "Error running action, raising error proxy",
+                error=e,
+                type=type(e).__name__,
+                traceback=traceback.format_exc(),
+            )
+            return ExecutorActionErrorInfo.from_exc(e, input.task.action)
+
+    def close(self) -> None:
+        try:
+            self.loop.run_until_complete(get_async_engine().dispose())
+            self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+        finally:
+            self.loop.close()
+
+
 async def _run_action_direct(*, action: BoundRegistryAction, args: ArgsT) -> Any:
     """Execute the UDF directly.
 
@@ -111,16 +192,84 @@ async def _run_action_direct(*, action: BoundRegistryAction, args: ArgsT) -> Any
         raise e
 
 
+async def get_bound_action(
+    action_name: str, *, registry_version: str | None = None
+) -> CachedBoundAction:
+    """Get an execution-mode bound action and its secrets.
+
+    Bindings are served from the per-process cache, keyed by the action name and
+    the registry commit SHA. Local repositories are hot-reloaded, so they are
+    never cached.
+    """
+    key = (action_name, registry_version)
+    use_cache = not config.TRACECAT__LOCAL_REPOSITORY_ENABLED
+    if use_cache and (cached := bound_action_cache.get(key)) is not None:
+        return cached
+
+    async with RegistryActionsService.with_session() as service:
+        reg_action = await service.get_action(action_name)
+        action_secrets = await service.fetch_all_action_secrets(reg_action)
+        action = service.get_bound(reg_action, mode="execution")
+    bound = CachedBoundAction(action=action, secrets=frozenset(action_secrets))
+    if use_cache:
+        bound_action_cache.set(key, bound)
+    return bound
+
+
+async def get_bound_actions(
+    action_names: Iterable[str], *, registry_version: str | None = None
+) -> dict[str, CachedBoundAction]:
+    """Get execution-mode bound actions and their secrets in bulk.
+
+    Like `get_bound_action`, but actions missing from the per-process cache are
+    loaded and bound together in one session. Actions that aren't in the
+    registry are left out of the result.
+    """
+    use_cache = not config.TRACECAT__LOCAL_REPOSITORY_ENABLED
+    bound_actions: dict[str, CachedBoundAction] = {}
+    uncached: list[str] = []
+    for action_name in dict.fromkeys(action_names):
+        if (
+            use_cache
+            and (cached := bound_action_cache.get((action_name, registry_version)))
+            is not None
+        ):
+            bound_actions[action_name] = cached
+        else:
+            uncached.append(action_name)
+    if not uncached:
+        return bound_actions
+
+    async with RegistryActionsService.with_session() as service:
+        reg_actions = await service.get_actions(uncached)
+        all_secrets = await service.fetch_all_actions_secrets(reg_actions)
+        for reg_action in reg_actions:
+            bound = CachedBoundAction(
+                action=service.get_bound(reg_action, mode="execution"),
+                secrets=frozenset(all_secrets[reg_action.action]),
+            )
+            bound_actions[reg_action.action] = bound
+            if use_cache:
+                bound_action_cache.set((reg_action.action, registry_version), bound)
+    return bound_actions
+
+
 async def run_single_action(
     *,
     action: BoundRegistryAction,
     args: ArgsT,
     context: ExecutionContext,
+    registry_version: str | None = None,
 ) -> Any:
     """Run a UDF async."""
     if action.is_template:
         logger.info("Running template action async", action=action.name)
-        result = await run_template_action(action=action, args=args, context=context)
+        result = await run_template_action(
+            action=action,
+            args=args,
+            context=context,
+            registry_version=registry_version,
+        )
     else:
         logger.trace("Running UDF async", action=action.name)
         # Get secrets from context
@@ -137,6 +286,7 @@ async def run_template_action(
     action: BoundRegistryAction,
     args: ArgsT,
     context: ExecutionContext | None = None,
+    registry_version: str | None = None,
 ) -> Any:
     """Handle template execution."""
     if not action.template_action:
@@ -176,15 +326,15 @@ async def run_template_action(
                 step.args, operand=cast(ExprOperand, template_context)
             ),
         )
-        async with RegistryActionsService.with_session() as service:
-            step_action = await service.load_action_impl(
-                action_name=step.action, mode="execution"
-            )
+        step_action = (
+            await get_bound_action(step.action, registry_version=registry_version)
+        ).action
         logger.trace("Running action step", step_action=step_action.action)
         result = await run_single_action(
             action=step_action,
             args=evaled_args,
             context=template_context,
+            registry_version=registry_version,
         )
         # Store the result of the step
         logger.trace("Storing step result", step=step.ref, result=result)
@@ -254,14 +404,24 @@ async def get_action_secrets(
 
     # Get oauth integrations
     try:
-        if oauth_secrets:
+        workspace_id = ctx_role.get().workspace_id
+        uncached_provider_keys: set[ProviderKey] = set()
+        for provider_key, secret in oauth_secrets.items():
+            if workspace_id is not None and (
+                token := access_token_cache.get((workspace_id, provider_key))
+            ):
+                secrets[provider_key.id] = {secret.token_name: token.get_secret_value()}
+            else:
+                uncached_provider_keys.add(provider_key)
+        if uncached_provider_keys:
             async with IntegrationService.with_session() as service:
                 oauth_integrations = await service.list_integrations(
-                    provider_keys=set(oauth_secrets.keys())
+                    provider_keys=uncached_provider_keys
                 )
                 for integration in oauth_integrations:
                     await service.refresh_token_if_needed(integration)
                     access_token = await service.get_access_token(integration)
+                    cache_access_token(integration, access_token)
                     secret = oauth_secrets[
                         ProviderKey(
                             id=integration.provider_id,
@@ -279,10 +439,24 @@ async def get_action_secrets(
     return secrets
 
 
-async def run_action_from_input(input: RunActionInput, role: Role) -> Any:
-    """Main entrypoint for running an action."""
+async def run_action_from_input(
+    input: RunActionInput,
+    role: Role,
+    *,
+    registry_version: str | None = None,
+    loop_vars: dict[str, Any] | None = None,
+) -> Any:
+    """Main entrypoint for running an action.
+
+    `loop_vars` are the loop variables of a `for_each` iteration. They're applied
+    on top of the shared input's local variables.
+    """
+    if loop_vars is not None:
+        input = with_loop_vars(input, loop_vars)
     ctx_role.set(role)
     ctx_run.set(input.run_context)
+    # Actions that bind other actions (e.g. agent tools) use the same registry
+    ctx_registry_version.set(registry_version)
     # The interaction context was generated by the worker
     if input.interaction_context is not None:
         ctx_interaction.set(input.interaction_context)
@@ -291,12 +465,13 @@ async def run_action_from_input(input: RunActionInput, role: Role) -> Any:
     task = input.task
     action_name = task.action
 
-    async with RegistryActionsService.with_session() as service:
-        reg_action = await service.get_action(action_name)
-        action_secrets = await service.fetch_all_action_secrets(reg_action)
-        action = service.get_bound(reg_action, mode="execution")
+    action, action_secrets = await get_bound_action(
+        action_name, registry_version=registry_version
+    )
 
-    secrets = await get_action_secrets(args=task.args, action_secrets=action_secrets)
+    secrets = await get_action_secrets(
+        args=task.args, action_secrets=set(action_secrets)
+    )
     if config.TRACECAT__UNSAFE_DISABLE_SM_MASKING:
         log.warning(
             "Secrets masking is disabled. This is unsafe in production workflows."
@@ -333,7 +508,12 @@ async def run_action_from_input(input: RunActionInput, role: Role) -> Any:
     flattened_secrets = flatten_secrets(secrets)
     with env_sandbox(flattened_secrets):
         args = evaluate_templated_args(task, context)
-        result = await run_single_action(action=action, args=args, context=context)
+        result = await run_single_action(
+            action=action,
+            args=args,
+            context=context,
+            registry_version=registry_version,
+        )
 
     if mask_values:
         result = apply_masks_object(result, masks=mask_values)
@@ -377,21 +557,45 @@ def flatten_secrets(secrets: dict[str, Any]):
 
 
 @ray.remote
-def run_action_task(input: RunActionInput, role: Role) -> ExecutionResult:
+def run_action_task(
+    input: RunActionInput,
+    role: Role,
+    registry_version: str | None = None,
+    loop_vars: dict[str, Any] | None = None,
+) -> ExecutionResult:
     """Ray task that runs an action."""
-    return sync_executor_entrypoint(input, role)
+    return sync_executor_entrypoint(input, role, registry_version, loop_vars)
 
 
-async def run_action_on_ray_cluster(
-    input: RunActionInput, ctx: DispatchActionContext, iteration: int | None = None
-) -> ExecutionResult:
-    """Run an action on the ray cluster.
+def get_ray_runtime_env(ctx: DispatchActionContext) -> RuntimeEnv:
+    """Get the Ray runtime environment for a dispatch context.
 
-    If any exceptions are thrown here, they're platform level errors.
-    All application/user level errors are caught by the executor and returned as values.
+    Runtime environments are memoized per (SSH command, pinned git URL, local
+    repository pyproject.toml mtime), so the pyproject.toml is only re-read when
+    it changes. The returned environment is shared and must not be mutated.
     """
+    git_url = ctx.git_url.to_url() if ctx.git_url and ctx.git_url.ref else None
+    local_repo_mtime_ns: int | None = None
+    if config.TRACECAT__LOCAL_REPOSITORY_ENABLED:
+        pyproject_path = (
+            Path(config.TRACECAT__LOCAL_REPOSITORY_CONTAINER_PATH) / "pyproject.toml"
+        )
+        try:
+            local_repo_mtime_ns = pyproject_path.stat().st_mtime_ns
+        except FileNotFoundError as e:
+            logger.error(
+                "No pyproject.toml found in local repository", path=pyproject_path
+            )
+            raise ValueError("No pyproject.toml found in local repository") from e
+    return _build_runtime_env(ctx.ssh_command, git_url, local_repo_mtime_ns)
+
+
+@functools.lru_cache(maxsize=32)
+def _build_runtime_env(
+    ssh_command: str | None, git_url: str | None, local_repo_mtime_ns: int | None
+) -> RuntimeEnv:
     # Initialize runtime environment variables
-    env_vars = {"GIT_SSH_COMMAND": ctx.ssh_command} if ctx.ssh_command else {}
+    env_vars = {"GIT_SSH_COMMAND": ssh_command} if ssh_command else {}
     # Override UV_SYSTEM_PYTHON to allow uv to respect Ray's virtual environment
     # The global UV_SYSTEM_PYTHON=1 in Dockerfile forces system Python usage,
     # but Ray creates its own virtual environment and expects uv to use it
@@ -400,29 +604,19 @@ async def run_action_on_ray_cluster(
 
     # Add git URL to pip dependencies if SHA is present
     pip_deps = []
-    if ctx.git_url and ctx.git_url.ref:
-        url = ctx.git_url.to_url()
-        pip_deps.append(url)
-        logger.trace("Adding git URL to runtime env", git_url=ctx.git_url, url=url)
+    if git_url:
+        pip_deps.append(git_url)
+        logger.trace("Adding git URL to runtime env", url=git_url)
 
     # If we have a local registry, we need to add it to the runtime env
-    if config.TRACECAT__LOCAL_REPOSITORY_ENABLED:
+    if local_repo_mtime_ns is not None:
         local_repo_path = config.TRACECAT__LOCAL_REPOSITORY_CONTAINER_PATH
         logger.info(
             "Adding local repository and required dependencies to runtime env",
             local_repo_path=local_repo_path,
         )
-
-        # Try pyproject.toml first
         pyproject_path = Path(local_repo_path) / "pyproject.toml"
-        if not pyproject_path.exists():
-            logger.error(
-                "No pyproject.toml found in local repository", path=pyproject_path
-            )
-            raise ValueError("No pyproject.toml found in local repository")
-        required_deps = await asyncio.to_thread(
-            get_pyproject_toml_required_deps, pyproject_path
-        )
+        required_deps = get_pyproject_toml_required_deps(pyproject_path)
         logger.debug(
             "Found pyproject.toml with required dependencies", deps=required_deps
         )
@@ -432,13 +626,107 @@ async def run_action_on_ray_cluster(
     if pip_deps:
         additional_vars["uv"] = pip_deps
 
-    runtime_env = RuntimeEnv(env_vars=env_vars, **additional_vars)
+    return RuntimeEnv(env_vars=env_vars, **additional_vars)
+
+
+@ray.remote(num_cpus=0)
+def _noop_task() -> None:
+    return None
+
+
+async def prewarm_runtime_env(runtime_env: RuntimeEnv) -> None:
+    """Install a runtime environment on every alive Ray node.
+
+    Ray sets up runtime environments lazily, so without this the first action
+    on each node after a registry sync blocks on the uv install. If worker
+    pools are enabled, this also starts the pool for the new environment.
+    """
+    node_ids = [node["NodeID"] for node in ray.nodes() if node.get("Alive")]
+    logger.info("Prewarming runtime environment", n_nodes=len(node_ids))
+    obj_refs = [
+        _noop_task.options(
+            runtime_env=runtime_env,
+            scheduling_strategy=NodeAffinitySchedulingStrategy(
+                node_id=node_id, soft=False
+            ),
+        ).remote()
+        for node_id in node_ids
+    ]
+    get_worker_pool(runtime_env)
+    coro = asyncio.to_thread(ray.get, obj_refs)
+    await asyncio.wait_for(coro, timeout=EXECUTION_TIMEOUT)
+    logger.info("Prewarmed runtime environment", n_nodes=len(node_ids))
+
+
+async def run_action_on_ray_cluster(
+    input: RunActionInput,
+    ctx: DispatchActionContext,
+    iteration: int | None = None,
+    *,
+    loop_vars: dict[str, Any] | None = None,
+    input_ref: ObjectRef[RunActionInput] | None = None,
+) -> ExecutionResult:
+    """Run an action on the ray cluster.
+
+    If any exceptions are thrown here, they're platform level errors.
+    All application/user level errors are caught by the executor and returned as values.
+
+    For loop iterations, `input_ref` is the shared input in the Ray object store
+    and `loop_vars` are the iteration's loop variables, which are applied on the
+    worker.
+    """
+    runtime_env = get_ray_runtime_env(ctx)
+
+    registry_version = ctx.git_url.ref if ctx.git_url else None
+    if pool := get_worker_pool(runtime_env):
+        logger.trace("Running action on warm worker", runtime_env=runtime_env)
+        try:
+            exec_result = await pool.run(
+                input,
+                ctx.role,
+                registry_version,
+                loop_vars=loop_vars,
+                input_ref=input_ref,
+            )
+        except TimeoutError as e:
+            logger.error("Action timed out, recycling worker", error=e)
+            raise e
+        except RayTaskError as e:
+            logger.error("Error running action on warm worker", error=e)
+            if isinstance(e.cause, BaseException):
+                raise e.cause from None
+            raise e
+    else:
+        exec_result = await _run_action_task(
+            input_ref or input, ctx, runtime_env, registry_version, loop_vars
+        )
+
+    # Here, we have some result or error.
+    # Reconstruct the error and raise some kind of proxy
+    if isinstance(exec_result, ExecutorActionErrorInfo):
+        logger.trace("Raising executor error proxy", exec_result=exec_result)
+        if iteration is not None:
+            exec_result.loop_iteration = iteration
+            exec_result.loop_vars = loop_vars
+        raise ExecutionError(info=exec_result)
+    return exec_result
+
 
+async def _run_action_task(
+    input: RunActionInput | ObjectRef[RunActionInput],
+    ctx: DispatchActionContext,
+    runtime_env: RuntimeEnv,
+    registry_version: str | None,
+    loop_vars: dict[str, Any] | None = None,
+) -> ExecutionResult:
+    """Run an action as a one-off Ray task."""
     logger.trace("Running action on ray cluster", runtime_env=runtime_env)
-    obj_ref = run_action_task.options(runtime_env=runtime_env).remote(input, ctx.role)
+    obj_ref = run_action_task.options(runtime_env=runtime_env).remote(
+        input, ctx.role, registry_version, loop_vars
+    )
     try:
         coro = asyncio.to_thread(ray.get, obj_ref)
-        exec_result = await asyncio.wait_for(coro, timeout=EXECUTION_TIMEOUT)
+        return await asyncio.wait_for(coro, timeout=EXECUTION_TIMEOUT)
     except TimeoutError as e:
         logger.error("Action timed out, cancelling task", error=e)
         ray.cancel(obj_ref, force=True)
@@ -449,16 +737,6 @@ async def run_action_on_ray_cluster(
             raise e.cause from None
         raise e
 
-    # Here, we have some result or error.
-    # Reconstruct the error and raise some kind of proxy
-    if isinstance(exec_result, ExecutorActionErrorInfo):
-        logger.trace("Raising executor error proxy", exec_result=exec_result)
-        if iteration is not None:
-            exec_result.loop_iteration = iteration
-            exec_result.loop_vars = input.exec_context[ExprContext.LOCAL_VARS]
-        raise ExecutionError(info=exec_result)
-    return exec_result
-
 
 async def dispatch_action_on_cluster(
     input: RunActionInput,
@@ -481,6 +759,12 @@ async def dispatch_action_on_cluster(
         TracecatException: If there are errors evaluating for_each expressions or during execution
         ExecutorErrorWrapper: If there are errors from the executor itself
     """
+    ctx = await prepare_dispatch_context(session)
+    return await _dispatch_action(input=input, ctx=ctx)
+
+
+async def prepare_dispatch_context(session: AsyncSession) -> DispatchActionContext:
+    """Resolve the registry git URL and SSH command for the current role."""
     git_url = await prepare_git_url()
 
     role = ctx_role.get()
@@ -490,7 +774,7 @@ async def dispatch_action_on_cluster(
         sh_cmd = await get_ssh_command(git_url=git_url, session=session, role=role)
         ctx.ssh_command = sh_cmd
         ctx.git_url = git_url
-    return await _dispatch_action(input=input, ctx=ctx)
+    return ctx
 
 
 async def _dispatch_action(
@@ -506,33 +790,39 @@ async def _dispatch_action(
     logger.info("Running for_each on action in parallel", action=task.action)
 
     # Handle for_each by creating parallel executions
-    base_context = input.exec_context
     # We have a list of iterators that give a variable assignment path ".path.to.value"
     # and a collection of values as a tuple.
-    iterators = get_iterables_from_expression(expr=task.for_each, operand=base_context)
-
-    async def iteration(patched_input: RunActionInput, i: int):
-        return await run_action_on_ray_cluster(patched_input, ctx, iteration=i)
+    iterators = get_iterables_from_expression(
+        expr=task.for_each, operand=input.exec_context
+    )
+    loop_items = list(zip(*iterators, strict=False))
+    n_iterations = len(loop_items)
+    results: list[Any] = [None] * n_iterations
+    # Ship the input to the object store once. Each iteration only sends its
+    # loop variables, which the worker applies on top of the shared context.
+    input_ref = ray.put(input)
+    indices = iter(range(n_iterations))
+
+    async def run_iterations() -> None:
+        # Each runner pulls the next pending iteration from the shared iterator,
+        # so at most `window` iterations are in flight at any time
+        for i in indices:
+            loop_vars: dict[str, Any] = {}
+            for iterator_path, iterator_value in loop_items[i]:
+                patch_object(
+                    obj=loop_vars, path=iterator_path.lstrip("."), value=iterator_value
+                )
+            results[i] = await run_action_on_ray_cluster(
+                input, ctx, iteration=i, loop_vars=loop_vars, input_ref=input_ref
+            )
 
-    tasks: list[asyncio.Task[ExecutionResult]] = []
+    window = min(config.TRACECAT__LOOP_MAX_BATCH_SIZE, n_iterations)
+    logger.debug("Dispatching loop", n_iterations=n_iterations, window=window)
     try:
-        # Create a generator that zips the iterables together
-        # Iterate over the for_each items
-        async with GatheringTaskGroup() as tg:
-            for i, items in enumerate(zip(*iterators, strict=False)):
-                new_context = base_context.copy()
-                # Patch each loop variable
-                for iterator_path, iterator_value in items:
-                    patch_object(
-                        obj=new_context,  # type: ignore
-                        path=ExprContext.LOCAL_VARS + iterator_path,
-                        value=iterator_value,
-                    )
-                # Create a new task with the patched context
-                new_input = input.model_copy(update={"exec_context": new_context})
-                coro = iteration(new_input, i)
-                tasks.append(tg.create_task(coro))
-        return tg.results()
+        async with asyncio.TaskGroup() as tg:
+            for _ in range(window):
+                tg.create_task(run_iterations())
+        return results
     except* ExecutionError as eg:
         loop_errors = flatten_wrapped_exc_error_group(eg)
         raise LoopExecutionError(loop_errors) from eg
@@ -548,10 +838,6 @@ async def _dispatch_action(
             ),
             detail={"errors": errors},
         ) from eg
-    finally:
-        logger.debug("Shut down any pending tasks")
-        for t in tasks:
-            t.cancel()
 
 
 """Utilities"""
@@ -568,6 +854,20 @@ def patch_object(obj: dict[str, Any], *, path: str, value: Any, sep: str = ".")
     obj[leaf] = value
 
 
+def with_loop_vars(input: RunActionInput, loop_vars: dict[str, Any]) -> RunActionInput:
+    """Return a copy of `input` with the loop variables of one iteration applied.
+
+    The execution context is copied shallowly, so the shared context is never
+    mutated.
+    """
+    exec_context = input.exec_context.copy()
+    exec_context[ExprContext.LOCAL_VARS] = {
+        **exec_context.get(ExprContext.LOCAL_VARS, {}),
+        **loop_vars,
+    }
+    return input.model_copy(update={"exec_context": exec_context})
+
+
 def iter_for_each(
     task: ActionStatement,
     context: ExecutionContext,
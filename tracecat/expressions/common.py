@@ -1,5 +1,6 @@
 import ast
 import functools
+import re
 import sys
 from collections.abc import Callable, Iterable, Iterator, Mapping
 from dataclasses import dataclass
@@ -7,8 +8,10 @@ from enum import StrEnum, auto
 from typing import Any, TypeVar
 
 import jsonpath_ng.ext
+from jsonpath_ng import JSONPath
 from jsonpath_ng.exceptions import JsonPathParserError
 
+from tracecat import config
 from tracecat.logger import logger
 from tracecat.types.exceptions import TracecatExpressionError
 
@@ -531,6 +534,70 @@ def build_safe_lambda(lambda_expr: str) -> Callable[[Any], Any]:
     return create_sandboxed_lambda(lambda_func)
 
 
+_SIMPLE_JSONPATH_PATTERN = re.compile(r"(?:\.[A-Za-z_][A-Za-z0-9_]*|\[\d+\])+")
+_SIMPLE_JSONPATH_SEGMENT = re.compile(r"\.([A-Za-z_][A-Za-z0-9_]*)|\[(\d+)\]")
+# Identifiers that the jsonpath_ng ext lexer does not tokenize as plain field names
+_JSONPATH_RESERVED_PREFIXES = ("true", "false", "where")
+
+type SimplePath = tuple[str | int, ...]
+"""A jsonpath made up only of field names (str) and list indices (int)."""
+
+
+@functools.lru_cache(maxsize=config.TRACECAT__JSONPATH_CACHE_SIZE)
+def _parse_simple_path(expr: str) -> SimplePath | None:
+    """Split a dotted/indexed jsonpath into segments, or return None if the
+    expression requires the full jsonpath engine (filters, wildcards, slices,
+    quoted keys, recursive descent, etc.)."""
+    path = expr.removeprefix("$")
+    if path and path[0] not in ".[":
+        path = "." + path
+    if not _SIMPLE_JSONPATH_PATTERN.fullmatch(path):
+        return None
+    segments: list[str | int] = []
+    for field, index in _SIMPLE_JSONPATH_SEGMENT.findall(path):
+        if field:
+            if field.startswith(_JSONPATH_RESERVED_PREFIXES):
+                return None
+            segments.append(field)
+        else:
+            segments.append(int(index))
+    return tuple(segments)
+
+
+@functools.lru_cache(maxsize=config.TRACECAT__JSONPATH_CACHE_SIZE)
+def _parse_jsonpath(expr: str) -> JSONPath:
+    """Parse a jsonpath expression, caching the compiled path by expression text."""
+    return jsonpath_ng.ext.parse(expr)
+
+
+_NO_MATCH = object()
+_UNRESOLVED = object()
+
+
+def _resolve_simple_path(path: SimplePath, operand: Any) -> Any:
+    """Resolve a simple path with direct dict/list indexing.
+
+    Returns `_NO_MATCH` if the path doesn't exist, or `_UNRESOLVED` if a value
+    along the path isn't a plain dict or list, in which case the caller should
+    defer to jsonpath_ng to preserve its exact semantics.
+    """
+    value = operand
+    for segment in path:
+        if isinstance(segment, str):
+            if not isinstance(value, dict):
+                return _UNRESOLVED
+            value = value.get(segment, _NO_MATCH)
+            if value is _NO_MATCH:
+                return _NO_MATCH
+        else:
+            if not isinstance(value, list):
+                return _UNRESOLVED
+            if segment >= len(value):
+                return _NO_MATCH
+            value = value[segment]
+    return value
+
+
 def eval_jsonpath(
     expr: str,
     operand: Mapping[str | StrEnum, Any],
@@ -545,16 +612,24 @@ def eval_jsonpath(
         raise TracecatExpressionError(
             f"A dict or list operand is required as jsonpath target. Got {type(operand)}"
         )
-    try:
-        # Try to evaluate the expression
-        jsonpath_expr = jsonpath_ng.ext.parse(expr)
-    except JsonPathParserError as e:
-        logger.error(
-            "Invalid jsonpath expression", expr=repr(expr), context_type=context_type
-        )
-        formatted_expr = _expr_with_context(expr, context_type)
-        raise TracecatExpressionError(f"Invalid jsonpath {formatted_expr!r}") from e
-    matches = [found.value for found in jsonpath_expr.find(operand)]
+    if (path := _parse_simple_path(expr)) is not None and (
+        value := _resolve_simple_path(path, operand)
+    ) is not _UNRESOLVED:
+        # Fast path: direct indexing yields a single match or no match
+        matches = [] if value is _NO_MATCH else [value]
+    else:
+        try:
+            # Try to evaluate the expression
+            jsonpath_expr = _parse_jsonpath(expr)
+        except JsonPathParserError as e:
+            logger.error(
+                "Invalid jsonpath expression",
+                expr=repr(expr),
+                context_type=context_type,
+            )
+            formatted_expr = _expr_with_context(expr, context_type)
+            raise TracecatExpressionError(f"Invalid jsonpath {formatted_expr!r}") from e
+        matches = [found.value for found in jsonpath_expr.find(operand)]
     if len(matches) > 1 or "[*]" in expr:
         # If there are multiple matches or array wildcard, return the list
         return matches
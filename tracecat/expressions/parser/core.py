@@ -1,16 +1,52 @@
+import functools
+from typing import NamedTuple
+
 from lark import Lark, Token, Tree
 from lark.exceptions import UnexpectedCharacters, UnexpectedEOF, UnexpectedInput
 
+from tracecat import config
 from tracecat.expressions.parser.grammar import grammar
 from tracecat.logger import logger
 from tracecat.types.exceptions import TracecatExpressionError
 
 
+class ParseCacheInfo(NamedTuple):
+    """Hit/miss statistics for the compiled expression cache."""
+
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+
 class ExprParser:
-    def __init__(self, start_rule: str = "root") -> None:
+    """LALR expression parser with a bounded LRU cache of parse trees.
+
+    Parse trees are keyed by the raw expression text. They are treated as
+    read-only by every visitor and transformer, so a single tree can be shared
+    across evaluations, validation and extraction.
+    """
+
+    def __init__(
+        self,
+        start_rule: str = "root",
+        *,
+        cache_size: int | None = config.TRACECAT__EXPR_PARSE_CACHE_SIZE,
+    ) -> None:
         self.parser = Lark(grammar, start=start_rule, parser="lalr")
+        # Failed parses raise and are therefore never cached
+        self._cached_parse = functools.lru_cache(maxsize=cache_size)(self._parse)
 
     def parse(self, expression: str) -> Tree[Token] | None:
+        return self._cached_parse(expression)
+
+    def cache_info(self) -> ParseCacheInfo:
+        return ParseCacheInfo(*self._cached_parse.cache_info())
+
+    def cache_clear(self) -> None:
+        self._cached_parse.cache_clear()
+
+    def _parse(self, expression: str) -> Tree[Token] | None:
         try:
             return self.parser.parse(expression)
         except (UnexpectedCharacters, UnexpectedEOF, UnexpectedInput) as e:
@@ -43,6 +43,7 @@ class ResourcePrefix(StrEnum):
     WORKFLOW_DEFN = "wf-defn"
     WORKFLOW_RUN = "wf-run"  # TODO: Unused
     WEBHOOK = "wh"
+    WEBHOOK_BATCH = "wh-batch"
     SCHEDULE = "sch"
     SECRET = "secret"
     USER = "user"
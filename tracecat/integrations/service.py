@@ -1,15 +1,22 @@
 """Service for managing user integrations with external services."""
 
+import asyncio
+import hashlib
 import os
-from collections.abc import Sequence
-from datetime import datetime, timedelta
+import weakref
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from pydantic import SecretStr
-from sqlmodel import and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlmodel import and_, func, or_, select
 
+from tracecat import config
+from tracecat.cache import TTLCache
 from tracecat.db.schemas import OAuthIntegration
-from tracecat.identifiers import UserID
+from tracecat.identifiers import UserID, WorkspaceID
 from tracecat.integrations.base import (
     AuthorizationCodeOAuthProvider,
     BaseOAuthProvider,
@@ -21,6 +28,53 @@ from tracecat.integrations.providers import ProviderRegistry
 from tracecat.secrets.encryption import decrypt_value, encrypt_value
 from tracecat.service import BaseWorkspaceService
 
+access_token_cache: TTLCache[tuple[WorkspaceID, ProviderKey], SecretStr] = TTLCache(
+    maxsize=config.TRACECAT__SECRETS_CACHE_SIZE
+)
+"""Decrypted OAuth access tokens, keyed by (workspace ID, provider key)."""
+
+
+def _access_token_cache_key(
+    integration: OAuthIntegration,
+) -> tuple[WorkspaceID, ProviderKey]:
+    return (
+        integration.owner_id,
+        ProviderKey(id=integration.provider_id, grant_type=integration.grant_type),
+    )
+
+
+_refresh_locks: weakref.WeakValueDictionary[
+    tuple[WorkspaceID, ProviderKey], asyncio.Lock
+] = weakref.WeakValueDictionary()
+"""In-process token refresh locks, kept only while a refresh is pending."""
+
+
+def _refresh_lock_id(key: tuple[WorkspaceID, ProviderKey]) -> int:
+    """Postgres advisory lock ID for refreshing an integration's token."""
+    workspace_id, provider_key = key
+    digest = hashlib.sha256(
+        f"oauth-refresh:{workspace_id}:{provider_key.id}:{provider_key.grant_type}".encode()
+    ).digest()
+    # Advisory lock IDs are signed 64-bit integers
+    return int.from_bytes(digest[:8], "big", signed=True)
+
+
+def cache_access_token(integration: OAuthIntegration, access_token: SecretStr) -> None:
+    """Cache an integration's access token until it is due for refresh.
+
+    Tokens without an expiry are cached for `TRACECAT__SECRETS_CACHE_TTL` seconds.
+    """
+    if integration.expires_at is None:
+        ttl = config.TRACECAT__SECRETS_CACHE_TTL
+    else:
+        # Same refresh window as `OAuthIntegration.needs_refresh`
+        refresh_at = integration.expires_at - timedelta(minutes=5)
+        ttl = (refresh_at - datetime.now(UTC)).total_seconds()
+    if ttl > 0:
+        access_token_cache.set(
+            _access_token_cache_key(integration), access_token, ttl=ttl
+        )
+
 
 class IntegrationService(BaseWorkspaceService):
     """Service for managing user integrations."""
@@ -110,6 +164,7 @@ class IntegrationService(BaseWorkspaceService):
             self.session.add(integration)
             await self.session.commit()
             await self.session.refresh(integration)
+            access_token_cache.pop(_access_token_cache_key(integration))
 
             self.logger.info(
                 "Updated user integration",
@@ -158,43 +213,80 @@ class IntegrationService(BaseWorkspaceService):
         integration.requested_scopes = None
         self.session.add(integration)
         await self.session.commit()
+        access_token_cache.pop(_access_token_cache_key(integration))
 
     async def remove_integration(self, *, integration: OAuthIntegration) -> None:
         """Remove a user's integration for a specific provider."""
+        key = _access_token_cache_key(integration)
         await self.session.delete(integration)
         await self.session.commit()
+        access_token_cache.pop(key)
 
     async def refresh_token_if_needed(
         self, integration: OAuthIntegration
     ) -> OAuthIntegration:
-        """Refresh the access token if it's expired or about to expire."""
+        """Refresh the access token if it's expired or about to expire.
+
+        Only one refresh per integration runs at a time across all executors.
+        Callers that wait on an in-flight refresh reuse its result instead of
+        calling the provider again.
+        """
         if not integration.needs_refresh:
             return integration
 
-        try:
-            if integration.grant_type == OAuthGrantType.AUTHORIZATION_CODE:
-                integration = await self._refresh_ac_integration(integration)
-            elif integration.grant_type == OAuthGrantType.CLIENT_CREDENTIALS:
-                integration = await self._refresh_cc_integration(integration)
-            else:
-                self.logger.warning(
-                    "Unsupported grant type for refresh",
-                    grant_type=integration.grant_type,
+        async with self._refresh_lock(integration):
+            # Another caller may have refreshed the token while we waited
+            await self.session.refresh(integration)
+            if not integration.needs_refresh:
+                return integration
+
+            try:
+                if integration.grant_type == OAuthGrantType.AUTHORIZATION_CODE:
+                    integration = await self._refresh_ac_integration(integration)
+                elif integration.grant_type == OAuthGrantType.CLIENT_CREDENTIALS:
+                    integration = await self._refresh_cc_integration(integration)
+                else:
+                    self.logger.warning(
+                        "Unsupported grant type for refresh",
+                        grant_type=integration.grant_type,
+                        provider=integration.provider_id,
+                    )
+                    return integration
+            except Exception as e:
+                self.logger.error(
+                    "Failed to refresh token, continuing with current token",
+                    error=str(e),
                     provider=integration.provider_id,
+                    expires_at=integration.expires_at,
                 )
+                # Return unchanged - let it fail naturally when token expires
                 return integration
-        except Exception as e:
-            self.logger.error(
-                "Failed to refresh token, continuing with current token",
-                error=str(e),
-                provider=integration.provider_id,
-                expires_at=integration.expires_at,
-            )
-            # Return unchanged - let it fail naturally when token expires
+
+            await self.session.refresh(integration)
             return integration
 
-        await self.session.refresh(integration)
-        return integration
+    @asynccontextmanager
+    async def _refresh_lock(self, integration: OAuthIntegration) -> AsyncIterator[None]:
+        """Hold the refresh lock for an integration's (workspace, provider, grant type).
+
+        Coroutines in this process queue on an `asyncio.Lock`, so only one of them
+        holds a Postgres advisory lock, which coordinates with other processes.
+        The advisory lock is taken on its own connection because the session may
+        release its connection when a refresh commits.
+        """
+        key = _access_token_cache_key(integration)
+        if (lock := _refresh_locks.get(key)) is None:
+            lock = _refresh_locks[key] = asyncio.Lock()
+        async with lock:
+            bind = self.session.bind
+            engine = bind.engine if isinstance(bind, AsyncConnection) else bind
+            lock_id = _refresh_lock_id(key)
+            async with engine.connect() as conn:
+                await conn.execute(select(func.pg_advisory_lock(lock_id)))
+                try:
+                    yield
+                finally:
+                    await conn.execute(select(func.pg_advisory_unlock(lock_id)))
 
     async def _provider_from_integration(
         self, integration: OAuthIntegration
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from collections import defaultdict
 from collections.abc import Sequence
+from typing import NamedTuple
 
 from pydantic import UUID4, ValidationError
 from pydantic_core import ErrorDetails, to_jsonable_python
@@ -10,6 +11,7 @@ from sqlmodel import cast, func, or_, select
 from tracecat_registry import RegistrySecretType, RegistrySecretTypeValidator
 
 from tracecat import config
+from tracecat.cache import TTLCache
 from tracecat.db.schemas import RegistryAction, RegistryRepository
 from tracecat.expressions.eval import extract_expressions
 from tracecat.expressions.validator.validator import (
@@ -23,6 +25,7 @@ from tracecat.registry.actions.enums import (
 from tracecat.registry.actions.models import (
     BoundRegistryAction,
     RegistryActionCreate,
+    RegistryActionImpl,
     RegistryActionImplValidator,
     RegistryActionRead,
     RegistryActionUpdate,
@@ -40,6 +43,20 @@ from tracecat.types.exceptions import (
 )
 
 
+class CachedBoundAction(NamedTuple):
+    """A bound registry action and all secrets it requires, including template steps."""
+
+    action: BoundRegistryAction
+    secrets: frozenset[RegistrySecretType]
+
+
+bound_action_cache: TTLCache[tuple[str, str | None], CachedBoundAction] = TTLCache(
+    maxsize=config.TRACECAT__REGISTRY_ACTION_CACHE_SIZE,
+    ttl=config.TRACECAT__REGISTRY_ACTION_CACHE_TTL,
+)
+"""Per-process cache of execution-mode bound actions, keyed by (action name, registry commit SHA)."""
+
+
 class RegistryActionsService(BaseService):
     """Registry actions service."""
 
@@ -133,6 +150,7 @@ class RegistryActionsService(BaseService):
 
         self.session.add(action)
         await self.session.commit()
+        bound_action_cache.clear()
         return action
 
     async def update_action(
@@ -155,6 +173,7 @@ class RegistryActionsService(BaseService):
             setattr(action, key, value)
         self.session.add(action)
         await self.session.commit()
+        bound_action_cache.clear()
         return action
 
     async def delete_action(self, action: RegistryAction) -> RegistryAction:
@@ -169,6 +188,7 @@ class RegistryActionsService(BaseService):
         """
         await self.session.delete(action)
         await self.session.commit()
+        bound_action_cache.clear()
         return action
 
     async def sync_actions_from_repository(
@@ -297,6 +317,8 @@ class RegistryActionsService(BaseService):
                 await self.delete_action(action_to_remove)
                 n_deleted += 1
 
+        # Template actions depend on their steps, so drop every cached binding
+        bound_action_cache.clear()
         self.logger.info(
             "Synced actions from repository",
             repository=db_repo.origin,
@@ -332,28 +354,73 @@ class RegistryActionsService(BaseService):
         Returns:
             set[RegistrySecret]: A set of secret names used by the action and its template steps
         """
-        secrets = set()
-        impl = RegistryActionImplValidator.validate_python(action.implementation)
-        if impl.type == "udf":
-            if action.secrets:
-                secrets.update(
-                    RegistrySecretTypeValidator.validate_python(secret)
-                    for secret in action.secrets
+        all_secrets = await self.fetch_all_actions_secrets([action])
+        return all_secrets[action.action]
+
+    async def fetch_all_actions_secrets(
+        self, actions: Sequence[RegistryAction]
+    ) -> dict[str, set[RegistrySecretType]]:
+        """Recursively fetch all secrets for many actions and their template steps.
+
+        Template steps are loaded one nesting level at a time, so this runs one
+        query per level of template nesting rather than one per action or step.
+
+        Args:
+            actions: The registry actions to fetch secrets from
+
+        Returns:
+            dict[str, set[RegistrySecret]]: The secrets used by each action and its
+            template steps, keyed by action name
+        """
+        loaded = {action.action: action for action in actions}
+        impls: dict[str, RegistryActionImpl] = {}
+        requested = set(loaded)
+        pending = list(loaded.values())
+        while pending:
+            step_action_names: set[str] = set()
+            for action in pending:
+                impl = impls[action.action] = (
+                    RegistryActionImplValidator.validate_python(action.implementation)
                 )
-        elif impl.type == "template":
-            ta = impl.template_action
-            if ta is None:
-                raise ValueError("Template action is not defined")
-            # Add secrets from the template action itself
-            if template_secrets := ta.definition.secrets:
-                secrets.update(template_secrets)
-            # Recursively fetch secrets from each step
-            step_action_names = [step.action for step in ta.definition.steps]
-            step_ras = await self.get_actions(step_action_names)
-            for step_ra in step_ras:
-                step_secrets = await self.fetch_all_action_secrets(step_ra)
-                secrets.update(step_secrets)
-        return secrets
+                if impl.type == "template":
+                    ta = impl.template_action
+                    if ta is None:
+                        raise ValueError("Template action is not defined")
+                    step_action_names.update(
+                        step.action for step in ta.definition.steps
+                    )
+            # Steps that aren't in the registry are skipped
+            missing = step_action_names - requested
+            requested |= missing
+            pending = list(await self.get_actions(list(missing))) if missing else []
+            loaded.update((action.action, action) for action in pending)
+
+        all_secrets: dict[str, set[RegistrySecretType]] = {}
+
+        def collect(action_name: str) -> set[RegistrySecretType]:
+            if (secrets := all_secrets.get(action_name)) is not None:
+                return secrets
+            secrets = all_secrets[action_name] = set()
+            impl = impls[action_name]
+            if impl.type == "udf":
+                if action_secrets := loaded[action_name].secrets:
+                    secrets.update(
+                        RegistrySecretTypeValidator.validate_python(secret)
+                        for secret in action_secrets
+                    )
+            elif impl.type == "template":
+                ta = impl.template_action
+                if ta is None:
+                    raise ValueError("Template action is not defined")
+                # Add secrets from the template action itself
+                if template_secrets := ta.definition.secrets:
+                    secrets.update(template_secrets)
+                for step in ta.definition.steps:
+                    if step.action in loaded:
+                        secrets.update(collect(step.action))
+            return secrets
+
+        return {action.action: collect(action.action) for action in actions}
 
     def get_bound(
         self,
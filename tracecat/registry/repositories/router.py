@@ -6,6 +6,7 @@ from sqlalchemy.exc import IntegrityError, NoResultFound
 
 from tracecat.auth.credentials import RoleACL
 from tracecat.db.dependencies import AsyncDBSession
+from tracecat.executor.client import ExecutorClient
 from tracecat.logger import logger
 from tracecat.registry.actions.models import RegistryActionRead
 from tracecat.registry.actions.service import RegistryActionsService
@@ -23,8 +24,9 @@ from tracecat.registry.repositories.models import (
     RegistryRepositoryUpdate,
 )
 from tracecat.registry.repositories.service import RegistryReposService
-from tracecat.types.auth import AccessLevel, Role
+from tracecat.types.auth import AccessLevel, Role, system_role
 from tracecat.types.exceptions import (
+    ExecutorClientError,
     RegistryActionValidationError,
     RegistryError,
     TracecatValidationError,
@@ -109,6 +111,11 @@ async def sync_registry_repository(
             ),
         )
         logger.info("Updated repository", origin=repo.origin)
+        try:
+            # Install the new commit's runtime environment ahead of the first action
+            await ExecutorClient(role=system_role()).prewarm()
+        except ExecutorClientError as e:
+            logger.warning("Failed to prewarm executor", error=e)
 
     except RegistryError as e:
         logger.warning("Cannot sync repository", exc=e)
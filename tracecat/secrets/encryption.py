@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any
 
 import orjson
@@ -6,15 +7,21 @@ from cryptography.fernet import Fernet, InvalidToken
 from .models import SecretBase, SecretKeyValue
 
 
+@lru_cache(maxsize=8)
+def _get_cipher(key: str) -> Fernet:
+    """Get a reusable Fernet cipher for an encryption key."""
+    return Fernet(key)
+
+
 def encrypt_bytes(obj: dict[str, Any], *, key: str) -> bytes:
-    cipher_suite = Fernet(key)
+    cipher_suite = _get_cipher(key)
     obj_bytes = orjson.dumps(obj)
     encrypted_value = cipher_suite.encrypt(obj_bytes)
     return encrypted_value
 
 
 def decrypt_bytes(encrypted_obj: bytes, *, key: str) -> dict[str, Any]:
-    cipher_suite = Fernet(key)
+    cipher_suite = _get_cipher(key)
     obj_bytes = cipher_suite.decrypt(encrypted_obj)
     return orjson.loads(obj_bytes)
 
@@ -46,7 +53,7 @@ def encrypt_value(value: bytes, *, key: str) -> bytes:
         ValueError: If the key is invalid
     """
     try:
-        return Fernet(key).encrypt(value)
+        return _get_cipher(key).encrypt(value)
     except Exception as e:
         raise ValueError(f"Encryption failed: {str(e)}") from e
 
@@ -66,7 +73,7 @@ def decrypt_value(encrypted_value: bytes, *, key: str) -> bytes:
         InvalidToken: If the encrypted data is corrupted
     """
     try:
-        return Fernet(key).decrypt(encrypted_value)
+        return _get_cipher(key).decrypt(encrypted_value)
     except InvalidToken as e:
         raise InvalidToken("Decryption failed: corrupted or invalid token") from e
     except Exception as e:
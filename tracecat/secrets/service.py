@@ -9,8 +9,9 @@ from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from tracecat import config
+from tracecat.cache import TTLCache
 from tracecat.db.schemas import BaseSecret, OrganizationSecret, Secret
-from tracecat.identifiers import SecretID
+from tracecat.identifiers import SecretID, WorkspaceID
 from tracecat.logger import logger
 from tracecat.registry.constants import GIT_SSH_KEY_SECRET_NAME
 from tracecat.secrets.constants import DEFAULT_SECRETS_ENVIRONMENT
@@ -26,6 +27,12 @@ from tracecat.service import BaseService
 from tracecat.types.auth import Role
 from tracecat.types.exceptions import TracecatAuthorizationError, TracecatNotFoundError
 
+secrets_cache: TTLCache[tuple[WorkspaceID | None, str, str], dict[str, str]] = TTLCache(
+    maxsize=config.TRACECAT__SECRETS_CACHE_SIZE,
+    ttl=config.TRACECAT__SECRETS_CACHE_TTL,
+)
+"""Decrypted secret keys, keyed by (workspace ID, environment, secret name)."""
+
 
 class SecretsService(BaseService):
     """Secrets manager service."""
@@ -81,11 +88,13 @@ class SecretsService(BaseService):
             setattr(secret, field, value)
         self.session.add(secret)
         await self.session.commit()
+        secrets_cache.clear()
 
     async def _delete_secret(self, secret: BaseSecret) -> None:
         """Delete a base secret."""
         await self.session.delete(secret)
         await self.session.commit()
+        secrets_cache.clear()
 
     # === Workspace secrets ===
 
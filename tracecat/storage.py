@@ -1,10 +1,16 @@
 """Storage utilities for handling file uploads and downloads with S3."""
 
+import asyncio
 import hashlib
 import os
 import re
+from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Any
 
 import aioboto3
+from aiobotocore.config import AioConfig
 from botocore.exceptions import ClientError
 from polyfile.magic import MagicMatcher
 
@@ -781,18 +787,24 @@ class FileSecurityValidator:
         return filename
 
 
-# Core storage utility functions
-def get_storage_client():
-    """Get a configured S3 client for either AWS S3 or MinIO.
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+"""Size of the chunks yielded by streamed downloads."""
+
+
+def _create_storage_client():
+    """Create a configured S3 client context manager for either AWS S3 or MinIO.
 
     Uses environment variables for credentials:
     - For MinIO: MINIO_ROOT_USER, MINIO_ROOT_PASSWORD
     - For S3: AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY
-
-    Returns:
-        Configured aioboto3 S3 client context manager
     """
     session = aioboto3.Session()
+    client_config = AioConfig(
+        max_pool_connections=config.TRACECAT__BLOB_STORAGE_MAX_POOL_CONNECTIONS,
+        connector_args={
+            "keepalive_timeout": config.TRACECAT__BLOB_STORAGE_KEEPALIVE_TIMEOUT
+        },
+    )
 
     # Configure client based on protocol
     if config.TRACECAT__BLOB_STORAGE_PROTOCOL == "minio":
@@ -802,10 +814,79 @@ def get_storage_client():
             endpoint_url=config.TRACECAT__BLOB_STORAGE_ENDPOINT,
             aws_access_key_id=os.environ.get("MINIO_ROOT_USER"),
             aws_secret_access_key=os.environ.get("MINIO_ROOT_PASSWORD"),
+            config=client_config,
         )
     else:
         # AWS S3 configuration - use AWS credentials from environment or default credential chain
-        return session.client("s3")
+        return session.client("s3", config=client_config)
+
+
+class _StorageClientPool:
+    """Process-wide S3 clients that keep their connection pools alive across calls.
+
+    aiobotocore clients are bound to the event loop they were created on, so each
+    loop gets its own client. Clients are held open by an async generator, which
+    the loop closes when it shuts down (`asyncio.run` calls `shutdown_asyncgens`).
+    Closing the generator closes the client and drops the loop's entry, so a
+    finished loop doesn't leave its client and connections behind.
+    """
+
+    def __init__(self) -> None:
+        self._clients: dict[
+            asyncio.AbstractEventLoop, tuple[Any, AsyncGenerator[Any]]
+        ] = {}
+
+    async def _hold(self, loop: asyncio.AbstractEventLoop) -> AsyncGenerator[Any]:
+        """Hold a storage client open until the generator is closed."""
+        async with _create_storage_client() as client:
+            try:
+                yield client
+            finally:
+                if (entry := self._clients.get(loop)) is not None and entry[
+                    0
+                ] is client:
+                    del self._clients[loop]
+
+    async def get(self) -> Any:
+        loop = asyncio.get_running_loop()
+        if (entry := self._clients.get(loop)) is not None:
+            return entry[0]
+        holder = self._hold(loop)
+        client = await anext(holder)
+        if (entry := self._clients.get(loop)) is not None:
+            # Another task created the client while we were waiting
+            await holder.aclose()
+            return entry[0]
+        self._clients[loop] = (client, holder)
+        return client
+
+    async def close(self) -> None:
+        """Close the client of the running event loop."""
+        entry = self._clients.get(asyncio.get_running_loop())
+        if entry is not None:
+            await entry[1].aclose()
+
+
+_client_pool = _StorageClientPool()
+
+
+# Core storage utility functions
+@asynccontextmanager
+async def get_storage_client() -> AsyncIterator[Any]:
+    """Get the shared S3 client for either AWS S3 or MinIO.
+
+    The client and its connection pool are reused for the lifetime of the
+    process, so callers don't pay session and connection setup on every call.
+
+    Yields:
+        Configured aioboto3 S3 client
+    """
+    yield await _client_pool.get()
+
+
+async def close_storage_client() -> None:
+    """Close the shared S3 client and its connection pool."""
+    await _client_pool.close()
 
 
 async def ensure_bucket_exists(bucket: str) -> None:
@@ -843,6 +924,45 @@ async def ensure_bucket_exists(bucket: str) -> None:
                 raise
 
 
+async def set_bucket_expiration(bucket: str, days: int, prefix: str = "") -> None:
+    """Expire objects in a bucket a number of days after they were last written.
+
+    Replaces any existing lifecycle configuration of the bucket.
+
+    Args:
+        bucket: Bucket name (required)
+        days: Days after which objects are deleted
+        prefix: Only expire objects under this key prefix
+
+    Raises:
+        ClientError: If the lifecycle configuration can't be set
+    """
+
+    try:
+        async with get_storage_client() as s3_client:
+            await s3_client.put_bucket_lifecycle_configuration(
+                Bucket=bucket,
+                LifecycleConfiguration={
+                    "Rules": [
+                        {
+                            "ID": "tracecat-expiration",
+                            "Filter": {"Prefix": prefix},
+                            "Status": "Enabled",
+                            "Expiration": {"Days": days},
+                        }
+                    ]
+                },
+            )
+            logger.info("Set bucket expiration", bucket=bucket, days=days)
+    except ClientError as e:
+        logger.error(
+            "Failed to set bucket expiration",
+            bucket=bucket,
+            error=str(e),
+        )
+        raise
+
+
 async def generate_presigned_download_url(
     key: str,
     bucket: str,
@@ -1034,6 +1154,13 @@ async def upload_file(
         ClientError: If the upload fails
     """
 
+    if len(content) > config.TRACECAT__BLOB_STORAGE_PART_SIZE:
+        # Upload large files in parts so no single request carries the whole file
+        await upload_file_stream(
+            _iter_parts(content), key=key, bucket=bucket, content_type=content_type
+        )
+        return
+
     try:
         async with get_storage_client() as s3_client:
             kwargs = {
@@ -1104,6 +1231,171 @@ async def download_file(key: str, bucket: str) -> bytes:
         raise
 
 
+async def _iter_parts(content: bytes) -> AsyncIterator[bytes]:
+    part_size = config.TRACECAT__BLOB_STORAGE_PART_SIZE
+    for offset in range(0, len(content), part_size):
+        yield content[offset : offset + part_size]
+
+
+async def upload_file_stream(
+    chunks: AsyncIterable[bytes],
+    key: str,
+    bucket: str,
+    content_type: str | None = None,
+) -> int:
+    """Upload a stream of bytes to S3/MinIO with bounded memory.
+
+    Streams that fit in a single part are uploaded with one request. Larger
+    streams are sent as a multipart upload, buffering at most one part at a
+    time. Failed multipart uploads are aborted.
+
+    Args:
+        chunks: The file content as an async iterable of byte chunks
+        key: The S3 object key
+        bucket: Bucket name (required)
+        content_type: Optional MIME type of the file
+
+    Returns:
+        The number of bytes uploaded
+
+    Raises:
+        ClientError: If the upload fails
+    """
+    part_size = config.TRACECAT__BLOB_STORAGE_PART_SIZE
+    chunk_iter = aiter(chunks)
+    buffer = bytearray()
+    async for chunk in chunk_iter:
+        buffer += chunk
+        if len(buffer) >= part_size:
+            break
+    else:
+        await upload_file(
+            bytes(buffer), key=key, bucket=bucket, content_type=content_type
+        )
+        return len(buffer)
+
+    kwargs = {"Bucket": bucket, "Key": key}
+    if content_type:
+        kwargs["ContentType"] = content_type
+
+    try:
+        async with get_storage_client() as s3_client:
+            upload = await s3_client.create_multipart_upload(**kwargs)
+            upload_id = upload["UploadId"]
+            parts: list[dict[str, Any]] = []
+            size = 0
+
+            async def upload_part(data: bytes) -> None:
+                nonlocal size
+                part_number = len(parts) + 1
+                response = await s3_client.upload_part(
+                    Bucket=bucket,
+                    Key=key,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    Body=data,
+                )
+                parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+                size += len(data)
+
+            try:
+                while True:
+                    while len(buffer) >= part_size:
+                        await upload_part(bytes(buffer[:part_size]))
+                        del buffer[:part_size]
+                    chunk = await anext(chunk_iter, None)
+                    if chunk is None:
+                        break
+                    buffer += chunk
+                if buffer:
+                    await upload_part(bytes(buffer))
+                await s3_client.complete_multipart_upload(
+                    Bucket=bucket,
+                    Key=key,
+                    UploadId=upload_id,
+                    MultipartUpload={"Parts": parts},
+                )
+            except BaseException:
+                try:
+                    await s3_client.abort_multipart_upload(
+                        Bucket=bucket, Key=key, UploadId=upload_id
+                    )
+                except ClientError as abort_error:
+                    logger.warning(
+                        "Failed to abort multipart upload",
+                        key=key,
+                        bucket=bucket,
+                        error=str(abort_error),
+                    )
+                raise
+
+            logger.info(
+                "File uploaded successfully",
+                key=key,
+                bucket=bucket,
+                size=size,
+                parts=len(parts),
+            )
+            return size
+    except ClientError as e:
+        logger.error(
+            "Failed to upload file",
+            key=key,
+            bucket=bucket,
+            error=str(e),
+        )
+        raise
+
+
+async def download_file_stream(
+    key: str, bucket: str, chunk_size: int = DOWNLOAD_CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """Stream a file from S3/MinIO without buffering it in memory.
+
+    The object is requested before returning, so a missing file raises here
+    rather than once iteration has started.
+
+    Args:
+        key: The S3 object key
+        bucket: Bucket name (required)
+        chunk_size: Maximum size of each yielded chunk in bytes
+
+    Returns:
+        Async iterator over the file content
+
+    Raises:
+        ClientError: If the download fails
+        FileNotFoundError: If the file doesn't exist
+    """
+
+    try:
+        async with get_storage_client() as s3_client:
+            response = await s3_client.get_object(Bucket=bucket, Key=key)
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") == "NoSuchKey":
+            logger.warning(
+                "File not found in storage",
+                key=key,
+                bucket=bucket,
+            )
+            raise FileNotFoundError(f"File {key} not found in bucket {bucket}") from e
+        logger.error(
+            "Failed to download file",
+            key=key,
+            bucket=bucket,
+            error=str(e),
+        )
+        raise
+
+    async def iter_chunks() -> AsyncIterator[bytes]:
+        # Release the connection back to the pool even if iteration stops early
+        async with response["Body"] as body:
+            async for chunk in body.iter_chunks(chunk_size):
+                yield chunk
+
+    return iter_chunks()
+
+
 async def delete_file(key: str, bucket: str) -> None:
     """Delete a file from S3/MinIO.
 
@@ -1161,3 +1453,65 @@ async def file_exists(key: str, bucket: str) -> bool:
             error=str(e),
         )
         raise
+
+
+async def get_file_last_modified(key: str, bucket: str) -> datetime | None:
+    """Get the time a file in S3/MinIO was last written.
+
+    Args:
+        key: The S3 object key
+        bucket: Bucket name (required)
+
+    Returns:
+        The last modified time, or None if the file doesn't exist
+
+    Raises:
+        ClientError: If the check fails (other than 404)
+    """
+
+    try:
+        async with get_storage_client() as s3_client:
+            response = await s3_client.head_object(Bucket=bucket, Key=key)
+            return response["LastModified"]
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") == "404":
+            return None
+        logger.error(
+            "Failed to get file metadata",
+            key=key,
+            bucket=bucket,
+            error=str(e),
+        )
+        raise
+
+
+async def touch_file(key: str, bucket: str) -> None:
+    """Reset the last modified time of a file by copying it onto itself.
+
+    Restarts the bucket's expiration clock for the file without downloading it.
+
+    Args:
+        key: The S3 object key
+        bucket: Bucket name (required)
+
+    Raises:
+        ClientError: If the copy fails
+    """
+
+    try:
+        async with get_storage_client() as s3_client:
+            await s3_client.copy_object(
+                Bucket=bucket,
+                Key=key,
+                CopySource={"Bucket": bucket, "Key": key},
+                MetadataDirective="REPLACE",
+            )
+            logger.debug("File touched", key=key, bucket=bucket)
+    except ClientError as e:
+        logger.error(
+            "Failed to touch file",
+            key=key,
+            bucket=bucket,
+            error=str(e),
+        )
+        raise
@@ -1,4 +1,5 @@
-from datetime import datetime
+from datetime import UTC, datetime
+from decimal import Decimal, InvalidOperation
 from typing import Any
 from uuid import UUID
 
@@ -131,3 +132,40 @@ def convert_value(value: str, type: SqlType) -> Any:
         raise TypeError(
             f"Cannot convert value {value!r} to {type.__class__.__name__} {type.value}"
         ) from e
+
+
+def to_copy_value(value: str, type: SqlType) -> Any:
+    """Convert a string value to the Python type asyncpg expects in a binary COPY.
+
+    Empty strings are loaded as NULL, except in TEXT columns.
+
+    Raises:
+        TypeError: If the value can't be converted to the SQL type
+    """
+    if not value:
+        return value if type == SqlType.TEXT else None
+    match type:
+        case SqlType.NUMERIC:
+            # Keep the exact decimal representation
+            try:
+                return Decimal(value)
+            except InvalidOperation as e:
+                raise TypeError(
+                    f"Cannot convert value {value!r} to {type.__class__.__name__} {type.value}"
+                ) from e
+        case SqlType.JSONB:
+            # The JSONB codec takes the serialized document, so only validate it
+            convert_value(value, type)
+            return value
+        case SqlType.TIMESTAMP:
+            dt = convert_value(value, type)
+            if dt.tzinfo is not None:
+                dt = dt.astimezone(UTC).replace(tzinfo=None)
+            return dt
+        case SqlType.TIMESTAMPTZ:
+            dt = convert_value(value, type)
+            if dt.tzinfo is None:
+                dt = dt.replace(tzinfo=UTC)
+            return dt
+        case _:
+            return convert_value(value, type)
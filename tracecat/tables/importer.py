@@ -1,9 +1,14 @@
-from typing import Any
+import asyncio
+import csv
+import io
+from itertools import islice
+from typing import IO, Any
 
 from pydantic import BaseModel
 
 from tracecat.db.schemas import Table, TableColumn
-from tracecat.tables.common import convert_value
+from tracecat.logger import logger
+from tracecat.tables.common import convert_value, to_copy_value
 from tracecat.tables.enums import SqlType
 from tracecat.tables.service import TablesService
 from tracecat.types.exceptions import TracecatImportError
@@ -14,7 +19,17 @@ class ColumnInfo(BaseModel):
     type: SqlType
 
 
+class CSVRowError(BaseModel):
+    line: int
+    """Line number of the row in the CSV file, counting the header."""
+    column: str | None = None
+    error: str
+
+
 class CSVImporter:
+    max_errors = 100
+    """Maximum number of row errors collected before an import is aborted."""
+
     def __init__(
         self, table_columns: list[TableColumn], chunk_size: int = 1000
     ) -> None:
@@ -60,3 +75,90 @@ class CSVImporter:
         if chunk:
             count = await service.batch_insert_rows(table, chunk)
             self.total_rows_inserted += count
+
+    async def import_csv(
+        self,
+        file: IO[bytes],
+        column_mapping: dict[str, str],
+        service: TablesService,
+        table: Table,
+        *,
+        chunk_size: int = 10_000,
+        encoding: str = "utf-8-sig",
+    ) -> int:
+        """Stream a CSV file into the table with COPY, one chunk of rows at a time.
+
+        The file is decoded incrementally, so memory use is bounded by the chunk
+        size rather than the file size. Rows are loaded in the session's
+        transaction. If any row can't be converted, no further rows are loaded and
+        a `TracecatImportError` listing the failing rows is raised; the caller
+        should roll back.
+
+        Returns:
+            Number of rows inserted
+        """
+        mapping = [
+            (csv_col, col_info)
+            for csv_col, table_col in column_mapping.items()
+            if table_col
+            and table_col != "skip"
+            and (col_info := self.columns.get(table_col))
+        ]
+        columns = [col_info.name for _, col_info in mapping]
+        errors: list[CSVRowError] = []
+
+        text = io.TextIOWrapper(file, encoding=encoding, newline="")
+        reader = csv.DictReader(text)
+
+        def read_chunk() -> tuple[list[tuple[Any, ...]], bool]:
+            records: list[tuple[Any, ...]] = []
+            n_rows = 0
+            for csv_row in islice(reader, chunk_size):
+                n_rows += 1
+                record = []
+                for csv_col, col_info in mapping:
+                    value = csv_row.get(csv_col) or ""
+                    try:
+                        record.append(to_copy_value(value, col_info.type))
+                    except TypeError as e:
+                        errors.append(
+                            CSVRowError(
+                                line=reader.line_num,
+                                column=col_info.name,
+                                error=str(e),
+                            )
+                        )
+                        break
+                else:
+                    records.append(tuple(record))
+                if len(errors) >= self.max_errors:
+                    break
+            return records, n_rows == chunk_size
+
+        try:
+            has_more = True
+            while has_more and len(errors) < self.max_errors:
+                # Decoding and type conversion are CPU bound, so keep them off the event loop
+                records, has_more = await asyncio.to_thread(read_chunk)
+                if errors or not records:
+                    # Keep validating to report errors, but stop loading rows
+                    continue
+                self.total_rows_inserted += await service.copy_rows(
+                    table, columns, records
+                )
+                logger.info(
+                    "Imported CSV rows",
+                    table=table.name,
+                    rows_inserted=self.total_rows_inserted,
+                )
+        finally:
+            # Leave the underlying upload open for its owner to close
+            text.detach()
+
+        if errors:
+            raise TracecatImportError(
+                f"{len(errors)}{'+' if len(errors) >= self.max_errors else ''}"
+                " row(s) could not be imported",
+                detail=[e.model_dump() for e in errors],
+            )
+        return self.total_rows_inserted
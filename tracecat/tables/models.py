@@ -4,6 +4,7 @@ from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from tracecat import config
 from tracecat.identifiers import TableColumnID, TableID, TableRowID
 from tracecat.tables.enums import SqlType
 
@@ -17,6 +18,8 @@ class TableColumnRead(BaseModel):
     nullable: bool = True
     default: Any | None = None
     is_index: bool = False
+    is_search_index: bool = False
+    is_secondary_index: bool = False
 
 
 class TableColumnCreate(BaseModel):
@@ -76,6 +79,14 @@ class TableColumnUpdate(BaseModel):
         default=None,
         description="Whether the column is an index",
     )
+    is_search_index: bool | None = Field(
+        default=None,
+        description="Whether the column has a trigram search index",
+    )
+    is_secondary_index: bool | None = Field(
+        default=None,
+        description="Whether the column has a secondary index for sorting and lookups",
+    )
 
 
 class TableRowRead(BaseModel):
@@ -106,6 +117,26 @@ class TableRowInsertBatchResponse(BaseModel):
     rows_inserted: int
 
 
+class TableRowLookupBatch(BaseModel):
+    """Request body for looking up many keys in a table."""
+
+    columns: list[str] = Field(..., min_length=1)
+    """The columns each key is matched against."""
+    keys: list[list[Any]] = Field(
+        ..., max_length=config.TRACECAT__MAX_LOOKUP_KEYS_CLIENT_POSTGRES
+    )
+    """Key tuples, each with one value per column."""
+    limit: int | None = Field(default=1, ge=1)
+    """Maximum number of rows returned per key."""
+
+
+class TableRowLookupBatchResponse(BaseModel):
+    """Response for a batch lookup, aligned with the requested keys."""
+
+    results: list[list[dict[str, Any]]]
+    """Matching rows per key, in request order. Misses are empty lists."""
+
+
 class TableReadMinimal(BaseModel):
     """Read model for a table."""
 
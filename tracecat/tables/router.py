@@ -1,6 +1,4 @@
-import csv
-from io import StringIO
-from typing import Annotated, Any
+from typing import Annotated, Literal
 from uuid import UUID
 
 import orjson
@@ -33,6 +31,8 @@ from tracecat.tables.models import (
     TableRowInsert,
     TableRowInsertBatch,
     TableRowInsertBatchResponse,
+    TableRowLookupBatch,
+    TableRowLookupBatchResponse,
     TableRowRead,
     TableUpdate,
 )
@@ -136,6 +136,8 @@ async def get_table(
 
     # Get unique index info or default to empty dict if not present
     index_columns = await service.get_index(table)
+    search_index_columns = await service.get_search_index(table)
+    secondary_index_columns = await service.get_secondary_index(table)
 
     # Convert to response model (includes is_index field)
     return TableRead(
@@ -149,6 +151,8 @@ async def get_table(
                 nullable=column.nullable,
                 default=column.default,
                 is_index=column.name in index_columns,
+                is_search_index=column.name in search_index_columns,
+                is_secondary_index=column.name in secondary_index_columns,
             )
             for column in table.columns
         ],
@@ -312,6 +316,10 @@ async def list_rows(
     limit: int = Query(default=20, ge=1, le=100),
     cursor: str | None = Query(default=None),
     reverse: bool = Query(default=False),
+    order_by: str | None = Query(default=None, description="Column to order by"),
+    sort: Literal["asc", "desc"] | None = Query(
+        default=None, description="Direction to sort (asc or desc)"
+    ),
 ) -> CursorPaginatedResponse[TableRowRead]:
     """Get a row by ID."""
     service = TablesService(session, role=role)
@@ -329,7 +337,15 @@ async def list_rows(
         reverse=reverse,
     )
 
-    response = await service.list_rows_paginated(table, params)
+    try:
+        response = await service.list_rows_paginated(
+            table, params, order_by=order_by, sort=sort
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
 
     # Convert the response items to TableRowRead format
     return CursorPaginatedResponse(
@@ -451,6 +467,42 @@ async def batch_insert_rows(
         ) from e
 
 
+@router.post("/{table_id}/rows/lookup")
+async def batch_lookup_rows(
+    role: WorkspaceUser,
+    session: AsyncDBSession,
+    table_id: TableID,
+    params: TableRowLookupBatch,
+) -> TableRowLookupBatchResponse:
+    """Lookup many keys in a table with a single query.
+
+    Results are aligned with the requested keys. Keys without matches get an
+    empty list.
+    """
+    service = TablesService(session, role=role)
+    try:
+        table = await service.get_table(table_id)
+    except TracecatNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        ) from e
+
+    try:
+        results = await service.batch_lookup_rows(
+            table.name,
+            columns=params.columns,
+            keys=params.keys,
+            limit=params.limit,
+        )
+    except (TypeError, ValueError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+    return TableRowLookupBatchResponse(results=results)
+
+
 async def get_column_mapping(column_mapping: str = Form(...)) -> dict[str, str]:
     try:
         return orjson.loads(column_mapping)
@@ -484,38 +536,23 @@ async def import_csv(
     # Initialize import service
     importer = CSVImporter(table.columns)
 
-    # Process CSV file
+    # Stream the spooled upload into the table in a single transaction
     try:
-        contents = await file.read()
-        csv_file = StringIO(contents.decode())
-        csv_reader = csv.DictReader(csv_file)
-
-        current_chunk: list[dict[str, Any]] = []
-
-        # Process rows in chunks
-        for row in csv_reader:
-            mapped_row = importer.map_row(row, column_mapping)
-            current_chunk.append(mapped_row)
-
-            if len(current_chunk) >= importer.chunk_size:
-                await importer.process_chunk(current_chunk, service, table)
-                current_chunk = []
-
-        # Process remaining rows
-        await importer.process_chunk(current_chunk, service, table)
+        await importer.import_csv(file.file, column_mapping, service, table)
+        await session.commit()
     except TracecatImportError as e:
         logger.warning(f"Error during import: {e}")
+        await session.rollback()
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=str(e),
+            detail={"message": str(e), "errors": e.detail} if e.detail else str(e),
         ) from e
     except Exception as e:
         logger.warning(f"Unexpected error during import: {e}")
+        await session.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Error processing CSV: {str(e)}",
         ) from e
-    finally:
-        csv_file.close()
 
     return TableRowInsertBatchResponse(rows_inserted=importer.total_rows_inserted)
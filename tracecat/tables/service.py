@@ -1,8 +1,12 @@
-from collections.abc import Mapping, Sequence
+import re
+from collections.abc import Iterable, Mapping, Sequence
 from datetime import datetime
-from typing import Any
+from decimal import Decimal
+from typing import Any, Literal, cast
 from uuid import UUID
 
+import asyncpg
+import orjson
 import sqlalchemy as sa
 from asyncpg.exceptions import (
     InFailedSQLTransactionError,
@@ -26,6 +30,7 @@ from tracecat.identifiers import TableColumnID, TableID
 from tracecat.identifiers.workflow import WorkspaceUUID
 from tracecat.service import BaseService
 from tracecat.tables.common import (
+    convert_value,
     handle_default_value,
     is_valid_sql_type,
     to_sql_clause,
@@ -51,6 +56,42 @@ _RETRYABLE_DB_EXCEPTIONS = (
     InFailedSQLTransactionError,
 )
 
+_SEARCH_INDEX_PREFIX = "trgm_"
+"""Name prefix of the trigram indexes that back `search_rows`."""
+
+_SEARCHABLE_TYPES = (SqlType.TEXT.value, SqlType.JSONB.value)
+"""SQL types of the columns `search_rows` matches the search term against."""
+
+_SECONDARY_INDEX_PREFIX = "ix_"
+"""Name prefix of the B-tree indexes that back sorting and keyset pagination."""
+
+_CAST_EXPRESSION_PATTERN = re.compile(r"\(*(\w+)\)*::text\)*")
+"""Matches the reflected expression of a JSONB search index, e.g. `((data)::text)`."""
+
+_BUILTIN_COLUMN_TYPES = {
+    "id": SqlType.UUID,
+    "created_at": SqlType.TIMESTAMPTZ,
+    "updated_at": SqlType.TIMESTAMPTZ,
+}
+"""SQL types of the columns every user-defined table has."""
+
+
+def _coerce_lookup_key(value: Any, sql_type: SqlType) -> Any:
+    """Convert a lookup key to the Python type asyncpg expects for the column."""
+    if value is None:
+        return None
+    match sql_type:
+        case SqlType.TEXT:
+            return str(value)
+        case SqlType.JSONB:
+            return value if isinstance(value, str) else orjson.dumps(value).decode()
+        case SqlType.NUMERIC:
+            return Decimal(str(value))
+        case _ if isinstance(value, str):
+            return convert_value(value, sql_type)
+        case _:
+            return value
+
 
 class BaseTablesService(BaseService):
     """Service for managing user-defined tables."""
@@ -115,27 +156,32 @@ class BaseTablesService(BaseService):
 
     async def get_index(self, table: Table) -> list[str]:
         """Get columns that have unique constraints."""
-        schema_name = self._get_schema_name()
-        conn = await self.session.connection()
-
-        def inspect_indexes(
-            sync_conn: sa.Connection,
-        ) -> Sequence[sa.engine.interfaces.ReflectedIndex]:
-            inspector = sa.inspect(sync_conn)
-            indexes = inspector.get_indexes(table.name, schema=schema_name)
-            return indexes
-
-        indexes = await conn.run_sync(inspect_indexes)
+        indexes = await self._get_indexes(table)
         # Assume only single column indexes
         index_names = [
             index["column_names"][0]
             for index in indexes
-            if len(index["column_names"]) == 1
+            if index["unique"]
+            and len(index["column_names"]) == 1
             and isinstance(index["column_names"][0], str)
         ]
         self.logger.info("Found unique index column", columns=index_names)
         return index_names
 
+    async def _get_indexes(
+        self, table: Table
+    ) -> Sequence[sa.engine.interfaces.ReflectedIndex]:
+        schema_name = self._get_schema_name()
+        conn = await self.session.connection()
+
+        def inspect_indexes(
+            sync_conn: sa.Connection,
+        ) -> Sequence[sa.engine.interfaces.ReflectedIndex]:
+            inspector = sa.inspect(sync_conn)
+            return inspector.get_indexes(table.name, schema=schema_name)
+
+        return await conn.run_sync(inspect_indexes)
+
     async def get_table_by_name(self, table_name: str) -> Table:
         """Get a lookup table by name.
 
@@ -362,11 +408,18 @@ class BaseTablesService(BaseService):
         full_table_name = self._full_table_name(column.table.name)
         conn = await self.session.connection()
         is_index = set_fields.pop("is_index", False)
+        is_search_index = set_fields.pop("is_search_index", None)
+        is_secondary_index = set_fields.pop("is_secondary_index", None)
 
         # Create index if requested
         if is_index:
             await self.create_unique_index(column.table, column.name)
 
+        search_index_name = None
+        if "type" in set_fields or is_search_index is not None:
+            search_indexes = await self.get_search_index(column.table)
+            search_index_name = search_indexes.get(column.name)
+
         # Handle physical column changes if name or type is being updated
         if "name" in set_fields or "type" in set_fields:
             old_name = self._sanitize_identifier(column.name)
@@ -385,12 +438,19 @@ class BaseTablesService(BaseService):
                     )
                 )
             if "type" in set_fields:
+                if search_index_name is not None:
+                    # Trigram operator classes are tied to the old type, so rebuild the index
+                    await self._drop_index(search_index_name)
                 await conn.execute(
                     sa.DDL(
                         "ALTER TABLE %s ALTER COLUMN %s TYPE %s",
                         (full_table_name, new_name, new_type),
                     )
                 )
+                if search_index_name is not None and new_type in _SEARCHABLE_TYPES:
+                    await self._create_search_index(
+                        column.table.name, new_name, new_type
+                    )
             if "nullable" in set_fields:
                 constraint = (
                     "DROP NOT NULL" if set_fields["nullable"] else "SET NOT NULL"
@@ -432,6 +492,32 @@ class BaseTablesService(BaseService):
                         )
                     )
 
+        # Create or drop the search index if requested
+        if is_search_index is not None:
+            column_name = self._sanitize_identifier(set_fields.get("name", column.name))
+            if is_search_index:
+                await self._create_search_index(
+                    column.table.name,
+                    column_name,
+                    set_fields.get("type", column.type),
+                )
+            elif search_index_name is not None:
+                await self._drop_index(search_index_name)
+
+        # Create or drop the secondary index if requested
+        if is_secondary_index is not None:
+            column_name = self._sanitize_identifier(set_fields.get("name", column.name))
+            if is_secondary_index:
+                await self._create_secondary_index(
+                    column.table.name,
+                    column_name,
+                    set_fields.get("type", column.type),
+                )
+            elif index_name := (await self.get_secondary_index(column.table)).get(
+                column.name
+            ):
+                await self._drop_index(index_name)
+
         # Update the column metadata
         for key, value in set_fields.items():
             setattr(column, key, value)
@@ -476,6 +562,129 @@ class BaseTablesService(BaseService):
         # Commit the transaction
         await self.session.flush()
 
+    async def get_search_index(self, table: Table) -> dict[str, str]:
+        """Get columns that have a trigram search index, mapped to the index name."""
+        indexes = await self._get_indexes(table)
+        search_indexes: dict[str, str] = {}
+        for index in indexes:
+            name = index["name"]
+            if not name or not name.startswith(_SEARCH_INDEX_PREFIX):
+                continue
+            # TEXT columns are indexed directly, JSONB columns through a text cast
+            column_name = index["column_names"][0]
+            if column_name is None and (expressions := index.get("expressions")):
+                if match := _CAST_EXPRESSION_PATTERN.fullmatch(expressions[0]):
+                    column_name = match.group(1)
+            if column_name is not None:
+                search_indexes[column_name] = name
+        return search_indexes
+
+    @require_access_level(AccessLevel.ADMIN)
+    async def create_search_index(self, table: Table, column_name: str) -> None:
+        """Create a trigram search index on a TEXT or JSONB column.
+
+        The index is used by `search_rows` for substring matching and ranking,
+        and is maintained by Postgres on every insert and update.
+        """
+        sanitized_column = self._sanitize_identifier(column_name)
+        column = next((c for c in table.columns if c.name == sanitized_column), None)
+        if column is None:
+            raise ValueError(f"Column '{column_name}' does not exist")
+        await self._create_search_index(table.name, sanitized_column, column.type)
+        await self.session.flush()
+
+    @require_access_level(AccessLevel.ADMIN)
+    async def drop_search_index(self, table: Table, column_name: str) -> None:
+        """Drop the trigram search index of a column, if it has one."""
+        sanitized_column = self._sanitize_identifier(column_name)
+        search_indexes = await self.get_search_index(table)
+        if index_name := search_indexes.get(sanitized_column):
+            await self._drop_index(index_name)
+            await self.session.flush()
+
+    async def _drop_index(self, index_name: str) -> None:
+        conn = await self.session.connection()
+        await conn.execute(
+            sa.DDL(
+                "DROP INDEX IF EXISTS %s",
+                f'"{self._get_schema_name()}".{index_name}',
+            )
+        )
+
+    async def _create_search_index(
+        self, table_name: str, column_name: str, column_type: str
+    ) -> None:
+        match column_type:
+            case SqlType.TEXT.value:
+                expression = column_name
+            case SqlType.JSONB.value:
+                # Must match the cast used by search_rows for the index to apply
+                expression = f"(CAST({column_name} AS TEXT))"
+            case _:
+                raise ValueError(
+                    "Search indexes are only supported on TEXT and JSONB columns"
+                )
+        index_name = self._sanitize_identifier(
+            f"{_SEARCH_INDEX_PREFIX}{table_name}_{column_name}"
+        )
+        conn = await self.session.connection()
+        await conn.execute(
+            sa.DDL(
+                "CREATE INDEX IF NOT EXISTS %s ON %s USING gin (%s gin_trgm_ops)",
+                (index_name, self._full_table_name(table_name), expression),
+            )
+        )
+
+    async def get_secondary_index(self, table: Table) -> dict[str, str]:
+        """Get columns that have a secondary B-tree index, mapped to the index name."""
+        indexes = await self._get_indexes(table)
+        return {
+            column_name: name
+            for index in indexes
+            if (name := index["name"])
+            and name.startswith(_SECONDARY_INDEX_PREFIX)
+            and isinstance(column_name := index["column_names"][0], str)
+        }
+
+    @require_access_level(AccessLevel.ADMIN)
+    async def create_secondary_index(self, table: Table, column_name: str) -> None:
+        """Create a secondary B-tree index on a column.
+
+        The index covers `(column, created_at, id)`, so it serves equality lookups
+        on the column as well as `list_rows_paginated` sorted by the column.
+        """
+        sanitized_column = self._sanitize_identifier(column_name)
+        column = next((c for c in table.columns if c.name == sanitized_column), None)
+        if column is None:
+            raise ValueError(f"Column '{column_name}' does not exist")
+        await self._create_secondary_index(table.name, sanitized_column, column.type)
+        await self.session.flush()
+
+    @require_access_level(AccessLevel.ADMIN)
+    async def drop_secondary_index(self, table: Table, column_name: str) -> None:
+        """Drop the secondary index of a column, if it has one."""
+        sanitized_column = self._sanitize_identifier(column_name)
+        secondary_indexes = await self.get_secondary_index(table)
+        if index_name := secondary_indexes.get(sanitized_column):
+            await self._drop_index(index_name)
+            await self.session.flush()
+
+    async def _create_secondary_index(
+        self, table_name: str, column_name: str, column_type: str
+    ) -> None:
+        if column_type == SqlType.JSONB.value:
+            raise ValueError("Secondary indexes are not supported on JSONB columns")
+        index_name = self._sanitize_identifier(
+            f"{_SECONDARY_INDEX_PREFIX}{table_name}_{column_name}"
+        )
+        conn = await self.session.connection()
+        await conn.execute(
+            sa.DDL(
+                "CREATE INDEX IF NOT EXISTS %s ON %s (%s, created_at, id)",
+                (index_name, self._full_table_name(table_name), column_name),
+            )
+        )
+
     @require_access_level(AccessLevel.ADMIN)
     async def delete_column(self, column: TableColumn) -> None:
         """Remove a column from an existing table."""
@@ -786,6 +995,111 @@ class BaseTablesService(BaseService):
                 )
                 raise
 
+    @retry(
+        retry=retry_if_exception_type(_RETRYABLE_DB_EXCEPTIONS),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=0.1, min=0.2, max=2),
+        reraise=True,
+    )
+    async def batch_lookup_rows(
+        self,
+        table_name: str,
+        *,
+        columns: Sequence[str],
+        keys: Sequence[Sequence[Any]],
+        limit: int | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """Lookup many key tuples in a table with a single query.
+
+        The keys are sent as one array per column and joined against the table
+        with `unnest(...) WITH ORDINALITY`, so the query plan is the same
+        whether there is one key or thousands.
+
+        Args:
+            table_name: The table to lookup the keys in
+            columns: The columns each key tuple is matched against
+            keys: Key tuples, each with one value per column
+            limit: Maximum number of rows returned per key
+
+        Returns:
+            One list of matching rows per key, in the same order as `keys`.
+            Keys without matches get an empty list.
+        """
+        if not columns:
+            raise ValueError("At least one column is required")
+        if any(len(key) != len(columns) for key in keys):
+            raise ValueError("Each key must have one value per column")
+        if not keys:
+            return []
+
+        table = await self.get_table_by_name(table_name)
+        column_types = {c.name: SqlType(c.type) for c in table.columns}
+        column_types.update(_BUILTIN_COLUMN_TYPES)
+        schema_name = self._get_schema_name()
+        sanitized_table_name = self._sanitize_identifier(table_name)
+
+        arrays: list[str] = []
+        aliases: list[str] = []
+        conditions: list[str] = []
+        params: dict[str, Any] = {}
+        for i, column in enumerate(columns):
+            name = self._sanitize_identifier(column)
+            if (sql_type := column_types.get(name)) is None:
+                raise ValueError(
+                    f"Column '{column}' does not exist in table '{table_name}'"
+                )
+            params[f"k{i}"] = [_coerce_lookup_key(key[i], sql_type) for key in keys]
+            arrays.append(f"CAST(:k{i} AS {sql_type.value}[])")
+            # Sanitized identifiers start with a letter, so these aliases can't collide
+            aliases.append(f"__k{i}")
+            conditions.append(f"t.{name} = k.__k{i}")
+
+        stmt = (
+            f"SELECT k.__key_index, t.* FROM "
+            f'"{schema_name}".{sanitized_table_name} AS t '
+            f"JOIN unnest({', '.join(arrays)}) WITH ORDINALITY "
+            f"AS k({', '.join(aliases)}, __key_index) "
+            f"ON {' AND '.join(conditions)}"
+        )
+        if limit is not None:
+            stmt = (
+                "SELECT * FROM (SELECT s.*, row_number() OVER "
+                f"(PARTITION BY s.__key_index) AS __key_rank FROM ({stmt}) AS s) AS r "
+                "WHERE r.__key_rank <= :limit"
+            )
+            params["limit"] = limit
+
+        conn = await self.session.connection()
+        try:
+            result = await conn.execute(sa.text(stmt), params)
+        except _RETRYABLE_DB_EXCEPTIONS as e:
+            self.logger.warning(
+                "Retryable DB exception occurred",
+                kind=type(e).__name__,
+                error=str(e),
+                table=table_name,
+                schema=schema_name,
+            )
+            await self.session.rollback()
+            raise
+        except ProgrammingError as e:
+            while (cause := e.__cause__) is not None:
+                e = cause
+            if isinstance(e, UndefinedTableError):
+                raise TracecatNotFoundError(
+                    f"Table '{table_name}' does not exist"
+                ) from e
+            raise ValueError(str(e)) from e
+
+        results: list[list[dict[str, Any]]] = [[] for _ in keys]
+        for row in result.mappings().all():
+            data = dict(row)
+            # WITH ORDINALITY counts from 1
+            index = data.pop("__key_index") - 1
+            data.pop("__key_rank", None)
+            results[index].append(data)
+        return results
+
     async def search_rows(
         self,
         table: Table,
@@ -847,24 +1161,35 @@ class BaseTablesService(BaseService):
             if searchable_columns:
                 # Use SQLAlchemy's concat function for proper parameter binding
                 search_pattern = sa.func.concat("%", search_term, "%")
-                search_conditions = []
+                jsonb_columns = {
+                    c.name for c in table.columns if c.type == SqlType.JSONB.value
+                }
+                search_exprs = []
                 for col_name in searchable_columns:
                     sanitized_col = self._sanitize_identifier(col_name)
-                    if col_name in [
-                        c.name for c in table.columns if c.type == SqlType.JSONB.value
-                    ]:
+                    if col_name in jsonb_columns:
                         # For JSONB columns, convert to text for searching
-                        search_conditions.append(
-                            sa.func.cast(sa.column(sanitized_col), sa.TEXT).ilike(
-                                search_pattern
-                            )
+                        search_exprs.append(
+                            sa.func.cast(sa.column(sanitized_col), sa.TEXT)
                         )
                     else:
                         # For TEXT columns, search directly
-                        search_conditions.append(
-                            sa.column(sanitized_col).ilike(search_pattern)
-                        )
-                where_conditions.append(sa.or_(*search_conditions))
+                        search_exprs.append(sa.column(sanitized_col))
+                # ILIKE with a wildcard pattern is served by trigram search indexes
+                where_conditions.append(
+                    sa.or_(*(expr.ilike(search_pattern) for expr in search_exprs))
+                )
+                # Rank the best matching rows first
+                rank = sa.func.greatest(
+                    *(
+                        sa.func.word_similarity(search_term, expr)
+                        for expr in search_exprs
+                    )
+                )
+                # Break ties so rows with equal rank keep their place across pages
+                stmt = stmt.order_by(
+                    rank.desc(), sa.column("created_at").desc(), sa.column("id").desc()
+                )
             else:
                 # No searchable columns found, search_term will have no effect
                 self.logger.warning(
@@ -923,6 +1248,8 @@ class BaseTablesService(BaseService):
         end_time: datetime | None = None,
         updated_before: datetime | None = None,
         updated_after: datetime | None = None,
+        order_by: str | None = None,
+        sort: Literal["asc", "desc"] | None = None,
     ) -> CursorPaginatedResponse[dict[str, Any]]:
         """List rows in a table with cursor-based pagination.
 
@@ -934,6 +1261,8 @@ class BaseTablesService(BaseService):
             end_time: Filter records created before this time
             updated_before: Filter records updated before this time
             updated_after: Filter records updated after this time
+            order_by: Column to order the rows by. Defaults to `created_at`.
+            sort: Direction to sort (asc or desc). Defaults to desc.
 
         Returns:
             Cursor paginated response with matching rows
@@ -946,6 +1275,22 @@ class BaseTablesService(BaseService):
         sanitized_table_name = self._sanitize_identifier(table.name)
         conn = await self.session.connection()
 
+        # Ties on the sort column are broken by (created_at, id)
+        sort_column: str | None = None
+        sort_type: SqlType | None = None
+        if order_by is not None and order_by != "created_at":
+            sort_column = self._sanitize_identifier(order_by)
+            column_types = {c.name: SqlType(c.type) for c in table.columns}
+            column_types.update(_BUILTIN_COLUMN_TYPES)
+            if (sort_type := column_types.get(sort_column)) is None:
+                raise ValueError(
+                    f"Column '{order_by}' does not exist in table '{table.name}'"
+                )
+            if sort_type == SqlType.JSONB:
+                raise ValueError("Cannot sort rows by a JSONB column")
+        sort_col = sa.column(sort_column) if sort_column else None
+        descending = sort != "asc"
+
         # Build the base query
         stmt = sa.select(sa.text("*")).select_from(
             sa.table(sanitized_table_name, schema=schema_name)
@@ -972,24 +1317,24 @@ class BaseTablesService(BaseService):
             if searchable_columns:
                 # Use SQLAlchemy's concat function for proper parameter binding
                 search_pattern = sa.func.concat("%", search_term, "%")
-                search_conditions = []
+                jsonb_columns = {
+                    c.name for c in table.columns if c.type == SqlType.JSONB.value
+                }
+                search_exprs = []
                 for col_name in searchable_columns:
                     sanitized_col = self._sanitize_identifier(col_name)
-                    if col_name in [
-                        c.name for c in table.columns if c.type == SqlType.JSONB.value
-                    ]:
+                    if col_name in jsonb_columns:
                         # For JSONB columns, convert to text for searching
-                        search_conditions.append(
-                            sa.func.cast(sa.column(sanitized_col), sa.TEXT).ilike(
-                                search_pattern
-                            )
+                        search_exprs.append(
+                            sa.func.cast(sa.column(sanitized_col), sa.TEXT)
                         )
                     else:
                         # For TEXT columns, search directly
-                        search_conditions.append(
-                            sa.column(sanitized_col).ilike(search_pattern)
-                        )
-                where_conditions.append(sa.or_(*search_conditions))
+                        search_exprs.append(sa.column(sanitized_col))
+                # ILIKE with a wildcard pattern is served by trigram search indexes
+                where_conditions.append(
+                    sa.or_(*(expr.ilike(search_pattern) for expr in search_exprs))
+                )
             else:
                 # No searchable columns found, search_term will have no effect
                 self.logger.warning(
@@ -1020,41 +1365,36 @@ class BaseTablesService(BaseService):
                 cursor_data = BaseCursorPaginator.decode_cursor(params.cursor)
             except Exception as e:
                 raise ValueError(f"Invalid cursor: {e}") from e
+            if cursor_data.sort_column != sort_column:
+                raise ValueError("Cursor does not match the requested sort order")
 
             # Apply cursor filtering for table rows
-            cursor_time = cursor_data.created_at
-            cursor_id = UUID(cursor_data.id)
-
-            if params.reverse:
-                # For reverse pagination (going backwards)
-                stmt = stmt.where(
-                    sa.or_(
-                        sa.column("created_at") > cursor_time,
-                        sa.and_(
-                            sa.column("created_at") == cursor_time,
-                            sa.column("id") > cursor_id,
-                        ),
-                    )
-                )
-            else:
-                # For forward pagination (going forwards)
-                stmt = stmt.where(
-                    sa.or_(
-                        sa.column("created_at") < cursor_time,
-                        sa.and_(
-                            sa.column("created_at") == cursor_time,
-                            sa.column("id") < cursor_id,
-                        ),
-                    )
+            sort_value = cursor_data.sort_value
+            if sort_type is not None:
+                sort_value = _coerce_lookup_key(sort_value, sort_type)
+            stmt = stmt.where(
+                BaseCursorPaginator.keyset_predicate(
+                    sa.column("created_at"),
+                    sa.column("id"),
+                    cursor_data,
+                    sort_column=sort_col,
+                    sort_value=sort_value,
+                    descending=descending,
+                    reverse=params.reverse,
                 )
+            )
 
         # Apply consistent ordering for cursor pagination
-        if params.reverse:
-            # For reverse pagination, use ASC ordering
-            stmt = stmt.order_by(sa.column("created_at").asc(), sa.column("id").asc())
-        else:
-            # For forward pagination, use DESC ordering (newest first)
-            stmt = stmt.order_by(sa.column("created_at").desc(), sa.column("id").desc())
+        # Reverse pagination walks the same order backwards
+        stmt = stmt.order_by(
+            *BaseCursorPaginator.keyset_order_by(
+                sa.column("created_at"),
+                sa.column("id"),
+                sort_column=sort_col,
+                descending=descending,
+                reverse=params.reverse,
+            )
+        )
 
         # Fetch limit + 1 to determine if there are more items
         stmt = stmt.limit(params.limit + 1)
@@ -1094,14 +1434,20 @@ class BaseTablesService(BaseService):
                 # Generate next cursor from the last item
                 last_item = rows[-1]
                 next_cursor = BaseCursorPaginator.encode_cursor(
-                    last_item["created_at"], last_item["id"]
+                    last_item["created_at"],
+                    last_item["id"],
+                    sort_column=sort_column,
+                    sort_value=last_item[sort_column] if sort_column else None,
                 )
 
             if params.cursor:
                 # If we used a cursor to get here, we can go back
                 first_item = rows[0]
                 prev_cursor = BaseCursorPaginator.encode_cursor(
-                    first_item["created_at"], first_item["id"]
+                    first_item["created_at"],
+                    first_item["id"],
+                    sort_column=sort_column,
+                    sort_value=first_item[sort_column] if sort_column else None,
                 )
 
         # If we were doing reverse pagination, swap the cursors and reverse items
@@ -1171,6 +1517,46 @@ class BaseTablesService(BaseService):
         except Exception as e:
             raise DBAPIError("Failed to insert batch", str(e), e) from e
 
+    async def copy_rows(
+        self,
+        table: Table,
+        columns: Sequence[str],
+        records: Iterable[Sequence[Any]],
+    ) -> int:
+        """Bulk load rows into the table with the Postgres COPY protocol.
+
+        Values are sent in binary form without per-value parameter binding, so
+        this is much faster than `batch_insert_rows` for large imports. Values
+        must already have the Python type asyncpg expects for each column's
+        SQL type (see `tracecat.tables.common.to_copy_value`).
+
+        Args:
+            table: The table to insert into
+            columns: Names of the columns each record provides values for
+            records: Rows of values, in the same order as `columns`
+
+        Returns:
+            Number of rows inserted
+
+        Raises:
+            DBAPIError: If there's a database error during the copy
+        """
+        conn = await self.session.connection()
+        raw_conn = await conn.get_raw_connection()
+        # The asyncpg connection underneath SQLAlchemy's adapter
+        driver_conn = cast(asyncpg.Connection, raw_conn.driver_connection)
+        try:
+            status = await driver_conn.copy_records_to_table(
+                self._sanitize_identifier(table.name),
+                records=records,
+                columns=[self._sanitize_identifier(c) for c in columns],
+                schema_name=self._get_schema_name(),
+            )
+        except Exception as e:
+            raise DBAPIError("Failed to copy rows", str(e), e) from e
+        # The status string has the form "COPY <count>"
+        return int(status.rsplit(" ", 1)[-1])
+
 
 class TablesService(BaseTablesService):
     """Transactional tables service."""
@@ -3,7 +3,7 @@
 import base64
 import json
 from datetime import datetime
-from typing import TypeVar
+from typing import Any, TypeVar
 from uuid import UUID
 
 import sqlalchemy as sa
@@ -43,6 +43,8 @@ class CursorData(BaseModel):
 
     created_at: datetime
     id: str
+    sort_column: str | None = None
+    sort_value: Any = None
 
 
 class BaseCursorPaginator:
@@ -52,9 +54,24 @@ class BaseCursorPaginator:
         self.session = session
 
     @staticmethod
-    def encode_cursor(created_at: datetime, id: UUID | str) -> str:
-        """Encode a cursor from timestamp and ID."""
-        cursor_data = CursorData(created_at=created_at, id=str(id))
+    def encode_cursor(
+        created_at: datetime,
+        id: UUID | str,
+        *,
+        sort_column: str | None = None,
+        sort_value: Any = None,
+    ) -> str:
+        """Encode a cursor from timestamp and ID.
+
+        When paginating by another column, its name and value at the cursor
+        position are encoded as well.
+        """
+        cursor_data = CursorData(
+            created_at=created_at,
+            id=str(id),
+            sort_column=sort_column,
+            sort_value=sort_value,
+        )
         json_str = cursor_data.model_dump_json()
         return base64.urlsafe_b64encode(json_str.encode()).decode()
 
@@ -68,6 +85,78 @@ class BaseCursorPaginator:
         except Exception as e:
             raise ValueError(f"Invalid cursor format: {e}") from e
 
+    @staticmethod
+    def keyset_order_by(
+        created_at: sa.ColumnElement[Any],
+        id: sa.ColumnElement[Any],
+        *,
+        sort_column: sa.ColumnElement[Any] | None = None,
+        descending: bool = True,
+        reverse: bool = False,
+    ) -> list[sa.UnaryExpression[Any]]:
+        """Build the ORDER BY clause for keyset pagination.
+
+        Rows are ordered by the sort column (if any), then `created_at` and `id`
+        as tie breakers. All keys share one direction so that a B-tree index on
+        `(sort_column, created_at, id)` can serve the query in either direction.
+        """
+        keys = (
+            [created_at, id] if sort_column is None else [sort_column, created_at, id]
+        )
+        if descending == reverse:
+            return [key.asc() for key in keys]
+        return [key.desc() for key in keys]
+
+    @staticmethod
+    def keyset_predicate(
+        created_at: sa.ColumnElement[Any],
+        id: sa.ColumnElement[Any],
+        cursor: CursorData,
+        *,
+        sort_column: sa.ColumnElement[Any] | None = None,
+        sort_value: Any = None,
+        descending: bool = True,
+        reverse: bool = False,
+    ) -> sa.ColumnElement[bool]:
+        """Build the WHERE clause selecting the rows after the cursor.
+
+        The predicate matches the order of `keyset_order_by`. NULL sort values
+        are ordered as Postgres does by default: last when ascending and first
+        when descending.
+
+        Args:
+            created_at: The creation timestamp column
+            id: The ID column
+            cursor: The decoded cursor
+            sort_column: The column to paginate by, if not `created_at`
+            sort_value: The value of the sort column at the cursor, converted
+                to the column's Python type
+            descending: Whether the sort order is descending
+            reverse: Whether to walk the pages backwards
+        """
+        cursor_key = sa.tuple_(
+            sa.literal(cursor.created_at), sa.literal(UUID(cursor.id))
+        )
+        row_key = sa.tuple_(created_at, id)
+        increasing = descending == reverse
+        tie = row_key > cursor_key if increasing else row_key < cursor_key
+        if sort_column is None:
+            return tie
+        if sort_value is None:
+            if increasing:
+                return sa.and_(sort_column.is_(None), tie)
+            return sa.or_(sa.and_(sort_column.is_(None), tie), sort_column.is_not(None))
+        if increasing:
+            return sa.or_(
+                sort_column > sort_value,
+                sa.and_(sort_column == sort_value, tie),
+                sort_column.is_(None),
+            )
+        return sa.or_(
+            sort_column < sort_value,
+            sa.and_(sort_column == sort_value, tie),
+        )
+
     async def get_table_row_estimate(
         self, table_name: str, schema_name: str = "public"
     ) -> int | None:
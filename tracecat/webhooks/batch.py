@@ -0,0 +1,226 @@
+"""Bulk dispatch of NDJSON webhook payloads."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from temporalio.exceptions import WorkflowAlreadyStartedError
+from temporalio.service import RPCError, RPCStatusCode
+
+from tracecat import config
+from tracecat.cache import TTLCache
+from tracecat.dsl.common import DSLInput
+from tracecat.identifiers.resource import ResourcePrefix, generate_resource_id
+from tracecat.identifiers.workflow import WorkflowID, generate_exec_id
+from tracecat.logger import logger
+from tracecat.webhooks.models import WebhookBatchRead, WebhookBatchRecord
+from tracecat.workflow.executions.enums import TriggerType
+from tracecat.workflow.executions.service import WorkflowExecutionsService
+
+BACKPRESSURE_STATUSES = frozenset(
+    {
+        RPCStatusCode.RESOURCE_EXHAUSTED,
+        RPCStatusCode.UNAVAILABLE,
+        RPCStatusCode.DEADLINE_EXCEEDED,
+    }
+)
+"""Temporal RPC statuses that signal the cluster is overloaded and the start should be retried."""
+
+MAX_START_ATTEMPTS = 5
+
+
+class AdaptiveRateLimiter:
+    """Token bucket whose refill rate adapts to backpressure.
+
+    The rate grows additively with every accepted request and halves on every
+    rejected one (AIMD), so a batch converges on the rate the cluster sustains.
+    """
+
+    def __init__(
+        self, rate: float, *, min_rate: float = 1.0, max_rate: float | None = None
+    ):
+        """
+        Args:
+            rate: The initial rate at which tokens are added (tokens per second)
+            min_rate: The rate never drops below this value
+            max_rate: The rate never grows above this value. Defaults to `rate`.
+        """
+        self.min_rate = min_rate
+        self.max_rate = max(max_rate or rate, min_rate)
+        self.rate = min(max(rate, min_rate), self.max_rate)
+        self.tokens = 1.0
+        self.last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it."""
+        async with self._lock:
+            self._refill()
+            while self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= 1
+
+    def on_success(self) -> None:
+        """Additively increase the rate after an accepted request."""
+        self.rate = min(self.rate + 1, self.max_rate)
+
+    def on_backpressure(self) -> None:
+        """Halve the rate and drain the bucket after a rejected request."""
+        self.rate = max(self.rate / 2, self.min_rate)
+        self.tokens = min(self.tokens, 0.0)
+
+    def _refill(self) -> None:
+        # Allow bursts of up to one second's worth of tokens
+        now = time.monotonic()
+        elapsed = now - self.last_refill
+        self.tokens = min(max(self.rate, 1.0), self.tokens + elapsed * self.rate)
+        self.last_refill = now
+
+
+@dataclass
+class WebhookBatch:
+    """Dispatch state of an NDJSON webhook batch."""
+
+    batch_id: str
+    wf_id: WorkflowID
+    records: list[WebhookBatchRecord]
+    task: asyncio.Task[None] | None = field(default=None, repr=False)
+
+    def to_read(self) -> WebhookBatchRead:
+        counts = {"pending": 0, "started": 0, "failed": 0}
+        for record in self.records:
+            counts[record.status] += 1
+        return WebhookBatchRead(
+            batch_id=self.batch_id,
+            wf_id=self.wf_id,
+            total=len(self.records),
+            records=[record.model_copy() for record in self.records],
+            **counts,
+        )
+
+
+webhook_batch_cache: TTLCache[str, WebhookBatch] = TTLCache(
+    maxsize=config.TRACECAT__WEBHOOK_CACHE_SIZE,
+    ttl=config.TRACECAT__WEBHOOK_BATCH_TTL,
+)
+"""NDJSON webhook batches of this process, keyed by batch ID."""
+
+_running_batches: set[asyncio.Task[None]] = set()
+"""Strong references to in-flight batch dispatches, so they aren't garbage collected."""
+
+
+def create_webhook_batch(
+    service: WorkflowExecutionsService,
+    *,
+    dsl: DSLInput,
+    wf_id: WorkflowID,
+    payloads: list[Any],
+    trigger_type: TriggerType = TriggerType.WEBHOOK,
+) -> WebhookBatch:
+    """Assign execution IDs to every record and dispatch the batch in the background.
+
+    Returns immediately. The batch can be looked up in `webhook_batch_cache`
+    to poll the status of each record.
+    """
+    batch = WebhookBatch(
+        batch_id=generate_resource_id(ResourcePrefix.WEBHOOK_BATCH),
+        wf_id=wf_id,
+        records=[
+            WebhookBatchRecord(index=i, wf_exec_id=generate_exec_id(wf_id))
+            for i in range(len(payloads))
+        ],
+    )
+    webhook_batch_cache.set(batch.batch_id, batch)
+    task = asyncio.create_task(
+        dispatch_webhook_batch(
+            service, batch, dsl=dsl, payloads=payloads, trigger_type=trigger_type
+        )
+    )
+    _running_batches.add(task)
+    task.add_done_callback(_running_batches.discard)
+    batch.task = task
+    return batch
+
+
+async def dispatch_webhook_batch(
+    service: WorkflowExecutionsService,
+    batch: WebhookBatch,
+    *,
+    dsl: DSLInput,
+    payloads: list[Any],
+    trigger_type: TriggerType = TriggerType.WEBHOOK,
+    concurrency: int | None = None,
+    limiter: AdaptiveRateLimiter | None = None,
+) -> None:
+    """Start one workflow execution per record with bounded concurrency.
+
+    Starts are admitted through an adaptive rate limiter. Starts rejected because
+    Temporal is overloaded are retried after backing off, and any other failure
+    is recorded against the record.
+    """
+    limiter = limiter or AdaptiveRateLimiter(
+        config.TRACECAT__WEBHOOK_BATCH_START_RATE,
+        max_rate=config.TRACECAT__WEBHOOK_BATCH_MAX_RATE,
+    )
+    queue: asyncio.Queue[WebhookBatchRecord] = asyncio.Queue()
+    for record in batch.records:
+        queue.put_nowait(record)
+
+    async def start(record: WebhookBatchRecord) -> None:
+        for attempt in range(1, MAX_START_ATTEMPTS + 1):
+            await limiter.acquire()
+            try:
+                await service.start_workflow_execution(
+                    dsl=dsl,
+                    wf_id=batch.wf_id,
+                    wf_exec_id=record.wf_exec_id,
+                    payload=payloads[record.index],
+                    trigger_type=trigger_type,
+                )
+            except WorkflowAlreadyStartedError:
+                # A previous attempt timed out after Temporal accepted it
+                pass
+            except RPCError as e:
+                if e.status in BACKPRESSURE_STATUSES and attempt < MAX_START_ATTEMPTS:
+                    limiter.on_backpressure()
+                    logger.info(
+                        "Temporal backpressure, retrying workflow start",
+                        batch_id=batch.batch_id,
+                        wf_exec_id=record.wf_exec_id,
+                        rate=limiter.rate,
+                        attempt=attempt,
+                    )
+                    continue
+                raise
+            limiter.on_success()
+            record.status = "started"
+            return
+
+    async def worker() -> None:
+        while not queue.empty():
+            record = queue.get_nowait()
+            try:
+                await start(record)
+            except Exception as e:
+                logger.warning(
+                    "Failed to start workflow for batch record",
+                    batch_id=batch.batch_id,
+                    wf_exec_id=record.wf_exec_id,
+                    error=str(e),
+                )
+                record.status = "failed"
+                record.error = str(e)
+
+    n_workers = min(
+        concurrency or config.TRACECAT__WEBHOOK_BATCH_CONCURRENCY, queue.qsize()
+    )
+    async with asyncio.TaskGroup() as tg:
+        for _ in range(n_workers):
+            tg.create_task(worker())
+    logger.info(
+        "Webhook batch dispatched", **batch.to_read().model_dump(exclude={"records"})
+    )
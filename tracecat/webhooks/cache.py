@@ -0,0 +1,47 @@
+"""Per-process caches for the webhook ingress path."""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+from tracecat import config
+from tracecat.cache import TTLCache
+from tracecat.dsl.common import DSLInput
+from tracecat.identifiers import WorkspaceID
+from tracecat.identifiers.workflow import WorkflowID
+
+
+class CachedWebhook(NamedTuple):
+    """The webhook fields needed to authorize an incoming request."""
+
+    owner_id: WorkspaceID
+    secret: str
+    status: str
+    normalized_methods: tuple[str, ...]
+
+
+webhook_cache: TTLCache[WorkflowID, CachedWebhook] = TTLCache(
+    maxsize=config.TRACECAT__WEBHOOK_CACHE_SIZE,
+    ttl=config.TRACECAT__WEBHOOK_CACHE_TTL,
+)
+"""Validated webhooks, keyed by workflow ID."""
+
+latest_definition_version_cache: TTLCache[WorkflowID, int] = TTLCache(
+    maxsize=config.TRACECAT__WEBHOOK_CACHE_SIZE,
+    ttl=config.TRACECAT__WEBHOOK_CACHE_TTL,
+)
+"""Latest committed workflow definition version, keyed by workflow ID."""
+
+dsl_input_cache: TTLCache[tuple[WorkflowID, int], DSLInput] = TTLCache(
+    maxsize=config.TRACECAT__WEBHOOK_CACHE_SIZE
+)
+"""Validated DSL inputs, keyed by (workflow ID, definition version).
+
+Definition versions are immutable once committed, so entries never go stale.
+"""
+
+
+def invalidate_webhook_cache(workflow_id: WorkflowID) -> None:
+    """Drop the cached webhook and latest definition version for a workflow."""
+    webhook_cache.pop(workflow_id)
+    latest_definition_version_cache.pop(workflow_id)
@@ -10,6 +10,7 @@ from sqlmodel import col, select
 from tracecat.contexts import ctx_role
 from tracecat.db.engine import get_async_session_context_manager
 from tracecat.db.schemas import Webhook, WorkflowDefinition
+from tracecat.dsl.common import DSLInput
 from tracecat.dsl.models import TriggerInputs
 from tracecat.ee.interactions.connectors import parse_slack_interaction_input
 from tracecat.ee.interactions.enums import InteractionCategory
@@ -17,9 +18,61 @@ from tracecat.ee.interactions.models import InteractionInput
 from tracecat.identifiers.workflow import AnyWorkflowIDPath
 from tracecat.logger import logger
 from tracecat.types.auth import Role
+from tracecat.webhooks.cache import (
+    CachedWebhook,
+    dsl_input_cache,
+    latest_definition_version_cache,
+    webhook_cache,
+)
 from tracecat.webhooks.models import NDJSON_CONTENT_TYPES
 
 
+async def validate_webhook_secret(
+    workflow_id: AnyWorkflowIDPath, secret: str
+) -> CachedWebhook:
+    """Authenticate a request against the workflow's webhook secret.
+
+    Sets the service role for the webhook's workspace.
+    """
+    if (webhook := webhook_cache.get(workflow_id)) is None:
+        async with get_async_session_context_manager() as session:
+            result = await session.exec(
+                select(Webhook).where(Webhook.workflow_id == workflow_id)
+            )
+            try:
+                # One webhook per workflow
+                record = result.one()
+            except NoResultFound as e:
+                logger.info("Webhook does not exist")
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Unauthorized webhook request",
+                ) from e
+            webhook = CachedWebhook(
+                owner_id=record.owner_id,
+                secret=record.secret,
+                status=record.status,
+                normalized_methods=record.normalized_methods,
+            )
+        webhook_cache.set(workflow_id, webhook)
+
+    if secret != webhook.secret:
+        logger.warning("Secret does not match")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Unauthorized webhook request",
+        )
+
+    ctx_role.set(
+        Role(
+            type="service",
+            workspace_id=webhook.owner_id,
+            service_id="tracecat-runner",
+        )
+    )
+    return webhook
+
+
 async def validate_incoming_webhook(
     workflow_id: AnyWorkflowIDPath, secret: str, request: Request
 ) -> None:
@@ -27,55 +80,39 @@ async def validate_incoming_webhook(
 
     NOte: The webhook ID here is the workflow ID.
     """
-    async with get_async_session_context_manager() as session:
-        result = await session.exec(
-            select(Webhook).where(Webhook.workflow_id == workflow_id)
-        )
-        try:
-            # One webhook per workflow
-            webhook = result.one()
-        except NoResultFound as e:
-            logger.info("Webhook does not exist")
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Unauthorized webhook request",
-            ) from e
-
-        if secret != webhook.secret:
-            logger.warning("Secret does not match")
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Unauthorized webhook request",
-            )
-
-        # If we're here, the webhook has been validated
-        if webhook.status == "offline":
-            logger.info("Webhook is offline")
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Webhook is offline",
-            )
+    webhook = await validate_webhook_secret(workflow_id, secret)
 
-        if request.method.lower() not in webhook.normalized_methods:
-            logger.info("Method does not match")
-            raise HTTPException(
-                status_code=status.HTTP_405_METHOD_NOT_ALLOWED,
-                detail="Request method not allowed",
-            ) from None
-
-        ctx_role.set(
-            Role(
-                type="service",
-                workspace_id=webhook.owner_id,
-                service_id="tracecat-runner",
-            )
+    # If we're here, the webhook has been validated
+    if webhook.status == "offline":
+        logger.info("Webhook is offline")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Webhook is offline",
         )
 
+    if request.method.lower() not in webhook.normalized_methods:
+        logger.info("Method does not match")
+        raise HTTPException(
+            status_code=status.HTTP_405_METHOD_NOT_ALLOWED,
+            detail="Request method not allowed",
+        ) from None
+
 
 async def validate_workflow_definition(
     workflow_id: AnyWorkflowIDPath,
-) -> WorkflowDefinition:
-    # Reaching here means the webhook is online and connected to an entrypoint
+) -> DSLInput:
+    """Return the validated DSL of the latest workflow definition.
+
+    Reaching here means the webhook is online and connected to an entrypoint.
+    A hot webhook is served from the per-process caches without touching the
+    database or re-validating the DSL.
+    """
+    version = latest_definition_version_cache.get(workflow_id)
+    if (
+        version is not None
+        and (dsl := dsl_input_cache.get((workflow_id, version))) is not None
+    ):
+        return dsl
 
     # Match the webhook id with the workflow id and get the latest version
     # of the workflow defitniion.
@@ -93,10 +130,16 @@ async def validate_workflow_definition(
                 detail="No workflow definition found for workflow ID."
                 " Please commit your changes to the workflow and try again.",
             )
+        version = defn.version
+        content = defn.content
 
-        # If we are here, all checks have passed
-        validated_defn = WorkflowDefinition.model_validate(defn)
-        return validated_defn
+    # If we are here, all checks have passed
+    key = (workflow_id, version)
+    if (dsl := dsl_input_cache.get(key)) is None:
+        dsl = DSLInput(**content)
+        dsl_input_cache.set(key, dsl)
+    latest_definition_version_cache.set(workflow_id, version)
+    return dsl
 
 
 def parse_content_type(content_type: str) -> tuple[str, dict[str, str]]:
@@ -202,6 +245,4 @@ def parse_interaction_payload(
 
 
 PayloadDep = Annotated[TriggerInputs | None, Depends(parse_webhook_payload)]
-ValidWorkflowDefinitionDep = Annotated[
-    WorkflowDefinition, Depends(validate_workflow_definition)
-]
+ValidWorkflowDefinitionDep = Annotated[DSLInput, Depends(validate_workflow_definition)]
@@ -3,7 +3,7 @@ from typing import Any, Literal
 from pydantic import BaseModel, Field
 
 from tracecat.db.schemas import Resource
-from tracecat.identifiers.workflow import WorkflowID
+from tracecat.identifiers.workflow import WorkflowExecutionID, WorkflowID
 
 # API Models
 
@@ -41,3 +41,23 @@ class WebhookUpdate(BaseModel):
     status: WebhookStatus | None = None
     methods: list[WebhookMethod] | None = None
     entrypoint_ref: str | None = None
+
+
+type WebhookBatchRecordStatus = Literal["pending", "started", "failed"]
+
+
+class WebhookBatchRecord(BaseModel):
+    index: int = Field(..., description="Position of the record in the NDJSON body")
+    wf_exec_id: WorkflowExecutionID
+    status: WebhookBatchRecordStatus = "pending"
+    error: str | None = None
+
+
+class WebhookBatchRead(BaseModel):
+    batch_id: str
+    wf_id: WorkflowID
+    total: int
+    pending: int
+    started: int
+    failed: int
+    records: list[WebhookBatchRecord]
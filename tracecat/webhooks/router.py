@@ -1,4 +1,3 @@
-from itertools import batched
 from typing import Annotated, Any, TypedDict
 
 from fastapi import (
@@ -13,23 +12,23 @@ from fastapi import (
 )
 from temporalio.service import RPCError
 
-from tracecat.concurrency import cooperative
 from tracecat.contexts import ctx_role
 from tracecat.dsl.client import get_temporal_client
-from tracecat.dsl.common import DSLInput
 from tracecat.dsl.workflow import DSLWorkflow
 from tracecat.ee.interactions.enums import InteractionCategory
 from tracecat.ee.interactions.models import InteractionInput
-from tracecat.identifiers.workflow import AnyWorkflowIDPath, generate_exec_id
+from tracecat.identifiers.workflow import AnyWorkflowIDPath
 from tracecat.logger import logger
+from tracecat.webhooks.batch import create_webhook_batch, webhook_batch_cache
 from tracecat.webhooks.dependencies import (
     PayloadDep,
     ValidWorkflowDefinitionDep,
     parse_content_type,
     parse_interaction_payload,
     validate_incoming_webhook,
+    validate_webhook_secret,
 )
-from tracecat.webhooks.models import NDJSON_CONTENT_TYPES
+from tracecat.webhooks.models import NDJSON_CONTENT_TYPES, WebhookBatchRead
 from tracecat.workflow.executions.enums import TriggerType
 from tracecat.workflow.executions.models import (
     ReceiveInteractionResponse,
@@ -43,6 +42,12 @@ router = APIRouter(
     dependencies=[Depends(validate_incoming_webhook)],
 )
 
+batch_router = APIRouter(
+    prefix="/webhooks/{workflow_id}/{secret}/batches",
+    tags=["public"],
+    dependencies=[Depends(validate_webhook_secret)],
+)
+
 
 class OktaVerificationResponse(TypedDict):
     verification: str
@@ -54,7 +59,7 @@ class OktaVerificationResponse(TypedDict):
 async def incoming_webhook(
     *,
     workflow_id: AnyWorkflowIDPath,
-    defn: ValidWorkflowDefinitionDep,
+    dsl_input: ValidWorkflowDefinitionDep,
     payload: PayloadDep,
     echo: bool = Query(default=False, description="Echo back to the caller"),
     empty_echo: bool = Query(
@@ -76,32 +81,26 @@ async def incoming_webhook(
     logger.info("Webhook hit", path=workflow_id, role=ctx_role.get())
     logger.trace("Webhook payload", payload=payload)
 
-    dsl_input = DSLInput(**defn.content)
-
     service = await WorkflowExecutionsService.connect()
-    # If this was a ndjson, automatically batch the requests
-    # This is a workaround for the fact that Temporal doesn't support batching
-    # of webhook requests
+    # If this was a ndjson, start one execution per record
     mime_type = parse_content_type(content_type)[0] if content_type else ""
-    if mime_type in NDJSON_CONTENT_TYPES and isinstance(payload, list):
-        one_response = None
-        # Slow release to avoid overwhelming the system
-        async for p in cooperative(batched(payload, 8), delay=2):
-            one_response = service.create_workflow_execution_nowait(
-                dsl=dsl_input,
-                wf_id=workflow_id,
-                payload=p,
-                trigger_type=TriggerType.WEBHOOK,
-            )
-        # Currently just return the last response's wf_exec_id
+    if mime_type in NDJSON_CONTENT_TYPES and isinstance(payload, list) and payload:
+        # Start one execution per record in the background. The execution IDs
+        # of every record can be polled through the batch ID.
+        batch = create_webhook_batch(
+            service,
+            dsl=dsl_input,
+            wf_id=workflow_id,
+            payloads=payload,
+            trigger_type=TriggerType.WEBHOOK,
+        )
+        # Return the last record's wf_exec_id for backwards compatibility
         response = WorkflowExecutionCreateResponse(
-            message="Workflow execution created",
+            message="Workflow executions created",
             wf_id=workflow_id,
-            wf_exec_id=one_response["wf_exec_id"]
-            if one_response
-            else generate_exec_id(workflow_id),  # This should never happen
+            wf_exec_id=batch.records[-1].wf_exec_id,
+            batch_id=batch.batch_id,
         )
-
     else:
         response = service.create_workflow_execution_nowait(
             dsl=dsl_input,
@@ -140,7 +139,7 @@ async def incoming_webhook(
 @router.post("/wait")
 async def incoming_webhook_wait(
     workflow_id: AnyWorkflowIDPath,
-    defn: ValidWorkflowDefinitionDep,
+    dsl_input: ValidWorkflowDefinitionDep,
     payload: PayloadDep,
 ) -> Any:
     """Webhook endpoint to trigger a workflow.
@@ -151,8 +150,6 @@ async def incoming_webhook_wait(
     logger.info("Webhook hit", path=workflow_id, role=ctx_role.get())
     logger.trace("Webhook payload", payload=payload)
 
-    dsl_input = DSLInput(**defn.content)
-
     service = await WorkflowExecutionsService.connect()
     response = await service.create_workflow_execution(
         dsl=dsl_input,
@@ -218,3 +215,20 @@ async def receive_interaction(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to process interaction: {str(e)}",
         ) from e
+
+
+@batch_router.get("/{batch_id}")
+async def get_webhook_batch(
+    workflow_id: AnyWorkflowIDPath, batch_id: str
+) -> WebhookBatchRead:
+    """Get the dispatch status and execution IDs of an NDJSON webhook batch.
+
+    Batches are tracked by the API process that received them and expire after
+    `TRACECAT__WEBHOOK_BATCH_TTL` seconds.
+    """
+    batch = webhook_batch_cache.get(batch_id)
+    if batch is None or batch.wf_id != workflow_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Webhook batch not found"
+        )
+    return batch.to_read()
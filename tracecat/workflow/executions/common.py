@@ -6,6 +6,7 @@ from temporalio.api.enums.v1 import EventType
 from temporalio.api.history.v1 import HistoryEvent
 
 from tracecat.dsl.compression import get_compression_payload_codec
+from tracecat.dsl.offload import get_offload_payload_codec
 from tracecat.ee.interactions.service import InteractionService
 from tracecat.identifiers import UserID, WorkflowID
 from tracecat.logger import logger
@@ -77,6 +78,7 @@ UTILITY_ACTIONS = {
     "validate_action_activity",
     "parse_wait_until_activity",
     "evaluate_single_expression_activity",
+    "resolve_workflow_definition_activity",
     WorkflowsManagementService.resolve_workflow_alias_activity.__name__,
     WorkflowsManagementService.get_error_handler_workflow_id.__name__,
     InteractionService.create_interaction_activity.__name__,
@@ -151,11 +153,14 @@ async def extract_payload(
     payload: temporalio.api.common.v1.Payloads, index: int = 0
 ) -> Any:
     """Extract the first payload from a workflow history event."""
-    # Always call the decoder. It will return the original payload if it's not compressed.
+    # Always call the decoders. They return the original payload if it's not
+    # offloaded or compressed.
     # This enables backwards compatibility of newer payloads with older clients.
-    codec = get_compression_payload_codec()
-    decompressed_payload = await codec.decode(payload.payloads)
-    raw_data = decompressed_payload[index].data
+    # Only the requested payload is decoded, so claim checks of the others are
+    # never fetched from blob storage.
+    fetched = await get_offload_payload_codec().decode([payload.payloads[index]])
+    decompressed_payload = await get_compression_payload_codec().decode(fetched)
+    raw_data = decompressed_payload[0].data
     try:
         return orjson.loads(raw_data)
     except orjson.JSONDecodeError as e:
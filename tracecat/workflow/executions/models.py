@@ -488,6 +488,8 @@ class WorkflowExecutionCreateResponse(TypedDict):
     wf_exec_id: WorkflowExecutionID
     payload: NotRequired[Any]
     """The HTTP request body of the request that triggered the workflow."""
+    batch_id: NotRequired[str]
+    """The ID of the NDJSON batch this execution belongs to, if any."""
 
 
 class WorkflowDispatchResponse(TypedDict):
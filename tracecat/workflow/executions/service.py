@@ -629,15 +629,48 @@ class WorkflowExecutionsService:
             trigger_type=trigger_type,
         )
 
-    async def _dispatch_workflow(
+    async def start_workflow_execution(
         self,
         dsl: DSLInput,
+        *,
         wf_id: WorkflowID,
         wf_exec_id: WorkflowExecutionID,
-        trigger_inputs: TriggerInputs | None = None,
+        payload: TriggerInputs | None = None,
         trigger_type: TriggerType = TriggerType.MANUAL,
+    ) -> WorkflowExecutionCreateResponse:
+        """Start a new workflow execution.
+
+        Note: Unlike `create_workflow_execution_nowait`, this method waits until
+        Temporal has accepted the execution, so start failures (e.g. RPC errors)
+        are raised to the caller.
+        """
+        validation_result = validate_trigger_inputs(dsl=dsl, payload=payload)
+        if validation_result.status == "error":
+            raise TracecatValidationError(
+                validation_result.msg, detail=validation_result.detail
+            )
+        await self._client.start_workflow(
+            DSLWorkflow.run,
+            DSLRunArgs(dsl=dsl, role=self.role, wf_id=wf_id, trigger_inputs=payload),
+            **self._workflow_start_kwargs(
+                dsl=dsl, wf_exec_id=wf_exec_id, trigger_type=trigger_type
+            ),
+        )
+        return WorkflowExecutionCreateResponse(
+            message="Workflow execution started",
+            wf_id=wf_id,
+            wf_exec_id=wf_exec_id,
+        )
+
+    def _workflow_start_kwargs(
+        self,
+        *,
+        dsl: DSLInput,
+        wf_exec_id: WorkflowExecutionID,
+        trigger_type: TriggerType,
         **kwargs: Any,
-    ) -> WorkflowDispatchResponse:
+    ) -> dict[str, Any]:
+        """Temporal options for starting a DSL workflow execution."""
         if rpc_timeout := config.TEMPORAL__CLIENT_RPC_TIMEOUT:
             kwargs["rpc_timeout"] = datetime.timedelta(seconds=float(rpc_timeout))
         if task_timeout := config.TEMPORAL__TASK_TIMEOUT:
@@ -645,15 +678,6 @@ class WorkflowExecutionsService:
                 "task_timeout", datetime.timedelta(seconds=float(task_timeout))
             )
 
-        logger.info(
-            f"Executing DSL workflow: {dsl.title}",
-            role=self.role,
-            wf_exec_id=wf_exec_id,
-            run_config=dsl.config,
-            kwargs=kwargs,
-            trigger_type=trigger_type,
-        )
-
         pairs = [trigger_type.to_temporal_search_attr_pair()]
         if self.role.user_id is not None:
             pairs.append(
@@ -664,20 +688,44 @@ class WorkflowExecutionsService:
                     value=str(self.role.user_id),
                 )
             )
-        search_attrs = TypedSearchAttributes(search_attributes=pairs)
+        return {
+            "id": wf_exec_id,
+            "task_queue": config.TEMPORAL__CLUSTER_QUEUE,
+            "retry_policy": RETRY_POLICIES["workflow:fail_fast"],
+            # We don't currently differentiate between exec and run timeout as we fail fast for workflows
+            "execution_timeout": datetime.timedelta(seconds=dsl.config.timeout),
+            "search_attributes": TypedSearchAttributes(search_attributes=pairs),
+            **kwargs,
+        }
+
+    async def _dispatch_workflow(
+        self,
+        dsl: DSLInput,
+        wf_id: WorkflowID,
+        wf_exec_id: WorkflowExecutionID,
+        trigger_inputs: TriggerInputs | None = None,
+        trigger_type: TriggerType = TriggerType.MANUAL,
+        **kwargs: Any,
+    ) -> WorkflowDispatchResponse:
+        start_kwargs = self._workflow_start_kwargs(
+            dsl=dsl, wf_exec_id=wf_exec_id, trigger_type=trigger_type, **kwargs
+        )
+        logger.info(
+            f"Executing DSL workflow: {dsl.title}",
+            role=self.role,
+            wf_exec_id=wf_exec_id,
+            run_config=dsl.config,
+            kwargs=kwargs,
+            trigger_type=trigger_type,
+        )
+
         try:
             result = await self._client.execute_workflow(
                 DSLWorkflow.run,
                 DSLRunArgs(
                     dsl=dsl, role=self.role, wf_id=wf_id, trigger_inputs=trigger_inputs
                 ),
-                id=wf_exec_id,
-                task_queue=config.TEMPORAL__CLUSTER_QUEUE,
-                retry_policy=RETRY_POLICIES["workflow:fail_fast"],
-                # We don't currently differentiate between exec and run timeout as we fail fast for workflows
-                execution_timeout=datetime.timedelta(seconds=dsl.config.timeout),
-                search_attributes=search_attrs,
-                **kwargs,
+                **start_kwargs,
             )
         except WorkflowFailureError as e:
             self.logger.error(
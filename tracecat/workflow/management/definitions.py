@@ -3,13 +3,28 @@ from __future__ import annotations
 from sqlmodel import select
 from temporalio import activity
 
+from tracecat import config
+from tracecat.cache import TTLCache
 from tracecat.db.schemas import WorkflowDefinition
 from tracecat.dsl.common import DSLInput
+from tracecat.identifiers import WorkspaceID
 from tracecat.identifiers.workflow import WorkflowID
 from tracecat.logger import logger
 from tracecat.service import BaseService
 from tracecat.types.exceptions import TracecatAuthorizationError, TracecatException
-from tracecat.workflow.management.models import GetWorkflowDefinitionActivityInputs
+from tracecat.webhooks.cache import invalidate_webhook_cache
+from tracecat.workflow.management.models import (
+    GetWorkflowDefinitionActivityInputs,
+    ResolvedWorkflowDefinition,
+)
+
+definition_cache: TTLCache[tuple[WorkspaceID | None, WorkflowID, int], DSLInput] = (
+    TTLCache(maxsize=config.TRACECAT__WORKFLOW_DEFINITION_CACHE_SIZE)
+)
+"""Validated workflow definitions on this worker, keyed by (workspace ID, workflow ID, version).
+
+Definition versions are immutable once committed, so entries never go stale.
+"""
 
 
 class WorkflowDefinitionsService(BaseService):
@@ -72,6 +87,7 @@ class WorkflowDefinitionsService(BaseService):
         if commit:
             self.session.add(defn)
             await self.session.commit()
+            invalidate_webhook_cache(workflow_id)
             await self.session.refresh(defn)
         return defn
 
@@ -80,6 +96,30 @@ class WorkflowDefinitionsService(BaseService):
 async def get_workflow_definition_activity(
     input: GetWorkflowDefinitionActivityInputs,
 ) -> DSLInput:
+    if input.version is not None:
+        # Pinned versions are served from the worker cache
+        key = (input.role.workspace_id, input.workflow_id, input.version)
+        if dsl := definition_cache.get(key):
+            return dsl
+    resolved = await _resolve_workflow_definition(input)
+    return resolved.dsl
+
+
+@activity.defn
+async def resolve_workflow_definition_activity(
+    input: GetWorkflowDefinitionActivityInputs,
+) -> ResolvedWorkflowDefinition:
+    """Get a workflow definition along with the version it resolved to.
+
+    Lets callers pin the latest version, so the definition can be passed on by
+    (workflow ID, version) reference instead of by value.
+    """
+    return await _resolve_workflow_definition(input)
+
+
+async def _resolve_workflow_definition(
+    input: GetWorkflowDefinitionActivityInputs,
+) -> ResolvedWorkflowDefinition:
     async with WorkflowDefinitionsService.with_session(role=input.role) as service:
         defn = await service.get_definition_by_workflow_id(
             input.workflow_id, version=input.version
@@ -88,5 +128,10 @@ async def get_workflow_definition_activity(
             msg = f"Workflow definition not found for {input.workflow_id!r}, version={input.version}"
             logger.error(msg)
             raise TracecatException(msg)
-        dsl = DSLInput(**defn.content)
-    return dsl
+        key = (input.role.workspace_id, input.workflow_id, defn.version)
+        if (dsl := definition_cache.get(key)) is None:
+            dsl = DSLInput(**defn.content)
+            definition_cache.set(key, dsl)
+    return ResolvedWorkflowDefinition(
+        workflow_id=input.workflow_id, version=defn.version, dsl=dsl
+    )
@@ -43,6 +43,7 @@ from tracecat.validation.models import (
     ValidationResult,
 )
 from tracecat.validation.service import validate_dsl
+from tracecat.webhooks.cache import invalidate_webhook_cache
 from tracecat.workflow.actions.models import ActionControlFlow
 from tracecat.workflow.management.models import (
     ExternalWorkflowDefinition,
@@ -326,6 +327,7 @@ class WorkflowsManagementService(BaseService):
         workflow = result.one()
         await self.session.delete(workflow)
         await self.session.commit()
+        invalidate_webhook_cache(workflow_id)
 
     async def create_workflow(self, params: WorkflowCreate) -> Workflow:
         """Create a new workflow."""
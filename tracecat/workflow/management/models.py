@@ -117,6 +117,14 @@ class GetWorkflowDefinitionActivityInputs(BaseModel):
         return WorkflowUUID.new(v)
 
 
+class ResolvedWorkflowDefinition(BaseModel):
+    """A workflow definition pinned to the version it was resolved to."""
+
+    workflow_id: WorkflowUUID
+    version: int
+    dsl: DSLInput
+
+
 class ResolveWorkflowAliasActivityInputs(BaseModel):
     workflow_alias: str
     role: Role
@@ -36,6 +36,7 @@ from tracecat.validation.models import (
     ValidationResultType,
 )
 from tracecat.validation.service import validate_dsl
+from tracecat.webhooks.cache import invalidate_webhook_cache
 from tracecat.webhooks.models import WebhookCreate, WebhookRead, WebhookUpdate
 from tracecat.workflow.actions.models import ActionRead
 from tracecat.workflow.management.definitions import WorkflowDefinitionsService
@@ -395,6 +396,7 @@ async def commit_workflow(
     session.add(workflow)
     session.add(defn)
     await session.commit()
+    invalidate_webhook_cache(workflow_id)
     await session.refresh(workflow)
     await session.refresh(defn)
 
@@ -535,6 +537,7 @@ async def create_webhook(
     )  # type: ignore
     session.add(webhook)
     await session.commit()
+    invalidate_webhook_cache(workflow_id)
     await session.refresh(webhook)
 
 
@@ -595,6 +598,7 @@ async def update_webhook(
 
     session.add(webhook)
     await session.commit()
+    invalidate_webhook_cache(workflow_id)
     await session.refresh(webhook)
 
 